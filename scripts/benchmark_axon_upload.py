@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+
+import synapse.axon as s_axon
+import synapse.common as s_common
+
+import synapse.lib.hashset as s_hashset
+
+'''
+Benchmark Axon upload throughput and ioloop responsiveness.
+
+Uploads a file in large chunks while computing the full hash set, as done
+by Axon.wget(), while a probe task measures how long it is delayed beyond
+a short sleep.
+'''
+
+logger = logging.getLogger(__name__)
+
+s_common.setlogging(logger, 'ERROR')
+
+async def probe(done, delays):
+    while not done.is_set():
+        tick = time.perf_counter()
+        await asyncio.sleep(0.001)
+        delays.append(time.perf_counter() - tick - 0.001)
+
+async def main(argv):
+
+    pars = argparse.ArgumentParser(prog='benchmark_axon_upload', description=__doc__)
+    pars.add_argument('--size', type=int, default=256, help='The size of the file to upload in MiB.')
+    pars.add_argument('--chunk', type=int, default=16, help='The size of each uploaded chunk in MiB.')
+    opts = pars.parse_args(argv)
+
+    chunk = os.urandom(opts.chunk * 1024 * 1024)
+    count = opts.size // opts.chunk
+
+    with s_common.getTempDir() as dirn:
+
+        async with await s_axon.Axon.anit(dirn) as axon:
+
+            done = asyncio.Event()
+            delays = []
+
+            task = axon.schedCoro(probe(done, delays))
+
+            tick = time.perf_counter()
+
+            hashset = s_hashset.HashSet()
+
+            async with await axon.upload() as upload:
+                for i in range(count):
+                    # make each chunk unique to avoid measuring cache effects
+                    byts = i.to_bytes(8, 'big') + chunk[8:]
+                    if hasattr(hashset, 'aupdate'):
+                        await hashset.aupdate(byts)
+                    else:
+                        hashset.update(byts)
+                    await upload.write(byts)
+
+                size, _ = await upload.save()
+
+            if hasattr(hashset, 'wait'):
+                await hashset.wait()
+
+            took = time.perf_counter() - tick
+
+            done.set()
+            await task
+
+            mibs = size / took / (1024 * 1024)
+            print(f'uploaded {size} bytes in {took:.3f}s ({mibs:.1f} MiB/sec)')
+
+            delays.sort()
+            print(f'ioloop delay: p50={delays[len(delays) // 2] * 1000:.2f}ms max={delays[-1] * 1000:.2f}ms')
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,69 @@
+import sys
+import time
+import asyncio
+import logging
+import argparse
+
+import synapse.common as s_common
+import synapse.cortex as s_cortex
+
+'''
+Benchmark bulk ingest of pre-normalized nodes.
+
+Adds the same nodes using the syn.nodes feed function and using the
+Cortex.addNodesBulk() API and reports the rate in nodes/sec for each.
+'''
+
+logger = logging.getLogger(__name__)
+
+s_common.setlogging(logger, 'ERROR')
+
+conf = {
+    'layers:lockmemory': False,
+    'layer:lmdb:map_async': False,
+    'nexslog:en': False,
+    'layers:logedits': False,
+}
+
+def getItems(count):
+    return [(('inet:ipv4', i), {'props': {'asn': i % 1000}, 'tags': {'foo.bar': (None, None)}})
+            for i in range(count)]
+
+async def feed(core, items, batch):
+    for offs in range(0, len(items), batch):
+        await core.addFeedData('syn.nodes', items[offs:offs + batch])
+
+async def bulk(core, items, batch):
+    for offs in range(0, len(items), batch):
+        await core.addNodesBulk(items[offs:offs + batch])
+
+async def measure(func, items, batch):
+
+    with s_common.getTempDir() as dirn:
+
+        async with await s_cortex.Cortex.anit(dirn, conf=conf) as core:
+
+            tick = time.perf_counter()
+            await func(core, items, batch)
+            await core.getLayer().layrslab.sync()
+            took = time.perf_counter() - tick
+
+            assert await core.count('inet:ipv4') == len(items)
+
+            return took
+
+async def main(argv):
+
+    pars = argparse.ArgumentParser(prog='benchmark_bulk_ingest', description=__doc__)
+    pars.add_argument('--count', type=int, default=20000, help='The number of nodes to add.')
+    pars.add_argument('--batch', type=int, default=5000, help='The number of nodes per call.')
+    opts = pars.parse_args(argv)
+
+    items = getItems(opts.count)
+
+    for name, func in (('syn.nodes feed', feed), ('addNodesBulk', bulk)):
+        took = await measure(func, items, opts.batch)
+        print(f'{name}: added {opts.count} nodes in {took:.3f}s ({opts.count / took:.0f} nodes/sec)')
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(asyncio.run(main(sys.argv[1:])))
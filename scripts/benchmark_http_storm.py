@@ -0,0 +1,85 @@
+import sys
+import time
+import asyncio
+import logging
+import argparse
+
+import aiohttp
+
+import synapse.common as s_common
+import synapse.cortex as s_cortex
+
+'''
+Benchmark the throughput of streaming storm messages over the HTTP API.
+
+Runs a storm query which lifts a number of nodes using the /api/v1/storm
+endpoint with each stream format and content encoding.
+'''
+
+logger = logging.getLogger(__name__)
+
+s_common.setlogging(logger, 'ERROR')
+
+conf = {
+    'layers:lockmemory': False,
+    'layer:lmdb:map_async': False,
+    'nexslog:en': False,
+    'layers:logedits': False,
+}
+
+modes = (
+    (None, 'identity'),
+    ('jsonlines', 'identity'),
+    ('jsonlines', 'gzip'),
+    ('msgpack', 'identity'),
+    ('msgpack', 'gzip'),
+)
+
+async def stream(sess, url, body, encoding):
+    size = 0
+    tick = time.perf_counter()
+    async with sess.get(url, json=body, headers={'Accept-Encoding': encoding}) as resp:
+        async for byts in resp.content.iter_any():
+            size += len(byts)
+    return size, time.perf_counter() - tick
+
+async def main(argv):
+
+    pars = argparse.ArgumentParser(prog='benchmark_http_storm', description=__doc__)
+    pars.add_argument('--count', type=int, default=50000, help='The number of nodes to stream.')
+    pars.add_argument('--rounds', type=int, default=3, help='The number of times to run each query.')
+    opts = pars.parse_args(argv)
+
+    with s_common.getTempDir() as dirn:
+
+        async with await s_cortex.Cortex.anit(dirn, conf=conf) as core:
+
+            podes = [(('inet:ipv4', i), {'props': {'asn': i}}) for i in range(opts.count)]
+            await core.addFeedData('syn.nodes', podes)
+
+            root = await core.auth.getUserByName('root')
+            await root.setPasswd('secret')
+
+            host, port = await core.addHttpsPort(0, host='127.0.0.1')
+            url = f'https://127.0.0.1:{port}/api/v1/storm'
+
+            headers = {'Authorization': aiohttp.BasicAuth('root', 'secret').encode()}
+            conn = aiohttp.TCPConnector(ssl=False)
+
+            async with aiohttp.ClientSession(headers=headers, connector=conn, auto_decompress=False) as sess:
+
+                # warm up the caches before measuring
+                await stream(sess, url, {'query': 'inet:ipv4'}, 'identity')
+
+                for i in range(opts.rounds):
+
+                    for fmt, encoding in modes:
+
+                        body = {'query': 'inet:ipv4', 'stream': fmt}
+
+                        size, took = await stream(sess, url, body, encoding)
+                        print(f'stream={fmt} encoding={encoding} read {size} bytes in {took:.3f}s '
+                              f'({opts.count / took:.0f} nodes/sec)')
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,97 @@
+import sys
+import time
+import random
+import asyncio
+import logging
+import argparse
+
+import synapse.common as s_common
+import synapse.cortex as s_cortex
+
+import synapse.lib.layer as s_layer
+import synapse.lib.output as s_output
+import synapse.lib.msgpack as s_msgpack
+
+import synapse.tools.cortex.layer.build as s_t_build
+
+'''
+Benchmark building an empty layer from a node edits export.
+
+Writes a .nodeedits file of inet:ipv4 nodes in random buid order and
+compares applying the edits with Layer.saveNodeEdits() ( as the layer.load
+tool does ) against the offline layer.build tool.
+'''
+
+logger = logging.getLogger(__name__)
+
+s_common.setlogging(logger, 'ERROR')
+
+def genNodeEdits(path, count, chunksize=100):
+
+    rand = random.Random(0)
+
+    with open(path, 'wb') as fd:
+
+        fd.write(s_msgpack.en(('init', {'offset': 0})))
+
+        offs = -1
+        for chunk in s_common.chunks(rand.sample(range(2 ** 32), count), chunksize):
+
+            edits = []
+            for ipv4 in chunk:
+                edits.append((s_common.buid(('inet:ipv4', ipv4)), 'inet:ipv4', (
+                    (s_layer.EDIT_NODE_ADD, (ipv4, s_layer.STOR_TYPE_U32), ()),
+                    (s_layer.EDIT_PROP_SET, ('asn', ipv4 % 1000, None, s_layer.STOR_TYPE_I64), ()),
+                    (s_layer.EDIT_PROP_SET, ('loc', 'us.va', None, s_layer.STOR_TYPE_LOC), ()),
+                    (s_layer.EDIT_TAG_SET, ('foo', (None, None), None), ()),
+                )))
+
+            offs += 1
+            fd.write(s_msgpack.en(('edit', (offs, edits, {}))))
+
+        fd.write(s_msgpack.en(('fini', {'offset': offs})))
+
+async def load(dirn, path):
+
+    async with await s_cortex.Cortex.anit(dirn) as core:
+
+        layr = core.getLayer((await core.addLayer()).get('iden'))
+
+        tick = time.perf_counter()
+
+        for mesg in s_msgpack.iterfile(path):
+            if mesg[0] == 'edit':
+                await layr.saveNodeEdits(mesg[1][1], {})
+
+        await layr.layrslab.sync()
+
+        return time.perf_counter() - tick
+
+async def build(dirn, path):
+
+    async with await s_cortex.Cortex.anit(dirn) as core:
+        iden = (await core.addLayer()).get('iden')
+
+    tick = time.perf_counter()
+
+    assert await s_t_build.main((dirn, iden, path), outp=s_output.OutPutStr()) == 0
+
+    return time.perf_counter() - tick
+
+async def main(argv):
+
+    pars = argparse.ArgumentParser(prog='benchmark_layer_build', description=__doc__)
+    pars.add_argument('--count', type=int, default=200000, help='The number of nodes to add.')
+    opts = pars.parse_args(argv)
+
+    with s_common.getTempDir() as dirn:
+
+        path = s_common.genpath(dirn, 'bench.nodeedits')
+        genNodeEdits(path, opts.count)
+
+        for name, func in (('saveNodeEdits', load), ('layer.build', build)):
+            took = await func(s_common.genpath(dirn, name), path)
+            print(f'{name}: added {opts.count} nodes in {took:.3f}s ({opts.count / took:.0f} nodes/sec)')
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,59 @@
+import sys
+import time
+import asyncio
+import logging
+import argparse
+
+import synapse.common as s_common
+import synapse.cortex as s_cortex
+
+'''
+Benchmark Nexus change log throughput with many concurrent writers.
+
+Runs a number of concurrent tasks which each add nodes one at a time and
+reports the node add rate with and without Nexus group commits enabled.
+'''
+
+logger = logging.getLogger(__name__)
+
+s_common.setlogging(logger, 'ERROR')
+
+conf = {
+    'layers:lockmemory': False,
+    'layer:lmdb:map_async': False,
+    'nexslog:en': True,
+    'layers:logedits': False,
+}
+
+async def writer(core, base, count):
+    for i in range(count):
+        await core.addNode(core.auth.rootuser, 'inet:ipv4', base + i)
+
+async def measure(groupsize, writers, count):
+
+    with s_common.getTempDir() as dirn:
+
+        async with await s_cortex.Cortex.anit(dirn, conf={**conf, 'nexslog:group:size': groupsize}) as core:
+
+            tick = time.perf_counter()
+            await asyncio.gather(*[writer(core, i * count, count) for i in range(writers)])
+            took = time.perf_counter() - tick
+
+            return took
+
+async def main(argv):
+
+    pars = argparse.ArgumentParser(prog='benchmark_nexus', description=__doc__)
+    pars.add_argument('--writers', type=int, default=100, help='The number of concurrent writers.')
+    pars.add_argument('--count', type=int, default=100, help='The number of nodes added by each writer.')
+    pars.add_argument('--group-size', type=int, default=64, help='The nexslog:group:size to compare against.')
+    opts = pars.parse_args(argv)
+
+    total = opts.writers * opts.count
+
+    for groupsize in (1, opts.group_size):
+        took = await measure(groupsize, opts.writers, opts.count)
+        print(f'nexslog:group:size={groupsize}: added {total} nodes in {took:.3f}s ({total / took:.0f} nodes/sec)')
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(asyncio.run(main(sys.argv[1:])))
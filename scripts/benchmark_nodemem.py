@@ -0,0 +1,93 @@
+import gc
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import tracemalloc
+
+import synapse.common as s_common
+import synapse.cortex as s_cortex
+
+'''
+Benchmark the memory footprint and allocation churn of Node objects.
+
+Lifts a number of nodes and reports the memory retained per live Node along
+with the time and number of gc collections required to lift them.
+'''
+
+logger = logging.getLogger(__name__)
+
+s_common.setlogging(logger, 'ERROR')
+
+conf = {
+    'layers:lockmemory': False,
+    'layer:lmdb:map_async': False,
+    'nexslog:en': False,
+    'layers:logedits': False,
+}
+
+async def addNodes(core, count, opts=None):
+
+    q = '''
+        for $i in $lib.range($count) {
+            [ inet:ipv4=$i :asn=$($i % 100) :loc=us.va .seen=2020 +#cno.mal.foo +#rep.vt=2021 +#cno.mal.foo:score=$i ]
+        }
+    '''
+    opts = dict(opts or {})
+    opts['vars'] = {'count': count}
+
+    await core.nodes('$lib.model.ext.addTagProp(score, (int, ({})), ({}))')
+    await core.callStorm(q, opts=opts)
+
+async def measure(core, opts):
+
+    view = core.getView(opts.get('view'))
+
+    async with await view.snap(user=core.auth.rootuser) as snap:
+
+        snap.cachebuids = False
+
+        gc.collect()
+        collections = sum(stat['collections'] for stat in gc.get_stats())
+
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+
+        tick = time.perf_counter()
+        nodes = [node async for node in snap.nodesByProp('inet:ipv4')]
+        took = time.perf_counter() - tick
+
+        size = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+
+        collections = sum(stat['collections'] for stat in gc.get_stats()) - collections
+
+        return len(nodes), size, took, collections
+
+async def main(argv):
+
+    pars = argparse.ArgumentParser(prog='benchmark_nodemem', description=__doc__)
+    pars.add_argument('--count', type=int, default=10000, help='The number of nodes to lift.')
+    pars.add_argument('--fork', action='store_true', help='Lift from a forked view with edits in both layers.')
+    opts = pars.parse_args(argv)
+
+    with s_common.getTempDir() as dirn:
+
+        async with await s_cortex.Cortex.anit(dirn, conf=conf) as core:
+
+            await addNodes(core, opts.count)
+
+            qopts = {}
+            if opts.fork:
+                view = await core.callStorm('return($lib.view.get().fork().iden)')
+                qopts['view'] = view
+                await core.nodes('inet:ipv4 [ :asn=10 +#fork ]', opts=qopts)
+
+            count, size, took, collections = await measure(core, qopts)
+
+            print(f'lifted {count} nodes in {took:.3f}s ({collections} gc collections)')
+            print(f'retained {size} bytes ({size / count:.0f} bytes per node)')
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(asyncio.run(main(sys.argv[1:])))
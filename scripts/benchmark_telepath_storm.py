@@ -0,0 +1,69 @@
+import sys
+import time
+import asyncio
+import logging
+import argparse
+
+import synapse.common as s_common
+import synapse.cortex as s_cortex
+
+'''
+Benchmark the throughput of streaming storm messages over telepath.
+
+Runs a storm query which lifts a number of nodes over a telepath proxy with
+and without the batched yield telepath feature.
+'''
+
+logger = logging.getLogger(__name__)
+
+s_common.setlogging(logger, 'ERROR')
+
+conf = {
+    'layers:lockmemory': False,
+    'layer:lmdb:map_async': False,
+    'nexslog:en': False,
+    'layers:logedits': False,
+}
+
+async def stream(prox, text, opts):
+    count = 0
+    tick = time.perf_counter()
+    async for mesg in prox.storm(text, opts=opts):
+        count += 1
+    return count, time.perf_counter() - tick
+
+async def main(argv):
+
+    pars = argparse.ArgumentParser(prog='benchmark_telepath_storm', description=__doc__)
+    pars.add_argument('--count', type=int, default=100000, help='The number of nodes to stream.')
+    pars.add_argument('--rounds', type=int, default=3, help='The number of times to run each query.')
+    opts = pars.parse_args(argv)
+
+    with s_common.getTempDir() as dirn:
+
+        async with await s_cortex.Cortex.anit(dirn, conf=conf) as core:
+
+            podes = [(('inet:ipv4', i), {'props': {'asn': i}}) for i in range(opts.count)]
+            await core.addFeedData('syn.nodes', podes)
+
+            stormopts = {'repr': True}
+
+            async with core.getLocalProxy() as prox:
+
+                # warm up the caches before measuring
+                await stream(prox, 'inet:ipv4', stormopts)
+
+                for i in range(opts.rounds):
+
+                    for batch in (False, True):
+
+                        if batch:
+                            prox._features['batchyield'] = 1
+                        else:
+                            prox._features.pop('batchyield', None)
+
+                        count, took = await stream(prox, 'inet:ipv4', stormopts)
+                        print(f'batch={batch} streamed {count} messages in {took:.3f}s ({count / took:.0f} msgs/sec)')
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(asyncio.run(main(sys.argv[1:])))
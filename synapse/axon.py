@@ -1,3 +1,4 @@
+import os
 import csv
 import struct
 import asyncio
@@ -13,7 +14,9 @@ import synapse.exc as s_exc
 import synapse.common as s_common
 
 import synapse.lib.cell as s_cell
+import synapse.lib.cdc as s_cdc
 import synapse.lib.base as s_base
+import synapse.lib.coro as s_coro
 import synapse.lib.json as s_json
 import synapse.lib.link as s_link
 import synapse.lib.const as s_const
@@ -57,8 +60,8 @@ class AxonHttpUploadV1(AxonHandlerMixin, s_httpapi.StreamHandler):
 
     async def data_received(self, chunk):
         if chunk is not None:
+            await self.hashset.aupdate(chunk)
             await self.upfd.write(chunk)
-            self.hashset.update(chunk)
             await asyncio.sleep(0)
 
     def on_finish(self):
@@ -71,6 +74,8 @@ class AxonHttpUploadV1(AxonHandlerMixin, s_httpapi.StreamHandler):
     async def _save(self):
         size, sha256b = await self.upfd.save()
 
+        await self.hashset.wait()
+
         fhashes = {htyp: hasher.hexdigest() for htyp, hasher in self.hashset.hashes}
 
         assert sha256b == s_common.uhex(fhashes.get('sha256'))
@@ -327,8 +332,18 @@ class UpLoad(s_base.Base):
             (None): Returns None.
         '''
         self.size += len(byts)
-        self.sha256.update(byts)
-        self.fd.write(byts)
+
+        if len(byts) < s_hashset.THREAD_MIN_SIZE:
+            self.sha256.update(byts)
+            self.fd.write(byts)
+            return
+
+        # hash in the executor pool while the bytes are written to the spool file
+        todo = s_coro.executor(self.sha256.update, byts)
+        try:
+            self.fd.write(byts)
+        finally:
+            await todo
 
     async def save(self):
         '''
@@ -387,6 +402,429 @@ class UpLoadProxy(s_share.Share):
     async def save(self):
         return await self.item.save()
 
+class BlobStor(s_base.Base):
+    '''
+    The base class for Axon blob storage backends.
+
+    Notes:
+        Blob bytes are saved in order as a series of chunks. The save() and
+        commit() methods are called from Nexus handlers and must be idempotent.
+    '''
+    byterange = True
+
+    async def __anit__(self, axon):  # type: ignore
+        await s_base.Base.__anit__(self)
+        self.axon = axon
+
+    async def save(self, sha256, indx, offs, byts):
+        '''
+        Save a chunk of bytes for a blob.
+
+        Args:
+            sha256 (bytes): The sha256 hash of the blob.
+            indx (int): The index of the chunk within the blob.
+            offs (int): The offset of the end of the chunk within the blob.
+            byts (bytes): The chunk bytes.
+        '''
+        raise s_exc.NoSuchImpl(mesg=f'{self.__class__.__name__} does not implement save()')
+
+    async def commit(self, sha256, size):
+        '''
+        Complete saving a blob once all of its chunks have been saved.
+        '''
+        pass
+
+    async def get(self, sha256):
+        '''
+        Yield the chunks of bytes for a blob.
+        '''
+        raise s_exc.NoSuchImpl(mesg=f'{self.__class__.__name__} does not implement get()')
+        yield None  # pragma: no cover
+
+    async def getOffsSize(self, sha256, offs, size):
+        '''
+        Yield size bytes of a blob starting at the given offset.
+        '''
+        raise s_exc.NoSuchImpl(mesg=f'{self.__class__.__name__} does not implement getOffsSize()')
+        yield None  # pragma: no cover
+
+    async def delete(self, sha256):
+        '''
+        Delete the bytes for a blob.
+        '''
+        raise s_exc.NoSuchImpl(mesg=f'{self.__class__.__name__} does not implement delete()')
+
+    def getMetrics(self):
+        '''
+        Return a dictionary of backend specific metrics which are included in the Axon metrics.
+        '''
+        return {}
+
+class LmdbBlobStor(BlobStor):
+    '''
+    Store blobs as CHUNK_SIZE values in an LMDB slab.
+    '''
+    async def __anit__(self, axon):  # type: ignore
+
+        await BlobStor.__anit__(self, axon)
+
+        path = s_common.gendir(axon.dirn, 'blob.lmdb')
+
+        self.slab = await s_lmdbslab.Slab.anit(path)
+        self.blobs = self.slab.initdb('blobs')
+        self.offsets = self.slab.initdb('offsets')
+        self.metadata = self.slab.initdb('metadata')
+        self.onfini(self.slab.fini)
+
+        if axon.inaugural:
+            self._setStorVers(1)
+
+        storvers = self._getStorVers()
+        if storvers < 1:
+            storvers = await self._setStorVers01()
+
+    async def _setStorVers01(self):
+
+        logger.warning('Updating Axon storage version (adding offset index). This may take a while.')
+
+        offs = 0
+        cursha = b''
+
+        # TODO: need LMDB to support getting value size without getting value
+        for lkey, byts in self.slab.scanByFull(db=self.blobs):
+
+            await asyncio.sleep(0)
+
+            blobsha = lkey[:32]
+
+            if blobsha != cursha:
+                offs = 0
+                cursha = blobsha
+
+            offs += len(byts)
+
+            self.slab.put(cursha + offs.to_bytes(8, 'big'), lkey[32:], db=self.offsets)
+
+        return self._setStorVers(1)
+
+    def _getStorVers(self):
+        byts = self.slab.get(b'version', db=self.metadata)
+        if not byts:
+            return 0
+        return int.from_bytes(byts, 'big')
+
+    def _setStorVers(self, version):
+        self.slab.put(b'version', version.to_bytes(8, 'big'), db=self.metadata)
+        return version
+
+    async def save(self, sha256, indx, offs, byts):
+        ikey = indx.to_bytes(8, 'big')
+        okey = offs.to_bytes(8, 'big')
+
+        self.slab.put(sha256 + ikey, byts, db=self.blobs)
+        self.slab.put(sha256 + okey, ikey, db=self.offsets)
+
+    async def get(self, sha256):
+        for _, byts in self.slab.scanByPref(sha256, db=self.blobs):
+            yield byts
+
+    def _offsToIndx(self, sha256, offs):
+        lkey = sha256 + offs.to_bytes(8, 'big')
+        for offskey, indxbyts in self.slab.scanByRange(lkey, db=self.offsets):
+            return int.from_bytes(offskey[32:], 'big'), indxbyts
+
+    async def _getBytsOffs(self, sha256, offs):
+
+        first = True
+
+        boff, indxbyts = self._offsToIndx(sha256, offs)
+
+        for bkey, byts in self.slab.scanByRange(sha256 + indxbyts, db=self.blobs):
+
+            await asyncio.sleep(0)
+
+            if bkey[:32] != sha256:
+                return
+
+            if first:
+                first = False
+                delt = boff - offs
+                yield byts[-delt:]
+                continue
+
+            yield byts
+
+    async def getOffsSize(self, sha256, offs, size):
+        # This implementation assumes that the offs provided is < the maximum
+        # size of the sha256 value being asked for.
+        remain = size
+        async for byts in self._getBytsOffs(sha256, offs):
+
+            blen = len(byts)
+            if blen >= remain:
+                yield byts[:remain]
+                return
+
+            remain -= blen
+
+            yield byts
+
+    async def delete(self, sha256):
+
+        # remove the offset indexes...
+        for lkey in self.slab.scanKeysByPref(sha256, db=self.blobs):
+            self.slab.delete(lkey, db=self.offsets)
+            await asyncio.sleep(0)
+
+        # remove the actual blobs...
+        for lkey in self.slab.scanKeysByPref(sha256, db=self.blobs):
+            self.slab.delete(lkey, db=self.blobs)
+            await asyncio.sleep(0)
+
+class FileBlobStor(BlobStor):
+    '''
+    Store blobs as content addressed files on the local filesystem.
+
+    Notes:
+        Chunks are written to a temporary file which is synced to disk and
+        renamed to blobs/<xx>/<sha256> once the blob is committed. File IO
+        is done in the executor pool to avoid blocking the ioloop.
+    '''
+    async def __anit__(self, axon):  # type: ignore
+
+        await BlobStor.__anit__(self, axon)
+
+        self.dirn = s_common.gendir(axon.dirn, 'blobs')
+        self.tmpdirn = s_common.gendir(self.dirn, 'tmp')
+
+    def _getBlobPath(self, sha256):
+        fhash = s_common.ehex(sha256)
+        return s_common.genpath(self.dirn, fhash[:2], fhash)
+
+    def _getTempPath(self, sha256):
+        return s_common.genpath(self.tmpdirn, s_common.ehex(sha256))
+
+    async def save(self, sha256, indx, offs, byts):
+        await s_coro.executor(self._saveByts, self._getTempPath(sha256), offs - len(byts), byts)
+
+    def _saveByts(self, path, offs, byts):
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT, 0o600)
+        try:
+            os.pwrite(fd, byts, offs)
+        finally:
+            os.close(fd)
+
+    async def commit(self, sha256, size):
+        await s_coro.executor(self._commitBlob, self._getTempPath(sha256), self._getBlobPath(sha256), size)
+
+    def _commitBlob(self, tmppath, path, size):
+
+        if not os.path.isfile(tmppath) and os.path.isfile(path):
+            return
+
+        try:
+            tmpsize = os.path.getsize(tmppath)
+        except FileNotFoundError:
+            tmpsize = None
+
+        # empty blobs have no chunks to save
+        if tmpsize is None and size == 0:
+            with open(tmppath, 'wb'):
+                tmpsize = 0
+
+        if tmpsize != size:
+
+            # remove the file so a retry of the upload starts over
+            if tmpsize is not None:
+                os.unlink(tmppath)
+
+            mesg = f'Blob file size {tmpsize} does not match the expected size {size}.'
+            raise s_exc.BadDataValu(mesg=mesg, expected=size, received=tmpsize)
+
+        fd = os.open(tmppath, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        dirn = s_common.gendir(os.path.dirname(path))
+        os.replace(tmppath, path)
+
+        # sync the directory so the rename is durable
+        fd = os.open(dirn, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    async def get(self, sha256):
+        async for byts in self.getOffsSize(sha256, 0, None):
+            yield byts
+
+    async def getOffsSize(self, sha256, offs, size):
+
+        fd = await s_coro.executor(os.open, self._getBlobPath(sha256), os.O_RDONLY)
+        try:
+
+            while size is None or size > 0:
+
+                rlen = CHUNK_SIZE
+                if size is not None:
+                    rlen = min(size, CHUNK_SIZE)
+
+                byts = await s_coro.executor(os.pread, fd, rlen, offs)
+                if not byts:
+                    return
+
+                offs += len(byts)
+                if size is not None:
+                    size -= len(byts)
+
+                yield byts
+
+        finally:
+            os.close(fd)
+
+    async def delete(self, sha256):
+        await s_coro.executor(self._delBlob, self._getTempPath(sha256), self._getBlobPath(sha256))
+
+    def _delBlob(self, tmppath, path):
+        for path in (tmppath, path):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+class CdcBlobStor(BlobStor):
+    '''
+    Store blobs as deduplicated content defined chunks in an LMDB slab.
+
+    Notes:
+        Each saved chunk of a blob is split into content defined chunks
+        which are stored once by sha256 with a reference count.  Blobs are
+        stored as a list of chunk digests keyed by the end offset of each chunk.
+    '''
+    async def __anit__(self, axon):  # type: ignore
+
+        await BlobStor.__anit__(self, axon)
+
+        path = s_common.gendir(axon.dirn, 'cdc.lmdb')
+
+        self.slab = await s_lmdbslab.Slab.anit(path)
+        self.blobs = self.slab.initdb('blobs')  # <sha256><offs> = <chunk sha256>
+        self.chunks = self.slab.initdb('chunks')  # <chunk sha256> = <byts>
+        self.refs = self.slab.initdb('refs')  # <chunk sha256> = <refcount><size>
+        self.onfini(self.slab.fini)
+
+        self.metrics = await self.slab.getHotCount('metrics')
+
+    def _getChunks(self, offs, byts):
+        retn = []
+        for chnk in s_cdc.chunks(byts):
+            offs += len(chnk)
+            retn.append((offs, hashlib.sha256(chnk).digest(), chnk))
+        return retn
+
+    async def save(self, sha256, indx, offs, byts):
+
+        # chunk and hash the bytes in the executor pool
+        chunks = await s_coro.executor(self._getChunks, offs - len(byts), byts)
+
+        for offs, digest, chnk in chunks:
+
+            lastdigest = self.slab.replace(sha256 + offs.to_bytes(8, 'big'), digest, db=self.blobs)
+            if lastdigest == digest:
+                continue
+
+            if lastdigest is not None:
+                self._decRef(lastdigest)
+
+            self._incRef(digest, chnk)
+
+            await asyncio.sleep(0)
+
+    def _incRef(self, digest, chnk):
+
+        refs = 1
+        size = len(chnk)
+
+        byts = self.slab.get(digest, db=self.refs)
+        if byts is None:
+            self.slab.put(digest, chnk, db=self.chunks)
+            self.metrics.inc('chunk:count')
+            self.metrics.inc('chunk:bytes', valu=size)
+        else:
+            refs += int.from_bytes(byts[:8], 'big')
+
+        self.metrics.inc('ref:bytes', valu=size)
+        self.slab.put(digest, refs.to_bytes(8, 'big') + size.to_bytes(8, 'big'), db=self.refs)
+
+    def _decRef(self, digest):
+
+        byts = self.slab.get(digest, db=self.refs)
+        if byts is None:  # pragma: no cover
+            return
+
+        refs = int.from_bytes(byts[:8], 'big') - 1
+        size = int.from_bytes(byts[8:], 'big')
+
+        self.metrics.inc('ref:bytes', valu=-size)
+
+        if refs > 0:
+            self.slab.put(digest, refs.to_bytes(8, 'big') + byts[8:], db=self.refs)
+            return
+
+        self.slab.delete(digest, db=self.refs)
+        self.slab.delete(digest, db=self.chunks)
+        self.metrics.inc('chunk:count', valu=-1)
+        self.metrics.inc('chunk:bytes', valu=-size)
+
+    async def get(self, sha256):
+        for _, digest in self.slab.scanByPref(sha256, db=self.blobs):
+            yield self.slab.get(digest, db=self.chunks)
+
+    async def getOffsSize(self, sha256, offs, size):
+
+        remain = size
+
+        # the first chunk which ends after offs contains the first byte
+        lkey = sha256 + (offs + 1).to_bytes(8, 'big')
+        for bkey, digest in self.slab.scanByRange(lkey, db=self.blobs):
+
+            if bkey[:32] != sha256:
+                return
+
+            byts = self.slab.get(digest, db=self.chunks)
+
+            boff = int.from_bytes(bkey[32:], 'big') - len(byts)
+            if boff < offs:
+                byts = byts[offs - boff:]
+
+            blen = len(byts)
+            if blen >= remain:
+                yield byts[:remain]
+                return
+
+            remain -= blen
+
+            yield byts
+
+    async def delete(self, sha256):
+
+        for lkey, digest in self.slab.scanByPref(sha256, db=self.blobs):
+            self._decRef(digest)
+            self.slab.delete(lkey, db=self.blobs)
+            await asyncio.sleep(0)
+
+    def getMetrics(self):
+        return {f'blob:{name}': valu for (name, valu) in self.metrics.pack().items()}
+
+blobstors = {
+    'lmdb': LmdbBlobStor,
+    'files': FileBlobStor,
+    'cdc': CdcBlobStor,
+}
+
 class AxonApi(s_cell.CellApi, s_share.Share):  # type: ignore
 
     async def __anit__(self, cell, link, user):
@@ -807,6 +1245,11 @@ class Axon(s_cell.Cell):
             'description': 'An optional directory of CAs which are added to the TLS CA chain for wget and wput APIs.',
             'type': 'string',
         },
+        'blob:store': {
+            'description': 'The blob storage backend used to store file bytes (defaults to lmdb). The cdc backend deduplicates identical regions of files using content defined chunking. This may not be changed once the Axon has been initialized.',
+            'type': 'string',
+            'enum': ['lmdb', 'files', 'cdc'],
+        },
     }
 
     async def initServiceStorage(self):  # type: ignore
@@ -835,6 +1278,7 @@ class Axon(s_cell.Cell):
         self.maxcount = self.conf.get('max:count')
 
         # modularize blob storage
+        self.blobstor = None
         await self._initBlobStor()
 
         # Set the byterange flag as an integer AFTER we've called
@@ -906,56 +1350,33 @@ class Axon(s_cell.Cell):
 
     async def _initBlobStor(self):
 
-        self.byterange = True
+        # axons created prior to pluggable blob storage used lmdb
+        lastname = self.cellinfo.get('axon:blob:store')
+        if lastname is None and not self.inaugural:
+            lastname = 'lmdb'
 
-        path = s_common.gendir(self.dirn, 'blob.lmdb')
+        name = self.conf.get('blob:store')
+        if name is None:
+            name = lastname or 'lmdb'
 
-        self.blobslab = await s_lmdbslab.Slab.anit(path)
-        self.blobs = self.blobslab.initdb('blobs')
-        self.offsets = self.blobslab.initdb('offsets')
-        self.metadata = self.blobslab.initdb('metadata')
-        self.onfini(self.blobslab.fini)
+        if lastname is None:
+            lastname = name
+            self.cellinfo.set('axon:blob:store', name)
 
-        if self.inaugural:
-            self._setStorVers(1)
+        if name != lastname:
+            mesg = f'The Axon blob:store may not be changed from {lastname} to {name}.'
+            raise s_exc.BadConfValu(mesg=mesg, name='blob:store', valu=name)
 
-        storvers = self._getStorVers()
-        if storvers < 1:
-            storvers = await self._setStorVers01()
+        self.blobstor = await blobstors[name].anit(self)
+        self.onfini(self.blobstor)
 
-    async def _setStorVers01(self):
-
-        logger.warning('Updating Axon storage version (adding offset index). This may take a while.')
-
-        offs = 0
-        cursha = b''
-
-        # TODO: need LMDB to support getting value size without getting value
-        for lkey, byts in self.blobslab.scanByFull(db=self.blobs):
-
-            await asyncio.sleep(0)
-
-            blobsha = lkey[:32]
-
-            if blobsha != cursha:
-                offs = 0
-                cursha = blobsha
-
-            offs += len(byts)
+        self.byterange = self.blobstor.byterange
 
-            self.blobslab.put(cursha + offs.to_bytes(8, 'big'), lkey[32:], db=self.offsets)
-
-        return self._setStorVers(1)
-
-    def _getStorVers(self):
-        byts = self.blobslab.get(b'version', db=self.metadata)
-        if not byts:
-            return 0
-        return int.from_bytes(byts, 'big')
-
-    def _setStorVers(self, version):
-        self.blobslab.put(b'version', version.to_bytes(8, 'big'), db=self.metadata)
-        return version
+        if isinstance(self.blobstor, LmdbBlobStor):
+            self.blobslab = self.blobstor.slab
+            self.blobs = self.blobstor.blobs
+            self.offsets = self.blobstor.offsets
+            self.metadata = self.blobstor.metadata
 
     def _initAxonHttpApi(self):
         self.addHttpApi('/api/v1/axon/files/del', AxonHttpDelV1, {'cell': self})
@@ -1095,8 +1516,7 @@ class Axon(s_cell.Cell):
                 await asyncio.sleep(0)
 
     async def _get(self, sha256):
-
-        for _, byts in self.blobslab.scanByPref(sha256, db=self.blobs):
+        async for byts in self.blobstor.get(sha256):
             yield byts
 
     async def put(self, byts):
@@ -1208,9 +1628,11 @@ class Axon(s_cell.Cell):
         hashset = s_hashset.HashSet()
 
         async for byts in self._get(sha256):
-            hashset.update(byts)
+            await hashset.aupdate(byts)
             await asyncio.sleep(0)
 
+        await hashset.wait()
+
         return dict([(n, s_common.ehex(h)) for (n, h) in hashset.digests()])
 
     async def metrics(self):
@@ -1220,7 +1642,10 @@ class Axon(s_cell.Cell):
         Returns:
             dict: A dictionary of runtime data about the Axon.
         '''
-        return self.axonmetrics.pack()
+        retn = self.axonmetrics.pack()
+        if self.blobstor is not None:
+            retn.update(self.blobstor.getMetrics())
+        return retn
 
     async def save(self, sha256, genr, size):
         '''
@@ -1266,6 +1691,8 @@ class Axon(s_cell.Cell):
         if byts is not None:
             return False
 
+        await self._commitBlobByts(sha256, size)
+
         tick = info.get('tick')
         self._addSyncItem((sha256, size), tick=tick)
 
@@ -1288,58 +1715,22 @@ class Axon(s_cell.Cell):
 
         return size
 
+    async def _commitBlobByts(self, sha256, size):
+        # implementations which override _initBlobStor may not use a blob store
+        if self.blobstor is not None:
+            await self.blobstor.commit(sha256, size)
+
     # a nexusified way to save local bytes
     @s_nexus.Pusher.onPushAuto('axon:bytes:add')
     async def _axonBytsSave(self, sha256, indx, offs, byts):
-        ikey = indx.to_bytes(8, 'big')
-        okey = offs.to_bytes(8, 'big')
-
-        self.blobslab.put(sha256 + ikey, byts, db=self.blobs)
-        self.blobslab.put(sha256 + okey, ikey, db=self.offsets)
-
-    def _offsToIndx(self, sha256, offs):
-        lkey = sha256 + offs.to_bytes(8, 'big')
-        for offskey, indxbyts in self.blobslab.scanByRange(lkey, db=self.offsets):
-            return int.from_bytes(offskey[32:], 'big'), indxbyts
-
-    async def _getBytsOffs(self, sha256, offs):
-
-        first = True
-
-        boff, indxbyts = self._offsToIndx(sha256, offs)
-
-        for bkey, byts in self.blobslab.scanByRange(sha256 + indxbyts, db=self.blobs):
-
-            await asyncio.sleep(0)
-
-            if bkey[:32] != sha256:
-                return
-
-            if first:
-                first = False
-                delt = boff - offs
-                yield byts[-delt:]
-                continue
-
-            yield byts
+        await self.blobstor.save(sha256, indx, offs, byts)
 
     async def _getBytsOffsSize(self, sha256, offs, size):
         '''
         Implementation dependent method to stream size # of bytes from the Axon,
         starting a given offset.
         '''
-        # This implementation assumes that the offs provided is < the maximum
-        # size of the sha256 value being asked for.
-        remain = size
-        async for byts in self._getBytsOffs(sha256, offs):
-
-            blen = len(byts)
-            if blen >= remain:
-                yield byts[:remain]
-                return
-
-            remain -= blen
-
+        async for byts in self.blobstor.getOffsSize(sha256, offs, size):
             yield byts
 
     async def dels(self, sha256s):
@@ -1388,16 +1779,7 @@ class Axon(s_cell.Cell):
             return True
 
     async def _delBlobByts(self, sha256):
-
-        # remove the offset indexes...
-        for lkey in self.blobslab.scanKeysByPref(sha256, db=self.blobs):
-            self.blobslab.delete(lkey, db=self.offsets)
-            await asyncio.sleep(0)
-
-        # remove the actual blobs...
-        for lkey in self.blobslab.scanKeysByPref(sha256, db=self.blobs):
-            self.blobslab.delete(lkey, db=self.blobs)
-            await asyncio.sleep(0)
+        await self.blobstor.delete(sha256)
 
     async def wants(self, sha256s):
         '''
@@ -1840,11 +2222,13 @@ class Axon(s_cell.Cell):
 
                     async with await self.upload() as upload:
                         async for byts in resp.content.iter_chunked(CHUNK_SIZE):
+                            await hashset.aupdate(byts)
                             await upload.write(byts)
-                            hashset.update(byts)
 
                         size, _ = await upload.save()
 
+                    await hashset.wait()
+
                     info['size'] = size
                     info['hashes'] = dict([(n, s_common.ehex(h)) for (n, h) in hashset.digests()])
                     return info
@@ -1,5 +1,6 @@
 import os
 import copy
+import time
 import regex
 import asyncio
 import logging
@@ -20,6 +21,7 @@ import synapse.lib.base as s_base
 import synapse.lib.cell as s_cell
 import synapse.lib.chop as s_chop
 import synapse.lib.coro as s_coro
+import synapse.lib.snap as s_snap
 import synapse.lib.view as s_view
 import synapse.lib.cache as s_cache
 import synapse.lib.const as s_const
@@ -41,10 +43,12 @@ import synapse.lib.schemas as s_schemas
 import synapse.lib.spooled as s_spooled
 import synapse.lib.version as s_version
 import synapse.lib.urlhelp as s_urlhelp
+import synapse.lib.columnar as s_columnar
 import synapse.lib.hashitem as s_hashitem
 import synapse.lib.jsonstor as s_jsonstor
 import synapse.lib.modelrev as s_modelrev
 import synapse.lib.stormsvc as s_stormsvc
+import synapse.lib.stormpool as s_stormpool
 import synapse.lib.lmdbslab as s_lmdbslab
 
 import synapse.lib.crypto.rsa as s_rsa
@@ -121,6 +125,10 @@ SYNC_LAYR_DEL = 4   # A layer was deleted
 
 MAX_NEXUS_DELTA = 3_600
 
+SODE_BATCH_SIZE = 256  # The number of buids to resolve per layer at once when merging lifts
+
+BULK_CHUNK_SIZE = 1000  # The number of nodes per layer edit batch in addNodesBulk()
+
 reqValidTagModel = s_config.getJsValidator({
     'type': 'object',
     'properties': {
@@ -244,6 +252,18 @@ class CoreApi(s_cell.CellApi):
         '''
         return await self.cell.getCoreInfoV2()
 
+    async def getNodeCacheInfo(self):
+        '''
+        Return the size and hit/miss counters for the node cache shared by read-only views.
+        '''
+        return await self.cell.getNodeCacheInfo()
+
+    async def getStormQueryCacheInfo(self):
+        '''
+        Return the size and hit/miss counters for the compiled Storm query cache.
+        '''
+        return await self.cell.getStormQueryCacheInfo()
+
     @s_cell.adminapi()
     async def saveLayerNodeEdits(self, layriden, edits, meta):
         return await self.cell.saveLayerNodeEdits(layriden, edits, meta)
@@ -277,6 +297,21 @@ class CoreApi(s_cell.CellApi):
         async for pode in self.cell.exportStorm(text, opts=opts):
             yield pode
 
+    async def exportStormCols(self, text, cols, opts=None):
+        '''
+        Execute a storm query and yield dictionary encoded column batches.
+
+        Args:
+            text (str): The storm query text.
+            cols (list): A list of column names such as ``iden``, ``valu``, ``:asn`` or ``#foo``.
+            opts (dict): Storm runtime query option params.
+
+        NOTE: See synapse.lib.columnar for details on the message format.
+        '''
+        opts = self._reqValidStormOpts(opts)
+        async for mesg in self.cell.exportStormCols(text, cols, opts=opts):
+            yield mesg
+
     async def feedFromAxon(self, sha256, opts=None):
         '''
         Import a msgpack .nodes file from the axon.
@@ -370,6 +405,15 @@ class CoreApi(s_cell.CellApi):
             snap.strict = False
             await snap.addFeedData(name, items)
 
+    @s_cell.adminapi(log=True)
+    async def addNodesBulk(self, items, *, viewiden=None):
+        '''
+        Add pre-normalized nodes in bulk, bypassing node edit permissions and triggers.
+
+        NOTE: See Cortex.addNodesBulk() for details on the item format.
+        '''
+        return await self.cell.addNodesBulk(items, viewiden=viewiden, user=self.user)
+
     async def count(self, text, opts=None):
         '''
         Count the number of nodes which result from a storm query.
@@ -845,6 +889,24 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             'type': 'boolean',
             'hideconf': True,
         },
+        'node:cache:size': {
+            'default': 64 * s_const.mebibyte,
+            'description': 'The maximum estimated size in bytes of the node cache shared by the snaps of read-only views.',
+            'type': 'integer',
+            'minimum': 0,
+        },
+        'storm:query:cache:size': {
+            'default': 256 * s_const.mebibyte,
+            'description': 'The maximum estimated size in bytes of the cache of compiled Storm queries.',
+            'type': 'integer',
+            'minimum': 0,
+        },
+        'snap:cache:size': {
+            'default': 256 * s_const.mebibyte,
+            'description': 'The maximum estimated size in bytes of the recently used nodes kept alive by each snap.',
+            'type': 'integer',
+            'minimum': 0,
+        },
         'max:nodes': {
             'description': 'Maximum number of nodes which are allowed to be stored in a Cortex.',
             'type': 'integer',
@@ -923,6 +985,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         self.maxnodes = self.conf.get('max:nodes')
         self.nodecount = 0
 
+        self.nodecache = s_snap.NodeCache(self.conf.get('node:cache:size'))
+
         self.migration = False
         self._migration_lock = asyncio.Lock()
 
@@ -943,11 +1007,13 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         self.tagvalid = s_cache.FixedCache(self._isTagValid, size=1000)
         self.tagprune = s_cache.FixedCache(self._getTagPrune, size=1000)
 
-        self.querycache = s_cache.FixedCache(self._getStormQuery, size=10000)
+        self.querycache = s_cache.SizedCache(self._getStormQuery, self._getStormQuerySize,
+                                             self.conf.get('storm:query:cache:size'))
 
         self.stormpool = None
         self.stormpoolurl = None
         self.stormpoolopts = None
+        self.stormpoolrouter = None
 
         self.libroot = (None, {}, {})
         self.stormlibs = []
@@ -1726,6 +1792,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
             self.stormpoolurl = url
             self.stormpoolopts = opts
+            self.stormpoolrouter = s_stormpool.StormPoolRouter(opts)
 
             async def onlink(proxy, urlinfo):
                 _url = s_urlhelp.sanitizeUrl(s_telepath.zipurl(urlinfo))
@@ -1751,6 +1818,28 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             return None
         return s_msgpack.un(byts)
 
+    async def getStormPoolStats(self):
+        '''
+        Return the load statistics for the mirrors in the Storm pool.
+
+        Returns:
+            list: A list of dictionaries for each mirror which has been used or is
+            currently available, or None if there is no Storm pool.
+        '''
+        if self.stormpool is None:
+            return None
+
+        online = set(s_stormpool.getMirrorName(proxy) for proxy in self.stormpool.proxies)
+        for name in online:
+            if name != self.ahasvcname:
+                self.stormpoolrouter.getStats(name)
+
+        retn = self.stormpoolrouter.pack()
+        for info in retn:
+            info['online'] = info['name'] in online
+
+        return retn
+
     @s_nexus.Pusher.onPushAuto('storm:pool:set')
     async def setStormPool(self, url, opts):
 
@@ -2386,15 +2475,28 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         #       the cluster case to minimize round trips
         return [await layr.getStorNode(buid) for layr in layers]
 
-    async def _genSodeList(self, buid, sodes, layers, filtercmpr=None):
+    async def _getStorNodesBatch(self, buids, layers):
+        # NOTE: Batched version of _getStorNodes() which returns
+        #       a list of per-layer sode lists in buid order.
+        bylayer = [await layr.getStorNodesBatch(buids) for layr in layers]
+        return [list(sodes) for sodes in zip(*bylayer)]
+
+    async def _genSodeList(self, buid, sodes, layers, filtercmpr=None, fetched=None):
         sodelist = []
 
+        async def getsode(layr):
+            if fetched is not None:
+                sode = fetched.get(layr.iden, {}).get(buid)
+                if sode is not None:
+                    return sode
+            return await layr.getStorNode(buid)
+
         if filtercmpr is not None:
             filt = True
             for layr in layers[-1::-1]:
                 sode = sodes.get(layr.iden)
                 if sode is None:
-                    sode = await layr.getStorNode(buid)
+                    sode = await getsode(layr)
                     if filt and filtercmpr(sode):
                         return
                 else:
@@ -2406,28 +2508,45 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         for layr in layers:
             sode = sodes.get(layr.iden)
             if sode is None:
-                sode = await layr.getStorNode(buid)
+                sode = await getsode(layr)
             sodelist.append((layr.iden, sode))
 
         return (buid, sodelist)
 
+    async def _genSodeLists(self, chunk, layers, filtercmpr=None):
+        # resolve the sodes which were not produced by the lift in one batch per layer
+        fetched = {}
+        for layr in layers:
+            buids = [buid for (buid, sodes) in chunk if layr.iden not in sodes]
+            if buids:
+                fetched[layr.iden] = dict(zip(buids, await layr.getStorNodesBatch(buids)))
+
+        for buid, sodes in chunk:
+            sodelist = await self._genSodeList(buid, sodes, layers, filtercmpr, fetched=fetched)
+            if sodelist is not None:
+                yield sodelist
+
     async def _mergeSodes(self, layers, genrs, cmprkey, filtercmpr=None, reverse=False):
+        chunk = []
         lastbuid = None
         sodes = {}
         async for layr, (_, buid), sode in s_common.merggenr2(genrs, cmprkey, reverse=reverse):
             if not buid == lastbuid or layr in sodes:
                 if lastbuid is not None:
-                    sodelist = await self._genSodeList(lastbuid, sodes, layers, filtercmpr)
-                    if sodelist is not None:
-                        yield sodelist
-                    sodes.clear()
+                    chunk.append((lastbuid, sodes))
+                    if len(chunk) >= SODE_BATCH_SIZE:
+                        async for sodelist in self._genSodeLists(chunk, layers, filtercmpr):
+                            yield sodelist
+                        chunk = []
+                    sodes = {}
                 lastbuid = buid
             sodes[layr] = sode
 
         if lastbuid is not None:
-            sodelist = await self._genSodeList(lastbuid, sodes, layers, filtercmpr)
-            if sodelist is not None:
-                yield sodelist
+            chunk.append((lastbuid, sodes))
+
+        async for sodelist in self._genSodeLists(chunk, layers, filtercmpr):
+            yield sodelist
 
     async def _liftByDataName(self, name, layers):
         if len(layers) == 1:
@@ -4783,6 +4902,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         self.addHttpApi('/api/v1/storm/call', s_httpapi.StormCallV1, {'cell': self})
         self.addHttpApi('/api/v1/storm/nodes', s_httpapi.StormNodesV1, {'cell': self})
         self.addHttpApi('/api/v1/storm/export', s_httpapi.StormExportV1, {'cell': self})
+        self.addHttpApi('/api/v1/storm/export/cols', s_httpapi.StormExportColsV1, {'cell': self})
         self.addHttpApi('/api/v1/reqvalidstorm', s_httpapi.ReqValidStormV1, {'cell': self})
 
         self.addHttpApi('/api/v1/storm/vars/set', s_httpapi.StormVarsSetV1, {'cell': self})
@@ -5344,6 +5464,9 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
         self.layerdefs.pop(iden)
 
+        # cached nodes may include data joined from the deleted layer
+        self.nodecache.clear()
+
         await layr.delete()
 
         layr.deloffs = nexsitem[0]
@@ -5595,6 +5718,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         self.layers[layr.iden] = layr
         self.dynitems[layr.iden] = layr
 
+        layr.on('layer:write', self._onLayrWriteNodeCache)
+
         if self.maxnodes:
             counts = await layr.getFormCounts()
             self.nodecount += sum(counts.values())
@@ -5619,6 +5744,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
         return layr
 
+    def _onLayrWriteNodeCache(self, mesg):
+        for nodeedit in mesg[1].get('edits'):
+            self.nodecache.pop(nodeedit[0])
+
     async def _ctorLayr(self, layrinfo):
         '''
         Actually construct the Layer instance for the given HiveDict.
@@ -6154,10 +6283,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         opts = self._initStormOpts(opts)
 
         if self.stormpool is not None and opts.get('mirror', True):
-            proxy = await self._getMirrorProxy(opts)
+            proxy = await self._getMirrorProxy(opts, text=text)
 
             if proxy is not None:
-                proxname = proxy._ahainfo.get('name')
+                proxname = s_stormpool.getMirrorName(proxy)
                 extra = await self.getLogExtra(mirror=proxname, hash=s_storm.queryhash(text))
                 logger.info(f'Offloading Storm query to mirror {proxname}.', extra=extra)
 
@@ -6167,7 +6296,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    return await proxy.count(text, opts=mirropts)
+                    with self.stormpoolrouter.track(proxname):
+                        return await proxy.count(text, opts=mirropts)
 
                 except s_exc.TimeOut:
                     mesg = 'Timeout waiting for query mirror, running locally instead.'
@@ -6192,7 +6322,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         mirropts['nexstimeout'] = self.stormpoolopts.get('timeout:sync')
         return mirropts
 
-    async def _getMirrorProxy(self, opts):
+    async def _getMirrorProxy(self, opts, text=None):
 
         if self.stormpool is None:  # pragma: no cover
             return None
@@ -6204,25 +6334,41 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
         timeout = self.stormpoolopts.get('timeout:connection')
 
-        for _ in range(size):
-
-            try:
-                proxy = await self.stormpool.proxy(timeout=timeout)
+        try:
+            await self.stormpool.waitready(timeout=timeout)
+        except TimeoutError:
+            logger.warning('Timeout waiting for pool mirror proxy.')
+            return None
 
-                proxyname = proxy._ahainfo.get('name')
-                if proxyname is not None and proxyname == self.ahasvcname:
-                    # we are part of the pool and were selected. Skip.
-                    continue
+        proxies = {}
+        for proxy in self.stormpool.proxies:
 
-            except TimeoutError:
-                logger.warning('Timeout waiting for pool mirror proxy.')
+            proxyname = s_stormpool.getMirrorName(proxy)
+            if proxyname == self.ahasvcname:
+                # we are part of the pool. Skip.
                 continue
 
+            proxies[proxyname] = proxy
+
+        for proxyname in self.stormpoolrouter.order(proxies.keys(), text=text):
+
+            proxy = proxies[proxyname]
+
+            # count the mirror as loaded while checking the offset so
+            # concurrent queries do not all select the same mirror
+            stats = self.stormpoolrouter.getStats(proxyname)
+            stats.lastused = time.monotonic()
+            stats.inflight += 1
+
             try:
 
                 curoffs = opts.setdefault('nexsoffs', await self.getNexsIndx() - 1)
                 miroffs = await s_common.wait_for(proxy.getNexsIndx(), timeout) - 1
-                if (delta := curoffs - miroffs) <= MAX_NEXUS_DELTA:
+
+                delta = curoffs - miroffs
+                self.stormpoolrouter.setNexsLag(proxyname, delta)
+
+                if delta <= MAX_NEXUS_DELTA:
                     return proxy
 
                 mesg = f'Pool mirror [{proxyname}] is too far out of sync. Skipping.'
@@ -6240,6 +6386,9 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mesg = f'Timeout waiting for pool mirror [{proxyname}] Nexus offset.'
                 logger.warning(mesg, extra=await self.getLogExtra(mirror=proxyname))
 
+            finally:
+                stats.inflight -= 1
+
         logger.warning('Pool members exhausted. Running query locally.', extra=await self.getLogExtra())
         return None
 
@@ -6248,10 +6397,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         opts = self._initStormOpts(opts)
 
         if self.stormpool is not None and opts.get('mirror', True):
-            proxy = await self._getMirrorProxy(opts)
+            proxy = await self._getMirrorProxy(opts, text=text)
 
             if proxy is not None:
-                proxname = proxy._ahainfo.get('name')
+                proxname = s_stormpool.getMirrorName(proxy)
                 extra = await self.getLogExtra(mirror=proxname, hash=s_storm.queryhash(text))
                 logger.info(f'Offloading Storm query to mirror {proxname}.', extra=extra)
 
@@ -6261,8 +6410,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    async for mesg in proxy.storm(text, opts=mirropts):
-                        yield mesg
+                    with self.stormpoolrouter.track(proxname) as query:
+                        async for mesg in proxy.storm(text, opts=mirropts):
+                            query.onResult()
+                            yield mesg
                     return
 
                 except s_exc.TimeOut:
@@ -6282,10 +6433,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         opts = self._initStormOpts(opts)
 
         if self.stormpool is not None and opts.get('mirror', True):
-            proxy = await self._getMirrorProxy(opts)
+            proxy = await self._getMirrorProxy(opts, text=text)
 
             if proxy is not None:
-                proxname = proxy._ahainfo.get('name')
+                proxname = s_stormpool.getMirrorName(proxy)
                 extra = await self.getLogExtra(mirror=proxname, hash=s_storm.queryhash(text))
                 logger.info(f'Offloading Storm query to mirror {proxname}.', extra=extra)
 
@@ -6295,7 +6446,8 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    return await proxy.callStorm(text, opts=mirropts)
+                    with self.stormpoolrouter.track(proxname):
+                        return await proxy.callStorm(text, opts=mirropts)
                 except s_exc.TimeOut:
                     mesg = 'Timeout waiting for query mirror, running locally instead.'
                     logger.warning(mesg, extra=extra)
@@ -6312,10 +6464,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         opts = self._initStormOpts(opts)
 
         if self.stormpool is not None and opts.get('mirror', True):
-            proxy = await self._getMirrorProxy(opts)
+            proxy = await self._getMirrorProxy(opts, text=text)
 
             if proxy is not None:
-                proxname = proxy._ahainfo.get('name')
+                proxname = s_stormpool.getMirrorName(proxy)
                 extra = await self.getLogExtra(mirror=proxname, hash=s_storm.queryhash(text))
                 logger.info(f'Offloading Storm query to mirror {proxname}.', extra=extra)
 
@@ -6325,8 +6477,10 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
                 mirropts['_loginfo']['pool:from'] = self.ahasvcname
 
                 try:
-                    async for mesg in proxy.exportStorm(text, opts=mirropts):
-                        yield mesg
+                    with self.stormpoolrouter.track(proxname) as query:
+                        async for mesg in proxy.exportStorm(text, opts=mirropts):
+                            query.onResult()
+                            yield mesg
                     return
 
                 except s_exc.TimeOut:
@@ -6377,6 +6531,76 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             size, sha256 = await fd.save()
             return (size, s_common.ehex(sha256))
 
+    async def exportStormCols(self, text, cols, opts=None):
+
+        opts = self._initStormOpts(opts)
+
+        # validate the column names before running the query
+        batch = s_columnar.ColumnBatch(cols)
+
+        if self.stormpool is not None and opts.get('mirror', True):
+            proxy = await self._getMirrorProxy(opts, text=text)
+
+            if proxy is not None:
+                proxname = s_stormpool.getMirrorName(proxy)
+                extra = await self.getLogExtra(mirror=proxname, hash=s_storm.queryhash(text))
+                logger.info(f'Offloading Storm query to mirror {proxname}.', extra=extra)
+
+                mirropts = await self._getMirrorOpts(opts)
+
+                mirropts.setdefault('_loginfo', {})
+                mirropts['_loginfo']['pool:from'] = self.ahasvcname
+
+                try:
+                    with self.stormpoolrouter.track(proxname) as query:
+                        async for mesg in proxy.exportStormCols(text, cols, opts=mirropts):
+                            query.onResult()
+                            yield mesg
+                    return
+
+                except s_exc.TimeOut:
+                    mesg = 'Timeout waiting for query mirror, running locally instead.'
+                    logger.warning(mesg, extra=extra)
+
+        if (nexsoffs := opts.get('nexsoffs')) is not None:
+            if not await self.waitNexsOffs(nexsoffs, timeout=opts.get('nexstimeout')):
+                raise s_exc.TimeOut(mesg=f'Timeout waiting for nexus offset {nexsoffs} in exportStormCols().')
+
+        user = self._userFromOpts(opts)
+        view = self._viewFromOpts(opts)
+
+        taskinfo = {'query': text, 'view': view.iden}
+        taskiden = opts.get('task')
+        await self.boss.promote('storm:export:cols', user=user, info=taskinfo, taskiden=taskiden)
+
+        yield ('cols', {'cols': batch.cols, 'version': s_columnar.VERSION})
+
+        rows = 0
+        with s_scope.enter({'user': user}):
+
+            async with await self.snap(user=user, view=view) as snap:
+
+                async for node, path in snap.storm(text, opts=opts):
+
+                    batch.add(node)
+                    if batch.size >= s_columnar.BATCH_SIZE:
+                        rows += batch.size
+                        yield batch.pack()
+                        batch.clear()
+
+        if batch.size:
+            rows += batch.size
+            yield batch.pack()
+
+        yield ('fini', {'rows': rows})
+
+    async def exportStormColsToAxon(self, text, cols, opts=None):
+        async with await self.axon.upload() as fd:
+            async for mesg in self.exportStormCols(text, cols, opts=opts):
+                await fd.write(s_msgpack.en(mesg))
+            size, sha256 = await fd.save()
+            return (size, s_common.ehex(sha256))
+
     async def feedFromAxon(self, sha256, opts=None):
 
         opts = self._initStormOpts(opts)
@@ -6442,7 +6666,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
     async def _getStormEval(self, text):
         try:
-            astvalu = copy.deepcopy(await s_parser.evalcache.aget(text))
+            astvalu = await s_parser.evalcache.aget(text)
         except s_exc.FatalErr:
             logger.exception(f'Fatal error while parsing [{text}]', extra={'synapse': {'text': text}})
             await self.fini()
@@ -6452,7 +6676,7 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
 
     async def _getStormQuery(self, args):
         try:
-            query = copy.deepcopy(await s_parser.querycache.aget(args))
+            query = await s_parser.querycache.aget(args)
         except s_exc.FatalErr:
             logger.exception(f'Fatal error while parsing [{args}]', extra={'synapse': {'text': args[0]}})
             await self.fini()
@@ -6461,7 +6685,17 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
         await asyncio.sleep(0)
         return query
 
+    def _getStormQuerySize(self, args, query):
+        return len(args[0]) + query.getAstSize()
+
     async def getStormQuery(self, text, mode='storm'):
+        '''
+        Return a compiled Storm query from the query cache.
+
+        Notes:
+            The returned query is shared by all runtimes executing the same
+            text and mode and must not be modified.
+        '''
         return await self.querycache.aget((text, mode))
 
     @contextlib.asynccontextmanager
@@ -6543,6 +6777,26 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             'stormdocs': await self.getStormDocs(),
         }
 
+    async def getCellInfo(self):
+        info = await s_cell.Cell.getCellInfo(self)
+        info['cortex'] = {
+            'nodecache': self.nodecache.pack(),
+            'querycache': self.querycache.pack(),
+        }
+        return info
+
+    async def getNodeCacheInfo(self):
+        '''
+        Return the size and hit/miss counters for the node cache shared by read-only views.
+        '''
+        return self.nodecache.pack()
+
+    async def getStormQueryCacheInfo(self):
+        '''
+        Return the size and hit/miss counters for the compiled Storm query cache.
+        '''
+        return self.querycache.pack()
+
     async def getStormDocs(self):
         '''
         Get a struct containing the Storm Types documentation.
@@ -6597,6 +6851,292 @@ class Cortex(s_oauth.OAuthMixin, s_cell.Cell):  # type: ignore
             async for node in snap.addNodes(nodedefs):
                 yield node
 
+    async def addNodesBulk(self, items, *, viewiden=None, user=None, chunksize=BULK_CHUNK_SIZE):
+        '''
+        Add pre-normalized nodes to the write layer of a view in bulk.
+
+        Args:
+            items (list): A list of ((form, valu), {'props': {}, 'tags': {}, 'tagprops': {}}) tuples with normalized values.
+            viewiden (str): The iden of a view to use.
+                If a view is not specified, the default view is used.
+            user (User): The user to record in the edit metadata. Defaults to root.
+            chunksize (int): The number of nodes to save per layer edit batch.
+
+        Notes:
+            Items use the node definition format of addNodes() rather than
+            (buid, form, edits) node edits, so each item can be validated
+            against the data model and existing values can be skipped before
+            the edits are generated.
+
+            The "tagprops" of an item map a tag to a dictionary of tag
+            property values, as in a packed node. Setting a tag property
+            also sets its tag if the tag is not already present.
+
+            Forms, props, tags and tag props are validated against the data
+            model once per batch and values are checked against their types
+            once per distinct value, but values are not normalized and nodes
+            referenced by props are not created. Read-only props may not be
+            changed. Missing tag nodes are created. Existing values are
+            resolved with batched storage node lookups and only the remaining
+            edits are saved directly to the write layer, so triggers do not
+            fire.
+
+        Returns:
+            dict: A dictionary of ingest statistics including the rate in nodes/sec.
+        '''
+        tick = time.perf_counter()
+
+        view = self.getView(viewiden)
+        if view is None:
+            raise s_exc.NoSuchView(mesg=f'No such view iden={viewiden}', iden=viewiden)
+
+        if user is None:
+            user = self.auth.rootuser
+
+        # merge items by buid and collect the names to validate
+        nodes = {}
+        propnames = collections.defaultdict(set)
+        tagnames = set()
+        tagpropnames = set()
+
+        for (formname, valu), info in items:
+
+            buid = s_common.buid((formname, valu))
+
+            node = nodes.get(buid)
+            if node is None:
+                node = nodes[buid] = (formname, valu, {}, {}, {})
+
+            props = info.get('props', {})
+            node[2].update(props)
+            propnames[formname].update(props.keys())
+
+            tags = info.get('tags', {})
+            node[3].update(tags)
+            tagnames.update(tags.keys())
+
+            for tag, tagprops in info.get('tagprops', {}).items():
+                node[3].setdefault(tag, (None, None))
+                node[4].setdefault(tag, {}).update(tagprops)
+                tagnames.add(tag)
+                tagpropnames.update(tagprops.keys())
+
+        roprops = set()
+        stortypes = {}
+        for formname, names in propnames.items():
+
+            form = self.model.form(formname)
+            if form is None:
+                raise s_exc.NoSuchForm.init(formname)
+
+            if form.isrunt:
+                raise s_exc.IsRuntForm(mesg=f'Cannot make runt nodes: {formname}.', form=formname)
+
+            if form.locked:
+                mesg = f'Form {form.full} is locked due to deprecation.'
+                raise s_exc.IsDeprLocked(mesg=mesg, prop=form.full)
+
+            stortypes[(formname, None)] = form.type.stortype
+
+            for name in names:
+
+                prop = form.props.get(name)
+                if prop is None:
+                    raise s_exc.NoSuchProp.init(f'{formname}:{name}')
+
+                if prop.locked:
+                    mesg = f'Prop {prop.full} is locked due to deprecation.'
+                    raise s_exc.IsDeprLocked(mesg=mesg, prop=prop.full)
+
+                stortypes[(formname, name)] = prop.type.stortype
+
+                if prop.info.get('ro'):
+                    roprops.add((formname, name))
+
+        for name in tagpropnames:
+
+            prop = self.model.getTagProp(name)
+            if prop is None:
+                raise s_exc.NoSuchTagProp(mesg=f'No tag property named {name}.', name=name)
+
+            if prop.locked:
+                raise s_exc.IsDeprLocked(mesg=f'Tagprop {name} is locked.', prop=name)
+
+        # values are validated once per distinct value of each form and prop
+        normvals = set()
+
+        def reqNormValu(full, typeobj, valu):
+
+            key = (full, valu)
+            try:
+                if key in normvals:
+                    return
+            except TypeError:
+                key = None
+
+            try:
+                norm, _ = typeobj.norm(valu)
+            except s_exc.BadTypeValu as e:
+                e.update({'prop': full, 'mesg': f'Bad value {full}={valu!r} : {e.get("mesg")}'})
+                raise e
+
+            if norm != valu:
+                mesg = f'Value {full}={valu!r} is not normalized.'
+                raise s_exc.BadTypeValu(mesg=mesg, prop=full, valu=valu)
+
+            if key is not None:
+                normvals.add(key)
+
+        for formname, valu, props, tags, tagprops in nodes.values():
+
+            form = self.model.form(formname)
+            reqNormValu(formname, form.type, valu)
+
+            for name, pval in props.items():
+                prop = form.props.get(name)
+                reqNormValu(prop.full, prop.type, pval)
+
+            for tprops in tagprops.values():
+                for name, pval in tprops.items():
+                    prop = self.model.getTagProp(name)
+                    reqNormValu(name, prop.type, pval)
+
+        # resolve each tag to the list of tags to set including its parents
+        tagtype = self.model.type('syn:tag')
+        realtags = {}
+
+        async with await self.snap(user=user, view=view) as snap:
+
+            for tag in tagnames:
+
+                norm, _ = tagtype.norm(tag)
+                if norm != tag:
+                    raise s_exc.BadTypeValu(mesg=f'Tag {tag} is not normalized.', name='syn:tag', valu=tag)
+
+                tagnode = await snap.getTagNode(norm)
+                if tagnode is s_common.novalu:
+                    tagnode = await snap.addNode('syn:tag', norm)
+
+                toks = tagnode.ndef[1].split('.')
+                realtags[tag] = ['.'.join(toks[:i + 1]) for i in range(len(toks))]
+
+        ivaltype = self.model.type('ival')
+        ivals = {(None, None): (None, None)}
+
+        def normival(valu):
+            valu = tuple(valu)
+            norm = ivals.get(valu)
+            if norm is None:
+                norm = ivals[valu] = ivaltype.norm(valu)[0]
+            return norm
+
+        def getSodeValu(sodes, name, key):
+            for sode in sodes:
+                valu = sode.get(name, {}).get(key)
+                if valu is not None:
+                    return valu
+
+        def getSodeTagProp(sodes, tag, name):
+            for sode in sodes:
+                valu = sode.get('tagprops', {}).get(tag, {}).get(name)
+                if valu is not None:
+                    return valu
+
+        wlyr = view.layers[0]
+
+        added = 0
+        edited = 0
+        buids = list(nodes.keys())
+
+        for offs in range(0, len(buids), chunksize):
+
+            chunk = buids[offs:offs + chunksize]
+            sodelists = await self._getStorNodesBatch(chunk, view.layers)
+
+            newcount = 0
+            nodeedits = []
+
+            for buid, sodes in zip(chunk, sodelists):
+
+                formname, valu, props, tags, tagprops = nodes[buid]
+
+                edits = []
+
+                if not any(sode.get('valu') for sode in sodes):
+                    newcount += 1
+                    edits.append((s_layer.EDIT_NODE_ADD, (valu, stortypes[(formname, None)]), ()))
+
+                for name, pval in props.items():
+
+                    curv = getSodeValu(sodes, 'props', name)
+                    if curv is not None:
+
+                        if curv[0] == pval:
+                            continue
+
+                        if (formname, name) in roprops:
+                            mesg = f'Property is read only: {formname}:{name}.'
+                            raise s_exc.ReadOnlyProp(mesg=mesg, prop=f'{formname}:{name}')
+
+                    edits.append((s_layer.EDIT_PROP_SET, (name, pval, None, stortypes[(formname, name)]), ()))
+
+                tagedits = {}
+                for tag, tval in tags.items():
+
+                    *parents, realtag = realtags[tag]
+
+                    for name in parents:
+                        if name not in tagedits and getSodeValu(sodes, 'tags', name) is None:
+                            tagedits[name] = (None, None)
+
+                    tval = normival(tval)
+
+                    curv = getSodeValu(sodes, 'tags', realtag)
+                    if curv == tval or (curv is not None and tval == (None, None)):
+                        continue
+
+                    tagedits[realtag] = tval
+
+                for name, tval in tagedits.items():
+                    edits.append((s_layer.EDIT_TAG_SET, (name, tval, None), ()))
+
+                for tag, tprops in tagprops.items():
+
+                    realtag = realtags[tag][-1]
+
+                    for name, pval in tprops.items():
+
+                        curv = getSodeTagProp(sodes, realtag, name)
+                        if curv is not None and curv[0] == pval:
+                            continue
+
+                        stortype = self.model.getTagProp(name).type.stortype
+                        edits.append((s_layer.EDIT_TAGPROP_SET, (realtag, name, pval, None, stortype), ()))
+
+                if edits:
+                    nodeedits.append((buid, formname, edits))
+
+            if nodeedits:
+                self._checkMaxNodes(delta=newcount)
+
+                meta = {'time': s_common.now(), 'user': user.iden}
+                await wlyr.saveNodeEdits(nodeedits, meta)
+
+                added += newcount
+                edited += len(nodeedits)
+
+            await asyncio.sleep(0)
+
+        took = time.perf_counter() - tick
+
+        return {
+            'nodes': len(nodes),
+            'added': added,
+            'edited': edited,
+            'took': int(took * 1000),
+            'rate': len(nodes) / took if took else 0.0,
+        }
+
     async def addFeedData(self, name, items, *, viewiden=None):
         '''
         Add data using a feed/parser function.
@@ -8,6 +8,7 @@ import synapse.common as s_common
 
 import synapse.lib.base as s_base
 import synapse.lib.cell as s_cell
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.schemas as s_schemas
 import synapse.lib.lmdbslab as s_lmdbslab
 import synapse.lib.slabseqn as s_slabseqn
@@ -15,6 +16,9 @@ import synapse.lib.slaboffs as s_slaboffs
 
 logger = logging.getLogger(__name__)
 
+# the default number of items in each batch yielded by packed()
+PACKED_BATCH = 1000
+
 class TankApi(s_cell.CellApi):
 
     async def slice(self, offs, size=None, wait=False, timeout=None):
@@ -22,6 +26,20 @@ class TankApi(s_cell.CellApi):
         async for item in self.cell.slice(offs, size=size, wait=wait, timeout=timeout):
             yield item
 
+    async def splits(self, count):
+        self.user.confirm(('cryo', 'tank', 'read'), gateiden=self.cell.iden())
+        return self.cell.splits(count)
+
+    async def packed(self, offs, size=None, batch=PACKED_BATCH):
+        self.user.confirm(('cryo', 'tank', 'read'), gateiden=self.cell.iden())
+        async for item in self.cell.packed(offs, size=size, batch=batch):
+            yield item
+
+    async def search(self, name, valu, offs=0, size=None):
+        self.user.confirm(('cryo', 'tank', 'read'), gateiden=self.cell.iden())
+        async for item in self.cell.search(name, valu, offs=offs, size=size):
+            yield item
+
     async def puts(self, items):
         self.user.confirm(('cryo', 'tank', 'put'), gateiden=self.cell.iden())
         return await self.cell.puts(items)
@@ -34,9 +52,24 @@ class TankApi(s_cell.CellApi):
     async def iden(self):
         return self.cell.iden()
 
+def _getItemPath(item, path):
+    for name in path:
+        try:
+            item = item[name]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return item
+
 class CryoTank(s_base.Base):
     '''
     A CryoTank implements a stream of structured data.
+
+    Notes:
+        Secondary indexes may be declared when the tank is created using the
+        ``indexes`` conf option, a dictionary of index names to a list of keys
+        and list offsets used to retrieve the indexed value from each item::
+
+            {'indexes': {'name': [0], 'bar': [1, 'bar']}}
     '''
     async def __anit__(self, dirn, iden, conf=None):
         s_common.deprecated('synapse.cryotank.CryoTank', curv='2.223.0')
@@ -50,13 +83,27 @@ class CryoTank(s_base.Base):
 
         self._iden = iden
 
+        # remaining conf options are slab options
+        slabconf = dict(conf)
+        indexes = slabconf.pop('indexes', None)
+        if indexes is None:
+            indexes = {}
+
+        if not isinstance(indexes, dict) or not all(isinstance(p, (list, tuple)) and p for p in indexes.values()):
+            mesg = 'CryoTank indexes must be a dictionary of names to non-empty lists of keys.'
+            raise s_exc.BadConfValu(mesg=mesg, name='indexes', valu=indexes)
+
         path = s_common.gendir(self.dirn, 'tank.lmdb')
 
-        self.slab = await s_lmdbslab.Slab.anit(path, map_async=True, **conf)
+        self.slab = await s_lmdbslab.Slab.anit(path, map_async=True, **slabconf)
 
         self._items = s_slabseqn.SlabSeqn(self.slab, 'items')
         self._metrics = s_slabseqn.SlabSeqn(self.slab, 'metrics')
 
+        self.indexes = {}
+        for name, idxpath in indexes.items():
+            self.indexes[name] = (tuple(idxpath), self.slab.initdb(f'index:{name}', dupsort=True))
+
         self.onfini(self.slab.fini)
 
     def iden(self):
@@ -83,12 +130,168 @@ class CryoTank(s_base.Base):
         for chunk in s_common.chunks(items, 1000):
             metrics = await self._items.save(chunk)
             self._metrics.add(metrics)
+            if self.indexes:
+                await self._indxItems(metrics['orig'], chunk)
             await self.fire('cryotank:puts', numrecords=len(chunk))
             size += len(chunk)
             await asyncio.sleep(0)
 
         return size
 
+    async def _indxItems(self, indx, items):
+
+        for name, (path, db) in self.indexes.items():
+
+            rows = []
+            for offs, item in enumerate(items, start=indx):
+
+                valu = _getItemPath(item, path)
+                if valu is None:
+                    continue
+
+                rows.append((s_common.buid(valu), s_common.int64en(offs)))
+
+            await self.slab.putmulti(rows, dupdata=True, db=db)
+
+    async def search(self, name, valu, offs=0, size=None):
+        '''
+        Yield items from the CryoTank with the given value for a secondary index.
+
+        Args:
+            name (str): The name of the index.
+            valu (obj): The value to search for.
+            offs (int): The minimum offset of the items to yield.
+            size (int): The max number of items to yield.
+
+        Yields:
+            ((index, object)): Index and item values.
+        '''
+        idef = self.indexes.get(name)
+        if idef is None:
+            mesg = f'CryoTank {self._iden} has no index named {name}.'
+            raise s_exc.NoSuchIndx(mesg=mesg, name=name)
+
+        path, db = idef
+
+        # items are compared encoded since tuples are decoded as lists
+        byts = s_msgpack.en(valu)
+
+        count = 0
+        minindx = s_common.int64en(offs)
+        for _, indxbyts in self.slab.scanByDups(s_common.buid(valu), db=db):
+
+            if indxbyts < minindx:
+                continue
+
+            if size is not None and count >= size:
+                return
+
+            item = self._items.getByIndxByts(indxbyts)
+            if s_msgpack.en(_getItemPath(item, path)) != byts:  # pragma: no cover
+                continue
+
+            yield s_common.int64un(indxbyts), item
+
+            count += 1
+            await asyncio.sleep(0)
+
+    async def cull(self, offs):
+        '''
+        Remove items up to (and including) the given offset and their index rows.
+
+        Args:
+            offs (int): The offset of the last item to remove.
+        '''
+        if self.indexes:
+
+            for itemoffs, item in self._items.iter(0):
+
+                if itemoffs > offs:
+                    break
+
+                indxbyts = s_common.int64en(itemoffs)
+                for path, db in self.indexes.values():
+
+                    valu = _getItemPath(item, path)
+                    if valu is None:
+                        continue
+
+                    self.slab.delete(s_common.buid(valu), val=indxbyts, db=db)
+
+                await asyncio.sleep(0)
+
+        await self._items.cull(offs)
+
+    def splits(self, count):
+        '''
+        Split the items in the CryoTank into offset ranges for parallel consumers.
+
+        Args:
+            count (int): The number of ranges to split the items into.
+
+        Returns:
+            list: A list of (offs, size) tuples which cover all current items.
+        '''
+        if count < 1:
+            raise s_exc.BadArg(mesg='CryoTank splits count must be greater than 0.', name='count')
+
+        first = self._items.first()
+        if first is None:
+            return []
+
+        minoffs = first[0]
+        total = self._items.index() - minoffs
+
+        step, extra = divmod(total, count)
+
+        retn = []
+        offs = minoffs
+        for i in range(min(count, total)):
+            size = step + (1 if i < extra else 0)
+            retn.append((offs, size))
+            offs += size
+
+        return retn
+
+    async def packed(self, offs, size=None, batch=PACKED_BATCH):
+        '''
+        Yield batches of raw msgpack encoded items from the CryoTank starting at a given offset.
+
+        Args:
+            offs (int): The index of the desired datum (starts at 0)
+            size (int): The max number of items to yield.
+            batch (int): The max number of items in each batch.
+
+        Notes:
+            The items are not decoded and may be unpacked using s_msgpack.Unpk.
+
+        Yields:
+            ((int, int, bytes)): The index of the first item, the number of items and the concatenated msgpack bytes.
+        '''
+        indx = None
+        rows = []
+        count = 0
+
+        for rowindx, byts in self._items.rows(offs):
+
+            if size is not None and count >= size:
+                break
+
+            if indx is None:
+                indx = rowindx
+
+            rows.append(byts)
+            count += 1
+
+            if len(rows) >= batch:
+                yield indx, len(rows), b''.join(rows)
+                indx = None
+                rows.clear()
+                await asyncio.sleep(0)
+
+        if rows:
+            yield indx, len(rows), b''.join(rows)
+
     async def metrics(self, offs, size=None):
         '''
         Yield metrics rows starting at offset.
@@ -162,6 +365,7 @@ class CryoTank(s_base.Base):
             'iden': self._iden,
             'indx': self._items.index(),
             'metrics': self._metrics.index(),
+            'indexes': {name: path for (name, (path, _)) in self.indexes.items()},
             'stat': stat,
         }
 
@@ -200,6 +404,28 @@ class CryoApi(s_cell.CellApi):
         async for item in tank.rows(offs, size):
             yield item
 
+    async def splits(self, name, count):
+        tank = await self.cell.init(name, user=self.user)
+        self.user.confirm(('cryo', 'tank', 'read'), gateiden=tank.iden())
+        return tank.splits(count)
+
+    async def packed(self, name, offs, size=None, batch=PACKED_BATCH):
+        tank = await self.cell.init(name, user=self.user)
+        self.user.confirm(('cryo', 'tank', 'read'), gateiden=tank.iden())
+        async for item in tank.packed(offs, size=size, batch=batch):
+            yield item
+
+    async def search(self, name, indx, valu, offs=0, size=None):
+        tank = await self.cell.init(name, user=self.user)
+        self.user.confirm(('cryo', 'tank', 'read'), gateiden=tank.iden())
+        async for item in tank.search(indx, valu, offs=offs, size=size):
+            yield item
+
+    @s_cell.adminapi(log=True)
+    async def cull(self, name, offs):
+        tank = await self.cell.init(name, user=self.user)
+        return await tank.cull(offs)
+
     async def metrics(self, name, offs, size=None):
         tank = await self.cell.init(name, user=self.user)
         self.user.confirm(('cryo', 'tank', 'read'), gateiden=tank.iden())
@@ -13,9 +13,22 @@ import synapse.lib.coro as s_coro
 import synapse.lib.link as s_link
 import synapse.lib.scope as s_scope
 import synapse.lib.share as s_share
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.certdir as s_certdir
 import synapse.lib.reflect as s_reflect
 
+# the maximum number of generator items in a t2:yields message
+BATCH_SIZE = 1000
+# the number of encoded bytes which causes a t2:yields message to be sent
+BATCH_BYTES = 1024 * 1024
+# the maximum number of seconds an item waits for a t2:yields message to fill
+BATCH_TIME = 0.01
+# the maximum number of t2:yields messages waiting for the sender task
+BATCH_QUEUE = 2
+
+# ( 't2:yields', {'items': [ ... ] } ) with an array16 header for the items
+YIELDS_PREFIX = b'\x92\xa9t2:yields\x81\xa5items\xdc'
+
 class Sess(s_base.Base):
 
     async def __anit__(self):
@@ -112,17 +125,172 @@ class AsyncGenr(s_share.Share):
             await self.link.tx(mesg)
             await self.fini()
 
+class GenrBatch:
+    '''
+    Coalesce generator results into t2:yields messages for a link.
+
+    Messages are transmitted by a sender task from a bounded queue, and the
+    generator is paused while the queue is full.  Pending items are queued
+    once the batch is full, once the oldest pending item has waited for the
+    batch time, or when flush() is called.
+    '''
+    def __init__(self, link, size, maxbytes, timeout):
+
+        self.link = link
+        self.size = size
+        self.maxbytes = maxbytes
+        self.timeout = timeout
+
+        self.items = []
+        self.bytes = 0
+        self.timer = None
+
+        self.queue = asyncio.Queue(maxsize=BATCH_QUEUE)
+        self.sender = link.schedCoro(self._runSender())
+
+    async def _runSender(self):
+
+        try:
+            while True:
+
+                byts, futu = await self.queue.get()
+
+                if byts is not None:
+                    await self.link.send(byts)
+
+                if futu is not None:
+                    futu.set_result(None)
+
+        finally:
+            # release a generator waiting on the queue, it raises on its next call
+            while not self.queue.empty():
+                self.queue.get_nowait()
+
+    def _chkSender(self):
+
+        if not self.sender.done():
+            return
+
+        if not self.sender.cancelled() and (exc := self.sender.exception()) is not None:
+            raise exc
+
+        raise s_exc.LinkShutDown(mesg='Link closed while sending generator results.')
+
+    async def put(self, item):
+
+        self._chkSender()
+
+        byts = s_msgpack.en(item)
+
+        self.items.append(byts)
+        self.bytes += len(byts)
+
+        if len(self.items) >= self.size or self.bytes >= self.maxbytes:
+            await self.queue.put((self._pack(), None))
+            return
+
+        if self.timer is None:
+            loop = asyncio.get_running_loop()
+            self.timer = loop.call_later(self.timeout, self._onBatchTime)
+
+    def _onBatchTime(self):
+
+        self.timer = None
+
+        if not self.items:
+            return
+
+        # the sender is busy, so a message is sent before these items anyway
+        if self.queue.full():
+            loop = asyncio.get_running_loop()
+            self.timer = loop.call_later(self.timeout, self._onBatchTime)
+            return
+
+        self.queue.put_nowait((self._pack(), None))
+
+    def _pack(self):
+
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        byts = YIELDS_PREFIX + len(self.items).to_bytes(2, 'big') + b''.join(self.items)
+
+        self.items.clear()
+        self.bytes = 0
+
+        return byts
+
+    async def flush(self):
+        '''
+        Queue the pending items to be transmitted.
+        '''
+        self._chkSender()
+
+        if self.items:
+            await self.queue.put((self._pack(), None))
+
+    async def sync(self):
+        '''
+        Wait for the pending items and the queued messages to be transmitted.
+        '''
+        await self.flush()
+
+        futu = asyncio.get_running_loop().create_future()
+        await self.queue.put((None, futu))
+
+        await asyncio.wait((futu, self.sender), return_when=asyncio.FIRST_COMPLETED)
+        self._chkSender()
+
+    def fini(self):
+
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        self.sender.cancel()
+
+class BatchLink:
+    '''
+    A Link which transmits the pending items of a GenrBatch before any other data.
+
+    This is set as the "link" in the scope of a batched generator, so a generator
+    which sends directly to the link does not overtake the items it yielded.
+    '''
+    def __init__(self, link, genrbatch):
+        self.link = link
+        self.genrbatch = genrbatch
+
+    def __getattr__(self, name):
+        return getattr(self.link, name)
+
+    async def flush(self):
+        await self.genrbatch.flush()
+
+    async def tx(self, mesg):
+        await self.genrbatch.sync()
+        return await self.link.tx(mesg)
+
+    async def send(self, byts):
+        await self.genrbatch.sync()
+        return await self.link.send(byts)
+
 dmonwrap = (
     (s_coro.GenrHelp, AsyncGenr),
     (types.AsyncGeneratorType, AsyncGenr),
     (types.GeneratorType, Genr),
 )
 
-async def t2call(link, meth, args, kwargs):
+async def t2call(link, meth, args, kwargs, batch=False):
     '''
     Call the given ``meth(*args, **kwargs)`` and handle the response to provide
     telepath task v2 events to the given link.
+
+    If batch is True, the items yielded by a generator are sent in t2:yields
+    messages which may contain multiple items.
     '''
+    genrbatch = None
+
     try:
 
         valu = meth(*args, **kwargs)
@@ -135,33 +303,54 @@ async def t2call(link, meth, args, kwargs):
             first = True
             if isinstance(valu, types.AsyncGeneratorType):
 
+                if batch:
+                    genrbatch = GenrBatch(link, BATCH_SIZE, BATCH_BYTES, BATCH_TIME)
+                    s_scope.set('link', BatchLink(link, genrbatch))
+
                 async for item in valu:
 
                     if first:
                         await link.tx(('t2:genr', {}))
                         first = False
 
+                    if genrbatch is not None:
+                        await genrbatch.put(item)
+                        continue
+
                     await link.tx(('t2:yield', {'retn': (True, item)}))
 
                 if first:
                     await link.tx(('t2:genr', {}))
 
+                if genrbatch is not None:
+                    await genrbatch.sync()
+
                 await link.tx(('t2:yield', {'retn': None}))
                 return
 
             elif isinstance(valu, types.GeneratorType):
 
+                if batch:
+                    genrbatch = GenrBatch(link, BATCH_SIZE, BATCH_BYTES, BATCH_TIME)
+
                 for item in valu:
 
                     if first:
                         await link.tx(('t2:genr', {}))
                         first = False
 
+                    if genrbatch is not None:
+                        await genrbatch.put(item)
+                        continue
+
                     await link.tx(('t2:yield', {'retn': (True, item)}))
 
                 if first:
                     await link.tx(('t2:genr', {}))
 
+                if genrbatch is not None:
+                    await genrbatch.sync()
+
                 await link.tx(('t2:yield', {'retn': None}))
                 return
 
@@ -192,6 +381,9 @@ async def t2call(link, meth, args, kwargs):
                 if first:
                     await link.tx(('t2:genr', {}))
 
+                if genrbatch is not None:
+                    await genrbatch.sync()
+
                 retn = s_common.retnexc(e)
                 await link.tx(('t2:yield', {'retn': retn}))
 
@@ -219,6 +411,10 @@ async def t2call(link, meth, args, kwargs):
             retn = s_common.retnexc(e)
             await link.tx(('t2:fini', {'retn': retn}))
 
+    finally:
+        if genrbatch is not None:
+            genrbatch.fini()
+
 class Daemon(s_base.Base):
 
     async def __anit__(self, certdir=None, ahainfo=None):
@@ -510,6 +706,7 @@ class Daemon(s_base.Base):
         name = mesg[1].get('name')
         sidn = mesg[1].get('sess')
         todo = mesg[1].get('todo')
+        batch = mesg[1].get('batch', False)
 
         try:
 
@@ -536,7 +733,7 @@ class Daemon(s_base.Base):
             if meth is None:
                 raise s_exc.NoSuchMeth.init(methname, item)
 
-            sessitem = await t2call(link, meth, args, kwargs)
+            sessitem = await t2call(link, meth, args, kwargs, batch=batch)
             if sessitem is not None:
                 sess.onfini(sessitem)
 
@@ -27,6 +27,11 @@ import synapse.lib.stormtypes as s_stormtypes
 
 from synapse.lib.stormtypes import tobool, toint, toprim, tostr, tonumber, tocmprvalu, undef
 
+PIVOT_WINDOW_SIZE = 100  # The number of inbound nodes to resolve pivot targets for at once
+PIVOT_WINDOW_TIME = 0.005  # The maximum time to wait for more inbound nodes to fill a pivot window
+
+AST_NODE_SIZE = 512  # The estimated memory used by an initialized AST node in bytes
+
 SET_ALWAYS = 0
 SET_UNSET = 1
 SET_NEVER = 2
@@ -50,6 +55,10 @@ class AstNode:
     # into children of this node.
     runtopaque = False
 
+    # initialized AST nodes may be shared by concurrent runtimes and
+    # must not be modified during execution.
+    isinit = False
+
     def __init__(self, astinfo, kids=()):
         self.kids = []
         self.astinfo = astinfo
@@ -123,9 +132,15 @@ class AstNode:
                 yield item
 
     def init(self, core):
+
+        if self.isinit:
+            return
+
         [k.init(core) for k in self.kids]
         self.prepare()
 
+        self.isinit = True
+
     def validate(self, runt):
         [k.validate(runt) for k in self.kids]
 
@@ -158,6 +173,12 @@ class AstNode:
     def optimize(self):
         [k.optimize() for k in self.kids]
 
+    def getAstSize(self):
+        '''
+        Return the estimated memory used by this AST node and its children in bytes.
+        '''
+        return AST_NODE_SIZE + sum(k.getAstSize() for k in self.kids)
+
     def __iter__(self):
         for kid in self.kids:
             yield kid
@@ -209,6 +230,14 @@ class Query(AstNode):
         self.opts = {}
         self.text = self.getAstText()
 
+    def init(self, core):
+
+        if self.isinit:
+            return
+
+        AstNode.init(self, core)
+        self.optimize()
+
     async def run(self, runt, genr):
 
         async with contextlib.AsyncExitStack() as stack:
@@ -220,7 +249,6 @@ class Query(AstNode):
 
     async def iterNodePaths(self, runt, genr=None):
 
-        self.optimize()
         self.validate(runt)
 
         # turtles all the way down...
@@ -1868,46 +1896,209 @@ class LiftProp(LiftOper):
         # check if we can optimize a form lift
         if prop.isform:
 
-            async for hint in self.getRightHints(runt, path):
-                if hint[0] == 'tag':
-                    tagname = hint[1].get('name')
-                    async for node in runt.snap.nodesByTag(tagname, form=prop.full, reverse=self.reverse):
+            hints = [hint async for hint in self.getRightHints(runt, path)]
+            if hints:
+
+                if prop.isrunt:
+                    hint = hints[0]
+                else:
+                    hint = await self.getLiftPlan(runt, prop, hints)
+
+                if hint is not None:
+                    async for node in self.hintlift(runt, prop, hint):
                         yield node
                     return
 
-                if hint[0] == 'relprop':
-                    relpropname = hint[1].get('name')
-                    isuniv = hint[1].get('univ')
+            if runt.parallel and not prop.isrunt and not self.reverse:
+                async for node in runt.snap.nodesByFormParallel(prop.full, runt.parallel):
+                    yield node
+                return
 
-                    if isuniv:
-                        fullname = ''.join([prop.full, relpropname])
-                    else:
-                        fullname = ':'.join([prop.full, relpropname])
+        async for node in runt.snap.nodesByProp(prop.full, reverse=self.reverse):
+            yield node
 
-                    prop = runt.model.prop(fullname)
-                    if prop is None:
-                        return
+    async def hintlift(self, runt, form, hint):
+
+        if hint[0] == 'tag':
+            tagname = hint[1].get('name')
+            async for node in runt.snap.nodesByTag(tagname, form=form.full, reverse=self.reverse):
+                yield node
+            return
 
-                    cmpr = hint[1].get('cmpr')
-                    valu = hint[1].get('valu')
+        if hint[0] == 'tagprop':
+            tagname = hint[1].get('tag')
+            propname = hint[1].get('name')
 
-                    if cmpr is not None and valu is not None:
-                        try:
-                            # try lifting by valu but no guarantee a cmpr is available
-                            async for node in runt.snap.nodesByPropValu(fullname, cmpr, valu, reverse=self.reverse):
-                                yield node
-                            return
-                        except asyncio.CancelledError:  # pragma: no cover
-                            raise
-                        except:
-                            pass
+            cmpr = hint[1].get('cmpr')
+            valu = hint[1].get('valu')
 
-                    async for node in runt.snap.nodesByProp(fullname, reverse=self.reverse):
+            if cmpr is not None and valu is not None:
+                try:
+                    # try lifting by valu but no guarantee a cmpr is available
+                    async for node in runt.snap.nodesByTagPropValu(form.full, tagname, propname, cmpr, valu,
+                                                                   reverse=self.reverse):
                         yield node
                     return
+                except asyncio.CancelledError:  # pragma: no cover
+                    raise
+                except:
+                    pass
 
-        async for node in runt.snap.nodesByProp(prop.full, reverse=self.reverse):
-            yield node
+            async for node in runt.snap.nodesByTagProp(form.full, tagname, propname, reverse=self.reverse):
+                yield node
+            return
+
+        if hint[0] == 'relprop':
+
+            fullname = self.getHintPropName(form, hint)
+
+            prop = runt.model.prop(fullname)
+            if prop is None:
+                return
+
+            cmpr = hint[1].get('cmpr')
+            valu = hint[1].get('valu')
+
+            if cmpr is not None and valu is not None:
+                try:
+                    # try lifting by valu but no guarantee a cmpr is available
+                    async for node in runt.snap.nodesByPropValu(fullname, cmpr, valu, reverse=self.reverse):
+                        yield node
+                    return
+                except asyncio.CancelledError:  # pragma: no cover
+                    raise
+                except:
+                    pass
+
+            async for node in runt.snap.nodesByProp(fullname, reverse=self.reverse):
+                yield node
+            return
+
+    def getHintPropName(self, form, hint):
+        relpropname = hint[1].get('name')
+        if hint[1].get('univ'):
+            return ''.join([form.full, relpropname])
+        return ':'.join([form.full, relpropname])
+
+    def reprHint(self, form, hint):
+
+        if hint is None:
+            return form.full
+
+        if hint[0] == 'tag':
+            return f'{form.full}#{hint[1].get("name")}'
+
+        if hint[0] == 'tagprop':
+            text = f'{form.full}#{hint[1].get("tag")}:{hint[1].get("name")}'
+        else:
+            text = self.getHintPropName(form, hint)
+
+        cmpr = hint[1].get('cmpr')
+        valu = hint[1].get('valu')
+        if cmpr is not None and valu is not None:
+            text = f'{text}{cmpr}{valu}'
+
+        return text
+
+    async def getLiftPlan(self, runt, form, hints):
+        '''
+        Choose the most selective index to lift a form from using the approximate
+        row counts for each candidate index in the layers of the current view.
+
+        Args:
+            runt (Runtime): The storm runtime.
+            form (synapse.datamodel.Form): The form being lifted.
+            hints (list): A list of lift hints from the filters to the right of the lift.
+
+        Returns:
+            (tuple): The lift hint to use or None to lift by form.
+
+        Notes:
+            Filters are never removed from the pipeline so the remaining hints
+            are always applied as filters to the nodes lifted by the chosen index.
+        '''
+        plan = None
+        size = sum(layr.formcounts.get(form.name) for layr in runt.snap.layers)
+
+        sizes = [(form.full, size)]
+        for hint in hints:
+
+            # counts only need to be accurate enough to beat the current plan
+            hintsize = await self.getHintSize(runt, form, hint, maxsize=size + 1)
+            if hintsize is None:
+                continue
+
+            sizes.append((self.reprHint(form, hint), hintsize))
+
+            # prefer a hint over the full form lift if the counts are equal
+            if hintsize < size or (plan is None and hintsize == size):
+                plan = hint
+                size = hintsize
+
+        if runt.debug:
+            cands = ', '.join(f'{text} ({count})' for (text, count) in sizes)
+            await runt.printf(f'Lift plan: {self.reprHint(form, plan)} (~{size} rows) from candidates: {cands}')
+
+        return plan
+
+    async def getHintSize(self, runt, form, hint, maxsize=None):
+        '''
+        Return the approximate number of index rows a lift hint would lift or None if unknown.
+        '''
+        count = 0
+
+        if hint[0] == 'tag':
+            tagname = hint[1].get('name')
+            for layr in runt.snap.layers:
+                count += await layr.getTagCount(tagname, formname=form.name)
+            return count
+
+        cmpr = hint[1].get('cmpr')
+        valu = hint[1].get('valu')
+
+        if hint[0] == 'tagprop':
+
+            tagname = hint[1].get('tag')
+
+            prop = runt.model.getTagProp(hint[1].get('name'))
+            if prop is None:
+                return None
+
+            if cmpr == '=' and valu is not None:
+                try:
+                    norm, info = prop.type.norm(valu)
+                    for layr in runt.snap.layers:
+                        count += layr.getTagPropValuCount(form.name, tagname, prop.name, prop.type.stortype, norm)
+                    return count
+                except s_exc.SynErr:
+                    count = 0
+
+            for layr in runt.snap.layers:
+                count += await layr.getTagPropCount(form.name, tagname, prop.name)
+            return count
+
+        if hint[0] == 'relprop':
+
+            prop = runt.model.prop(self.getHintPropName(form, hint))
+            if prop is None:
+                return 0
+
+            if cmpr == '=' and valu is not None:
+                try:
+                    norm, info = prop.type.norm(valu)
+                    for layr in runt.snap.layers:
+                        count += layr.getPropValuCount(form.name, prop.name, prop.type.stortype, norm)
+                    return count
+                except s_exc.SynErr:
+                    count = 0
+
+            for layr in runt.snap.layers:
+                count += await layr.getPropCount(form.name, prop.name, maxsize=maxsize)
+                if maxsize is not None and count >= maxsize:
+                    break
+            return count
+
+        return None
 
     async def getRightHints(self, runt, path):
 
@@ -1983,11 +2174,95 @@ class LiftPropBy(LiftOper):
         except s_exc.SynErr as e:
             raise self.addExcInfo(e)
 
+def isReadAheadSafe(astn):
+    '''
+    Return True if running the AST node ahead of the downstream operators has no side effects.
+    '''
+    todo = collections.deque([astn])
+    while todo:
+
+        item = todo.popleft()
+        if isinstance(item, FuncCall):
+            return False
+
+        if isinstance(item, Oper) and not isinstance(item, (LiftOper, FiltOper, PivotOper, N1Walk)):
+            return False
+
+        todo.extend(item.kids)
+
+    return True
+
 class PivotOper(Oper):
 
     def __init__(self, astinfo, kids=(), isjoin=False):
         Oper.__init__(self, astinfo, kids=kids)
         self.isjoin = isjoin
+        self.readahead = False
+
+    def prepare(self):
+        # reading a window of inbound nodes ahead of this pivot is only allowed
+        # when producing them has no side effects ( edits, $lib calls, prints ).
+        # the input of a lookup mode query may add nodes.
+        if not isinstance(self.parent, Query) or getattr(self.parent, 'autoadd', False):
+            return
+
+        opers = self.parent.kids[:self.pindex]
+        self.readahead = all(isReadAheadSafe(k) for k in opers + self.kids)
+
+    async def iterPivoWindows(self, runt, genr, getndefs=None):
+        '''
+        Yield (node, path, pivos) tuples for the inbound nodes.
+
+        The pivot target ndefs returned by getndefs(runt, node, path) for a window
+        of inbound nodes are sorted by buid and resolved in one batch.  The pivos
+        dict of buid to Node (or None) may be passed to getPivoByNdef().
+
+        The inbound nodes are read on a separate task and a partial window is
+        resolved once PIVOT_WINDOW_TIME seconds have passed since its first node,
+        so a slow or realtime upstream does not delay the nodes it has produced.
+
+        Notes:
+            Windows are only used for a pivot in the top level query of a runtime
+            which is only preceded by lifts, filters, pivots and walks without
+            function calls.  Any other upstream is iterated one node at a time
+            so its side effects are not run ahead of the downstream operators.
+        '''
+        if (getndefs is None or not runt.snap.cachebuids or not self.readahead or
+                runt.root is not None or runt.query is not self.parent):
+            async for node, path in genr:
+                yield node, path, {}
+            return
+
+        chunks = s_base.schedGenrChunks(genr, size=PIVOT_WINDOW_SIZE, timeout=PIVOT_WINDOW_TIME)
+        async with contextlib.aclosing(chunks) as chunks:
+            async for chunk in chunks:
+
+                buids = set()
+                for node, path in chunk:
+                    for ndef in await getndefs(runt, node, path):
+                        buids.add(s_common.buid(ndef))
+
+                pivos = {}
+                if buids:
+                    buids = sorted(buids)
+                    pivos = dict(zip(buids, await runt.snap.getNodesByBuids(buids)))
+
+                for node, path in chunk:
+                    yield node, path, pivos
+
+    async def getPivoByNdef(self, runt, ndef, pivos):
+        '''
+        Return the Node for the given ndef using the nodes resolved by iterPivoWindows().
+        '''
+        buid = s_common.buid(ndef)
+        if buid in pivos:
+            # the node may have been added or deleted since the window was resolved
+            node = runt.snap.livenodes.get(buid)
+            if node is pivos[buid]:
+                await asyncio.sleep(0)
+                return node
+
+        return await runt.snap.getNodeByBuid(buid)
 
     def repr(self):
         return f'{self.__class__.__name__}: {self.kids}, isjoin={self.isjoin}'
@@ -2012,15 +2287,54 @@ class PivotOut(PivotOper):
     '''
     async def run(self, runt, genr):
 
-        async for node, path in genr:
+        async for node, path, pivos in self.iterPivoWindows(runt, genr, self.getPivNdefs):
 
             if self.isjoin:
                 yield node, path
 
-            async for item in self.getPivsOut(runt, node, path):
+            async for item in self.getPivsOut(runt, node, path, pivos=pivos):
                 yield item
 
-    async def getPivsOut(self, runt, node, path):
+    async def getPivNdefs(self, runt, node, path):
+
+        ndefs = []
+
+        if node.form.name == 'syn:tag':
+            return ndefs
+
+        if isinstance(node.form.type, s_types.Edge):
+            if (n2def := node.get('n2')) is not None:
+                ndefs.append(n2def)
+            return ndefs
+
+        for name, prop in node.form.props.items():
+
+            valu = node.get(name)
+            if valu is None:
+                continue
+
+            if isinstance(prop.type, s_types.Ndef):
+                ndefs.append(valu)
+                continue
+
+            if isinstance(prop.type, s_types.Array):
+                if isinstance(prop.type.arraytype, s_types.Ndef):
+                    ndefs.extend(valu)
+                continue
+
+            if prop.isrunt:
+                continue
+
+            form = runt.model.forms.get(prop.type.name)
+            if form is not None:
+                ndefs.append((form.name, valu))
+
+        return ndefs
+
+    async def getPivsOut(self, runt, node, path, pivos=None):
+
+        if pivos is None:
+            pivos = {}
 
         # <syn:tag> -> * is "from tags to nodes with tags"
         if node.form.name == 'syn:tag':
@@ -2033,7 +2347,7 @@ class PivotOut(PivotOper):
 
         if isinstance(node.form.type, s_types.Edge):
             n2def = node.get('n2')
-            pivo = await runt.snap.getNodeByNdef(n2def)
+            pivo = await self.getPivoByNdef(runt, n2def, pivos)
             if pivo is None:  # pragma: no cover
                 logger.warning(f'Missing node corresponding to ndef {n2def} on edge')
                 return
@@ -2050,7 +2364,7 @@ class PivotOut(PivotOper):
             link = {'type': 'prop', 'prop': prop.name}
             # if the outbound prop is an ndef...
             if isinstance(prop.type, s_types.Ndef):
-                pivo = await runt.snap.getNodeByNdef(valu)
+                pivo = await self.getPivoByNdef(runt, valu, pivos)
                 if pivo is None:
                     continue
 
@@ -2060,7 +2374,7 @@ class PivotOut(PivotOper):
             if isinstance(prop.type, s_types.Array):
                 if isinstance(prop.type.arraytype, s_types.Ndef):
                     for item in valu:
-                        if (pivo := await runt.snap.getNodeByNdef(item)) is not None:
+                        if (pivo := await self.getPivoByNdef(runt, item, pivos)) is not None:
                             yield pivo, path.fork(pivo, link)
                     continue
 
@@ -2079,7 +2393,7 @@ class PivotOut(PivotOper):
                     yield pivo, path.fork(pivo, link)
                 continue
 
-            pivo = await runt.snap.getNodeByNdef((form.name, valu))
+            pivo = await self.getPivoByNdef(runt, (form.name, valu), pivos)
             if pivo is None:  # pragma: no cover
                 continue
 
@@ -2093,12 +2407,12 @@ class N1WalkNPivo(PivotOut):
 
     async def run(self, runt, genr):
 
-        async for node, path in genr:
+        async for node, path, pivos in self.iterPivoWindows(runt, genr, self.getPivNdefs):
 
             if self.isjoin:
                 yield node, path
 
-            async for item in self.getPivsOut(runt, node, path):
+            async for item in self.getPivsOut(runt, node, path, pivos=pivos):
                 yield item
 
             async for (verb, iden) in node.iterEdgesN1():
@@ -2297,7 +2611,7 @@ class FormPivot(PivotOper):
         # -> baz:ndef
         if isinstance(prop.type, s_types.Ndef):
 
-            async def pgenr(node, strict=True):
+            async def pgenr(node, strict=True, pivos=None):
                 link = {'type': 'prop', 'prop': prop.name, 'reverse': True}
                 async for pivo in runt.snap.nodesByPropValu(prop.full, '=', node.ndef, norm=False):
                     yield pivo, link
@@ -2307,7 +2621,7 @@ class FormPivot(PivotOper):
             isarray = isinstance(prop.type, s_types.Array)
 
             # plain old pivot...
-            async def pgenr(node, strict=True):
+            async def pgenr(node, strict=True, pivos=None):
                 if isarray:
                     if isinstance(prop.type.arraytype, s_types.Ndef):
                         ngenr = runt.snap.nodesByPropArray(prop.full, '=', node.ndef, norm=False)
@@ -2327,7 +2641,7 @@ class FormPivot(PivotOper):
 
             full = prop.name + ':n1'
 
-            async def pgenr(node, strict=True):
+            async def pgenr(node, strict=True, pivos=None):
                 link = {'type': 'prop', 'prop': 'n1', 'reverse': True}
                 async for pivo in runt.snap.nodesByPropValu(full, '=', node.ndef, norm=False):
                     yield pivo, link
@@ -2338,7 +2652,10 @@ class FormPivot(PivotOper):
             # form name and type name match
             destform = prop
 
-            async def pgenr(node, strict=True):
+            async def pgenr(node, strict=True, pivos=None):
+
+                if pivos is None:
+                    pivos = {}
 
                 # <syn:tag> -> <form> is "from tags to nodes" pivot
                 if node.form.name == 'syn:tag' and prop.isform:
@@ -2355,7 +2672,7 @@ class FormPivot(PivotOper):
                     if n2def[0] != destform.name:
                         return
 
-                    pivo = await runt.snap.getNodeByNdef(node.get('n2'))
+                    pivo = await self.getPivoByNdef(runt, n2def, pivos)
                     if pivo:
                         yield pivo, {'type': 'prop', 'prop': 'n2'}
 
@@ -2376,6 +2693,11 @@ class FormPivot(PivotOper):
                     refsvalu = node.get(refsname)
                     if refsvalu is not None:
                         link = {'type': 'prop', 'prop': refsname}
+                        if not destform.isrunt:
+                            if (pivo := await self.getPivoByNdef(runt, (refsform, refsvalu), pivos)) is not None:
+                                yield pivo, link
+                            continue
+
                         async for pivo in runt.snap.nodesByPropValu(refsform, '=', refsvalu, norm=False):
                             yield pivo, link
 
@@ -2390,6 +2712,11 @@ class FormPivot(PivotOper):
                     if refsvalu is not None:
                         link = {'type': 'prop', 'prop': refsname}
                         for refselem in refsvalu:
+                            if not destform.isrunt:
+                                if (pivo := await self.getPivoByNdef(runt, (destform.name, refselem), pivos)) is not None:
+                                    yield pivo, link
+                                continue
+
                             async for pivo in runt.snap.nodesByPropValu(destform.name, '=', refselem, norm=False):
                                 yield pivo, link
 
@@ -2399,7 +2726,7 @@ class FormPivot(PivotOper):
 
                     refsvalu = node.get(refsname)
                     if refsvalu is not None and refsvalu[0] == destform.name:
-                        pivo = await runt.snap.getNodeByNdef(refsvalu)
+                        pivo = await self.getPivoByNdef(runt, refsvalu, pivos)
                         if pivo is not None:
                             yield pivo, {'type': 'prop', 'prop': refsname}
 
@@ -2411,7 +2738,7 @@ class FormPivot(PivotOper):
                         link = {'type': 'prop', 'prop': refsname}
                         for aval in refsvalu:
                             if aval[0] == destform.name:
-                                if (pivo := await runt.snap.getNodeByNdef(aval)) is not None:
+                                if (pivo := await self.getPivoByNdef(runt, aval, pivos)) is not None:
                                     yield pivo, link
 
                 #########################################################################
@@ -2469,6 +2796,49 @@ class FormPivot(PivotOper):
 
         return pgenr
 
+    def pivondefs(self, runt, prop):
+        '''
+        Return a list of the forward "-> form" pivot target ndefs for a node.
+        '''
+        ndefs = []
+        if not prop.isform or prop.isrunt or isinstance(prop.type, s_types.Edge):
+            return lambda node: ndefs
+
+        destform = prop
+
+        def getndefs(node):
+
+            if node.form.name == 'syn:tag':
+                return ndefs
+
+            if isinstance(node.form.type, s_types.Edge):
+                n2def = node.get('n2')
+                if n2def is not None and n2def[0] == destform.name:
+                    return [n2def]
+                return ndefs
+
+            retn = []
+            refs = node.form.getRefsOut()
+            for refsname, refsform in refs.get('prop'):
+                if refsform == destform.name and (refsvalu := node.get(refsname)) is not None:
+                    retn.append((refsform, refsvalu))
+
+            for refsname, refsform in refs.get('array'):
+                if refsform == destform.name and (refsvalu := node.get(refsname)) is not None:
+                    retn.extend((refsform, refselem) for refselem in refsvalu)
+
+            for refsname in refs.get('ndef'):
+                if (refsvalu := node.get(refsname)) is not None and refsvalu[0] == destform.name:
+                    retn.append(refsvalu)
+
+            for refsname in refs.get('ndefarray'):
+                if (refsvalu := node.get(refsname)) is not None:
+                    retn.extend(aval for aval in refsvalu if aval[0] == destform.name)
+
+            return retn
+
+        return getndefs
+
     def buildgenr(self, runt, name):
 
         if isinstance(name, list) or (prop := runt.model.props.get(name)) is None:
@@ -2487,21 +2857,59 @@ class FormPivot(PivotOper):
 
                 pgenrs.append(self.pivogenr(runt, prop))
 
-            async def listpivot(node):
+            async def listpivot(node, pivos=None):
                 for pgenr in pgenrs:
-                    async for pivo, valu in pgenr(node, strict=False):
+                    async for pivo, valu in pgenr(node, strict=False, pivos=pivos):
                         yield pivo, valu
 
             return listpivot
 
         return self.pivogenr(runt, prop)
 
+    def buildndefs(self, runt, name):
+
+        if isinstance(name, list) or (prop := runt.model.props.get(name)) is None:
+
+            if isinstance(name, list):
+                proplist = name
+            else:
+                proplist = runt.model.reqPropsByLook(name, extra=self.kids[0].addExcInfo)
+
+            funcs = []
+            for propname in proplist:
+                prop = runt.model.props.get(propname)
+                if prop is None:
+                    raise self.kids[0].addExcInfo(s_exc.NoSuchProp.init(propname))
+
+                funcs.append(self.pivondefs(runt, prop))
+
+            def listndefs(node):
+                retn = []
+                for func in funcs:
+                    retn.extend(func(node))
+                return retn
+
+            return listndefs
+
+        return self.pivondefs(runt, prop)
+
     async def run(self, runt, genr):
 
         pgenr = None
         warned = False
 
-        async for node, path in genr:
+        ndefsfunc = None
+
+        async def getconstndefs(runt, node, path):
+            nonlocal ndefsfunc
+            if ndefsfunc is None:
+                name = await self.kids[0].compute(runt, None)
+                ndefsfunc = self.buildndefs(runt, name)
+            return ndefsfunc(node)
+
+        getndefs = getconstndefs if self.kids[0].isconst else None
+
+        async for node, path, pivos in self.iterPivoWindows(runt, genr, getndefs):
 
             if pgenr is None or not self.kids[0].isconst:
                 name = await self.kids[0].compute(runt, None)
@@ -2511,7 +2919,7 @@ class FormPivot(PivotOper):
                 yield node, path
 
             try:
-                async for pivo, link in pgenr(node):
+                async for pivo, link in pgenr(node, pivos=pivos):
                     yield pivo, path.fork(pivo, link)
             except (s_exc.BadTypeValu, s_exc.BadLiftValu) as e:
                 if not warned:
@@ -2526,10 +2934,35 @@ class PropPivotOut(PivotOper):
     '''
     :prop -> *
     '''
+    async def getPivNdefs(self, runt, node, path):
+
+        name = await self.kids[0].compute(runt, path)
+
+        prop = node.form.props.get(name)
+        if prop is None:
+            return ()
+
+        valu = node.get(name)
+        if valu is None:
+            return ()
+
+        if prop.type.isarray:
+            if isinstance(prop.type.arraytype, s_types.Ndef):
+                return valu
+            return ()
+
+        if isinstance(prop.type, s_types.Ndef):
+            return (valu,)
+
+        if prop.modl.form(prop.type.name) is None:
+            return ()
+
+        return ((prop.type.name, valu),)
+
     async def run(self, runt, genr):
 
         warned = False
-        async for node, path in genr:
+        async for node, path, pivos in self.iterPivoWindows(runt, genr, self.getPivNdefs):
 
             if self.isjoin:
                 yield node, path
@@ -2552,7 +2985,7 @@ class PropPivotOut(PivotOper):
             if prop.type.isarray:
                 if isinstance(prop.type.arraytype, s_types.Ndef):
                     for item in valu:
-                        if (pivo := await runt.snap.getNodeByNdef(item)) is not None:
+                        if (pivo := await self.getPivoByNdef(runt, item, pivos)) is not None:
                             yield pivo, path.fork(pivo, link)
                     continue
 
@@ -2573,7 +3006,7 @@ class PropPivotOut(PivotOper):
             # ndef pivot out syntax...
             # :ndef -> *
             if isinstance(prop.type, s_types.Ndef):
-                pivo = await runt.snap.getNodeByNdef(valu)
+                pivo = await self.getPivoByNdef(runt, valu, pivos)
                 if pivo is None:
                     logger.warning(f'Missing node corresponding to ndef {valu}')
                     continue
@@ -2590,7 +3023,7 @@ class PropPivotOut(PivotOper):
                 continue
 
             ndef = (fname, valu)
-            pivo = await runt.snap.getNodeByNdef(ndef)
+            pivo = await self.getPivoByNdef(runt, ndef, pivos)
             # A node explicitly deleted in the graph or missing from a underlying layer
             # could cause this lift to return None.
             if pivo:
@@ -2604,7 +3037,10 @@ class PropPivot(PivotOper):
 
     def pivogenr(self, runt, prop):
 
-        async def pgenr(node, srcprop, valu, strict=True):
+        async def pgenr(node, srcprop, valu, strict=True, pivos=None):
+
+            if pivos is None:
+                pivos = {}
 
             link = {'type': 'prop', 'prop': srcprop.name}
             if not prop.isform:
@@ -2616,7 +3052,7 @@ class PropPivot(PivotOper):
                         if aval[0] != prop.form.name:
                             continue
 
-                        if (pivo := await runt.snap.getNodeByNdef(aval)) is not None:
+                        if (pivo := await self.getPivoByNdef(runt, aval, pivos)) is not None:
                             yield pivo, link
                     return
 
@@ -2631,7 +3067,7 @@ class PropPivot(PivotOper):
                 if valu[0] != prop.form.name:
                     return
 
-                pivo = await runt.snap.getNodeByNdef(valu)
+                pivo = await self.getPivoByNdef(runt, valu, pivos)
                 if pivo is None:
                     await runt.snap.warn(f'Missing node corresponding to ndef {valu}', log=False, ndef=valu)
                     return
@@ -2644,6 +3080,11 @@ class PropPivot(PivotOper):
                 genr = runt.snap.nodesByPropArray(prop.full, '=', valu, norm=norm)
             else:
                 norm = prop.typehash is not srcprop.typehash
+                if not norm and prop.isform and not prop.isrunt:
+                    if (pivo := await self.getPivoByNdef(runt, (prop.name, valu), pivos)) is not None:
+                        yield pivo, link
+                    return
+
                 genr = runt.snap.nodesByPropValu(prop.full, '=', valu, norm=norm)
 
             async for pivo in genr:
@@ -2651,6 +3092,32 @@ class PropPivot(PivotOper):
 
         return pgenr
 
+    def pivondefs(self, runt, prop):
+        '''
+        Return a list of the pivot target ndefs which may be resolved without an index lift.
+        '''
+        def getndefs(srcprop, valu):
+
+            if not prop.isform or prop.isrunt or prop.type.isarray:
+                return ()
+
+            if srcprop.type.isarray:
+                if isinstance(srcprop.type.arraytype, s_types.Ndef):
+                    return [aval for aval in valu if aval[0] == prop.form.name]
+                return ()
+
+            if isinstance(srcprop.type, s_types.Ndef):
+                if valu[0] == prop.form.name:
+                    return (valu,)
+                return ()
+
+            if prop.typehash is srcprop.typehash:
+                return ((prop.name, valu),)
+
+            return ()
+
+        return getndefs
+
     def buildgenr(self, runt, name):
 
         if isinstance(name, list) or (prop := runt.model.props.get(name)) is None:
@@ -2671,21 +3138,72 @@ class PropPivot(PivotOper):
 
                 pgenrs.append(self.pivogenr(runt, prop))
 
-            async def listpivot(node, srcprop, valu):
+            async def listpivot(node, srcprop, valu, pivos=None):
                 for pgenr in pgenrs:
-                    async for pivo in pgenr(node, srcprop, valu, strict=False):
+                    async for pivo in pgenr(node, srcprop, valu, strict=False, pivos=pivos):
                         yield pivo
 
             return listpivot
 
         return self.pivogenr(runt, prop)
 
+    def buildndefs(self, runt, name):
+
+        if isinstance(name, list) or (prop := runt.model.props.get(name)) is None:
+
+            if isinstance(name, list):
+                proplist = name
+            else:
+                proplist = runt.model.ifaceprops.get(name)
+
+            if proplist is None:
+                raise self.kids[0].addExcInfo(s_exc.NoSuchProp.init(name))
+
+            funcs = []
+            for propname in proplist:
+                prop = runt.model.props.get(propname)
+                if prop is None:
+                    raise self.kids[0].addExcInfo(s_exc.NoSuchProp.init(propname))
+
+                funcs.append(self.pivondefs(runt, prop))
+
+            def listndefs(srcprop, valu):
+                retn = []
+                for func in funcs:
+                    retn.extend(func(srcprop, valu))
+                return retn
+
+            return listndefs
+
+        return self.pivondefs(runt, prop)
+
     async def run(self, runt, genr):
 
         pgenr = None
         warned = False
 
-        async for node, path in genr:
+        ndefsfunc = None
+
+        async def getconstndefs(runt, node, path):
+            nonlocal ndefsfunc
+            if ndefsfunc is None:
+                name = await self.kids[1].compute(runt, None)
+                ndefsfunc = self.buildndefs(runt, name)
+
+            try:
+                srcprop, valu = await self.kids[0].getPropAndValu(runt, path)
+            except s_exc.SynErr:
+                # let the pivot raise when it reaches this node
+                return ()
+
+            if valu is None:
+                return ()
+
+            return ndefsfunc(srcprop, valu)
+
+        getndefs = getconstndefs if self.kids[1].isconst else None
+
+        async for node, path, pivos in self.iterPivoWindows(runt, genr, getndefs):
 
             if pgenr is None or not self.kids[1].isconst:
                 name = await self.kids[1].compute(runt, None)
@@ -2701,7 +3219,7 @@ class PropPivot(PivotOper):
                 continue
 
             try:
-                async for pivo, link in pgenr(node, srcprop, valu):
+                async for pivo, link in pgenr(node, srcprop, valu, pivos=pivos):
                     yield pivo, path.fork(pivo, link)
 
             except (s_exc.BadTypeValu, s_exc.BadLiftValu) as e:
@@ -2922,8 +3440,8 @@ class AndCond(Cond):
     '''
     async def getLiftHints(self, runt, path):
         h0 = await self.kids[0].getLiftHints(runt, path)
-        h1 = await self.kids[0].getLiftHints(runt, path)
-        return h0 + h1
+        h1 = await self.kids[1].getLiftHints(runt, path)
+        return tuple(h0) + tuple(h1)
 
     async def getCondEval(self, runt):
 
@@ -3079,6 +3597,24 @@ class HasRelPropCond(Cond):
 
 class HasTagPropCond(Cond):
 
+    async def getLiftHints(self, runt, path):
+
+        if not self.isRuntSafe(runt):
+            return []
+
+        tag = await self.kids[0].compute(runt, path)
+        if '*' in tag:
+            return []
+
+        hint = {
+            'tag': tag,
+            'name': await self.kids[1].compute(runt, path),
+        }
+
+        return (
+            ('tagprop', hint),
+        )
+
     async def getCondEval(self, runt):
 
         async def cond(node, path):
@@ -3348,6 +3884,34 @@ class RelPropCond(Cond):
 
 class TagPropCond(Cond):
 
+    async def getLiftHints(self, runt, path):
+
+        if not self.isRuntSafe(runt):
+            return []
+
+        tag = await self.kids[0].compute(runt, path)
+        if '*' in tag:
+            return []
+
+        name = await self.kids[1].compute(runt, path)
+        cmpr = await self.kids[2].compute(runt, path)
+
+        # leave invalid comparisons to the filter for error reporting
+        prop = runt.model.getTagProp(name)
+        if prop is None or prop.type.getCmprCtor(cmpr) is None:
+            return []
+
+        hint = {
+            'tag': tag,
+            'name': name,
+            'cmpr': cmpr,
+            'valu': await self.kids[3].compute(runt, path),
+        }
+
+        return (
+            ('tagprop', hint),
+        )
+
     async def getCondEval(self, runt):
 
         cmpr = await self.kids[2].compute(runt, None)
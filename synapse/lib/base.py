@@ -826,6 +826,74 @@ async def schedGenr(genr, maxsize=100):
             await task
             return
 
+async def schedGenrChunks(genr, size=100, timeout=0.01):
+    '''
+    Schedule a generator to run on a separate task and yield lists of up to size results to this task.
+
+    Args:
+        genr: The async generator to run.
+        size (int): The maximum number of results in each list.
+        timeout (float): The maximum time in seconds to wait for more results once a list has one.
+
+    Notes:
+        A partial list is yielded once timeout seconds have passed since its first
+        result, so a slow generator does not delay the results it has already produced.
+    '''
+    q = asyncio.Queue(maxsize=size)
+
+    async def genrtask(base):
+        try:
+            async for item in genr:
+                await q.put((True, item))
+
+            await q.put((False, None))
+
+        except Exception:
+            if not base.isfini:
+                await q.put((False, None))
+            raise
+
+    loop = asyncio.get_running_loop()
+
+    async with await Base.anit() as base:
+
+        task = base.schedCoro(genrtask(base))
+
+        done = False
+        while not done:
+
+            ok, item = await q.get()
+            if not ok:
+                break
+
+            chunk = [item]
+            maxtime = loop.time() + timeout
+
+            while len(chunk) < size:
+
+                if q.empty():
+                    wait = maxtime - loop.time()
+                    if wait <= 0:
+                        break
+
+                    try:
+                        ok, item = await asyncio.wait_for(q.get(), wait)
+                    except asyncio.TimeoutError:
+                        break
+
+                else:
+                    ok, item = q.get_nowait()
+
+                if not ok:
+                    done = True
+                    break
+
+                chunk.append(item)
+
+            yield chunk
+
+        await task
+
 async def main(coro):  # pragma: no cover
     base = await coro
     if isinstance(base, Base):
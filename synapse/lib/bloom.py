@@ -0,0 +1,100 @@
+'''
+A bloom filter for fast negative membership tests.
+'''
+import math
+
+import xxhash
+
+class BloomFilter:
+    '''
+    A fixed capacity bloom filter.
+
+    Args:
+        capacity (int): The number of items the filter is sized for.
+        errrate (float): The false positive rate once the filter contains capacity items.
+
+    Notes:
+        Items may not be removed from a bloom filter.  Once more than capacity
+        items have been added, the false positive rate will increase and the
+        filter should be rebuilt with a larger capacity.
+    '''
+    def __init__(self, capacity, errrate=0.01):
+
+        self.count = 0
+        self.capacity = capacity
+        self.errrate = errrate
+
+        bits = -capacity * math.log(errrate) / (math.log(2) ** 2)
+
+        # use a power of 2 number of bits ( minimum of 64 bytes ) for cheap masking
+        self.size = max(1 << math.ceil(math.log2(max(bits, 1))), 512)
+        self.mask = self.size - 1
+
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.hashes = min(self.hashes, 16)
+
+        self.bits = bytearray(self.size >> 3)
+
+    def add(self, byts):
+        '''
+        Add an item to the filter.
+
+        Args:
+            byts (bytes): The item bytes.
+
+        Returns:
+            bool: True if the item was not already present in the filter.
+        '''
+        bits = self.bits
+        added = False
+
+        # double hashing using the two halves of a 64 bit hash
+        hval = xxhash.xxh64_intdigest(byts)
+        offs = hval & 0xffffffff
+        step = (hval >> 32) | 1
+
+        for _ in range(self.hashes):
+            offs &= self.mask
+            indx = offs >> 3
+            mask = 1 << (offs & 7)
+            if not bits[indx] & mask:
+                bits[indx] |= mask
+                added = True
+            offs += step
+
+        if added:
+            self.count += 1
+
+        return added
+
+    def __contains__(self, byts):
+
+        bits = self.bits
+
+        hval = xxhash.xxh64_intdigest(byts)
+        offs = hval & 0xffffffff
+        step = (hval >> 32) | 1
+
+        for _ in range(self.hashes):
+            offs &= self.mask
+            if not bits[offs >> 3] & (1 << (offs & 7)):
+                return False
+            offs += step
+
+        return True
+
+    def isfull(self):
+        '''
+        Return True if the filter contains more than capacity items.
+        '''
+        return self.count > self.capacity
+
+    def copy(self):
+        bloom = BloomFilter(self.capacity, errrate=self.errrate)
+        bloom.bits[:] = self.bits
+        bloom.count = self.count
+        return bloom
+
+    def clear(self):
+        self.count = 0
+        self.bits[:] = bytes(len(self.bits))
@@ -98,6 +98,88 @@ class FixedCache:
         self.fifo.clear()
         self.cache.clear()
 
+class SizedCache:
+    '''
+    An LRU cache for the results of a coroutine which is bounded by the total estimated size of the values.
+
+    Args:
+        callback: A coroutine function which returns the value for a key.
+        sizefunc: A function which returns the estimated size of a (key, valu) pair.
+        maxsize (int): The maximum total estimated size of the cached values.
+    '''
+    def __init__(self, callback, sizefunc, maxsize):
+
+        self.size = 0
+        self.maxsize = maxsize
+
+        self.callback = callback
+        self.sizefunc = sizefunc
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.cache = collections.OrderedDict()  # key -> (valu, size)
+
+    def __len__(self):
+        return len(self.cache)
+
+    async def aget(self, key):
+
+        item = self.cache.get(key)
+        if item is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return item[0]
+
+        self.misses += 1
+
+        valu = await self.callback(key)
+        if valu is s_common.novalu:
+            return valu
+
+        self.put(key, valu)
+        return valu
+
+    def put(self, key, valu):
+
+        self.pop(key)
+
+        size = self.sizefunc(key, valu)
+        if size > self.maxsize:
+            return
+
+        self.cache[key] = (valu, size)
+        self.size += size
+
+        while self.size > self.maxsize:
+            _, (_, delsize) = self.cache.popitem(last=False)
+            self.size -= delsize
+            self.evictions += 1
+
+    def pop(self, key):
+
+        item = self.cache.pop(key, None)
+        if item is None:
+            return None
+
+        self.size -= item[1]
+        return item[0]
+
+    def clear(self):
+        self.size = 0
+        self.cache.clear()
+
+    def pack(self):
+        return {
+            'size': self.size,
+            'maxsize': self.maxsize,
+            'count': len(self.cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
 class LruDict(collections.abc.MutableMapping):
     '''
     Maintains the last n accessed keys
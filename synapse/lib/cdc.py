@@ -0,0 +1,70 @@
+'''
+Content defined chunking of bytes for deduplicated storage.
+
+Chunk boundaries are selected based on the content of a small window of
+bytes rather than a fixed offset, so an insertion or deletion only changes
+the chunks near the edit and the rest of the chunks still match.
+'''
+import hashlib
+
+# the minimum and maximum size of a chunk in bytes
+MIN_SIZE = 16 * 1024
+MAX_SIZE = 256 * 1024
+
+# a boundary follows a window of this many consecutive bytes which map to 1
+WINDOW_SIZE = 14
+
+# smaller windows which are used if there is no full window within MAX_SIZE
+# to keep boundaries content defined for data with a skewed byte distribution
+WINDOW_FALLBACKS = (10, 6, 3, 1)
+
+# a fixed pseudo-random map of byte values to 0 or 1.
+# NOTE: changing this ( or the sizes above ) changes the chunk boundaries
+# and prevents new chunks from matching previously stored chunks.
+bitmap = bytes(hashlib.sha256(bytes([i])).digest()[0] & 1 for i in range(256))
+
+windows = [b'\x01' * size for size in (WINDOW_SIZE,) + WINDOW_FALLBACKS]
+
+def chunks(byts):
+    '''
+    Yield content defined chunks of the given bytes.
+
+    Args:
+        byts (bytes): The bytes to split into chunks.
+
+    Notes:
+        A boundary is placed after the first window of WINDOW_SIZE bytes
+        which all map to 1 in the bitmap once a chunk is at least MIN_SIZE.
+        This is equivalent to a rolling hash over the window and the search
+        is done using bytes.find() to run at C speed.  If there is no such
+        window before MAX_SIZE, progressively smaller windows are used and
+        chunks which still have no boundary are split at MAX_SIZE.
+
+    Yields:
+        bytes: The chunks in order.
+    '''
+    size = len(byts)
+    if size <= MIN_SIZE:
+        if size:
+            yield byts
+        return
+
+    bits = byts.translate(bitmap)
+
+    offs = 0
+    while offs < size:
+
+        if size - offs <= MIN_SIZE:
+            yield byts[offs:]
+            return
+
+        end = min(offs + MAX_SIZE, size)
+
+        for window in windows:
+            indx = bits.find(window, offs + MIN_SIZE - len(window), end)
+            if indx != -1:
+                end = indx + len(window)
+                break
+
+        yield byts[offs:end]
+        offs = end
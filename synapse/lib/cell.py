@@ -986,6 +986,18 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
             'description': 'Record all changes to a stream file on disk.  Required for mirroring (on both sides).',
             'type': 'boolean',
         },
+        'nexslog:group:size': {
+            'default': 1,
+            'description': 'The maximum number of concurrently issued changes which may be written to the Nexus log '
+                           'as a single batch. A value of 1 disables group commits.',
+            'type': 'integer',
+            'minimum': 1,
+        },
+        'nexslog:compress': {
+            'default': False,
+            'description': 'Compress Nexus log segments once they are rotated. Compressed segments are read-only.',
+            'type': 'boolean',
+        },
         'nexslog:async': {
             'default': True,
             'description': 'Deprecated. This option ignored.',
@@ -1205,7 +1217,8 @@ class Cell(s_nexus.Pusher, s_telepath.Aware):
             'tellready': 1,
             'dynmirror': 1,
             'tasks': 1,
-            'issuewait': 1
+            'issuewait': 1,
+            'batchyield': 1,
         }
 
         self.safemode = self.conf.req('safemode')
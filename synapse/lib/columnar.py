@@ -0,0 +1,189 @@
+'''
+Dictionary encoded column batches for bulk export of node properties.
+
+A columnar export is a stream of msgpack encoded messages::
+
+    ('cols', {'cols': (<name>, ...), 'version': 1})
+    ('batch', {'rows': <count>, 'cols': ((<valus>, <width>, <indx>), ...)})
+    ...
+    ('fini', {'rows': <total>})
+
+Each column in a batch is a list of the distinct values in the batch and
+a packed array of little-endian unsigned integers of the given byte width
+which index into the list of values for each row.  The index bytes may be
+used directly as a numpy/arrow dictionary index buffer without copying.
+'''
+import sys
+import array
+
+import synapse.exc as s_exc
+
+import synapse.lib.msgpack as s_msgpack
+
+VERSION = 1
+
+# the number of rows packed into each batch
+BATCH_SIZE = 10000
+
+typecodes = {
+    1: 'B',
+    2: 'H',
+    4: 'I',
+}
+
+bigendian = sys.byteorder == 'big'
+
+def getColFunc(name):
+    '''
+    Return a function which returns the value of a column for a node.
+
+    Args:
+        name (str): The column name.
+
+    Notes:
+        Column names may be ``iden``, ``form``, ``valu``, a relative or
+        universal property name such as ``:asn`` or ``.seen``, a tag such
+        as ``#foo.bar`` or a tag property such as ``#foo.bar:score``.
+    '''
+    if not isinstance(name, str) or not name:
+        mesg = f'Invalid export column name: {name!r}'
+        raise s_exc.BadArg(mesg=mesg, name=name)
+
+    if name == 'iden':
+        return lambda node: node.iden()
+
+    if name == 'form':
+        return lambda node: node.form.name
+
+    if name == 'valu':
+        return lambda node: node.ndef[1]
+
+    if name.startswith('#'):
+        tag, _, prop = name[1:].partition(':')
+        if prop:
+            return lambda node: node.getTagProp(tag, prop)
+        return lambda node: node.getTag(tag)
+
+    if name.startswith(':'):
+        name = name[1:]
+
+    return lambda node: node.get(name)
+
+class ColumnBatch:
+    '''
+    Accumulate dictionary encoded columns of node values.
+
+    Args:
+        cols (list): A list of column names.
+    '''
+    def __init__(self, cols):
+
+        if not cols:
+            raise s_exc.BadArg(mesg='Columnar export requires at least one column.', name='cols')
+
+        self.cols = tuple(cols)
+        self.funcs = [getColFunc(name) for name in self.cols]
+
+        self.clear()
+
+    def clear(self):
+        self.size = 0
+        self.valus = [[] for _ in self.cols]
+        self.lookup = [{} for _ in self.cols]
+        self.indxs = [array.array('I') for _ in self.cols]
+
+    def add(self, node):
+        '''
+        Add a row for the given node to the batch.
+        '''
+        for func, valus, lookup, indx in zip(self.funcs, self.valus, self.lookup, self.indxs):
+
+            valu = func(node)
+
+            key = valu
+            try:
+                offs = lookup.get(key)
+            except TypeError:
+                # unhashable values (such as data props) are keyed by their encoding
+                key = s_msgpack.en(valu)
+                offs = lookup.get(key)
+
+            if offs is None:
+                offs = lookup[key] = len(valus)
+                valus.append(valu)
+
+            indx.append(offs)
+
+        self.size += 1
+
+    def pack(self):
+        '''
+        Return a ('batch', info) message for the rows in the batch.
+        '''
+        cols = []
+        for valus, indx in zip(self.valus, self.indxs):
+
+            width = getIndxWidth(len(valus))
+            if width != 4:
+                indx = array.array(typecodes[width], indx)
+
+            if bigendian:  # pragma: no cover
+                indx.byteswap()
+
+            cols.append((valus, width, indx.tobytes()))
+
+        return ('batch', {'rows': self.size, 'cols': cols})
+
+def getIndxWidth(size):
+    '''
+    Return the number of bytes required for an index into a list of the given size.
+    '''
+    if size <= 0x100:
+        return 1
+    if size <= 0x10000:
+        return 2
+    return 4
+
+def unpackCols(info):
+    '''
+    Return a list of column value lists for a batch message.
+    '''
+    retn = []
+    for valus, width, byts in info.get('cols'):
+
+        typecode = typecodes.get(width)
+        if typecode is None:
+            mesg = f'Invalid columnar index width: {width}'
+            raise s_exc.BadDataValu(mesg=mesg)
+
+        indx = array.array(typecode, byts)
+        if bigendian:  # pragma: no cover
+            indx.byteswap()
+
+        retn.append([valus[i] for i in indx])
+
+    return retn
+
+def iterRows(mesgs):
+    '''
+    Yield row tuples from a sequence of columnar export messages.
+    '''
+    for mesg in mesgs:
+
+        if mesg[0] == 'cols':
+            version = mesg[1].get('version')
+            if version != VERSION:
+                mesg = f'Unsupported columnar export version: {version}'
+                raise s_exc.BadVersion(mesg=mesg)
+            continue
+
+        if mesg[0] != 'batch':
+            continue
+
+        yield from zip(*unpackCols(mesg[1]))
+
+def iterFileRows(path):
+    '''
+    Yield row tuples from a saved columnar export file.
+    '''
+    yield from iterRows(s_msgpack.iterfile(path))
@@ -1,10 +1,17 @@
+import asyncio
 import hashlib
 
+import synapse.lib.coro as s_coro
+
+# the minimum number of bytes hashed in the executor pool by aupdate()
+THREAD_MIN_SIZE = 64 * 1024
+
 class HashSet:
 
     def __init__(self):
 
         self.size = 0
+        self.pending = None
 
         # BEWARE ORDER MATTERS FOR guid()
         self.hashes = (
@@ -53,6 +60,46 @@ class HashSet:
         self.size += len(byts)
         [h[1].update(byts) for h in self.hashes]
 
+    async def aupdate(self, byts):
+        '''
+        Update all the hashes in the set with the given bytes without blocking the ioloop.
+
+        Notes:
+            Large buffers are hashed in parallel in the executor pool and
+            this method returns once the previous buffer has been hashed.
+            This allows the caller to read or write the next buffer while
+            the current one is hashed. Use wait() before retrieving digests.
+
+        Example:
+
+            hset = HashSet()
+
+            async for byts in genr:
+                await hset.aupdate(byts)
+                await save(byts)
+
+            await hset.wait()
+            digests = hset.digests()
+        '''
+        await self.wait()
+
+        if len(byts) < THREAD_MIN_SIZE:
+            self.update(byts)
+            return
+
+        self.size += len(byts)
+        self.pending = asyncio.gather(*[s_coro.executor(h[1].update, byts) for h in self.hashes])
+
+    async def wait(self):
+        '''
+        Wait for any pending aupdate() to complete.
+        '''
+        if self.pending is None:
+            return
+
+        pending, self.pending = self.pending, None
+        await pending
+
     def digests(self):
         '''
         Get a list of (name, bytes) tuples for the hashes in the hashset.
@@ -1,3 +1,4 @@
+import zlib
 import base64
 import asyncio
 import logging
@@ -18,6 +19,53 @@ import synapse.lib.schemas as s_schemas
 
 logger = logging.getLogger(__name__)
 
+# the maximum number of bytes buffered before streamed results are written
+STREAM_BATCH_SIZE = 64 * 1024
+# the maximum number of seconds a streamed result waits in the buffer
+STREAM_BATCH_TIME = 0.1
+# favor speed over size when compressing streamed results
+STREAM_GZIP_LEVEL = 1
+
+def acceptsEncoding(hval, name):
+    '''
+    Check if an Accept-Encoding header value allows a content coding.
+
+    Args:
+        hval (str): The Accept-Encoding header value.
+        name (str): The content coding name, such as "gzip".
+
+    Returns:
+        bool: True if the coding, or a "*" wildcard, is listed with a non-zero q-value.
+    '''
+    quals = {}
+    for item in hval.split(','):
+
+        coding, *params = item.split(';')
+
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        qval = 1.0
+        for param in params:
+
+            pkey, _, pval = param.partition('=')
+            if pkey.strip().lower() != 'q':
+                continue
+
+            try:
+                qval = float(pval.strip())
+            except ValueError:
+                qval = 0.0
+
+        quals[coding] = qval
+
+    qval = quals.get(name.lower())
+    if qval is None:
+        qval = quals.get('*', 0.0)
+
+    return qval > 0
+
 class Sess(s_base.Base):
 
     async def __anit__(self, cell, iden, info):
@@ -515,6 +563,106 @@ class StreamHandler(Handler):
         raise s_exc.NoSuchImpl(mesg='data_received must be implemented by subclasses.',
                                name='data_received')
 
+class StormStream:
+    '''
+    Write the streamed results of a Storm handler.
+
+    If batch is True, results are buffered until the batch size is reached
+    or the oldest buffered result has waited for the batch time, and they
+    are gzip compressed if the client accepts it.  Otherwise each result is
+    written and flushed as a separate HTTP chunk.
+
+    Notes:
+        Batches must only be used for formats where the results are
+        delimited, since the HTTP chunks do not align with the results.
+    '''
+    def __init__(self, handler, batch=False):
+
+        self.handler = handler
+        self.batch = batch
+
+        self.bufs = []
+        self.size = 0
+        self.sent = False
+        self.timer = None
+        self.flushing = None
+
+        self.zobj = None
+        if batch:
+            handler.add_header('Vary', 'Accept-Encoding')
+            if acceptsEncoding(handler.request.headers.get('Accept-Encoding', ''), 'gzip'):
+                self.zobj = zlib.compressobj(STREAM_GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    async def write(self, byts):
+
+        if not self.batch:
+            self.handler.write(byts)
+            await self.handler.flush()
+            return
+
+        # raise the error from a flush started by the batch timer, such as a client disconnect
+        if self.flushing is not None:
+            futu, self.flushing = self.flushing, None
+            await futu
+
+        self.bufs.append(byts)
+        self.size += len(byts)
+
+        if self.size >= STREAM_BATCH_SIZE:
+            if self._drain():
+                await self.handler.flush()
+            return
+
+        if self.timer is None:
+            loop = asyncio.get_running_loop()
+            self.timer = loop.call_later(STREAM_BATCH_TIME, self._onBatchTime)
+
+    def _onBatchTime(self):
+        self.timer = None
+        if self._drain():
+            self.flushing = self.handler.flush()
+            self.flushing.add_done_callback(self._onFlushDone)
+
+    def _onFlushDone(self, futu):
+        # the error is also raised by the next write from the handler
+        if not futu.cancelled() and (exc := futu.exception()) is not None:
+            logger.debug(f'Error flushing Storm results: {exc!r}')
+
+    def _drain(self):
+
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        if not self.bufs:
+            return False
+
+        byts = b''.join(self.bufs)
+
+        self.bufs.clear()
+        self.size = 0
+
+        if self.zobj is not None:
+
+            if not self.sent:
+                self.handler.set_header('Content-Encoding', 'gzip')
+
+            byts = self.zobj.compress(byts) + self.zobj.flush(zlib.Z_SYNC_FLUSH)
+
+        self.sent = True
+        self.handler.write(byts)
+        return True
+
+    def fini(self):
+        '''
+        Write any buffered results and end the compressed stream.
+        '''
+        self._drain()
+
+        if self.zobj is not None and self.sent:
+            self.handler.write(self.zobj.flush())
+            self.zobj = None
+
 class StormHandler(Handler):
 
     def getCore(self):
@@ -551,6 +699,22 @@ class StormHandler(Handler):
 
         return opts
 
+    def _getStormStream(self, stream: str | None) -> StormStream:
+        '''
+        Return a StormStream which batches results for the delimited stream formats.
+        '''
+        if stream == 'msgpack':
+            self.set_header('Content-Type', 'application/x-msgpack')
+
+        return StormStream(self, batch=stream in ('jsonlines', 'msgpack'))
+
+    def _packStormMesg(self, mesg, stream: str | None) -> bytes:
+
+        if stream == 'msgpack':
+            return s_msgpack.en(mesg)
+
+        return s_json.dumps(mesg, newline=stream == 'jsonlines')
+
     def _handleStormErr(self, err: Exception):
         if isinstance(err, s_exc.AuthDeny):
             return self.sendRestExc(err, status_code=HTTPStatus.FORBIDDEN)
@@ -574,13 +738,13 @@ class StormNodesV1(StormHandler):
         opts = body.get('opts')
         query = body.get('query')
         stream = body.get('stream')
-        jsonlines = stream == 'jsonlines'
 
         opts = await self._reqValidOpts(opts)
         if opts is None:
             return
 
         flushed = False
+        strm = self._getStormStream(stream)
         try:
             view = self.cell._viewFromOpts(opts)
 
@@ -588,12 +752,13 @@ class StormNodesV1(StormHandler):
             await self.cell.boss.promote('storm', user=user, info=taskinfo)
 
             async for pode in view.iterStormPodes(query, opts=opts):
-                self.write(s_json.dumps(pode, newline=jsonlines))
-                await self.flush()
+                await strm.write(self._packStormMesg(pode, stream))
                 flushed = True
         except Exception as e:
             if not flushed:
                 return self._handleStormErr(e)
+        finally:
+            strm.fini()
 
 class StormV1(StormHandler):
 
@@ -612,7 +777,6 @@ class StormV1(StormHandler):
         opts = body.get('opts')
         query = body.get('query')
         stream = body.get('stream')
-        jsonlines = stream == 'jsonlines'
 
         # Maintain backwards compatibility with 0.1.x output
         opts = await self._reqValidOpts(opts)
@@ -621,14 +785,16 @@ class StormV1(StormHandler):
 
         opts.setdefault('editformat', 'nodeedits')
         flushed = None
+        strm = self._getStormStream(stream)
         try:
             async for mesg in self.getCore().storm(query, opts=opts):
-                self.write(s_json.dumps(mesg, newline=jsonlines))
-                await self.flush()
+                await strm.write(self._packStormMesg(mesg, stream))
                 flushed = True
         except Exception as e:
             if not flushed:
                 return self._handleStormErr(e)
+        finally:
+            strm.fini()
 
 class StormCallV1(StormHandler):
 
@@ -680,15 +846,52 @@ class StormExportV1(StormHandler):
             return
 
         flushed = False
+        strm = StormStream(self, batch=True)
         try:
             self.set_header('Content-Type', 'application/x-synapse-nodes')
             async for pode in self.getCore().exportStorm(query, opts=opts):
-                self.write(s_msgpack.en(pode))
-                await self.flush()
+                await strm.write(s_msgpack.en(pode))
+                flushed = True
+        except Exception as e:
+            if not flushed:
+                return self._handleStormErr(e)
+        finally:
+            strm.fini()
+
+class StormExportColsV1(StormHandler):
+
+    async def post(self):
+        return await self.get()
+
+    async def get(self):
+
+        if not await self.reqAuthUser():
+            return
+
+        body = self.getJsonBody()
+        if body is None:
+            return
+
+        opts = body.get('opts')
+        cols = body.get('cols')
+        query = body.get('query')
+
+        opts = await self._reqValidOpts(opts)
+        if opts is None:
+            return
+
+        flushed = False
+        strm = StormStream(self, batch=True)
+        try:
+            self.set_header('Content-Type', 'application/x-synapse-cols')
+            async for mesg in self.getCore().exportStormCols(query, cols, opts=opts):
+                await strm.write(s_msgpack.en(mesg))
                 flushed = True
         except Exception as e:
             if not flushed:
                 return self._handleStormErr(e)
+        finally:
+            strm.fini()
 
 class ReqValidStormV1(StormHandler):
 
@@ -0,0 +1,86 @@
+'''
+A HyperLogLog sketch for approximate distinct value counts.
+'''
+import math
+
+import xxhash
+
+# 2 ** 10 registers gives a standard error of ~3.25%
+PRECISION = 10
+
+class HyperLogLog:
+    '''
+    A HyperLogLog distinct value estimator.
+
+    Args:
+        regs (bytes): Optional register bytes to resume a previously saved sketch.
+        precision (int): The number of hash bits used to select a register.
+
+    Notes:
+        The sketch registers are a bytearray which may be saved using
+        the ``regs`` attribute.  Values may not be removed from a sketch.
+    '''
+    def __init__(self, regs=None, precision=PRECISION):
+
+        self.precision = precision
+        self.size = 1 << precision
+
+        if regs is None:
+            regs = bytearray(self.size)
+
+        elif not isinstance(regs, bytearray):
+            regs = bytearray(regs)
+
+        if len(regs) != self.size:
+            raise ValueError(f'HyperLogLog register size mismatch: {len(regs)} != {self.size}')
+
+        self.regs = regs
+
+        self.bits = 64 - precision
+        self.mask = (1 << self.bits) - 1
+
+    def add(self, byts):
+        '''
+        Add a value to the sketch.
+
+        Args:
+            byts (bytes): The encoded value bytes.
+
+        Returns:
+            bool: True if the sketch was modified.
+        '''
+        hval = xxhash.xxh64_intdigest(byts)
+
+        indx = hval >> self.bits
+        rank = self.bits - (hval & self.mask).bit_length() + 1
+
+        if rank <= self.regs[indx]:
+            return False
+
+        self.regs[indx] = rank
+        return True
+
+    def merge(self, other):
+        '''
+        Merge the registers from another sketch into this one.
+        '''
+        if other.size != self.size:
+            raise ValueError(f'HyperLogLog precision mismatch: {other.precision} != {self.precision}')
+
+        self.regs[:] = bytes(max(a, b) for (a, b) in zip(self.regs, other.regs))
+
+    def count(self):
+        '''
+        Return the estimated number of distinct values added to the sketch.
+        '''
+        size = self.size
+
+        alpha = 0.7213 / (1 + 1.079 / size)
+        esti = alpha * size * size / sum(2.0 ** -r for r in self.regs)
+
+        # use linear counting for small cardinalities
+        zeros = self.regs.count(0)
+        if zeros and esti <= 2.5 * size:
+            esti = size * math.log(size / zeros)
+
+        return int(round(esti))
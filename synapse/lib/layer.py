@@ -55,6 +55,10 @@ Storage Node (<sode>)
 
         }),
 
+    Storage nodes returned by lifts and getStorNode() are shared with the Layer cache and must
+    be treated as read-only.  The Layer makes a copy of a storage node before modifying it if
+    the node may have been shared with a reader ( copy-on-write ).
+
 '''
 import os
 import math
@@ -65,6 +69,7 @@ import logging
 import contextlib
 import collections
 
+import lmdb
 import regex
 import xxhash
 
@@ -79,6 +84,8 @@ import synapse.lib.cache as s_cache
 import synapse.lib.nexus as s_nexus
 import synapse.lib.queue as s_queue
 import synapse.lib.urlhelp as s_urlhelp
+import synapse.lib.hyperloglog as s_hyperloglog
+import synapse.lib.processpool as s_processpool
 
 import synapse.lib.config as s_config
 import synapse.lib.lmdbslab as s_lmdbslab
@@ -111,6 +118,19 @@ reqValidLdef = s_config.getJsValidator({
 WINDOW_MAXSIZE = 10_000
 MIGR_COMMIT_SIZE = 1_000
 
+# the version of the per-layer index statistics catalog
+STATS_VERSION = 1
+# the number of nodes read per step of building the index statistics
+STATS_BUILD_CHUNK = 1000
+
+# the number of significant bits retained in a histogram bucket
+HIST_BUCKET_BITS = 8
+
+# the maximum number of rows returned by a parallel lift worker per task
+PARALLEL_CHUNK_ROWS = 10_000
+# the number of index key ranges created per parallel lift worker
+PARALLEL_PARTS_PER_PROC = 4
+
 class LayerApi(s_cell.CellApi):
 
     async def __anit__(self, core, link, user, layr):
@@ -201,6 +221,14 @@ class LayerApi(s_cell.CellApi):
             await self._reqUserAllowed(self.readperm)
         return self.layr.iden
 
+    async def getIndexStats(self, name):
+        '''
+        Return the statistics catalog entry for the given index name.
+        '''
+        if not await self.allowed(self.liftperm):
+            await self._reqUserAllowed(self.readperm)
+        return await self.layr.getIndexStats(name)
+
 BUID_CACHE_SIZE = 10000
 
 STOR_TYPE_UTF8 = 1
@@ -242,6 +270,13 @@ STOR_TYPE_NDEF = 25
 
 STOR_FLAG_ARRAY = 0x8000
 
+# integer storage types which maintain a value histogram
+HIST_STOR_TYPES = (
+    STOR_TYPE_U8, STOR_TYPE_U16, STOR_TYPE_U32, STOR_TYPE_U64,
+    STOR_TYPE_I8, STOR_TYPE_I16, STOR_TYPE_I32, STOR_TYPE_I64,
+    STOR_TYPE_TIME, STOR_TYPE_MINTIME, STOR_TYPE_MAXTIME,
+)
+
 # Edit types (etyp)
 
 EDIT_NODE_ADD = 0      # (<etyp>, (<valu>, <type>), ())
@@ -1450,6 +1485,16 @@ class Layer(s_nexus.Pusher):
         self.dirty = {}
         self.futures = {}
 
+        # buids of cached sodes which have not been shared with readers
+        self.sodeowned = set()
+
+        # buids of sodes which are being modified by an edit batch
+        self.sodeediting = set()
+
+        # the index statistics are built by a background task when missing
+        self.statstask = None
+        self.statslock = asyncio.Lock()
+
         self.stortypes = [
 
             None,
@@ -1662,17 +1707,17 @@ class Layer(s_nexus.Pusher):
             self.layrslab.delete(abrv + indx, buid, db=self.byprop)
 
     def _testDelTagStor(self, buid, form, tag):
-        sode = self._getStorNode(buid)
+        sode = self._genStorNode(buid)
         sode['tags'].pop(tag, None)
         self.setSodeDirty(buid, sode, form)
 
     def _testDelPropStor(self, buid, form, prop):
-        sode = self._getStorNode(buid)
+        sode = self._genStorNode(buid)
         sode['props'].pop(prop, None)
         self.setSodeDirty(buid, sode, form)
 
     def _testDelFormValuStor(self, buid, form):
-        sode = self._getStorNode(buid)
+        sode = self._genStorNode(buid)
         sode['valu'] = None
         self.setSodeDirty(buid, sode, form)
 
@@ -2061,6 +2106,8 @@ class Layer(s_nexus.Pusher):
 
         self.dirty.clear()
         self.buidcache.clear()
+        self.sodeowned.clear()
+        self.core.nodecache.clear()
 
         await self.layrslab.trash()
         await self.nodeeditslab.trash()
@@ -2703,6 +2750,10 @@ class Layer(s_nexus.Pusher):
 
         self.formcounts = await self.layrslab.getHotCount('count:forms')
 
+        self.statcounts = await self.layrslab.getHotCount('stats:counts')
+        self.stathlls = await self.layrslab.getHotKeyVal('stats:hlls')
+        self.stathists = await self.layrslab.getHotKeyVal('stats:hists')
+
         nodeeditpath = s_common.genpath(self.dirn, 'nodeedits.lmdb')
         self.nodeeditslab = await s_lmdbslab.Slab.anit(nodeeditpath, **otherslabopts)
 
@@ -2746,6 +2797,7 @@ class Layer(s_nexus.Pusher):
 
         if self.fresh:
             self.meta.set('version', 11)
+            self.meta.set('stats:version', STATS_VERSION)
 
         self.layrslab.addResizeCallback(self.core.checkFreeSpace)
         self.dataslab.addResizeCallback(self.core.checkFreeSpace)
@@ -2787,6 +2839,77 @@ class Layer(s_nexus.Pusher):
             mesg = f'Got layer version {self.layrvers}.  Expected 11.  Accidental downgrade?'
             raise s_exc.BadStorageVersion(mesg=mesg)
 
+        # edits to nodes with a buid <= statsbuid update the index statistics
+        self.statsbuid = b''
+        self.statsready = self.meta.get('stats:version') == STATS_VERSION
+
+        if self.statstask is not None:
+            self.statstask.cancel()
+            self.statstask = None
+
+        if not self.statsready:
+            self.statstask = self.schedCoro(self._initIndexStats())
+
+    async def _initIndexStats(self):
+        '''
+        Build the index statistics for the nodes in the layer in buid order.
+
+        Notes:
+            The count APIs use index scans until the build is complete.
+        '''
+        logger.warning(f'Building index statistics for layer {self.iden}')
+
+        for hotkv in (self.statcounts, self.stathlls, self.stathists):
+            for byts in list(hotkv.cache.keys()):
+                hotkv.delete(byts.decode())
+
+        while True:
+
+            # do not scan nodes while they are being edited
+            async with self.statslock:
+
+                # decode the rows directly rather than evicting the working set from the buid cache
+                sodes = {}
+                for buid, byts in self.layrslab.scanByRange(self.statsbuid, db=self.bybuidv3):
+
+                    if buid == self.statsbuid:
+                        continue
+
+                    sodes[buid] = s_msgpack.un(byts)
+                    if len(sodes) >= STATS_BUILD_CHUNK:
+                        break
+
+                # include nodes which have not been flushed to the slab yet
+                lastbuid = buid if len(sodes) >= STATS_BUILD_CHUNK else None
+                for buid, sode in self.dirty.items():
+                    if buid > self.statsbuid and (lastbuid is None or buid <= lastbuid):
+                        sodes[buid] = sode
+
+                stats = IndexStatsDelta()
+                for buid in sorted(sodes.keys()):
+
+                    sode = sodes[buid]
+
+                    form = sode.get('form')
+                    if form is None:
+                        continue
+
+                    self._updIndexStats(stats, form, getSodeStatEdits(sode))
+
+                self._saveIndexStats(stats)
+
+                if lastbuid is None:
+                    self.statsready = True
+                    break
+
+                self.statsbuid = lastbuid
+
+            await asyncio.sleep(0)
+
+        self.meta.set('stats:version', STATS_VERSION)
+
+        logger.warning('...complete!')
+
     async def getLayerSize(self):
         '''
         Get the total storage size for the layer.
@@ -2926,17 +3049,76 @@ class Layer(s_nexus.Pusher):
 
         self.layrslab._putmulti(kvlist, db=self.bybuidv3)
         self.dirty.clear()
+        self.sodeowned.clear()
 
     def getStorNodeCount(self):
         info = self.layrslab.stat(db=self.bybuidv3)
         return info.get('entries', 0)
 
     async def getStorNode(self, buid):
-        sode = self._getStorNode(buid)
+        '''
+        Return the storage node for the given buid.
+
+        NOTE: The returned storage node is shared and must not be modified.
+        '''
+        sode = self._getSharedStorNode(buid)
         if sode is not None:
-            return deepcopy(sode)
+            return sode
         return {}
 
+    async def getStorNodesBatch(self, buids):
+        '''
+        Return a list of storage nodes for the given buids.
+
+        Args:
+            buids (list): A list of buids.
+
+        Notes:
+            Buids which are not dirty or cached are sorted and resolved
+            with a single cursor walk of the bybuidv3 db.
+
+        Returns:
+            list: A list of shared ( read-only ) storage node dicts in the same order as buids.
+        '''
+        sodes = {}
+        todo = set()
+
+        for buid in buids:
+
+            sode = self.dirty.get(buid)
+            if sode is None:
+                sode = self.buidcache.get(buid)
+
+            if sode is None:
+                todo.add(buid)
+                continue
+
+            sodes[buid] = self._shareStorNode(buid, sode)
+
+        if todo:
+            for buid, byts in self.layrslab.getmulti(sorted(todo), db=self.bybuidv3):
+                if byts is None:
+                    continue
+
+                sode = collections.defaultdict(dict)
+                sode.update(s_msgpack.un(byts))
+                self.buidcache[buid] = sode
+                self.sodeowned.discard(buid)
+                sodes[buid] = sode
+
+            await asyncio.sleep(0)
+
+        retn = []
+        for buid in buids:
+            sode = sodes.get(buid)
+            if sode is None:
+                retn.append({})
+                continue
+
+            retn.append(sode)
+
+        return retn
+
     def _getStorNode(self, buid):
         '''
         Return the storage node for the given buid.
@@ -2965,15 +3147,45 @@ class Layer(s_nexus.Pusher):
 
         return sode
 
+    def _getSharedStorNode(self, buid):
+        '''
+        Return the storage node for the given buid and mark it as shared.
+
+        NOTE: The returned storage node must not be modified. A subsequent
+              edit will modify a copy of the storage node.
+        '''
+        sode = self._getStorNode(buid)
+        if sode is not None:
+            return self._shareStorNode(buid, sode)
+
+    def _shareStorNode(self, buid, sode):
+        # a sode which is being modified by an edit batch may change when the
+        # batch yields to the loop so readers get a copy of its current state
+        if buid in self.sodeediting:
+            return copysode(sode)
+
+        self.sodeowned.discard(buid)
+        return sode
+
     def _genStorNode(self, buid):
-        # get or create the storage node. this returns the *actual* storage node
+        # get or create a mutable storage node. this returns the *actual* storage node
+        # but makes a copy first if the storage node may have been shared with a reader.
 
         sode = self._getStorNode(buid)
         if sode is not None:
-            return sode
 
-        sode = collections.defaultdict(dict)
+            if buid in self.sodeowned:
+                return sode
+
+            sode = copysode(sode)
+            if buid in self.dirty:
+                self.dirty[buid] = sode
+
+        else:
+            sode = collections.defaultdict(dict)
+
         self.buidcache[buid] = sode
+        self.sodeowned.add(buid)
 
         return sode
 
@@ -2981,6 +3193,9 @@ class Layer(s_nexus.Pusher):
         '''
         Return the number of tag rows in the layer for the given tag/form.
         '''
+        if self.statsready:
+            return self.statcounts.get(getTagStatName(formname, tagname))
+
         try:
             abrv = self.tagabrv.bytsToAbrv(tagname.encode())
             if formname is not None:
@@ -2996,12 +3211,24 @@ class Layer(s_nexus.Pusher):
         '''
         Return the number of property rows in the layer for the given form/prop.
         '''
-        try:
-            abrv = self.getPropAbrv(formname, propname)
-        except s_exc.NoSuchAbrv:
-            return 0
+        if propname is None:
+            count = self.formcounts.get(formname)
 
-        return await self.layrslab.countByPref(abrv, db=self.byprop, maxsize=maxsize)
+        elif self.statsready:
+            count = self.statcounts.get(getPropStatName(formname, propname))
+
+        else:
+            try:
+                abrv = self.getPropAbrv(formname, propname)
+            except s_exc.NoSuchAbrv:
+                return 0
+
+            return await self.layrslab.countByPref(abrv, db=self.byprop, maxsize=maxsize)
+
+        if maxsize is not None:
+            return min(count, maxsize)
+
+        return count
 
     def getPropValuCount(self, formname, propname, stortype, valu):
         try:
@@ -3045,17 +3272,15 @@ class Layer(s_nexus.Pusher):
         '''
         Return the number of universal property rows in the layer for the given prop.
         '''
-        try:
-            abrv = self.getPropAbrv(None, propname)
-        except s_exc.NoSuchAbrv:
-            return 0
-
-        return await self.layrslab.countByPref(abrv, db=self.byprop, maxsize=maxsize)
+        return await self.getPropCount(None, propname, maxsize=maxsize)
 
     async def getTagPropCount(self, form, tag, prop):
         '''
         Return the number of property rows in the layer for the given form/tag/prop.
         '''
+        if self.statsready:
+            return self.statcounts.get(getTagPropStatName(form, tag, prop))
+
         try:
             abrv = self.getTagPropAbrv(form, tag, prop)
         except s_exc.NoSuchAbrv:
@@ -3063,6 +3288,162 @@ class Layer(s_nexus.Pusher):
 
         return await self.layrslab.countByPref(abrv, db=self.bytagprop)
 
+    async def getIndexStats(self, name):
+        '''
+        Return the statistics catalog entry for an index in the layer.
+
+        Args:
+            name (str): The index name. Index names use the Storm syntax for the
+                        form, property, tag or tag property being indexed.
+
+        Examples:
+            Index names for each type of index::
+
+                inet:ipv4
+                inet:ipv4:asn
+                inet:ipv4.seen
+                .seen
+                #cno.mal
+                inet:ipv4#cno.mal
+                #cno.mal:score
+                inet:ipv4#cno.mal:score
+
+        Returns:
+            dict: A dictionary containing the row count, the estimated number of
+                  distinct values and a histogram of (min, max, count) tuples.
+
+        Notes:
+            Distinct value estimates are not reduced when values are removed and
+            histograms are only maintained for integer and time values.  The values
+            are None while the statistics catalog is being built.
+        '''
+        if not self.statsready:
+            return {'count': None, 'distinct': None, 'histogram': None}
+
+        if self.core.model.form(name) is not None:
+            count = self.formcounts.get(name)
+        else:
+            count = self.statcounts.get(name)
+
+        distinct = None
+        regs = self.stathlls.get(name)
+        if regs is not None:
+            distinct = s_hyperloglog.HyperLogLog(regs=regs).count()
+
+        histogram = None
+        hist = self.stathists.get(name)
+        if hist is not None:
+            histogram = []
+            for lowv, size in sorted(hist.items()):
+                minv, maxv = getHistBucket(lowv)
+                histogram.append((minv, maxv, size))
+
+        return {
+            'count': count,
+            'distinct': distinct,
+            'histogram': histogram,
+        }
+
+    def _updIndexStats(self, stats, form, changes):
+
+        for edit in changes:
+
+            etyp = edit[0]
+
+            if etyp == EDIT_PROP_SET:
+                prop, valu, oldv, stortype = edit[1]
+                for name in getPropStatNames(form, prop):
+                    if oldv is None:
+                        stats.counts[name] += 1
+                    else:
+                        stats.addHist(name, oldv, stortype, -1)
+                    stats.addValu(name, valu, stortype)
+                continue
+
+            if etyp == EDIT_PROP_DEL:
+                prop, valu, stortype = edit[1]
+                for name in getPropStatNames(form, prop):
+                    stats.counts[name] -= 1
+                    stats.addHist(name, valu, stortype, -1)
+                continue
+
+            if etyp == EDIT_TAG_SET:
+                tag, valu, oldv = edit[1]
+                if oldv is None:
+                    stats.counts[getTagStatName(form, tag)] += 1
+                    stats.counts[getTagStatName(None, tag)] += 1
+                continue
+
+            if etyp == EDIT_TAG_DEL:
+                tag, oldv = edit[1]
+                stats.counts[getTagStatName(form, tag)] -= 1
+                stats.counts[getTagStatName(None, tag)] -= 1
+                continue
+
+            if etyp == EDIT_TAGPROP_SET:
+                tag, prop, valu, oldv, stortype = edit[1]
+                for name in (getTagPropStatName(form, tag, prop), getTagPropStatName(None, tag, prop)):
+                    if oldv is None:
+                        stats.counts[name] += 1
+                    else:
+                        stats.addHist(name, oldv, stortype, -1)
+                    stats.addValu(name, valu, stortype)
+                continue
+
+            if etyp == EDIT_TAGPROP_DEL:
+                tag, prop, valu, stortype = edit[1]
+                for name in (getTagPropStatName(form, tag, prop), getTagPropStatName(None, tag, prop)):
+                    stats.counts[name] -= 1
+                    stats.addHist(name, valu, stortype, -1)
+                continue
+
+            # the form counts are maintained separately
+            if etyp == EDIT_NODE_ADD:
+                valu, stortype = edit[1]
+                stats.addHist(form, valu, stortype, 1)
+                continue
+
+            if etyp == EDIT_NODE_DEL:
+                valu, stortype = edit[1]
+                stats.addHist(form, valu, stortype, -1)
+                continue
+
+    def _saveIndexStats(self, stats):
+        '''
+        Apply the index statistics changes accumulated by _updIndexStats().
+        '''
+        for name, incr in stats.counts.items():
+            if incr:
+                self.statcounts.inc(name, valu=incr)
+
+        for name, valus in stats.valus.items():
+
+            regs = self.stathlls.get(name)
+            hll = s_hyperloglog.HyperLogLog(regs=regs)
+
+            changed = regs is None
+            for byts in valus:
+                if hll.add(byts):
+                    changed = True
+
+            if changed:
+                self.stathlls.set(name, hll.regs)
+
+        for name, incrs in stats.hists.items():
+
+            hist = self.stathists.get(name)
+            if hist is None:
+                hist = {}
+
+            for lowv, incr in incrs.items():
+                size = hist.get(lowv, 0) + incr
+                if size > 0:
+                    hist[lowv] = size
+                else:
+                    hist.pop(lowv, None)
+
+            self.stathists.set(name, hist)
+
     def getTagPropValuCount(self, form, tag, prop, stortype, valu):
         try:
             abrv = self.getTagPropAbrv(form, tag, prop)
@@ -3133,12 +3514,12 @@ class Layer(s_nexus.Pusher):
 
         for lkey, buid in scan(abrv, db=self.bytag):
 
-            sode = self._getStorNode(buid)
+            sode = self._getSharedStorNode(buid)
             if sode is None: # pragma: no cover
                 # logger.warning(f'TagIndex for #{tag} has {s_common.ehex(buid)} but no storage node.')
                 continue
 
-            yield None, buid, deepcopy(sode)
+            yield None, buid, sode
 
     async def liftByTags(self, tags):
         # todo: support form and reverse kwargs
@@ -3163,11 +3544,11 @@ class Layer(s_nexus.Pusher):
 
             lastbuid = buid
 
-            sode = self._getStorNode(buid)
+            sode = self._getSharedStorNode(buid)
             if sode is None: # pragma: no cover
                 continue
 
-            yield None, buid, deepcopy(sode)
+            yield None, buid, sode
 
     async def liftByTagValu(self, tag, cmpr, valu, form=None, reverse=False):
 
@@ -3192,11 +3573,11 @@ class Layer(s_nexus.Pusher):
             # filter based on the ival value before lifting the node...
             valu = await self.getNodeTag(buid, tag)
             if filt(valu):
-                sode = self._getStorNode(buid)
+                sode = self._getSharedStorNode(buid)
                 if sode is None: # pragma: no cover
                     # logger.warning(f'TagValuIndex for #{tag} has {s_common.ehex(buid)} but no storage node.')
                     continue
-                yield None, buid, deepcopy(sode)
+                yield None, buid, sode
 
     async def hasTagProp(self, name):
         async for _ in self.liftTagProp(name):
@@ -3241,12 +3622,12 @@ class Layer(s_nexus.Pusher):
 
         for lkey, buid in scan(abrv, db=self.bytagprop):
 
-            sode = self._getStorNode(buid)
+            sode = self._getSharedStorNode(buid)
             if sode is None: # pragma: no cover
                 # logger.warning(f'TagPropIndex for {form}#{tag}:{prop} has {s_common.ehex(buid)} but no storage node.')
                 continue
 
-            yield lkey[8:], buid, deepcopy(sode)
+            yield lkey[8:], buid, sode
 
     async def liftByTagPropValu(self, form, tag, prop, cmprvals, reverse=False):
         '''
@@ -3256,12 +3637,115 @@ class Layer(s_nexus.Pusher):
 
             async for lkey, buid in self.stortypes[kind].indxByTagProp(form, tag, prop, cmpr, valu, reverse=reverse):
 
-                sode = self._getStorNode(buid)
+                sode = self._getSharedStorNode(buid)
                 if sode is None: # pragma: no cover
                     # logger.warning(f'TagPropValuIndex for {form}#{tag}:{prop} has {s_common.ehex(buid)} but no storage node.')
                     continue
 
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
+
+    async def liftByFormParallel(self, form, procs):
+        '''
+        Lift all the storage nodes for a form using worker processes.
+
+        The form index is partitioned into key ranges which are read by up to procs
+        worker processes which open the layer slab read-only.
+
+        Args:
+            form (str): The form name.
+            procs (int): The maximum number of worker processes to use.
+
+        Yields:
+            (bytes, dict): A (buid, sode) tuple for each node of the form.
+
+        Notes:
+            Storage nodes are not yielded in index order.
+        '''
+        try:
+            abrv = self.getPropAbrv(form, None)
+
+        except s_exc.NoSuchAbrv:
+            return
+
+        # workers may only read committed data
+        await self.layrslab.sync()
+
+        parts = collections.deque(self._getIndxParts(abrv, procs * PARALLEL_PARTS_PER_PROC))
+        if not parts:
+            return
+
+        path = self.layrslab.path
+        queue = asyncio.Queue(maxsize=procs)
+
+        async def work():
+
+            try:
+                while parts:
+
+                    startkey, stopkey = parts.popleft()
+                    while startkey is not None:
+                        rows, startkey = await s_processpool.semafork(_liftByPropRange, path, abrv, startkey, stopkey,
+                                                                      PARALLEL_CHUNK_ROWS)
+                        await queue.put((True, rows))
+
+            except Exception as e:
+                await queue.put((False, e))
+                return
+
+            await queue.put((True, None))
+
+        tasks = [self.schedCoro(work()) for _ in range(min(procs, len(parts)))]
+
+        try:
+            todo = len(tasks)
+            while todo:
+
+                ok, rows = await queue.get()
+                if not ok:
+                    raise rows
+
+                if rows is None:
+                    todo -= 1
+                    continue
+
+                for buid, sode in rows:
+                    yield buid, sode
+                    await asyncio.sleep(0)
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _getIndxParts(self, abrv, count):
+        '''
+        Return a list of (startkey, stopkey) tuples which partition the keys for an index abrv.
+        '''
+        first = None
+        for lkey, buid in self.layrslab.scanByPref(abrv, db=self.byprop):
+            first = lkey
+            break
+
+        if first is None:
+            return []
+
+        last = None
+        for lkey, buid in self.layrslab.scanByPrefBack(abrv, db=self.byprop):
+            last = lkey
+            break
+
+        # interpolate split points between the first and last 8 bytes of index value
+        minv = int.from_bytes(first[8:16].ljust(8, b'\x00'), 'big')
+        maxv = int.from_bytes(last[8:16].ljust(8, b'\x00'), 'big')
+
+        step = (maxv - minv) // count
+        if step == 0:
+            return [(abrv, None)]
+
+        keys = [abrv]
+        keys.extend(abrv + (minv + step * i).to_bytes(8, 'big') for i in range(1, count))
+        keys.append(None)
+
+        return list(zip(keys[:-1], keys[1:]))
 
     async def liftByProp(self, form, prop, reverse=False):
 
@@ -3277,11 +3761,11 @@ class Layer(s_nexus.Pusher):
             scan = self.layrslab.scanByPref
 
         for lkey, buid in scan(abrv, db=self.byprop):
-            sode = self._getStorNode(buid)
+            sode = self._getSharedStorNode(buid)
             if sode is None: # pragma: no cover
                 # logger.warning(f'PropIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                 continue
-            yield lkey[8:], buid, deepcopy(sode)
+            yield lkey[8:], buid, sode
 
     # NOTE: form vs prop valu lifting is differentiated to allow merge sort
     async def liftByFormValu(self, form, cmprvals, reverse=False):
@@ -3291,11 +3775,11 @@ class Layer(s_nexus.Pusher):
                 kind = STOR_TYPE_MSGP
 
             async for lkey, buid in self.stortypes[kind].indxByForm(form, cmpr, valu, reverse=reverse):
-                sode = self._getStorNode(buid)
+                sode = self._getSharedStorNode(buid)
                 if sode is None: # pragma: no cover
                     # logger.warning(f'FormValuIndex for {form} has {s_common.ehex(buid)} but no storage node.')
                     continue
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByPropValu(self, form, prop, cmprvals, reverse=False):
         for cmpr, valu, kind in cmprvals:
@@ -3305,21 +3789,21 @@ class Layer(s_nexus.Pusher):
 
             async for lkey, buid in self.stortypes[kind].indxByProp(form, prop, cmpr, valu, reverse=reverse):
 
-                sode = self._getStorNode(buid)
+                sode = self._getSharedStorNode(buid)
                 if sode is None: # pragma: no cover
                     # logger.warning(f'PropValuIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                     continue
 
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByPropArray(self, form, prop, cmprvals, reverse=False):
         for cmpr, valu, kind in cmprvals:
             async for lkey, buid in self.stortypes[kind].indxByPropArray(form, prop, cmpr, valu, reverse=reverse):
-                sode = self._getStorNode(buid)
+                sode = self._getSharedStorNode(buid)
                 if sode is None: # pragma: no cover
                     # logger.warning(f'PropArrayIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                     continue
-                yield lkey[8:], buid, deepcopy(sode)
+                yield lkey[8:], buid, sode
 
     async def liftByDataName(self, name):
         try:
@@ -3330,12 +3814,13 @@ class Layer(s_nexus.Pusher):
 
         for abrv, buid in self.dataslab.scanByDups(abrv, db=self.dataname):
 
-            sode = self._getStorNode(buid)
+            sode = self._getSharedStorNode(buid)
             if sode is None: # pragma: no cover
                 # logger.warning(f'PropArrayIndex for {form}:{prop} has {s_common.ehex(buid)} but no storage node.')
                 continue
 
-            sode = deepcopy(sode)
+            # only the top level is modified so a shallow copy is sufficient
+            sode = dict(sode)
 
             byts = self.dataslab.get(buid + abrv, db=self.nodedata)
             if byts is None:
@@ -3566,7 +4051,17 @@ class Layer(s_nexus.Pusher):
         Returns:
             List[Tuple[buid, form, edits]]  Same list, but with only the edits actually applied (plus the old value)
         '''
+        if self.statsready:
+            return await self._applyNodeEdits(nodeedits, meta, nexsitem)
+
+        # prevent the index statistics build from reading nodes while they are edited
+        async with self.statslock:
+            return await self._applyNodeEdits(nodeedits, meta, nexsitem)
+
+    async def _applyNodeEdits(self, nodeedits, meta, nexsitem):
+
         edited = False
+        stats = IndexStatsDelta()
 
         # use/abuse python's dict ordering behavior
         results = {}
@@ -3579,15 +4074,22 @@ class Layer(s_nexus.Pusher):
             sode = self._genStorNode(buid)
 
             changes = []
-            for edit in edits:
 
-                delt = await self.editors[edit[0]](buid, form, edit, sode, meta)
-                if delt and edit[2]:
-                    nodeedits.extend(edit[2])
+            self.sodeediting.add(buid)
+            try:
 
-                changes.extend(delt)
+                for edit in edits:
 
-                await asyncio.sleep(0)
+                    delt = await self.editors[edit[0]](buid, form, edit, sode, meta)
+                    if delt and edit[2]:
+                        nodeedits.extend(edit[2])
+
+                    changes.extend(delt)
+
+                    await asyncio.sleep(0)
+
+            finally:
+                self.sodeediting.discard(buid)
 
             flatedit = results.get(buid)
             if flatedit is None:
@@ -3597,10 +4099,14 @@ class Layer(s_nexus.Pusher):
 
             if changes:
                 edited = True
+                if self.statsready or buid <= self.statsbuid:
+                    self._updIndexStats(stats, form, changes)
 
         flatedits = list(results.values())
 
         if edited:
+            self._saveIndexStats(stats)
+
             nexsindx = nexsitem[0] if nexsitem is not None else None
             await self.fire('layer:write', layer=self.iden, edits=flatedits, meta=meta, nexsindx=nexsindx)
 
@@ -3641,6 +4147,7 @@ class Layer(s_nexus.Pusher):
             pass
         self.dirty.pop(buid, None)
         self.buidcache.pop(buid, None)
+        self.sodeowned.discard(buid)
         self.layrslab.delete(buid, db=self.bybuidv3)
 
         return True
@@ -3967,6 +4474,8 @@ class Layer(s_nexus.Pusher):
         tp_abrv = self.setTagPropAbrv(None, tag, prop)
         ftp_abrv = self.setTagPropAbrv(form, tag, prop)
 
+        oldv = None
+
         tp_dict = sode['tagprops'].get(tag)
         if tp_dict:
             oldv, oldt = tp_dict.get(prop, (None, None))
@@ -4702,7 +5211,7 @@ class Layer(s_nexus.Pusher):
 
         for buid, sode in list(self.dirty.items()):
             done.add(buid)
-            yield buid, sode
+            yield buid, self._shareStorNode(buid, sode)
 
         for buid, byts in self.layrslab.scanByFull(db=self.bybuidv3):
 
@@ -4831,6 +5340,158 @@ class Layer(s_nexus.Pusher):
         await self.fini()
         shutil.rmtree(self.dirn, ignore_errors=True)
 
+def getPropStatName(form, prop):
+    '''
+    Return the index statistics name for a form/prop ( or a universal prop if form is None ).
+    '''
+    if form is None:
+        return prop
+
+    if prop[0] == '.':
+        return f'{form}{prop}'
+
+    return f'{form}:{prop}'
+
+def getPropStatNames(form, prop):
+    if prop[0] == '.':
+        return (getPropStatName(form, prop), prop)
+    return (getPropStatName(form, prop),)
+
+def getTagStatName(form, tag):
+    '''
+    Return the index statistics name for a tag on an optional form.
+    '''
+    if form is None:
+        return f'#{tag}'
+    return f'{form}#{tag}'
+
+def getTagPropStatName(form, tag, prop):
+    '''
+    Return the index statistics name for a tag property on an optional form.
+    '''
+    return f'{getTagStatName(form, tag)}:{prop}'
+
+def getHistBucket(valu):
+    '''
+    Return the inclusive (min, max) range of the histogram bucket which contains an integer.
+
+    Notes:
+        Histogram buckets retain the HIST_BUCKET_BITS most significant bits of
+        the value, which bounds the relative width of each bucket.
+    '''
+    if valu < 0:
+        minv, maxv = getHistBucket(-valu)
+        return (-maxv, -minv)
+
+    shift = valu.bit_length() - HIST_BUCKET_BITS
+    if shift <= 0:
+        return (valu, valu)
+
+    minv = (valu >> shift) << shift
+    return (minv, minv + (1 << shift) - 1)
+
+class IndexStatsDelta:
+    '''
+    The index statistics changes for a batch of node edits which are applied to a layer at once.
+    '''
+    def __init__(self):
+        self.counts = collections.defaultdict(int)
+        self.valus = collections.defaultdict(set)
+        self.hists = collections.defaultdict(lambda: collections.defaultdict(int))
+
+    def addValu(self, name, valu, stortype):
+        self.valus[name].add(s_msgpack.en(valu))
+        self.addHist(name, valu, stortype, 1)
+
+    def addHist(self, name, valu, stortype, incr):
+        if stortype not in HIST_STOR_TYPES or not isinstance(valu, int):
+            return
+        self.hists[name][getHistBucket(valu)[0]] += incr
+
+def getSodeStatEdits(sode):
+    '''
+    Yield the edits used to update the index statistics for an existing storage node.
+    '''
+    valt = sode.get('valu')
+    if valt is not None:
+        yield (EDIT_NODE_ADD, valt, ())
+
+    for prop, (valu, stortype) in sode.get('props', {}).items():
+        yield (EDIT_PROP_SET, (prop, valu, None, stortype), ())
+
+    for tag, valu in sode.get('tags', {}).items():
+        yield (EDIT_TAG_SET, (tag, valu, None), ())
+
+    for tag, props in sode.get('tagprops', {}).items():
+        for prop, (valu, stortype) in props.items():
+            yield (EDIT_TAGPROP_SET, (tag, prop, valu, None, stortype), ())
+
+def _liftByPropRange(path, abrv, startkey, stopkey, maxrows):  # pragma: no cover
+    '''
+    Read the storage nodes for a range of prop index keys from a layer slab.
+
+    NOTE: This function is executed in a worker process which opens the slab read-only.
+
+    Returns:
+        (list, bytes): A list of (buid, sode) tuples and the key to resume from or None.
+    '''
+    rows = []
+
+    with lmdb.open(path, readonly=True, create=False, max_dbs=16384, lock=True) as lenv:
+
+        with lenv.begin() as xact:
+
+            byprop = lenv.open_db(b'byprop', txn=xact, dupsort=True, create=False)
+            bybuid = lenv.open_db(b'bybuidv3', txn=xact, create=False)
+
+            with xact.cursor(db=byprop) as curs:
+
+                if not curs.set_range(startkey):
+                    return rows, None
+
+                lastkey = None
+                for lkey, buid in curs.iternext():
+
+                    if not lkey.startswith(abrv):
+                        return rows, None
+
+                    if stopkey is not None and lkey >= stopkey:
+                        return rows, None
+
+                    # only stop between keys to avoid splitting duplicate values
+                    if len(rows) >= maxrows and lkey != lastkey:
+                        return rows, lkey
+
+                    lastkey = lkey
+
+                    byts = xact.get(buid, db=bybuid)
+                    if byts is None:
+                        continue
+
+                    rows.append((buid, s_msgpack.un(byts)))
+
+    return rows, None
+
+def copysode(sode):
+    '''
+    Return a mutable copy of a storage node.
+
+    NOTE: Only the dict containers are copied. Storage node values are
+          tuples which are never modified in place.
+    '''
+    copy = collections.defaultdict(dict)
+    for name, valu in sode.items():
+
+        if name == 'tagprops':
+            valu = {tag: dict(props) for tag, props in valu.items()}
+
+        elif isinstance(valu, dict):
+            valu = dict(valu)
+
+        copy[name] = valu
+
+    return copy
+
 def getFlatEdits(nodeedits):
 
     editsbynode = collections.defaultdict(list)
@@ -248,6 +248,15 @@ class Link(s_base.Base):
         byts = await self.pack(mesg)
         await self.send(byts)
 
+    async def flush(self):
+        '''
+        Transmit any data which is buffered for the link.
+
+        Notes:
+            The Link does not buffer data, since send() and tx() wait for the
+            writer to drain.  Wrappers which buffer data override this.
+        '''
+
     def txfini(self):
         self.sock.shutdown(1)
 
@@ -1,4 +1,5 @@
 import os
+import time
 import shutil
 import asyncio
 import threading
@@ -750,6 +751,34 @@ def _ceilpo2(i):
 
     return 1 << i.bit_length()
 
+class CommitHist:
+    '''
+    Counts of values in power of 2 buckets used to track slab commit statistics.
+    '''
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.maxvalu = 0
+        self.buckets = collections.defaultdict(int)
+
+    def add(self, valu):
+        valu = max(0, valu)
+        self.count += 1
+        self.total += valu
+        self.maxvalu = max(self.maxvalu, valu)
+        self.buckets[_ceilpo2(valu)] += 1
+
+    def pack(self):
+        '''
+        Return a dictionary of the histogram where buckets are (upper bound, count) tuples.
+        '''
+        return {
+            'count': self.count,
+            'total': self.total,
+            'max': self.maxvalu,
+            'buckets': sorted(self.buckets.items()),
+        }
+
 def _roundup(i, multiple):
     return ((i + multiple - 1) // multiple) * multiple
 
@@ -767,6 +796,24 @@ def _mapsizeround(size):
 class Slab(s_base.Base):
     '''
     A "monolithic" LMDB instance for use in a asyncio loop thread.
+
+    Notes:
+        The commit policy of a slab may be configured using the following
+        options which may also be set in the slab .opts.yaml file:
+
+        commit_period (float): Commit at most every N seconds. If None, the
+        slab commits whenever the sync loop runs ( every COMMIT_PERIOD seconds ).
+        If 0, the slab only commits on an explicit sync() or when the replay
+        log or byte limits are reached.
+
+        commit_bytes (int): Commit when the approximate number of key and
+        value bytes written in the current transaction reaches N.
+
+        max_replay_log (int): Commit when the number of operations in the
+        current transaction reaches N.
+
+        max_replay_grow (int): Allow the replay log to grow up to N operations
+        while the replay log is consistently filled between commits.
     '''
     # The paths of all open slabs, to prevent accidental opening of the same slab in two places
     allslabs = {}  # type: ignore
@@ -808,7 +855,7 @@ class Slab(s_base.Base):
     async def syncLoopTask(clas):
         while True:
             try:
-                await s_coro.event_wait(clas.syncevnt, timeout=clas.COMMIT_PERIOD)
+                await s_coro.event_wait(clas.syncevnt, timeout=clas._getSyncTimeout())
 
                 clas.syncevnt.clear()
 
@@ -820,10 +867,19 @@ class Slab(s_base.Base):
             except Exception:  # pragma: no cover
                 logger.exception('Slab.syncLoopTask')
 
+    @classmethod
+    def _getSyncTimeout(clas):
+        timeout = clas.COMMIT_PERIOD
+        for slab in clas.allslabs.values():
+            if slab.commit_period:
+                timeout = min(timeout, slab.commit_period)
+        return timeout
+
     @classmethod
     async def syncLoopOnce(clas):
+        tick = time.monotonic()
         for slab in list(clas.allslabs.values()):
-            if slab.dirty:
+            if slab.dirty and slab._isCommitDue(tick):
                 await slab.sync()
                 await asyncio.sleep(0)
 
@@ -842,7 +898,9 @@ class Slab(s_base.Base):
                 'maxsize': slab.maxsize,
                 'growsize': slab.growsize,
                 'mapasync': True,
-
+                'xactbytes': slab.xactbytes,
+                'commitpolicy': slab.getCommitPolicy(),
+                'commithist': slab.getCommitHist(),
             })
         return retn
 
@@ -882,9 +940,20 @@ class Slab(s_base.Base):
 
         # save the transaction deltas in case of error...
         self.xactops = []
+        self.xactbytes = 0
         self.max_xactops_len = opts.pop('max_replay_log', 10000)
         self.recovering = False
 
+        # commit policy options
+        self.commit_period = opts.pop('commit_period', None)
+        self.commit_bytes = opts.pop('commit_bytes', None)
+        self.max_replay_base = self.max_xactops_len
+        self.max_replay_grow = opts.pop('max_replay_grow', None)
+        if self.max_replay_grow is not None:
+            self.max_replay_grow = max(self.max_replay_grow, self.max_xactops_len)
+
+        self.lastcommit = time.monotonic()
+
         opts.setdefault('max_dbs', 128)
         opts.setdefault('writemap', True)
 
@@ -956,6 +1025,12 @@ class Slab(s_base.Base):
 
         self.commitstats = collections.deque(maxlen=1000)  # stores Tuple[time, replayloglen, commit time delta]
 
+        self.commithist = {
+            'time': CommitHist(),  # commit latency in milliseconds
+            'xactops': CommitHist(),  # number of operations per commit
+            'xactbytes': CommitHist(),  # approximate bytes written per commit
+        }
+
         if not self.readonly:
             await Slab.initSyncLoop(self)
 
@@ -980,6 +1055,11 @@ class Slab(s_base.Base):
         self.onfini(item)
         return item
 
+    async def getHotKeyVal(self, name):
+        item = await HotKeyVal.anit(self, name)
+        self.onfini(item)
+        return item
+
     def getSeqn(self, name):
         return s_slabseqn.SlabSeqn(self, name)
 
@@ -1006,8 +1086,54 @@ class Slab(s_base.Base):
             'lock_goal': self.lock_goal,  # how much we want to lock
             'prefaulting': self.prefaulting,  # whether we are right meow prefaulting
             'commitstats': list(self.commitstats),  # last X tuple(time,replaylogsize,commit time)
+            'commitpolicy': self.getCommitPolicy(),
+            'commithist': self.getCommitHist(),
         }
 
+    def getCommitPolicy(self):
+        '''
+        Return a dictionary of the current commit policy of the slab.
+        '''
+        return {
+            'period': self.commit_period,
+            'bytes': self.commit_bytes,
+            'replay': self.max_xactops_len,
+            'replay:base': self.max_replay_base,
+            'replay:grow': self.max_replay_grow,
+        }
+
+    def getCommitHist(self):
+        '''
+        Return the commit latency and transaction size histograms for the slab.
+        '''
+        return {name: hist.pack() for name, hist in self.commithist.items()}
+
+    def _isCommitDue(self, tick):
+
+        if len(self.xactops) >= self.max_xactops_len:
+            return True
+
+        if self.commit_bytes is not None and self.xactbytes >= self.commit_bytes:
+            return True
+
+        if self.commit_period is None:
+            return True
+
+        if not self.commit_period:
+            return False
+
+        return tick - self.lastcommit >= self.commit_period
+
+    def _adaptReplayLog(self, xactopslen):
+        # grow the replay log under sustained writes to reduce the number
+        # of commits and shrink it again once the write rate falls off.
+        if xactopslen >= self.max_xactops_len:
+            self.max_xactops_len = min(self.max_replay_grow, self.max_xactops_len * 2)
+            return
+
+        if xactopslen < self.max_xactops_len // 4:
+            self.max_xactops_len = max(self.max_replay_base, self.max_xactops_len // 2)
+
     def _acqXactForReading(self):
         if self.isfini:  # pragma: no cover
             raise s_exc.IsFini()
@@ -1090,6 +1216,7 @@ class Slab(s_base.Base):
         self.xact.commit()
 
         self.xactops.clear()
+        self.xactbytes = 0
 
         del self.xact
         self.xact = None
@@ -1303,6 +1430,34 @@ class Slab(s_base.Base):
         finally:
             self._relXactForReading()
 
+    def getmulti(self, lkeys, db=None):
+        '''
+        Return a list of (lkey, lval) tuples for the given keys using a single cursor.
+
+        Args:
+            lkeys (list): A list of keys ( sorted keys minimize cursor movement ).
+            db (str): The name of the db.
+
+        Notes:
+            The lval is None for keys which are not present in the db.
+
+        Returns:
+            list: A list of (lkey, lval) tuples in the same order as lkeys.
+        '''
+        retn = []
+        self._acqXactForReading()
+        realdb, _ = self.dbnames[db]
+        try:
+            with self.xact.cursor(db=realdb) as curs:
+                for lkey in lkeys:
+                    if curs.set_key(lkey):
+                        retn.append((lkey, curs.value()))
+                    else:
+                        retn.append((lkey, None))
+            return retn
+        finally:
+            self._relXactForReading()
+
     def last(self, db=None):
         '''
         Return the last key/value pair from the given db.
@@ -1447,7 +1602,7 @@ class Slab(s_base.Base):
                     return count
 
                 count += scan.curs.count()
-                if maxsize is not None and maxsize == count:
+                if maxsize is not None and count >= maxsize:
                     return count
 
                 await asyncio.sleep(0)
@@ -1598,7 +1753,13 @@ class Slab(s_base.Base):
     def _logXactOper(self, func, *args, **kwargs):
         self.xactops.append((func, args, kwargs))
 
-        if len(self.xactops) == self.max_xactops_len:
+        if len(self.xactops) >= self.max_xactops_len:
+            self.syncevnt.set()
+
+    def _addXactBytes(self, size):
+        self.xactbytes += size
+
+        if self.commit_bytes is not None and self.xactbytes >= self.commit_bytes:
             self.syncevnt.set()
 
     def _runXactOpers(self):
@@ -1647,6 +1808,7 @@ class Slab(s_base.Base):
 
             if not self.recovering:
                 self._logXactOper(calling_func, lkey, *args, db=db, **kwargs)
+                self._addXactBytes(len(lkey) + sum(len(a) for a in args if isinstance(a, bytes)))
 
             return xact_func(self.xact, lkey, *args, db=realdb, **kwargs)
 
@@ -1693,6 +1855,7 @@ class Slab(s_base.Base):
 
             if not self.recovering:
                 self._logXactOper(self._putmulti, kvpairs, dupdata=dupdata, append=append, db=db)
+                self._addXactBytes(sum(len(k) + len(v) for (k, v) in kvpairs))
 
             with self.xact.cursor(db=realdb) as curs:
                 return curs.putmulti(kvpairs, dupdata=dupdata, append=append)
@@ -1786,6 +1949,7 @@ class Slab(s_base.Base):
             return False
 
         xactopslen = len(self.xactops)
+        xactbytes = self.xactbytes
 
         # ok... lets commit and re-open
         starttime = s_common.now()
@@ -1794,8 +1958,16 @@ class Slab(s_base.Base):
 
         delta = donetime - starttime
 
+        self.lastcommit = time.monotonic()
         self.commitstats.append((starttime, xactopslen, delta))
 
+        self.commithist['time'].add(delta)
+        self.commithist['xactops'].add(xactopslen)
+        self.commithist['xactbytes'].add(xactbytes)
+
+        if self.max_replay_grow is not None:
+            self._adaptReplayLog(xactopslen)
+
         if self.WARN_COMMIT_TIME_MS and delta > self.WARN_COMMIT_TIME_MS:
 
             extra = {
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import zlib
 import heapq
 import bisect
 import shutil
@@ -15,6 +16,7 @@ import synapse.common as s_common
 
 import synapse.lib.base as s_base
 import synapse.lib.coro as s_coro
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.slabseqn as s_slabseqn
 import synapse.lib.lmdbslab as s_lmdbslab
 
@@ -24,6 +26,115 @@ logger = logging.getLogger(__name__)
 
 seqnslabre = regex.compile(r'^seqn([0-9a-f]{16})\.lmdb$')
 
+# the number of uncompressed item bytes stored in each block of a compressed segment
+COMPRESS_BLOCK_SIZE = 256 * 1024
+
+class BlockSeqn:
+    '''
+    A read-only sequence stored as blocks of zlib compressed items.
+
+    Each block is keyed by the index of the first item in the block so
+    reads may seek to an offset by decompressing a single block.
+    '''
+    def __init__(self, slab):
+
+        self.slab = slab
+        self.db = self.slab.initdb('blocks')
+
+        # a (blockkey, rows) tuple for the most recently decompressed block
+        self._cacheblock = None
+
+        self.indx = 0
+        self.size = 0
+
+        last = self.slab.last(db=self.db)
+        if last is not None:
+            rows = self._getBlockRows(*last)
+            self.indx = rows[-1][0] + 1
+
+        byts = self.slab.get(b'size', db=self.slab.initdb('info'))
+        if byts is not None:
+            self.size = s_common.int64un(byts)
+
+    def _getBlockRows(self, lkey, lval):
+
+        if self._cacheblock is not None and self._cacheblock[0] == lkey:
+            return self._cacheblock[1]
+
+        rows = s_msgpack.un(zlib.decompress(lval))
+        self._cacheblock = (lkey, rows)
+        return rows
+
+    def _iterBlocks(self, offs):
+
+        lkey = s_common.int64en(offs)
+
+        # start from the block which contains the offset ( if any )
+        for blockkey, _ in self.slab.scanByRangeBack(lkey, db=self.db):
+            lkey = blockkey
+            break
+
+        yield from self.slab.scanByRange(lkey, db=self.db)
+
+    def first(self):
+        for item in self.iter(0):
+            return item
+        return None
+
+    def last(self):
+
+        last = self.slab.last(db=self.db)
+        if last is None:
+            return None
+
+        indx, byts = self._getBlockRows(*last)[-1]
+        return indx, s_msgpack.un(byts)
+
+    def index(self):
+        return self.indx
+
+    def iter(self, offs):
+        '''
+        Iterate over items in the sequence from a given offset.
+
+        Args:
+            offs (int): The offset to begin iterating from.
+
+        Yields:
+            (indx, valu): The index and valu of the item.
+        '''
+        for lkey, lval in self._iterBlocks(offs):
+            for indx, byts in self._getBlockRows(lkey, lval):
+                if indx >= offs:
+                    yield indx, s_msgpack.un(byts)
+
+    def get(self, offs):
+        '''
+        Retrieve a single row by offset.
+        '''
+        for indx, valu in self.iter(offs):
+            if indx == offs:
+                return valu
+            return None
+
+    def add(self, item, indx=None):
+        return self.addWithPackRetn(item, indx=indx)[0]
+
+    def addWithPackRetn(self, item, indx=None):
+        '''
+        Items may only be re-added to a compressed segment if they are already present.
+        '''
+        byts = s_msgpack.en(item)
+
+        if indx is not None:
+            for offs, valu in self.iter(indx):
+                if offs == indx and s_msgpack.en(valu) == byts:
+                    return indx, byts
+                break
+
+        mesg = f'Cannot add an item at indx {indx} to the compressed segment {self.slab.path}'
+        raise s_exc.BadIndxValu(mesg=mesg, indx=indx)
+
 class MultiSlabSeqn(s_base.Base):
     '''
     An append-optimized sequence of byte blobs stored across multiple slabs for fast rotating/culling
@@ -47,6 +158,10 @@ class MultiSlabSeqn(s_base.Base):
         if opts is None:
             opts = {}
 
+        # recompress segments with zlib once they are rotated and immutable
+        self.compress = opts.get('compress', False)
+        self._compresslock = asyncio.Lock()
+
         self.offsevents: List[Tuple[int, int, asyncio.Event]] = []  # as a heap
         self._waitcounter = 0
 
@@ -81,6 +196,9 @@ class MultiSlabSeqn(s_base.Base):
 
         self.onfini(fini)
 
+        if self.compress:
+            self.schedCoro(self.compressSegments())
+
     def __repr__(self):
         return f'MultiSlabSeqn: {self.dirn!r}'
 
@@ -97,6 +215,30 @@ class MultiSlabSeqn(s_base.Base):
         db = slab.initdb('info')
         return slab.put(b'firstindx', s_common.int64en(indx), db=db)
 
+    @staticmethod
+    def _getSlabSeqn(slab):
+        if slab.dbexists('blocks'):
+            return BlockSeqn(slab)
+        # We use the old name of the sequence to ease migration from the old system
+        return slab.getSeqn('nexuslog')
+
+    def _recoverCompress(self):
+        '''
+        Clean up after a compression which was interrupted by a restart.
+        '''
+        for path in s_common.listdir(self.dirn, glob='*seqn' + '[abcdef01234567890]' * 16 + '.lmdb.*'):
+
+            fn, ext = os.path.splitext(path)
+
+            if ext == '.orig' and not os.path.isdir(fn):
+                logger.warning(f'Restoring uncompressed log {path} to {fn}')
+                os.rename(path, fn)
+                continue
+
+            if ext in ('.orig', '.comp'):
+                logger.warning(f'Removing incomplete log compression {path}')
+                shutil.rmtree(path)
+
     async def _discoverRanges(self):
         '''
         Go through the slabs and get the starting indices of the sequence in each slab
@@ -108,6 +250,8 @@ class MultiSlabSeqn(s_base.Base):
         self.indx = 0  # The next place an add() will go
         lowindx = None
 
+        self._recoverCompress()
+
         # Make sure the files are in order
 
         for fn in sorted(s_common.listdir(self.dirn, glob='*seqn' + '[abcdef01234567890]' * 16 + '.lmdb')):
@@ -137,8 +281,7 @@ class MultiSlabSeqn(s_base.Base):
 
             async with await s_lmdbslab.Slab.anit(fn, **self.slabopts) as slab:
                 self.firstindx = self._getFirstIndx(slab)
-                # We use the old name of the sequence to ease migration from the old system
-                seqn = slab.getSeqn('nexuslog')
+                seqn = self._getSlabSeqn(slab)
 
                 firstitem = seqn.first()
 
@@ -207,12 +350,113 @@ class MultiSlabSeqn(s_base.Base):
             return self._ranges[-1]
 
         logger.info('Rotating %s at indx %d', self.tailslab.path, self.indx)
-        return await self._initTailSlab(self.indx)
+        retn = await self._initTailSlab(self.indx)
+
+        if self.compress:
+            self.schedCoro(self.compressSegments())
+
+        return retn
+
+    async def compressSegments(self) -> int:
+        '''
+        Compress any rotated segments which are not already compressed.
+
+        Returns:
+            int: The number of segments which were compressed.
+        '''
+        count = 0
+        for startidx in self._ranges[:-1]:
+            # compress one segment at a time so cull() only waits for one
+            async with self._compresslock:
+                if await self._compressSegment(startidx):
+                    count += 1
+        return count
+
+    async def _compressSegment(self, startidx: int) -> bool:
+        '''
+        Rewrite a rotated segment as blocks of zlib compressed items.
+        '''
+        fn = self.slabFilename(self.dirn, startidx)
+        tmpfn = fn + '.comp'
+
+        if startidx not in self._ranges[:-1]:
+            return False
+
+        slab, seqn = await self._makeSlab(startidx)
+        try:
+            if isinstance(seqn, BlockSeqn):
+                return False
+
+            logger.info('Compressing log %s', fn)
+
+            if os.path.isdir(tmpfn):  # pragma: no cover
+                shutil.rmtree(tmpfn)
+
+            async with await s_lmdbslab.Slab.anit(tmpfn, **self.slabopts) as compslab:
+
+                compslab.initdb('blocks')
+
+                rows = []
+                size = 0
+                count = 0
+
+                async def saveblock():
+                    byts = await s_coro.executor(zlib.compress, s_msgpack.en(rows))
+                    compslab.put(s_common.int64en(rows[0][0]), byts, db='blocks')
+
+                for indx, byts in seqn.rows(startidx):
+
+                    rows.append((indx, byts))
+                    size += len(byts)
+                    count += 1
+
+                    if size >= COMPRESS_BLOCK_SIZE:
+                        await saveblock()
+                        rows.clear()
+                        size = 0
+
+                if rows:
+                    await saveblock()
+
+                info = compslab.initdb('info')
+                compslab.put(b'firstindx', s_common.int64en(self._getFirstIndx(slab)), db=info)
+                compslab.put(b'size', s_common.int64en(count), db=info)
+
+            try:
+                os.unlink(compslab.optspath)
+            except FileNotFoundError:  # pragma: no cover
+                pass
+
+        finally:
+            await slab.fini()
+
+        if self._cacheridx is not None and self._ranges[self._cacheridx] == startidx:
+            self._cacheridx = None
+            await self._cacheslab.fini()
+            self._cacheslab = self._cacheseqn = None
+
+        if self._openslabs.get(startidx):
+            logger.warning('Log %s will not be compressed since it is in use', fn)
+            shutil.rmtree(tmpfn)
+            return False
+
+        origfn = fn + '.orig'
+        os.rename(fn, origfn)
+        os.rename(tmpfn, fn)
+        shutil.rmtree(origfn)
+
+        logger.info('Compressed log %s', fn)
+        return True
 
     async def cull(self, offs: int) -> bool:
         '''
         Remove entries up to (and including) the given offset.
         '''
+        # compression holds the segment open so wait for it to finish
+        async with self._compresslock:
+            return await self._cull(offs)
+
+    async def _cull(self, offs: int) -> bool:
 
         logger.info('Culling %s at offs %d', self.dirn, offs)
 
@@ -286,7 +530,7 @@ class MultiSlabSeqn(s_base.Base):
             if self.cell is not None:
                 slab.addResizeCallback(self.cell.checkFreeSpace)
 
-            seqn = slab.getSeqn('nexuslog')
+            seqn = self._getSlabSeqn(slab)
 
             self._openslabs[startidx] = slab, seqn
 
@@ -398,6 +642,18 @@ class MultiSlabSeqn(s_base.Base):
 
         return retn
 
+    async def addsWithPackRetn(self, items):
+        '''
+        Add a list of items to the end of the sequence, returning a list of offset and packed item tuples.
+        '''
+        assert self.tailseqn
+        retn = await self.tailseqn.addsWithPackRetn(items, indx=self.indx)
+
+        self.indx += len(retn)
+        self._wake_waiters()
+
+        return retn
+
     async def last(self) -> Optional[Tuple[int, Any]]:
         ridx = self._getRangeIndx(self.indx - 1)
         if ridx is None:
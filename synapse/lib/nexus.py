@@ -4,6 +4,7 @@ import asyncio
 import logging
 import functools
 import contextlib
+import collections
 
 from typing import List, Dict, Any, Callable, Tuple, Optional, AsyncIterator
 
@@ -104,6 +105,11 @@ class NexsRoot(s_base.Base):
         self.applytask = None
         self.issuewait = False
 
+        # concurrently issued events waiting to be written to the log as a group
+        self.grouptask = None
+        self.groupq = collections.deque()
+        self.groupsize = self.cell.conf.get('nexslog:group:size', 1)
+
         self.ready = asyncio.Event()
         self.donexslog = self.cell.conf.get('nexslog:en')
 
@@ -137,7 +143,8 @@ class NexsRoot(s_base.Base):
         elif vers != 2:
             raise s_exc.BadStorageVersion(mesg=f'Got nexus log version {vers}.  Expected 2.  Accidental downgrade?')
 
-        self.nexslog = await s_multislabseqn.MultiSlabSeqn.anit(logpath, cell=cell)
+        opts = {'compress': cell.conf.get('nexslog:compress', False)}
+        self.nexslog = await s_multislabseqn.MultiSlabSeqn.anit(logpath, opts=opts, cell=cell)
 
         # just in case were previously configured differently
         logindx = self.nexslog.index()
@@ -148,6 +155,13 @@ class NexsRoot(s_base.Base):
         self.nexslog.setIndex(maxindx)
 
         async def fini():
+
+            if self.grouptask is not None:
+                self.grouptask.cancel()
+
+            for item, futu in self.groupq:
+                futu.cancel()
+
             for wind in self._linkmirrors:
                 await wind.fini()
 
@@ -272,14 +286,17 @@ class NexsRoot(s_base.Base):
 
     async def recover(self) -> None:
         '''
-        Replays the last entry in the nexus log in case we crashed between writing the log and applying it.
+        Replays the entries in the nexus log after the last applied entry in case we crashed between writing
+        the log and applying it.
 
         Notes:
             This must be called at cell startup after subsystems are initialized but before any write transactions
             might happen.
 
-            The log can only have recorded 1 entry ahead of what is applied.  All log actions are idempotent, so
-            replaying the last action that (might have) already happened is harmless.
+            The log can only have recorded 1 entry (or 1 group of entries when nexslog:group:size is set) ahead
+            of what is applied.  If the index of the last applied entry was not recorded, the last entry is
+            replayed.  All log actions are idempotent, so replaying the last action that (might have) already
+            happened is harmless.
         '''
         if not self.donexslog:  # pragma: no cover
             return
@@ -289,14 +306,22 @@ class NexsRoot(s_base.Base):
             # We have a brand new log
             return
 
-        try:
-            await self._apply(*indxitem)
+        offs = indxitem[0]
 
-        except asyncio.CancelledError:  # pragma: no cover  TODO:  remove once >= py 3.8 only
-            raise
+        applied = self.nexshot.get('nexs:applied', None)
+        if applied is not None:
+            offs = applied + 1
 
-        except Exception:
-            logger.exception(f'Exception while replaying log: {s_common.trimText(repr(indxitem))}')
+        async for indxitem in self.nexslog.iter(offs):
+
+            try:
+                await self._apply(*indxitem)
+
+            except asyncio.CancelledError:  # pragma: no cover  TODO:  remove once >= py 3.8 only
+                raise
+
+            except Exception:
+                logger.exception(f'Exception while replaying log: {s_common.trimText(repr(indxitem))}')
 
     async def addWriteHold(self, reason):
 
@@ -381,6 +406,9 @@ class NexsRoot(s_base.Base):
         if meta is None:
             meta = {}
 
+        if self.groupsize > 1 and self.donexslog:
+            return await self._eatGroup(nexsiden, event, args, kwargs, meta, wait=wait)
+
         await self.cell.nexslock.acquire()
 
         if self.isfini:
@@ -388,16 +416,7 @@ class NexsRoot(s_base.Base):
             raise s_exc.IsFini(mesg=f'Nexus has been shutdown, cannot propose {s_common.trimText(str((nexsiden, event, args, kwargs, meta)))}')
 
         try:
-            if (nexus := self._nexskids.get(nexsiden)) is None:
-                mesg = f'No Nexus Pusher with iden {nexsiden} {event=} args={s_common.trimText(repr(args))} ' \
-                       f'kwargs={s_common.trimText(repr(kwargs))}'
-                raise s_exc.NoSuchIden(mesg=mesg, iden=nexsiden, event=event)
-
-            if event not in nexus._nexshands:
-                mesg = f'No event handler for event {event} args={s_common.trimText(repr(args))} ' \
-                       f'kwargs={s_common.trimText(repr(kwargs))}'
-                raise s_exc.NoSuchName(mesg=mesg, iden=nexsiden, event=event)
-
+            self._reqNexsEvent(nexsiden, event, args, kwargs)
             self.reqNotReadOnly()
 
             # Keep a reference to the shielded task to ensure it isn't GC'd
@@ -410,6 +429,103 @@ class NexsRoot(s_base.Base):
         if wait:
             return await asyncio.shield(self.applytask)
 
+    def _reqNexsEvent(self, nexsiden, event, args, kwargs):
+
+        if (nexus := self._nexskids.get(nexsiden)) is None:
+            mesg = f'No Nexus Pusher with iden {nexsiden} {event=} args={s_common.trimText(repr(args))} ' \
+                   f'kwargs={s_common.trimText(repr(kwargs))}'
+            raise s_exc.NoSuchIden(mesg=mesg, iden=nexsiden, event=event)
+
+        if event not in nexus._nexshands:
+            mesg = f'No event handler for event {event} args={s_common.trimText(repr(args))} ' \
+                   f'kwargs={s_common.trimText(repr(kwargs))}'
+            raise s_exc.NoSuchName(mesg=mesg, iden=nexsiden, event=event)
+
+    async def _eatGroup(self, nexsiden, event, args, kwargs, meta, wait=True):
+        '''
+        Queue an event to be written to the log with any other concurrently issued events.
+        '''
+        item = (nexsiden, event, args, kwargs, meta)
+
+        if self.isfini:
+            raise s_exc.IsFini(mesg=f'Nexus has been shutdown, cannot propose {s_common.trimText(str(item))}')
+
+        self._reqNexsEvent(nexsiden, event, args, kwargs)
+        self.reqNotReadOnly()
+
+        futu = self.loop.create_future()
+        self.groupq.append((item, futu))
+
+        if self.grouptask is None:
+            self.grouptask = asyncio.create_task(self._runGroupLoop())
+
+        if wait:
+            return await asyncio.shield(futu)
+
+    async def _runGroupLoop(self):
+
+        todo = ()
+
+        try:
+            while self.groupq:
+
+                await self.cell.nexslock.acquire()
+
+                size = min(self.groupsize, len(self.groupq))
+                todo = [self.groupq.popleft() for _ in range(size)]
+
+                await self._eatGroupItems(todo)
+                todo = ()
+
+        finally:
+            self.grouptask = None
+
+            for item, futu in todo:
+                if not futu.done():
+                    futu.cancel()
+
+    async def _eatGroupItems(self, todo):
+        '''
+        Write a group of events to the log in a single batch and apply them in order.
+        '''
+        try:
+            if self.isfini:
+                raise s_exc.IsFini(mesg='Nexus has been shutdown, cannot apply a group of events.')
+
+            items = [item for (item, futu) in todo]
+
+            rows = await self.nexslog.addsWithPackRetn(items)
+
+            if self._linkmirrors:
+                tupls = [(saveindx, YIELD_PREFIX + s_msgpack.en(saveindx) + packitem) for (saveindx, packitem) in rows]
+                for wind in tuple(self._linkmirrors):
+                    await wind.puts(tupls)
+
+            if self._mirrors:
+                for dist in tuple(self._mirrors):
+                    dist.update()
+
+            for (saveindx, packitem), (item, futu) in zip(rows, todo):
+
+                try:
+                    retn = await self._apply(saveindx, item)
+
+                except Exception as e:
+                    if not futu.done():
+                        futu.set_exception(e)
+
+                else:
+                    if not futu.done():
+                        futu.set_result((saveindx, retn))
+
+        except Exception as e:
+            for item, futu in todo:
+                if not futu.done():
+                    futu.set_exception(e)
+
+        finally:
+            self.cell.nexslock.release()
+
     async def _eat(self, item, indx=None):
 
         try:
@@ -447,10 +563,19 @@ class NexsRoot(s_base.Base):
         nexus = self._nexskids[nexsiden]
         func, passitem = nexus._nexshands[event]
 
-        if passitem:
-            return await func(nexus, *args, nexsitem=(indx, mesg), **kwargs)
+        try:
+            if passitem:
+                retn = await func(nexus, *args, nexsitem=(indx, mesg), **kwargs)
+            else:
+                retn = await func(nexus, *args, **kwargs)
+
+        except Exception:
+            self.nexshot.set('nexs:applied', indx)
+            raise
 
-        return await func(nexus, *args, **kwargs)
+        # recover() only replays the log entries after the last applied entry
+        self.nexshot.set('nexs:applied', indx)
+        return retn
 
     async def index(self):
         if self.donexslog:
@@ -20,14 +20,24 @@ class Node:
 
     NOTE: This object is for local Cortex use during a single Xact.
     '''
-    def __init__(self, snap, sode, bylayer=None):
+    __slots__ = (
+        'snap', 'buid', 'ndef', 'form', 'props', 'tags', 'tagprops', 'nodedata',
+        'sodes', 'isrunt', '_bylayer', '__weakref__',
+    )
+
+    def __init__(self, snap, sode, bylayer=None, sodes=None):
         self.snap = snap
-        self.sode = sode
 
         self.buid = sode[0]
 
         # Tracks which property is retrieved from which layer
-        self.bylayer = bylayer
+        self._bylayer = bylayer
+
+        # The (layriden, sode) tuples the node was joined from which are
+        # used to construct bylayer on demand.
+        self.sodes = sodes
+
+        self.isrunt = False
 
         # if set, the node is complete.
         self.ndef = sode[1].get('ndef')
@@ -49,6 +59,13 @@ class Node:
         if self.nodedata is None:
             self.nodedata = {}
 
+    @property
+    def bylayer(self):
+        if self._bylayer is None and self.sodes is not None:
+            self._bylayer = getSodesByLayer(self.sodes)
+            self.sodes = None
+        return self._bylayer
+
     async def getStorNodes(self):
         '''
         Return a list of the raw storage nodes for each layer.
@@ -727,6 +744,53 @@ class Node:
         async for name in self.snap.iterNodeDataKeys(self.buid):
             yield name
 
+def getSodesByLayer(sodes):
+    '''
+    Return a bylayer dictionary for a list of (layriden, sode) tuples.
+
+    Args:
+        sodes (list): A list of (layriden, sode) tuples ordered from the bottom layer up.
+
+    Returns:
+        dict: A dictionary of which layer each of the ndef, props, tags, and tagprops came from.
+    '''
+    bylayer = {
+        'ndef': None,
+        'tags': {},
+        'props': {},
+        'tagprops': {},
+    }
+
+    for (layr, sode) in sodes:
+
+        if sode.get('valu') is not None:
+            bylayer['ndef'] = layr
+
+        storprops = sode.get('props')
+        if storprops is not None:
+            for prop in storprops.keys():
+                bylayer['props'][prop] = layr
+
+        stortags = sode.get('tags')
+        if stortags is not None:
+            for tag in stortags.keys():
+                bylayer['tags'][tag] = layr
+
+        stortagprops = sode.get('tagprops')
+        if stortagprops is not None:
+            for tag, propdict in stortagprops.items():
+                if not propdict:
+                    continue
+
+                tagbylayer = bylayer['tagprops'].get(tag)
+                if tagbylayer is None:
+                    tagbylayer = bylayer['tagprops'][tag] = {}
+
+                for tagprop in propdict.keys():
+                    tagbylayer[tagprop] = layr
+
+    return bylayer
+
 class Path:
     '''
     A path context tracked through the storm runtime.
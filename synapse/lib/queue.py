@@ -5,6 +5,7 @@ import collections
 import synapse.exc as s_exc
 import synapse.common as s_common
 import synapse.lib.base as s_base
+import synapse.lib.scope as s_scope
 
 class AQueue(s_base.Base):
     '''
@@ -144,6 +145,10 @@ class Window(s_base.Base):
             if self.isfini:
                 return
 
+            # don't hold data buffered for the link while waiting
+            if (link := s_scope.get('link')) is not None:
+                await link.flush()
+
             self.event.clear()
             await self.event.wait()
 
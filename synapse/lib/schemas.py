@@ -286,6 +286,10 @@ _stormPoolOptsSchema = {
     'properties': {
         'timeout:sync': {'type': 'integer', 'minimum': 1},
         'timeout:connection': {'type': 'integer', 'minimum': 1},
+        'weight:inflight': {'type': 'number', 'minimum': 0},
+        'weight:latency': {'type': 'number', 'minimum': 0},
+        'weight:nexslag': {'type': 'number', 'minimum': 0},
+        'pin': {'type': 'boolean'},
     },
     'additionalProperties': False,
 }
@@ -115,6 +115,35 @@ class SlabSeqn:
 
         return indx, packitem
 
+    async def addsWithPackRetn(self, items, indx=None):
+        '''
+        Add a list of items to the end of the sequence, returning a list of offset and packed item tuples.
+
+        Args:
+            items (list): The items to add.
+            indx (int): The offset of the first item which must not be lower than the current index.
+        '''
+        rows = []
+        retn = []
+
+        if indx is None:
+            indx = self.indx
+
+        for item in items:
+            packitem = s_msgpack.en(item)
+            rows.append((s_common.int64en(indx), packitem))
+            retn.append((indx, packitem))
+            indx += 1
+
+        await self.slab.putmulti(rows, append=True, db=self.db)
+
+        self.indx = indx
+        self.size += len(rows)
+
+        self._wake_waiters()
+
+        return retn
+
     def first(self):
 
         for lkey, lval in self.slab.scanByFull(db=self.db):
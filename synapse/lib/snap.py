@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 import types
 import asyncio
 import logging
@@ -18,10 +19,252 @@ import synapse.lib.cache as s_cache
 import synapse.lib.layer as s_layer
 import synapse.lib.storm as s_storm
 import synapse.lib.types as s_types
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.lmdbslab as s_lmdbslab
 
 logger = logging.getLogger(__name__)
 
+# the estimated memory footprint of a Node and its dicts
+NODE_BASE_SIZE = 1024
+# the estimated memory footprint of each prop/tag/tagprop in a Node
+NODE_ITEM_SIZE = 256
+# the estimated memory footprint of a storage node and its dicts
+SODE_BASE_SIZE = 512
+# the number of recently invalidated buids the node cache remembers
+NODE_CACHE_POP_HISTORY = 100000
+
+def getPodeSize(pode):
+    '''
+    Return the estimated memory footprint in bytes of a Node constructed from a pode.
+    '''
+    info = pode[1]
+    return _calcNodeSize(info.get('props'), info.get('tags'), info.get('tagprops'), info.get('nodedata'))
+
+def getSodesSize(sodes):
+    '''
+    Return the estimated memory footprint in bytes of the (layriden, sode) tuples a Node was joined from.
+    '''
+    size = 0
+    for _, sode in sodes:
+
+        size += SODE_BASE_SIZE
+
+        props = sode.get('props')
+        if props:
+            size += NODE_ITEM_SIZE * len(props)
+            for valu, _ in props.values():
+                if isinstance(valu, str):
+                    size += len(valu)
+
+        tags = sode.get('tags')
+        if tags:
+            size += NODE_ITEM_SIZE * len(tags)
+
+        tagprops = sode.get('tagprops')
+        if tagprops:
+            for props in tagprops.values():
+                size += NODE_ITEM_SIZE * len(props)
+
+    return size
+
+def copyPode(pode):
+    '''
+    Return a copy of a joined pode which does not share any mutable dicts with the original.
+    '''
+    info = pode[1]
+    return (pode[0], {
+        'ndef': info['ndef'],
+        'tags': info['tags'].copy(),
+        'props': info['props'].copy(),
+        'nodedata': info['nodedata'].copy(),
+        'tagprops': {tag: props.copy() for (tag, props) in info['tagprops'].items()},
+    })
+
+def getNodeSize(node):
+    '''
+    Return the estimated memory footprint in bytes of a Node.
+    '''
+    return _calcNodeSize(node.props, node.tags, node.tagprops, node.nodedata)
+
+def _calcNodeSize(props, tags, tagprops, nodedata):
+
+    size = NODE_BASE_SIZE
+
+    if props:
+        size += NODE_ITEM_SIZE * len(props)
+        for valu in props.values():
+            if isinstance(valu, str):
+                size += len(valu)
+
+    if tags:
+        size += NODE_ITEM_SIZE * len(tags)
+
+    if tagprops:
+        for props in tagprops.values():
+            size += NODE_ITEM_SIZE * len(props)
+
+    if nodedata:
+        size += len(s_msgpack.en(nodedata))
+
+    return size
+
+class NodeKeepAlive:
+    '''
+    A FIFO of recently used Node objects bounded by their estimated memory footprint.
+    '''
+    def __init__(self, maxsize):
+        self.size = 0
+        self.maxsize = maxsize
+        self.nodes = collections.deque()
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def append(self, node):
+
+        size = getNodeSize(node)
+
+        self.size += size
+        self.nodes.append((node, size))
+
+        # always keep the most recent node alive
+        while self.size > self.maxsize and len(self.nodes) > 1:
+            self.size -= self.nodes.popleft()[1]
+
+    def clear(self):
+        self.size = 0
+        self.nodes.clear()
+
+class NodeCache:
+    '''
+    A memory bounded LRU cache of joined node data which is shared by the Snaps of read-only views.
+
+    Entries are keyed by buid and the idens of the layers the node was joined from and are
+    invalidated by the edits made to any layer.
+
+    Notes:
+        Cached pode dictionaries must not be modified. Callers must use copyPode() to
+        construct a Node from a cached pode.
+    '''
+    def __init__(self, maxsize, pophist=NODE_CACHE_POP_HISTORY):
+
+        self.size = 0
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # incremented for every invalidation so readers may detect a racing edit
+        self.editgen = 0
+
+        # buid -> editgen of the most recent invalidation for a bounded number of buids.
+        # Readers which started before popfloor may have missed an invalidation.
+        self.popped = collections.OrderedDict()
+        self.popfloor = 0
+        self.pophist = pophist
+
+        self.cache = collections.OrderedDict()  # buid -> {layridens: (pode, sodes, size)}
+
+    def __len__(self):
+        return sum(len(ents) for ents in self.cache.values())
+
+    def get(self, buid, layridens):
+        '''
+        Return a (pode, sodes, size) tuple for the buid joined from the layers or None.
+        '''
+        ents = self.cache.get(buid)
+        if ents is not None:
+            item = ents.get(layridens)
+            if item is not None:
+                self.hits += 1
+                self.cache.move_to_end(buid)
+                return item
+
+        self.misses += 1
+        return None
+
+    def isFresh(self, buid, editgen):
+        '''
+        Return True if the buid has not been invalidated since the given edit generation.
+        '''
+        return self.popped.get(buid, self.popfloor) <= editgen
+
+    def put(self, buid, layridens, pode, sodes, editgen=None):
+        '''
+        Store the pode for the buid joined from the layers.
+
+        Args:
+            editgen (int): The edit generation from before the storage nodes were read.
+                           The pode is not stored if the buid was invalidated since.
+
+        Returns:
+            bool: True if the pode was stored.
+        '''
+        if editgen is not None and not self.isFresh(buid, editgen):
+            return False
+
+        # the storage nodes are retained by the entry after the layers evict them
+        size = getPodeSize(pode) + getSodesSize(sodes)
+        if size > self.maxsize:
+            return False
+
+        ents = self.cache.get(buid)
+        if ents is None:
+            ents = self.cache[buid] = {}
+        else:
+            self.cache.move_to_end(buid)
+
+        item = ents.get(layridens)
+        if item is not None:
+            self.size -= item[2]
+
+        ents[layridens] = (pode, sodes, size)
+        self.size += size
+
+        while self.size > self.maxsize:
+            _, ents = self.cache.popitem(last=False)
+            for item in ents.values():
+                self.size -= item[2]
+                self.evictions += 1
+
+        return True
+
+    def pop(self, buid):
+        '''
+        Invalidate any cached entries for the buid.
+        '''
+        self.editgen += 1
+
+        self.popped[buid] = self.editgen
+        self.popped.move_to_end(buid)
+
+        while len(self.popped) > self.pophist:
+            _, self.popfloor = self.popped.popitem(last=False)
+
+        ents = self.cache.pop(buid, None)
+        if ents is not None:
+            for item in ents.values():
+                self.size -= item[2]
+
+    def clear(self):
+        self.editgen += 1
+        self.popfloor = self.editgen
+        self.popped.clear()
+
+        self.size = 0
+        self.cache.clear()
+
+    def pack(self):
+        return {
+            'size': self.size,
+            'maxsize': self.maxsize,
+            'count': len(self),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
 class Scrubber:
 
     def __init__(self, rules):
@@ -60,6 +303,10 @@ class ProtoNode:
     TODO: This could eventually fully mirror the synapse.lib.node.Node API and be used
           to slipstream into sections of the pipeline to facilitate a bulk edit / transaction
     '''
+    __slots__ = (
+        'ctx', 'form', 'valu', 'buid', 'node', 'tags', 'props', 'edges', 'tagprops', 'nodedata', 'edgedels',
+    )
+
     def __init__(self, ctx, buid, form, valu, node):
         self.ctx = ctx
         self.form = form
@@ -677,7 +924,6 @@ class Snap(s_base.Base):
     ('print', {}),
     '''
     tagcachesize = 1000
-    buidcachesize = 100000
 
     async def __anit__(self, view, user):
         '''
@@ -702,6 +948,13 @@ class Snap(s_base.Base):
 
         self.readonly = self.wlyr.readonly
 
+        self.layridens = tuple(layr.iden for layr in self.layers)
+
+        # snaps which may not edit nodes share joined node data
+        self.nodecache = None
+        if self.readonly:
+            self.nodecache = self.core.nodecache
+
         # variables used by the storm runtime
         self.vars = {}
 
@@ -714,7 +967,7 @@ class Snap(s_base.Base):
         self.tagnorms = s_cache.FixedCache(self._getTagNorm, size=self.tagcachesize)
         self.tagcache = s_cache.FixedCache(self._getTagNode, size=self.tagcachesize)
         # Keeps alive the most recently accessed node objects
-        self.buidcache = collections.deque(maxlen=self.buidcachesize)
+        self.buidcache = NodeKeepAlive(self.core.conf.get('snap:cache:size'))
         self.livenodes = weakref.WeakValueDictionary()  # buid -> Node
         self._warnonce_keys = set()
 
@@ -940,6 +1193,22 @@ class Snap(s_base.Base):
         '''
         return await self._joinStorNode(buid, {})
 
+    async def getNodesByBuids(self, buids):
+        '''
+        Retrieve a list of nodes by binary id.
+
+        Args:
+            buids (list): A list of binary IDs.
+
+        Notes:
+            Storage nodes which are not already loaded are resolved
+            from each layer in a single batch.
+
+        Returns:
+            List[Optional[s_node.Node]]: A list of nodes (or None) in the same order as buids.
+        '''
+        return await self._joinStorNodes(buids)
+
     async def getNodeByNdef(self, ndef):
         '''
         Return a single Node by (form,valu) tuple.
@@ -955,17 +1224,19 @@ class Snap(s_base.Base):
         return await self.getNodeByBuid(buid)
 
     async def nodesByTagProp(self, form, tag, name, reverse=False):
+        editgen = self._getNodeCacheGen()
         prop = self.core.model.getTagProp(name)
         if prop is None:
             mesg = f'No tag property named {name}'
             raise s_exc.NoSuchTagProp(name=name, mesg=mesg)
 
         async for (buid, sodes) in self.core._liftByTagProp(form, tag, name, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
+            node = await self._joinSodes(buid, sodes, editgen=editgen)
             if node is not None:
                 yield node
 
     async def nodesByTagPropValu(self, form, tag, name, cmpr, valu, reverse=False):
+        editgen = self._getNodeCacheGen()
         prop = self.core.model.getTagProp(name)
         if prop is None:
             mesg = f'No tag property named {name}'
@@ -977,7 +1248,7 @@ class Snap(s_base.Base):
             return
 
         async for (buid, sodes) in self.core._liftByTagPropValu(form, tag, name, cmprvals, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
+            node = await self._joinSodes(buid, sodes, editgen=editgen)
             if node is not None:
                 yield node
 
@@ -988,6 +1259,16 @@ class Snap(s_base.Base):
             await asyncio.sleep(0)
             return node
 
+        editgen = None
+        if self.nodecache is not None and not cache:
+
+            item = self.nodecache.get(buid, self.layridens)
+            if item is not None:
+                await asyncio.sleep(0)
+                return self._initLiveNode(copyPode(item[0]), item[1])
+
+            editgen = self.nodecache.editgen
+
         layrs = [layr for layr in self.layers if layr.iden not in cache]
         if layrs:
             indx = 0
@@ -1001,9 +1282,55 @@ class Snap(s_base.Base):
                 indx += 1
             sodes.append((layr.iden, sode))
 
-        return await self._joinSodes(buid, sodes)
+        return await self._joinSodes(buid, sodes, editgen=editgen)
+
+    async def _joinStorNodes(self, buids):
+
+        todo = []
+        cached = {}
+        for buid in buids:
+
+            if buid in self.livenodes:
+                continue
+
+            if self.nodecache is not None:
+                item = self.nodecache.get(buid, self.layridens)
+                if item is not None:
+                    cached[buid] = self._initLiveNode(copyPode(item[0]), item[1])
+                    continue
+
+            todo.append(buid)
+
+        editgen = self._getNodeCacheGen()
+
+        sodes = {}
+        if todo:
+            layriden = [layr.iden for layr in self.layers]
+            for buid, sodelist in zip(todo, await self.core._getStorNodesBatch(todo, self.layers)):
+                sodes[buid] = list(zip(layriden, sodelist))
+
+        nodes = []
+        for buid in buids:
+
+            node = self.livenodes.get(buid)
+            if node is None:
+                node = cached.get(buid)
 
-    async def _joinSodes(self, buid, sodes):
+            if node is None:
+                sodelist = sodes.get(buid)
+                if sodelist is None:
+                    # the node was evicted from livenodes after we checked
+                    node = await self._joinStorNode(buid, {})
+                else:
+                    node = await self._joinSodes(buid, sodelist, editgen=editgen)
+            else:
+                await asyncio.sleep(0)
+
+            nodes.append(node)
+
+        return nodes
+
+    async def _joinSodes(self, buid, sodes, editgen=None):
 
         node = self.livenodes.get(buid)
         if node is not None:
@@ -1016,31 +1343,22 @@ class Snap(s_base.Base):
         nodedata = {}
         tagprops = {}
 
-        bylayer = {
-            'ndef': None,
-            'tags': {},
-            'props': {},
-            'tagprops': {},
-        }
-
+        # NOTE: bylayer is constructed from the sodes by the Node on demand
         for (layr, sode) in sodes:
 
             form = sode.get('form')
             valt = sode.get('valu')
             if valt is not None:
                 ndef = (form, valt[0])
-                bylayer['ndef'] = layr
 
             storprops = sode.get('props')
             if storprops is not None:
                 for prop, (valu, stype) in storprops.items():
-                    props[prop] = valu
-                    bylayer['props'][prop] = layr
+                    props[sys.intern(prop)] = valu
 
             stortags = sode.get('tags')
             if stortags is not None:
                 tags.update(stortags)
-                bylayer['tags'].update({p: layr for p in stortags.keys()})
 
             stortagprops = sode.get('tagprops')
             if stortagprops is not None:
@@ -1048,10 +1366,8 @@ class Snap(s_base.Base):
                     for tagprop, (valu, stype) in propdict.items():
                         if tag not in tagprops:
                             tagprops[tag] = {}
-                            bylayer['tagprops'][tag] = {}
 
-                        tagprops[tag][tagprop] = valu
-                        bylayer['tagprops'][tag][tagprop] = layr
+                        tagprops[tag][sys.intern(tagprop)] = valu
 
             stordata = sode.get('nodedata')
             if stordata is not None:
@@ -1069,21 +1385,40 @@ class Snap(s_base.Base):
             'tagprops': tagprops,
         })
 
-        node = s_node.Node(self, pode, bylayer=bylayer)
+        # only cache node data which was not modified while it was being read
+        if editgen is not None and not nodedata:
+            if self.nodecache.put(buid, self.layridens, pode, sodes, editgen=editgen):
+                pode = copyPode(pode)
+
+        node = self._initLiveNode(pode, sodes)
+
+        await asyncio.sleep(0)
+        return node
+
+    def _getNodeCacheGen(self):
+        # snapshot the node cache generation before reading storage nodes
+        if self.nodecache is None:
+            return None
+        return self.nodecache.editgen
+
+    def _initLiveNode(self, pode, sodes):
+
+        node = s_node.Node(self, pode, sodes=sodes)
         if self.cachebuids:
-            self.livenodes[buid] = node
+            self.livenodes[node.buid] = node
             self.buidcache.append(node)
 
-        await asyncio.sleep(0)
         return node
 
     async def nodesByDataName(self, name):
+        editgen = self._getNodeCacheGen()
         async for (buid, sodes) in self.core._liftByDataName(name, self.layers):
-            node = await self._joinSodes(buid, sodes)
+            node = await self._joinSodes(buid, sodes, editgen=editgen)
             if node is not None:
                 yield node
 
     async def nodesByProp(self, full, reverse=False):
+        editgen = self._getNodeCacheGen()
 
         prop = self.core.model.prop(full)
         if prop is None:
@@ -1097,14 +1432,14 @@ class Snap(s_base.Base):
 
         if prop.isform:
             async for (buid, sodes) in self.core._liftByProp(prop.name, None, self.layers, reverse=reverse):
-                node = await self._joinSodes(buid, sodes)
+                node = await self._joinSodes(buid, sodes, editgen=editgen)
                 if node is not None:
                     yield node
             return
 
         if prop.isuniv:
             async for (buid, sodes) in self.core._liftByProp(None, prop.name, self.layers, reverse=reverse):
-                node = await self._joinSodes(buid, sodes)
+                node = await self._joinSodes(buid, sodes, editgen=editgen)
                 if node is not None:
                     yield node
             return
@@ -1115,11 +1450,37 @@ class Snap(s_base.Base):
 
         # Prop is secondary prop
         async for (buid, sodes) in self.core._liftByProp(formname, prop.name, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
+            node = await self._joinSodes(buid, sodes, editgen=editgen)
+            if node is not None:
+                yield node
+
+    async def nodesByFormParallel(self, form, procs):
+        '''
+        Yield the nodes of a form using worker processes to read the form index.
+
+        Args:
+            form (str): The form name.
+            procs (int): The maximum number of worker processes to use.
+
+        Notes:
+            Nodes are not yielded in index order.  Views with more than one
+            layer fall back to a serial lift.
+        '''
+        if len(self.layers) > 1:
+            async for node in self.nodesByProp(form):
+                yield node
+            return
+
+        layr = self.layers[0]
+
+        editgen = self._getNodeCacheGen()
+        async for buid, sode in layr.liftByFormParallel(form, procs):
+            node = await self._joinSodes(buid, [(layr.iden, sode)], editgen=editgen)
             if node is not None:
                 yield node
 
     async def nodesByPropValu(self, full, cmpr, valu, reverse=False, norm=True):
+        editgen = self._getNodeCacheGen()
         if cmpr == 'type=':
             if reverse:
                 async for node in self.nodesByPropTypeValu(full, valu, reverse=reverse):
@@ -1181,7 +1542,7 @@ class Snap(s_base.Base):
 
         if prop.isform:
             async for (buid, sodes) in self.core._liftByFormValu(prop.name, cmprvals, self.layers, reverse=reverse):
-                node = await self._joinSodes(buid, sodes)
+                node = await self._joinSodes(buid, sodes, editgen=editgen)
                 if node is not None:
                     yield node
 
@@ -1189,26 +1550,28 @@ class Snap(s_base.Base):
 
         if prop.isuniv:
             async for (buid, sodes) in self.core._liftByPropValu(None, prop.name, cmprvals, self.layers, reverse=reverse):
-                node = await self._joinSodes(buid, sodes)
+                node = await self._joinSodes(buid, sodes, editgen=editgen)
                 if node is not None:
                     yield node
             return
 
         async for (buid, sodes) in self.core._liftByPropValu(prop.form.name, prop.name, cmprvals, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
+            node = await self._joinSodes(buid, sodes, editgen=editgen)
             if node is not None:
                 yield node
 
     async def nodesByTag(self, tag, form=None, reverse=False):
+        editgen = self._getNodeCacheGen()
         async for (buid, sodes) in self.core._liftByTag(tag, form, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
+            node = await self._joinSodes(buid, sodes, editgen=editgen)
             if node is not None:
                 yield node
 
     async def nodesByTagValu(self, tag, cmpr, valu, form=None, reverse=False):
+        editgen = self._getNodeCacheGen()
         norm, info = self.core.model.type('ival').norm(valu)
         async for (buid, sodes) in self.core._liftByTagValu(tag, cmpr, norm, form, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
+            node = await self._joinSodes(buid, sodes, editgen=editgen)
             if node is not None:
                 yield node
 
@@ -1227,6 +1590,7 @@ class Snap(s_base.Base):
                 yield node
 
     async def nodesByPropArray(self, full, cmpr, valu, reverse=False, norm=True):
+        editgen = self._getNodeCacheGen()
 
         prop = self.core.model.prop(full)
         if prop is None:
@@ -1244,7 +1608,7 @@ class Snap(s_base.Base):
 
         if prop.isform:
             async for (buid, sodes) in self.core._liftByPropArray(prop.name, None, cmprvals, self.layers, reverse=reverse):
-                node = await self._joinSodes(buid, sodes)
+                node = await self._joinSodes(buid, sodes, editgen=editgen)
                 if node is not None:
                     yield node
             return
@@ -1254,7 +1618,7 @@ class Snap(s_base.Base):
             formname = prop.form.name
 
         async for (buid, sodes) in self.core._liftByPropArray(formname, prop.name, cmprvals, self.layers, reverse=reverse):
-            node = await self._joinSodes(buid, sodes)
+            node = await self._joinSodes(buid, sodes, editgen=editgen)
             if node is not None:
                 yield node
 
@@ -1,8 +1,10 @@
+import asyncio
 import tempfile
 
 import synapse.common as s_common
 
 import synapse.lib.base as s_base
+import synapse.lib.bloom as s_bloom
 import synapse.lib.const as s_const
 import synapse.lib.msgpack as s_msgpack
 import synapse.lib.lmdbslab as s_lmdbslab
@@ -10,6 +12,12 @@ import synapse.lib.lmdbslab as s_lmdbslab
 MAX_SPOOL_SIZE = 10000
 DEFAULT_MAPSIZE = s_const.mebibyte * 32
 
+# the number of items buffered in memory before being written to the slab
+SPOOL_BATCH_SIZE = 1000
+
+# the minimum number of items the fallback bloom filter is sized for
+MIN_BLOOM_SIZE = 100000
+
 class Spooled(s_base.Base):
     '''
     A Base class that can be used to implement objects which fallback to lmdb.
@@ -30,6 +38,8 @@ class Spooled(s_base.Base):
         self.size = size
         self.dirn = dirn
         self.slab = None
+        self.bloom = None
+        self.rebloom = None
         self.fallback = False
 
         async def fini():
@@ -53,6 +63,63 @@ class Spooled(s_base.Base):
         if self.cell is not None:
             self.slab.addResizeCallback(self.cell.checkFreeSpace)
 
+        # 32 byte values ( buids ) are stored raw in their own db to skip msgpack
+        self.itemdb = self.slab.initdb('items')
+        self.buiddb = self.slab.initdb('buids')
+
+        # the bloom filter contains the keys of every item which has been spooled
+        self.bloom = s_bloom.BloomFilter(max(self.size * 10, MIN_BLOOM_SIZE))
+
+    async def _flush(self):
+        pass
+
+    def _getLkey(self, valu):
+        '''
+        Return a (lkey, db) tuple for storing the value in the slab.
+        '''
+        if type(valu) is bytes and len(valu) == 32:
+            return valu, self.buiddb
+        return s_msgpack.en(valu), self.itemdb
+
+    def _getValu(self, lkey, db):
+        if db == self.buiddb:
+            return lkey
+        return s_msgpack.un(lkey)
+
+    def _iterLkeys(self):
+        for db in (self.itemdb, self.buiddb):
+            for lkey in self.slab.scanKeys(db=db):
+                yield lkey, db
+
+    async def _addBloomKey(self, lkey):
+
+        self.bloom.add(lkey)
+
+        # keys added while a larger bloom filter is built are added to both
+        if self.rebloom is not None:
+            self.rebloom.add(lkey)
+            return
+
+        if not self.bloom.isfull():
+            return
+
+        # build a larger bloom filter from the spooled keys and only replace
+        # the current one once it is complete so membership checks stay correct
+        bloom = self.rebloom = s_bloom.BloomFilter(self.bloom.capacity * 4)
+
+        try:
+            await self._flush()
+
+            for indx, (lkey, db) in enumerate(self._iterLkeys()):
+                bloom.add(lkey)
+                if indx % 10000 == 0:
+                    await asyncio.sleep(0)
+
+        finally:
+            self.rebloom = None
+
+        self.bloom = bloom
+
 class Set(Spooled):
     '''
     A minimal set-like implementation that will spool to a slab on large growth.
@@ -63,6 +130,9 @@ class Set(Spooled):
         self.realset = set()
         self.len = 0
 
+        # new (lkey, db) tuples which have not been written to the slab yet
+        self.pending = set()
+
     async def __aiter__(self):
 
         if not self.fallback:
@@ -70,14 +140,41 @@ class Set(Spooled):
                 yield item
             return
 
-        for byts in self.slab.scanKeys():
-            yield s_msgpack.un(byts)
+        await self._flush()
+
+        for lkey, db in self._iterLkeys():
+            yield self._getValu(lkey, db)
 
     def __contains__(self, valu):
         if self.fallback:
-            return self.slab.get(s_msgpack.en(valu)) is not None
+            return self._hasLkey(*self._getLkey(valu))
         return valu in self.realset
 
+    def _hasLkey(self, lkey, db):
+
+        if lkey not in self.bloom:
+            return False
+
+        if (lkey, db) in self.pending:
+            return True
+
+        return self.slab.has(lkey, db=db)
+
+    async def _flush(self):
+
+        if not self.pending:
+            return
+
+        todo = {}
+        for lkey, db in self.pending:
+            todo.setdefault(db, []).append((lkey, b'\x01'))
+
+        self.pending.clear()
+
+        for db, kvpairs in todo.items():
+            kvpairs.sort()
+            await self.slab.putmulti(kvpairs, db=db)
+
     def __len__(self):
         '''
         Returns how many items are in the set, regardless of whether in RAM or backed to slab
@@ -91,8 +188,11 @@ class Set(Spooled):
         newset = await Set.anit(dirn=self.dirn, size=self.size, cell=self.cell)
 
         if self.fallback:
+            await self._flush()
             await newset._initFallBack()
-            await self.slab.copydb(None, newset.slab)
+            await self.slab.copydb(self.itemdb, newset.slab, destdbname=newset.itemdb)
+            await self.slab.copydb(self.buiddb, newset.slab, destdbname=newset.buiddb)
+            newset.bloom = self.bloom.copy()
             newset.len = self.len
 
         else:
@@ -103,6 +203,7 @@ class Set(Spooled):
     async def clear(self):
         if self.fallback:
             self.len = 0
+            self.pending.clear()
             await self.slab.trash()
             await self._initFallBack()
         else:
@@ -111,27 +212,54 @@ class Set(Spooled):
     async def add(self, valu):
 
         if self.fallback:
-            if self.slab.put(s_msgpack.en(valu), b'\x01', overwrite=False):
-                self.len += 1
+
+            lkey, db = self._getLkey(valu)
+            if self._hasLkey(lkey, db):
+                return
+
+            self.len += 1
+            self.pending.add((lkey, db))
+            await self._addBloomKey(lkey)
+
+            if len(self.pending) >= SPOOL_BATCH_SIZE:
+                await self._flush()
+
             return
 
         self.realset.add(valu)
 
         if len(self.realset) >= self.size:
             await self._initFallBack()
-            [self.slab.put(s_msgpack.en(valu), b'\x01') for valu in self.realset]
+
+            for valu in self.realset:
+                lkey, db = self._getLkey(valu)
+                self.bloom.add(lkey)
+                self.pending.add((lkey, db))
+
             self.len = len(self.realset)
             self.realset.clear()
 
+            await self._flush()
+
     def has(self, key):
         if self.fallback:
-            return self.slab.has(s_msgpack.en(key))
+            return self._hasLkey(*self._getLkey(key))
         return key in self.realset
 
     def discard(self, valu):
 
         if self.fallback:
-            ret = self.slab.pop(s_msgpack.en(valu))
+
+            lkey, db = self._getLkey(valu)
+            if lkey not in self.bloom:
+                return
+
+            if (lkey, db) in self.pending:
+                self.pending.discard((lkey, db))
+                self.len -= 1
+                return
+
+            ret = self.slab.pop(lkey, db=db)
             if ret is None:
                 return
             self.len -= 1
@@ -155,7 +283,17 @@ class Dict(Spooled):
     async def set(self, key, val):
 
         if self.fallback:
-            if self.slab.replace(s_msgpack.en(key), s_msgpack.en(val)) is None:
+
+            lkey, db = self._getLkey(key)
+
+            # keys which are not in the bloom filter may skip reading the previous value
+            if lkey not in self.bloom:
+                self.slab.put(lkey, s_msgpack.en(val), db=db)
+                await self._addBloomKey(lkey)
+                self.len += 1
+                return
+
+            if self.slab.replace(lkey, s_msgpack.en(val), db=db) is None:
                 self.len += 1
             return
 
@@ -163,13 +301,28 @@ class Dict(Spooled):
 
         if len(self.realdict) >= self.size:
             await self._initFallBack()
-            [self.slab.put(s_msgpack.en(k), s_msgpack.en(v)) for (k, v) in self.realdict.items()]
+
+            todo = {}
+            for (k, v) in self.realdict.items():
+                lkey, db = self._getLkey(k)
+                self.bloom.add(lkey)
+                todo.setdefault(db, []).append((lkey, s_msgpack.en(v)))
+
+            for db, kvpairs in todo.items():
+                kvpairs.sort()
+                await self.slab.putmulti(kvpairs, db=db)
+
             self.len = len(self.realdict)
             self.realdict.clear()
 
     def pop(self, key, defv=None):
         if self.fallback:
-            ret = self.slab.pop(s_msgpack.en(key))
+
+            lkey, db = self._getLkey(key)
+            if lkey not in self.bloom:
+                return defv
+
+            ret = self.slab.pop(lkey, db=db)
             if ret is None:
                 return defv
             self.len -= 1
@@ -178,13 +331,23 @@ class Dict(Spooled):
 
     def has(self, key):
         if self.fallback:
-            return self.slab.has(s_msgpack.en(key))
+
+            lkey, db = self._getLkey(key)
+            if lkey not in self.bloom:
+                return False
+
+            return self.slab.has(lkey, db=db)
         return key in self.realdict
 
     def get(self, key, defv=None):
 
         if self.fallback:
-            byts = self.slab.get(s_msgpack.en(key))
+
+            lkey, db = self._getLkey(key)
+            if lkey not in self.bloom:
+                return defv
+
+            byts = self.slab.get(lkey, db=db)
             if byts is None:
                 return defv
             return s_msgpack.un(byts)
@@ -194,8 +357,8 @@ class Dict(Spooled):
     def keys(self):
 
         if self.fallback:
-            for lkey in self.slab.scanKeys():
-                yield s_msgpack.un(lkey)
+            for lkey, db in self._iterLkeys():
+                yield self._getValu(lkey, db)
 
         # avoid edit while iter issues...
         for key in list(self.realdict.keys()):
@@ -204,8 +367,9 @@ class Dict(Spooled):
     def items(self):
 
         if self.fallback:
-            for lkey, lval in self.slab.scanByFull():
-                yield s_msgpack.un(lkey), s_msgpack.un(lval)
+            for db in (self.itemdb, self.buiddb):
+                for lkey, lval in self.slab.scanByFull(db=db):
+                    yield self._getValu(lkey, db), s_msgpack.un(lval)
 
         for item in list(self.realdict.items()):
             yield item
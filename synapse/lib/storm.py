@@ -1407,6 +1407,18 @@ class Runtime(s_base.Base):
         self.readonly = opts.get('readonly', False)  # EXPERIMENTAL: Make it safe to run untrusted queries
         self.model = snap.core.getDataModel()
 
+        # EXPERIMENTAL: the number of worker processes to use for full form lifts
+        self.parallel = opts.get('parallel')
+        if self.parallel is not None:
+
+            if not isinstance(self.parallel, int) or self.parallel < 1:
+                mesg = 'The parallel option must be a positive integer.'
+                raise s_exc.BadArg(mesg=mesg, name='parallel')
+
+            if not self.readonly:
+                mesg = 'The parallel option may only be used with readonly queries.'
+                raise s_exc.BadArg(mesg=mesg, name='parallel')
+
         self.task = asyncio.current_task()
         self.emitq = None
 
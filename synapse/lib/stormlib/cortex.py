@@ -1237,6 +1237,48 @@ class CortexHttpApi(s_stormtypes.Lib):
         index = await s_stormtypes.toint(index)
         return await self.runt.snap.view.core.setHttpApiIndx(iden, index)
 
+@s_stormtypes.registry.registerLib
+class CortexStormPool(s_stormtypes.Lib):
+    '''
+    A Storm Library for inspecting the Storm query offload mirror pool.
+    '''
+    _storm_locals = (
+        {'name': 'stats', 'desc': '''
+            Get the load statistics for the mirrors in the Storm pool.
+
+            Notes:
+                Each dictionary contains the following keys:
+
+                    name: The AHA service name of the mirror.
+                    online: True if the mirror is currently connected.
+                    count: The number of queries which have been offloaded to the mirror.
+                    errors: The number of offloaded queries which raised an exception.
+                    inflight: The number of offloaded queries currently running on the mirror.
+                    latency: The moving average of the duration of offloaded queries in milliseconds.
+                    nexslag: The number of Nexus entries the mirror was behind when last checked.
+
+            Examples:
+                Print the number of in-flight queries for each mirror::
+
+                    for $info in $lib.cortex.storm.pool.stats() {
+                        $lib.print(`{$info.name}: {$info.inflight}`)
+                    }''',
+         'type': {'type': 'function', '_funcname': 'getStats', 'args': (),
+                  'returns': {'type': ['list', 'null'],
+                              'desc': 'A list of dictionaries or null if no Storm pool is configured.'}}},
+    )
+    _storm_lib_path = ('cortex', 'storm', 'pool')
+
+    def getObjLocals(self):
+        return {
+            'stats': self.getStats,
+        }
+
+    @s_stormtypes.stormfunc(readonly=True)
+    async def getStats(self):
+        self.runt.reqAdmin(mesg='$lib.cortex.storm.pool.stats() requires global admin permissions.')
+        return await self.runt.snap.core.getStormPoolStats()
+
 class StormPoolSetCmd(s_storm.Cmd):
     '''
     Setup a Storm query offload mirror pool for the Cortex.
@@ -1248,6 +1290,14 @@ class StormPoolSetCmd(s_storm.Cmd):
             help='The maximum amount of time to wait for a connection from the pool to become available.')
         pars.add_argument('--sync-timeout', type='int', default=2,
             help='The maximum amount of time to wait for the mirror to be in sync with the leader')
+        pars.add_argument('--weight-inflight', type='float', default=1.0,
+            help='The routing weight of each query in-flight on a mirror.')
+        pars.add_argument('--weight-latency', type='float', default=1.0,
+            help='The routing weight of each second of average query latency on a mirror.')
+        pars.add_argument('--weight-nexslag', type='float', default=0.01,
+            help='The routing weight of each Nexus entry a mirror was behind the leader when last checked.')
+        pars.add_argument('--pin', default=False, action='store_true',
+            help='Route queries to a mirror selected by a hash of the query text rather than by load.')
         pars.add_argument('url', type='str', required=True, help='The telepath URL for the AHA service pool.')
         return pars
 
@@ -1271,6 +1321,10 @@ class StormPoolSetCmd(s_storm.Cmd):
         opts = {
             'timeout:sync': self.opts.sync_timeout,
             'timeout:connection': self.opts.connection_timeout,
+            'weight:inflight': self.opts.weight_inflight,
+            'weight:latency': self.opts.weight_latency,
+            'weight:nexslag': self.opts.weight_nexslag,
+            'pin': self.opts.pin,
         }
 
         await self.runt.snap.core.setStormPool(self.opts.url, opts)
@@ -1321,3 +1375,7 @@ class StormPoolGetCmd(s_storm.Cmd):
         await self.runt.printf(f'Storm Pool URL: {url}')
         await self.runt.printf(f'Sync Timeout (secs): {opts.get("timeout:sync")}')
         await self.runt.printf(f'Connection Timeout (secs): {opts.get("timeout:connection")}')
+        await self.runt.printf(f'In-flight Query Weight: {opts.get("weight:inflight", 1.0)}')
+        await self.runt.printf(f'Query Latency Weight: {opts.get("weight:latency", 1.0)}')
+        await self.runt.printf(f'Nexus Lag Weight: {opts.get("weight:nexslag", 0.01)}')
+        await self.runt.printf(f'Pin Queries By Hash: {opts.get("pin", False)}')
@@ -0,0 +1,164 @@
+'''
+Load aware selection of Storm pool mirrors.
+'''
+import time
+import hashlib
+import contextlib
+
+# the weight of the most recent query in the latency moving average
+LATENCY_ALPHA = 0.2
+
+def getMirrorName(proxy):
+    '''
+    Return the name used to track the load of a Storm pool mirror proxy.
+
+    Mirrors without an AHA service name are tracked separately for each proxy.
+    '''
+    name = proxy._ahainfo.get('name')
+    if name is not None:
+        return name
+
+    return f'proxy:{id(proxy):x}'
+
+class MirrorStats:
+    '''
+    Query load statistics for a single Storm pool mirror.
+    '''
+    def __init__(self, name):
+
+        self.name = name
+
+        self.count = 0
+        self.errors = 0
+        self.inflight = 0
+
+        self.nexslag = 0
+        self.latency = None  # moving average of the time to the first result in seconds
+
+        self.lastused = 0.0
+
+    def addLatency(self, took):
+        if self.latency is None:
+            self.latency = took
+            return
+
+        self.latency += LATENCY_ALPHA * (took - self.latency)
+
+    def pack(self):
+
+        latency = None
+        if self.latency is not None:
+            latency = int(self.latency * 1000)
+
+        return {
+            'name': self.name,
+            'count': self.count,
+            'errors': self.errors,
+            'inflight': self.inflight,
+            'latency': latency,
+            'nexslag': self.nexslag,
+        }
+
+class QueryTrack:
+    '''
+    The timing of a single query which is being run on a mirror.
+    '''
+    def __init__(self, stats):
+        self.stats = stats
+        self.tick = time.monotonic()
+        self.took = None
+
+    def onResult(self):
+        '''
+        Record the time to the first result of a streaming query.
+        '''
+        if self.took is None:
+            self.took = time.monotonic() - self.tick
+
+class StormPoolRouter:
+    '''
+    Track the load of Storm pool mirrors and order them for routing queries.
+
+    Mirrors are ordered by a weighted score of the number of in-flight queries,
+    the moving average of query latency and the Nexus lag at the last check.
+    Mirrors with equal scores are ordered by least recent use.
+
+    If the "pin" option is set, mirrors are instead ordered by rendezvous
+    hashing of the query text so each query is routed to the same mirror
+    while it is available.
+    '''
+    def __init__(self, opts):
+        self.opts = opts
+        self.stats = {}
+
+    def getStats(self, name):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = MirrorStats(name)
+        return stats
+
+    def getScore(self, stats):
+
+        score = stats.inflight * self.opts.get('weight:inflight', 1.0)
+        score += stats.nexslag * self.opts.get('weight:nexslag', 0.01)
+
+        if stats.latency is not None:
+            score += stats.latency * self.opts.get('weight:latency', 1.0)
+
+        return score
+
+    def order(self, names, text=None):
+        '''
+        Return the given mirror names in the order they should be used for a query.
+        '''
+        if text is not None and self.opts.get('pin', False):
+
+            def rank(name):
+                byts = f'{name}:{text}'.encode(errors='surrogatepass')
+                return hashlib.md5(byts, usedforsecurity=False).digest()
+
+            return sorted(names, key=rank, reverse=True)
+
+        def load(name):
+            stats = self.getStats(name)
+            return (self.getScore(stats), stats.lastused, name)
+
+        return sorted(names, key=load)
+
+    def setNexsLag(self, name, nexslag):
+        self.getStats(name).nexslag = max(nexslag, 0)
+
+    @contextlib.contextmanager
+    def track(self, name):
+        '''
+        Track a query which is being run on the named mirror.
+
+        The latency of a query is the time to its first result, which streaming
+        queries record using QueryTrack.onResult(), or else its duration.  The
+        time taken to consume a stream is not counted as mirror latency.
+        '''
+        stats = self.getStats(name)
+        query = QueryTrack(stats)
+
+        stats.inflight += 1
+        stats.lastused = query.tick
+
+        try:
+            yield query
+
+        except Exception:
+            stats.errors += 1
+            raise
+
+        finally:
+            stats.count += 1
+            stats.inflight -= 1
+
+            took = query.took
+            if took is None:
+                took = time.monotonic() - query.tick
+
+            stats.addLatency(took)
+
+    def pack(self):
+        return [self.stats[name].pack() for name in sorted(self.stats.keys())]
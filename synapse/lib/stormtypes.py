@@ -3646,11 +3646,28 @@ class LibExport(Lib):
                        'default': None, },
                   ),
                   'returns': {'type': 'list', 'desc': 'Returns a tuple of (size, sha256).', }}},
+        {'name': 'colstoaxon', 'desc': '''
+            Run a query and save the values of the given columns for the resulting nodes
+            to the axon as a stream of dictionary encoded column batches.
+
+            Notes:
+                Column names may be ``iden``, ``form``, ``valu``, a property such as ``:asn``
+                or ``.seen``, a tag such as ``#foo.bar`` or a tag property such as ``#foo.bar:score``.
+            ''',
+         'type': {'type': 'function', '_funcname': 'colstoaxon',
+                  'args': (
+                      {'name': 'query', 'type': 'str', 'desc': 'A query to run as an export.', },
+                      {'name': 'cols', 'type': 'list', 'desc': 'A list of column names to export.', },
+                      {'name': 'opts', 'type': 'dict', 'desc': 'Storm runtime query option params.',
+                       'default': None, },
+                  ),
+                  'returns': {'type': 'list', 'desc': 'Returns a tuple of (size, sha256).', }}},
     )
 
     def getObjLocals(self):
         return {
             'toaxon': self.toaxon,
+            'colstoaxon': self.colstoaxon,
         }
 
     async def toaxon(self, query, opts=None):
@@ -3669,6 +3686,26 @@ class LibExport(Lib):
         opts.setdefault('view', self.runt.snap.view.iden)
         return await self.runt.snap.core.exportStormToAxon(query, opts=opts)
 
+    async def colstoaxon(self, query, cols, opts=None):
+
+        query = await tostr(query)
+        cols = await toprim(cols)
+        if not isinstance(cols, (list, tuple)):
+            mesg = '$lib.export.colstoaxon() cols argument must be a list.'
+            raise s_exc.BadArg(mesg=mesg)
+
+        opts = await toprim(opts)
+        if opts is None:
+            opts = {}
+
+        if not isinstance(opts, dict):
+            mesg = '$lib.export.colstoaxon() opts argument must be a dictionary.'
+            raise s_exc.BadArg(mesg=mesg)
+
+        opts['user'] = self.runt.snap.user.iden
+        opts.setdefault('view', self.runt.snap.view.iden)
+        return await self.runt.snap.core.exportStormColsToAxon(query, cols, opts=opts)
+
 @registry.registerLib
 class LibFeed(Lib):
     '''
@@ -7109,6 +7146,30 @@ class Layer(Prim):
                        'desc': 'A specific value of the property to look up.', },
                   ),
                   'returns': {'type': 'int', 'desc': 'The count of rows.', }}},
+        {'name': 'getIndexStats', 'desc': '''
+            Get the statistics catalog entry for an index in the layer.
+
+            Notes:
+                The returned dictionary contains the row ``count``, the estimated number of
+                ``distinct`` values and a value ``histogram`` of (min, max, count) tuples.
+                The distinct estimate and histogram are null if they are not available for
+                the index.
+
+            Examples:
+                Get the estimated number of distinct ASNs on ``inet:ipv4`` nodes::
+
+                    $stats = $lib.layer.get().getIndexStats(inet:ipv4:asn)
+                    $lib.print($stats.distinct)
+
+                Get the statistics for the ``cno.mal`` tag on ``inet:ipv4`` nodes::
+
+                    $stats = $lib.layer.get().getIndexStats(inet:ipv4#cno.mal)''',
+         'type': {'type': 'function', '_funcname': '_methGetIndexStats',
+                  'args': (
+                      {'name': 'name', 'type': 'str',
+                       'desc': 'The form, property, tag or tag property index name in Storm syntax.', },
+                  ),
+                  'returns': {'type': 'dict', 'desc': 'The statistics for the index.', }}},
         {'name': 'getFormCounts', 'desc': '''
             Get the formcounts for the Layer.
 
@@ -7431,6 +7492,7 @@ class Layer(Prim):
             'getPropValues': self._methGetPropValues,
             'getTagPropCount': self._methGetTagPropCount,
             'getPropArrayCount': self._methGetPropArrayCount,
+            'getIndexStats': self._methGetIndexStats,
             'getFormCounts': self._methGetFormcount,
             'getStorNode': self.getStorNode,
             'getStorNodes': self.getStorNodes,
@@ -7774,6 +7836,14 @@ class Layer(Prim):
 
         return layr.getTagPropValuCount(form, tag, prop.name, prop.type.stortype, norm)
 
+    @stormfunc(readonly=True)
+    async def _methGetIndexStats(self, name):
+        name = await tostr(name)
+        layriden = self.valu.get('iden')
+        await self.runt.reqUserCanReadLayer(layriden)
+        layr = self.runt.snap.core.getLayer(layriden)
+        return await layr.getIndexStats(name)
+
     @stormfunc(readonly=True)
     async def _methGetPropValues(self, propname):
         propname = await tostr(propname)
@@ -7834,7 +7904,7 @@ class Layer(Prim):
         layriden = self.valu.get('iden')
         await self.runt.reqUserCanReadLayer(layriden)
         layr = self.runt.snap.core.getLayer(layriden)
-        return await layr.getStorNode(nodeid)
+        return s_msgpack.deepcopy(await layr.getStorNode(nodeid))
 
     @stormfunc(readonly=True)
     async def getStorNodes(self):
@@ -7860,7 +7930,7 @@ class Layer(Prim):
     @stormfunc(readonly=True)
     async def getStorNodesByProp(self, propname, propvalu=None, propcmpr='='):
         async for buid, sode in self._liftByProp(propname, propvalu=propvalu, propcmpr=propcmpr):
-            yield s_common.ehex(buid), sode
+            yield s_common.ehex(buid), s_msgpack.deepcopy(sode)
 
     @stormfunc(readonly=True)
     async def hasEdge(self, nodeid1, verb, nodeid2):
@@ -630,7 +630,8 @@ class View(s_nexus.Pusher):  # type: ignore
         '''
         Return a list of storage nodes for the given buid in layer order.
         '''
-        return await self.core._getStorNodes(buid, self.layers)
+        sodes = await self.core._getStorNodes(buid, self.layers)
+        return [s_msgpack.deepcopy(sode) for sode in sodes]
 
     def init2(self):
         '''
@@ -881,6 +881,9 @@ class Proxy(s_base.Base):
                 'name': name,
                 'sess': self.sess})
 
+        if self._hasTeleFeat('batchyield'):
+            mesg[1]['batch'] = True
+
         link = await self.getPoolLink()
 
         await link.tx(mesg)
@@ -906,6 +909,11 @@ class Proxy(s_base.Base):
                         if mesg is None:
                             raise s_exc.LinkShutDown(mesg='Remote peer disconnected')
 
+                        if mesg[0] == 't2:yields':
+                            for item in mesg[1].get('items'):
+                                yield item
+                            continue
+
                         if mesg[0] != 't2:yield':  # pragma: no cover
                             info = 'Telepath protocol violation:  unexpected message received'
                             raise s_exc.BadMesgFormat(mesg=info)
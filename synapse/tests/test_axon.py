@@ -18,6 +18,7 @@ import synapse.axon as s_axon
 import synapse.common as s_common
 import synapse.telepath as s_telepath
 
+import synapse.lib.cdc as s_cdc
 import synapse.lib.coro as s_coro
 import synapse.lib.json as s_json
 import synapse.lib.certdir as s_certdir
@@ -534,6 +535,147 @@ bar baz",vv
 
             self.eq(bbufretn[0], await axon.save(bbufhash, emptygen(), size=bbufretn[0]))
 
+    async def test_axon_blobstor_files(self):
+
+        with self.getTestDir() as dirn:
+
+            async with self.getTestAxon(dirn=dirn, conf={'blob:store': 'files'}) as axon:
+
+                self.isinstance(axon.blobstor, s_axon.FileBlobStor)
+                self.false(hasattr(axon, 'blobslab'))
+
+                await self.runAxonTestBase(axon)
+
+                size, sha256 = await axon.put(b'asdfqwerzxcv')
+                path = axon.blobstor._getBlobPath(sha256)
+                with open(path, 'rb') as fd:
+                    self.eq(b'asdfqwerzxcv', fd.read())
+
+                self.eq(b'dfqw', b''.join([b async for b in axon.get(sha256, 2, size=4)]))
+                self.eq(b'zxcv', b''.join([b async for b in axon.get(sha256, 8, size=100)]))
+
+                # blobs whose file does not match the expected size are not committed
+                sha256 = hashlib.sha256(b'hehehaha').digest()
+                tmppath = axon.blobstor._getTempPath(sha256)
+
+                with self.raises(s_exc.BadDataValu):
+                    await axon.blobstor.commit(sha256, 8)
+
+                await axon._axonBytsSave(sha256, 0, 4, b'hehe')
+                with self.raises(s_exc.BadDataValu):
+                    await axon.blobstor.commit(sha256, 8)
+                self.false(os.path.isfile(tmppath))
+
+                await axon._axonBytsSave(sha256, 0, 4, b'hehe')
+                await axon._axonBytsSave(sha256, 1, 10, b'haha!!')
+                with self.raises(s_exc.BadDataValu):
+                    await axon.blobstor.commit(sha256, 8)
+                self.false(os.path.isfile(tmppath))
+                self.false(os.path.isfile(axon.blobstor._getBlobPath(sha256)))
+
+                # chunks are written at their offsets
+                await axon._axonBytsSave(sha256, 1, 8, b'haha')
+                await axon._axonBytsSave(sha256, 0, 4, b'hehe')
+                await axon._axonFileAdd(sha256, 8, {'tick': s_common.now()})
+                self.eq(b'hehehaha', b''.join([b async for b in axon.get(sha256)]))
+                self.false(os.path.isfile(axon.blobstor._getTempPath(sha256)))
+
+                # committing an already committed blob is a no-op
+                await axon.blobstor.commit(sha256, 8)
+                self.eq(b'hehehaha', b''.join([b async for b in axon.get(sha256)]))
+
+                self.true(await axon.del_(sha256))
+                self.false(os.path.isfile(axon.blobstor._getBlobPath(sha256)))
+                await axon.blobstor.delete(sha256)
+
+            with self.raises(s_exc.BadConfValu):
+                async with self.getTestAxon(dirn=dirn, conf={'blob:store': 'lmdb'}) as axon:
+                    pass
+
+            async with self.getTestAxon(dirn=dirn) as axon:
+                self.isinstance(axon.blobstor, s_axon.FileBlobStor)
+                self.eq(b'asdfqwerzxcv', b''.join([b async for b in axon.get(hashlib.sha256(b'asdfqwerzxcv').digest())]))
+
+        with self.getTestDir() as dirn:
+
+            async with self.getTestAxon(dirn=dirn) as axon:
+                self.isinstance(axon.blobstor, s_axon.LmdbBlobStor)
+
+            with self.raises(s_exc.BadConfValu):
+                async with self.getTestAxon(dirn=dirn, conf={'blob:store': 'files'}) as axon:
+                    pass
+
+        blobstor = await s_axon.BlobStor.anit(None)
+        with self.raises(s_exc.NoSuchImpl):
+            await blobstor.save(asdfhash, 0, 4, b'asdf')
+        with self.raises(s_exc.NoSuchImpl):
+            await blobstor.get(asdfhash).__anext__()
+        with self.raises(s_exc.NoSuchImpl):
+            await blobstor.getOffsSize(asdfhash, 0, 4).__anext__()
+        with self.raises(s_exc.NoSuchImpl):
+            await blobstor.delete(asdfhash)
+        await blobstor.fini()
+
+    async def test_axon_blobstor_cdc(self):
+
+        with self.getTestDir() as dirn:
+
+            async with self.getTestAxon(dirn=dirn, conf={'blob:store': 'cdc'}) as axon:
+
+                self.isinstance(axon.blobstor, s_axon.CdcBlobStor)
+
+                await self.runAxonTestBase(axon)
+
+                for sha256 in [s async for _, (s, _) in axon.hashes(0)]:
+                    await axon.del_(sha256)
+
+                metrics = await axon.metrics()
+                self.eq(0, metrics['blob:chunk:count'])
+                self.eq(0, metrics['blob:chunk:bytes'])
+                self.eq(0, metrics['blob:ref:bytes'])
+
+                byts = os.urandom(8 * s_cdc.MAX_SIZE)
+                edit = byts[:s_cdc.MAX_SIZE] + b'hehe' + byts[s_cdc.MAX_SIZE:]
+
+                size, sha256 = await axon.put(byts)
+                editsize, editsha256 = await axon.put(edit)
+
+                self.eq(byts, b''.join([b async for b in axon.get(sha256)]))
+                self.eq(edit, b''.join([b async for b in axon.get(editsha256)]))
+
+                # the near duplicate file only adds a few chunks
+                metrics = await axon.metrics()
+                self.eq(size + editsize, metrics['blob:ref:bytes'])
+                self.lt(metrics['blob:chunk:bytes'], size + 3 * s_cdc.MAX_SIZE)
+
+                for offs, rsize in ((0, 10), (1, 10), (s_cdc.MAX_SIZE - 2, 10), (10, s_cdc.MAX_SIZE * 2), (100, size)):
+                    self.eq(edit[offs:offs + rsize], b''.join([b async for b in axon.get(editsha256, offs, rsize)]))
+
+                # saving the same chunks again does not add references
+                await axon._axonBytsSave(sha256, 0, size, byts)
+                self.eq(size + editsize, (await axon.metrics())['blob:ref:bytes'])
+
+                self.true(await axon.del_(sha256))
+                self.false(await axon.has(sha256))
+                self.eq(edit, b''.join([b async for b in axon.get(editsha256)]))
+
+                metrics = await axon.metrics()
+                self.eq(editsize, metrics['blob:ref:bytes'])
+                self.eq(editsize, metrics['blob:chunk:bytes'])
+
+                self.true(await axon.del_(editsha256))
+                metrics = await axon.metrics()
+                self.eq(0, metrics['blob:chunk:count'])
+                self.eq(0, metrics['blob:ref:bytes'])
+                self.eq(0, axon.blobstor.slab.stat(db=axon.blobstor.blobs)['entries'])
+
+                size, sha256 = await axon.put(byts)
+
+            async with self.getTestAxon(dirn=dirn) as axon:
+                self.isinstance(axon.blobstor, s_axon.CdcBlobStor)
+                self.eq(byts, b''.join([b async for b in axon.get(sha256)]))
+                self.eq(size, (await axon.metrics())['blob:ref:bytes'])
+
     async def test_axon_proxy(self):
         async with self.getTestAxon() as axon:
             async with axon.getLocalProxy() as prox:
@@ -24,9 +24,11 @@ import synapse.lib.layer as s_layer
 import synapse.lib.storm as s_storm
 import synapse.lib.output as s_output
 import synapse.lib.msgpack as s_msgpack
+import synapse.lib.columnar as s_columnar
 import synapse.lib.version as s_version
 import synapse.lib.modelrev as s_modelrev
 import synapse.lib.stormsvc as s_stormsvc
+import synapse.lib.stormpool as s_stormpool
 
 import synapse.tools.service.backup as s_tools_backup
 import synapse.tools.service.promote as s_tools_promote
@@ -2685,6 +2687,66 @@ class CortexTest(s_t_utils.SynTest):
                 with self.raises(s_exc.BadSyntax):
                     await core.nodes(q)
 
+    async def test_cortex_storm_query_cache(self):
+
+        async with self.getTestCore() as core:
+
+            info = await core.getStormQueryCacheInfo()
+            self.eq(info['maxsize'], core.conf.get('storm:query:cache:size'))
+
+            text = '[ test:str=$x ] $lib.print($node.value())'
+
+            query = await core.getStormQuery(text)
+            self.true(query.isinit)
+            self.true(query is await core.getStormQuery(text))
+            self.false(query is await core.getStormQuery(text, mode='lookup'))
+
+            # the same compiled query is shared by every execution
+            opts = {'vars': {'x': 'foo'}}
+            msgs = await core.stormlist(text, opts=opts)
+            self.stormIsInPrint('foo', msgs)
+
+            opts = {'vars': {'x': 'bar'}}
+            msgs = await core.stormlist(text, opts=opts)
+            self.stormIsInPrint('bar', msgs)
+
+            self.true(query is await core.getStormQuery(text))
+            self.len(2, await core.nodes('test:str'))
+
+            info = await core.getStormQueryCacheInfo()
+            self.ge(info['hits'], 4)
+            self.eq(info['size'], sum(size for (valu, size) in core.querycache.cache.values()))
+            self.eq(info['count'], len(core.querycache))
+
+            size = core._getStormQuerySize((text, 'storm'), query)
+            self.eq(size, len(text) + query.getAstSize())
+
+            # eval ASTs are shared rather than copied for each call
+            astvalu = await core._getStormEval('(1 + 2)')
+            self.true(astvalu is await core._getStormEval('(1 + 2)'))
+            self.eq(3, await core.callStorm('return($lib.storm.eval("(1 + 2)"))'))
+
+            self.eq(info['hits'], (await core.getCellInfo())['cortex']['querycache']['hits'])
+
+            async with core.getLocalProxy() as proxy:
+                info = await proxy.getStormQueryCacheInfo()
+                self.eq(info['count'], len(core.querycache))
+
+        conf = {'storm:query:cache:size': 20000}
+        async with self.getTestCore(conf=conf) as core:
+
+            for i in range(20):
+                await core.nodes(f'[ test:int={i} ] | limit 1')
+
+            info = await core.getStormQueryCacheInfo()
+            self.le(info['size'], 20000)
+            self.lt(info['count'], 20)
+            self.gt(info['evictions'], 0)
+
+            # the most recently used queries are kept
+            self.isin(('[ test:int=19 ] | limit 1', 'storm'), core.querycache.cache)
+            self.notin(('[ test:int=0 ] | limit 1', 'storm'), core.querycache.cache)
+
     async def test_cortex_storm_set_univ(self):
 
         async with self.getTestReadWriteCores() as (core, wcore):
@@ -4815,6 +4877,142 @@ class CortexBasicTest(s_t_utils.SynTest):
 
             self.true(slab.lockmemory)
 
+    async def test_cortex_add_nodes_bulk(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('[ inet:ipv4=1.2.3.4 :asn=10 +#foo.bar ]')
+
+            items = [
+                (('inet:ipv4', 0x01020304), {'props': {'asn': 10}, 'tags': {'foo.bar': (None, None)}}),
+                (('inet:ipv4', 0x01020305), {'props': {'asn': 20}, 'tags': {'foo.baz': (1000, 2000)}}),
+                (('inet:ipv4', 0x01020305), {'props': {'loc': 'us'}}),
+                (('inet:fqdn', 'vertex.link'), {}),
+            ]
+
+            retn = await core.addNodesBulk(items, chunksize=2)
+            self.eq(3, retn['nodes'])
+            self.eq(2, retn['added'])
+            self.eq(2, retn['edited'])
+            self.gt(retn['rate'], 0)
+
+            nodes = await core.nodes('inet:ipv4=1.2.3.5')
+            self.len(1, nodes)
+            self.eq(20, nodes[0].get('asn'))
+            self.eq('us', nodes[0].get('loc'))
+            self.nn(nodes[0].get('.created'))
+            self.eq((1000, 2000), nodes[0].getTag('foo.baz'))
+            self.eq((None, None), nodes[0].getTag('foo'))
+
+            self.len(1, await core.nodes('syn:tag=foo.baz'))
+            self.len(1, await core.nodes('inet:fqdn=vertex.link'))
+            self.eq(2, await core.count('inet:ipv4'))
+
+            # existing values produce no edits and tag intervals are merged
+            items = [
+                (('inet:ipv4', 0x01020305), {'props': {'asn': 20}, 'tags': {'foo.baz': (1000, 2000)}}),
+                (('inet:ipv4', 0x01020304), {'tags': {'foo.bar': (3000, 4000)}}),
+            ]
+            retn = await core.addNodesBulk(items)
+            self.eq(0, retn['added'])
+            self.eq(1, retn['edited'])
+
+            nodes = await core.nodes('inet:ipv4=1.2.3.5')
+            self.eq((1000, 2000), nodes[0].getTag('foo.baz'))
+
+            # nodes in a lower layer are not re-added to a fork
+            view = await core.callStorm('return($lib.view.get().fork().iden)')
+            items = [
+                (('inet:ipv4', 0x01020305), {'props': {'asn': 30}}),
+                (('inet:ipv4', 0x01020306), {}),
+            ]
+            retn = await core.addNodesBulk(items, viewiden=view)
+            self.eq(1, retn['added'])
+            self.eq(2, retn['edited'])
+            self.len(1, await core.nodes('inet:ipv4:asn=30', opts={'view': view}))
+            self.len(0, await core.nodes('inet:ipv4:asn=30'))
+            self.len(0, await core.nodes('inet:ipv4=1.2.3.6'))
+
+            with self.raises(s_exc.NoSuchView):
+                await core.addNodesBulk(items, viewiden='newp')
+
+            with self.raises(s_exc.NoSuchForm):
+                await core.addNodesBulk([(('newp:newp', 10), {})])
+
+            with self.raises(s_exc.NoSuchProp):
+                await core.addNodesBulk([(('inet:ipv4', 10), {'props': {'newp': 10}})])
+
+            with self.raises(s_exc.IsRuntForm):
+                await core.addNodesBulk([(('syn:cmd', 'newp'), {})])
+
+            with self.raises(s_exc.BadTypeValu):
+                await core.addNodesBulk([(('inet:ipv4', 10), {'tags': {'Foo.Bar': (None, None)}})])
+
+            self.len(0, await core.nodes('inet:ipv4=0.0.0.10'))
+
+            # values are checked against their types before any edits are saved
+            with self.raises(s_exc.BadTypeValu) as cm:
+                await core.addNodesBulk([(('inet:ipv4', 5), {'props': {'asn': 'newp'}}), (('inet:ipv4', 6), {})])
+            self.eq('inet:ipv4:asn', cm.exception.get('prop'))
+
+            with self.raises(s_exc.BadTypeValu):
+                await core.addNodesBulk([(('inet:ipv4', '1.2.3.4'), {})])
+
+            with self.raises(s_exc.BadTypeValu):
+                await core.addNodesBulk([(('inet:fqdn', 'VERTEX.link'), {})])
+
+            self.len(0, await core.nodes('inet:ipv4=0.0.0.5'))
+            self.len(0, await core.nodes('inet:ipv4=0.0.0.6'))
+
+            # read-only props may not be changed
+            await core.nodes('[ inet:fqdn=woot.com ]')
+            with self.raises(s_exc.ReadOnlyProp):
+                await core.addNodesBulk([(('inet:fqdn', 'woot.com'), {'props': {'domain': 'newp.com'}})])
+
+            self.eq('com', (await core.nodes('inet:fqdn=woot.com'))[0].get('domain'))
+
+            retn = await core.addNodesBulk([(('inet:fqdn', 'woot.com'), {'props': {'domain': 'com'}})])
+            self.eq(0, retn['edited'])
+
+            # tag props are set along with their tags
+            await core.addTagProp('score', ('int', {}), {})
+
+            items = [
+                (('inet:ipv4', 0x01020304), {'tagprops': {'foo.bar': {'score': 10}}}),
+                (('inet:ipv4', 0x01020305), {'tagprops': {'hehe.haha': {'score': 20}}}),
+            ]
+            retn = await core.addNodesBulk(items)
+            self.eq(2, retn['edited'])
+
+            nodes = await core.nodes('inet:ipv4=1.2.3.4')
+            self.eq(10, nodes[0].getTagProp('foo.bar', 'score'))
+            self.eq((3000, 4000), nodes[0].getTag('foo.bar'))
+
+            nodes = await core.nodes('inet:ipv4=1.2.3.5')
+            self.eq(20, nodes[0].getTagProp('hehe.haha', 'score'))
+            self.eq((None, None), nodes[0].getTag('hehe'))
+            self.len(1, await core.nodes('syn:tag=hehe.haha'))
+            self.len(1, await core.nodes('#foo.bar:score=10'))
+
+            retn = await core.addNodesBulk(items)
+            self.eq(0, retn['edited'])
+
+            with self.raises(s_exc.NoSuchTagProp):
+                await core.addNodesBulk([(('inet:ipv4', 10), {'tagprops': {'foo': {'newp': 10}}})])
+
+            with self.raises(s_exc.BadTypeValu):
+                await core.addNodesBulk([(('inet:ipv4', 10), {'tagprops': {'foo': {'score': '10'}}})])
+
+            await core.auth.addUser('visi')
+
+            async with core.getLocalProxy() as proxy:
+                retn = await proxy.addNodesBulk([(('inet:ipv4', 10), {})])
+                self.eq(1, retn['added'])
+
+            async with core.getLocalProxy(user='visi') as proxy:
+                with self.raises(s_exc.AuthDeny):
+                    await proxy.addNodesBulk([(('inet:ipv4', 11), {})])
+
     async def test_feed_syn_nodes(self):
 
         conf = {'modules': [('synapse.tests.utils.DeprModule', {})]}
@@ -6292,7 +6490,11 @@ class CortexBasicTest(s_t_utils.SynTest):
                 # remove the dmon without a nexus entry to verify recover works
                 await core._delStormDmon(iden)
                 self.none(await core.callStorm('return($lib.dmon.get($iden))', opts=asuser))
-                self.eq('storm:dmon:add', (await core.nexsroot.nexslog.last())[1][1])
+                indx, item = await core.nexsroot.nexslog.last()
+                self.eq('storm:dmon:add', item[1])
+
+                # the nexus entry was not applied before a crash
+                core.nexsroot.nexshot.set('nexs:applied', indx - 1)
 
             async with self.getTestCoreAndProxy(dirn=dirn) as (core, prox):
 
@@ -7669,6 +7871,71 @@ class CortexBasicTest(s_t_utils.SynTest):
             byts = b''.join([b async for b in core.axon.get(s_common.uhex(sha256))])
             self.isin(b'vertex.link', byts)
 
+    async def test_cortex_export_cols(self):
+
+        async with self.getTestCore() as core:
+
+            await core.auth.rootuser.setPasswd('secret')
+            host, port = await core.addHttpsPort(0, host='127.0.0.1')
+
+            await core.addTagProp('score', ('int', {}), {})
+            await core.nodes('for $i in $lib.range(300) { [ inet:ipv4=$i :asn=($i % 3) ] }')
+            await core.nodes('inet:ipv4=1 [ +#foo:score=10 :loc=us ]')
+
+            cols = ('valu', ':asn', 'loc', '#foo', '#foo:score', 'form')
+
+            async with core.getLocalProxy() as proxy:
+
+                mesgs = await alist(proxy.exportStormCols('inet:ipv4', cols))
+                self.eq(('cols', {'cols': cols, 'version': 1}), mesgs[0])
+                self.eq(('fini', {'rows': 300}), mesgs[-1])
+
+                # 300 rows with 3 distinct asn values
+                batch = mesgs[1][1]
+                self.eq(300, batch['rows'])
+                self.eq((0, 1, 2), batch['cols'][1][0])
+                self.eq(2, batch['cols'][0][1])
+                self.eq(1, batch['cols'][1][1])
+                self.len(300, batch['cols'][1][2])
+
+                rows = list(s_columnar.iterRows(mesgs))
+                self.len(300, rows)
+                self.eq((0, 0, None, None, None, 'inet:ipv4'), rows[0])
+                self.eq((1, 1, 'us', (None, None), 10, 'inet:ipv4'), rows[1])
+
+                with patch.object(s_columnar, 'BATCH_SIZE', 30):
+                    mesgs = await alist(proxy.exportStormCols('inet:ipv4 +:asn=1', ('iden', 'valu')))
+                    self.len(6, mesgs)
+                    self.eq(sorted(ipv4 for (iden, ipv4) in s_columnar.iterRows(mesgs)), list(range(1, 300, 3)))
+
+                with self.raises(s_exc.BadArg):
+                    await alist(proxy.exportStormCols('inet:ipv4', ()))
+
+                with self.raises(s_exc.BadArg):
+                    await alist(proxy.exportStormCols('inet:ipv4', ('valu', 10)))
+
+            size, sha256 = await core.exportStormColsToAxon('inet:ipv4 +:asn=2', ('valu',))
+            byts = b''.join([b async for b in core.axon.get(s_common.uhex(sha256))])
+            rows = list(s_columnar.iterRows(i[1] for i in s_msgpack.Unpk().feed(byts)))
+            self.eq([(i,) for i in range(2, 300, 3)], sorted(rows))
+
+            async with self.getHttpSess(port=port, auth=('root', 'secret')) as sess:
+
+                body = {'query': 'inet:ipv4 +#foo', 'cols': ('valu', '#foo:score')}
+                resp = await sess.post(f'https://localhost:{port}/api/v1/storm/export/cols', json=body)
+                self.eq(resp.status, http.HTTPStatus.OK)
+                self.eq('application/x-synapse-cols', resp.headers.get('Content-Type'))
+
+                byts = await resp.read()
+                rows = list(s_columnar.iterRows(i[1] for i in s_msgpack.Unpk().feed(byts)))
+                self.eq([(1, 10)], rows)
+
+                body = {'query': 'inet:ipv4', 'cols': ()}
+                resp = await sess.post(f'https://localhost:{port}/api/v1/storm/export/cols', json=body)
+                retval = await resp.json()
+                self.eq(resp.status, http.HTTPStatus.BAD_REQUEST)
+                self.eq('BadArg', retval['code'])
+
     async def test_cortex_lookup_mode(self):
         async with self.getTestCoreAndProxy() as (_core, proxy):
             retn = await proxy.count('[inet:email=foo.com@vertex.link]')
@@ -8732,13 +8999,10 @@ class CortexBasicTest(s_t_utils.SynTest):
                     self.notin('Timeout waiting for pool mirror', data)
                     self.notin('Timeout waiting for query mirror', data)
 
-                    orig = s_telepath.ClientV2.proxy
-                    async def finidproxy(self, timeout=None):
-                        prox = await orig(self, timeout=timeout)
-                        await prox.fini()
-                        return prox
+                    async def finidproxy(*args, **kwargs):
+                        raise s_exc.IsFini()
 
-                    with patch('synapse.telepath.ClientV2.proxy', finidproxy):
+                    with patch('synapse.cortex.CoreApi.getNexsIndx', finidproxy):
                         with self.getLoggerStream('synapse') as stream:
                             msgs = await alist(core00.storm('inet:asn=0'))
                             self.len(1, [m for m in msgs if m[0] == 'node'])
@@ -8912,6 +9176,149 @@ class CortexBasicTest(s_t_utils.SynTest):
                     msgs = await alist(core01.storm('inet:asn=0', opts={'mirror': False}))
                     self.len(1, [m for m in msgs if m[0] == 'node'])
 
+    async def test_cortex_query_offload_routing(self):
+
+        class Pool:
+
+            def __init__(self, proxies):
+                self.proxies = set(proxies)
+
+            def size(self):
+                return len(self.proxies)
+
+            async def waitready(self, timeout=None):
+                return
+
+        async with self.getTestCore() as core:
+
+            self.none(await core.getStormPoolStats())
+            self.none(await core.callStorm('return($lib.cortex.storm.pool.stats())'))
+
+            await core.nodes('[ inet:asn=0 ]')
+
+            async with core.getLocalProxy() as prox00, core.getLocalProxy() as prox01:
+
+                prox00._ahainfo = {'name': '00.mirror'}
+                prox01._ahainfo = {'name': '01.mirror'}
+
+                opts = {'timeout:sync': 1, 'timeout:connection': 1, 'weight:latency': 0.0}
+                core.stormpool = Pool((prox00, prox01))
+                core.stormpoolopts = opts
+                core.stormpoolrouter = s_stormpool.StormPoolRouter(opts)
+
+                with self.getStructuredAsyncLoggerStream('synapse') as stream:
+                    self.eq(1, await core.count('inet:asn=0'))
+                    self.eq(1, await core.count('inet:asn=0'))
+                    self.eq(0, await core.callStorm('inet:asn return($node.value())'))
+                    self.len(1, [m async for m in core.storm('inet:asn=0') if m[0] == 'node'])
+
+                mirrors = [m.get('mirror') for m in stream.jsonlines() if m.get('message', '').startswith('Offloading')]
+                self.eq(mirrors, ['00.mirror', '01.mirror', '00.mirror', '01.mirror'])
+
+                stats = await core.getStormPoolStats()
+                self.eq([2, 2], [s['count'] for s in stats])
+                self.eq([0, 0], [s['inflight'] for s in stats])
+                self.eq([0, 0], [s['errors'] for s in stats])
+                self.eq([True, True], [s['online'] for s in stats])
+                self.true(all(s['latency'] is not None for s in stats))
+
+                # the least loaded mirror is selected
+                with core.stormpoolrouter.track('00.mirror'):
+                    with self.getStructuredAsyncLoggerStream('synapse') as stream:
+                        self.eq(1, await core.count('inet:asn=0'))
+                        self.eq(1, await core.count('inet:asn=0'))
+
+                mirrors = [m.get('mirror') for m in stream.jsonlines() if m.get('message', '').startswith('Offloading')]
+                self.eq(mirrors, ['01.mirror', '01.mirror'])
+
+                # the lag of a mirror is recorded when it is checked
+                async def getNexsIndx(self):
+                    return 1
+
+                with patch('synapse.cortex.CoreApi.getNexsIndx', getNexsIndx):
+                    with patch('synapse.cortex.MAX_NEXUS_DELTA', -1):
+                        self.eq(1, await core.count('inet:asn=0'))
+
+                nexslag = await core.getNexsIndx() - 1
+                stats = await core.getStormPoolStats()
+                self.eq([nexslag, nexslag], [s['nexslag'] for s in stats])
+
+                # errors are counted
+                with self.raises(s_exc.NoSuchProp):
+                    await core.callStorm('newp:newp')
+
+                stats = await core.getStormPoolStats()
+                self.eq(1, sum(s['errors'] for s in stats))
+
+                opts = {'pin': True, 'timeout:sync': 1, 'timeout:connection': 1}
+                core.stormpoolopts = opts
+                core.stormpoolrouter = s_stormpool.StormPoolRouter(opts)
+
+                with self.getStructuredAsyncLoggerStream('synapse') as stream:
+                    for i in range(4):
+                        self.eq(1, await core.count('inet:asn=0'))
+
+                mirrors = [m.get('mirror') for m in stream.jsonlines() if m.get('message', '').startswith('Offloading')]
+                self.len(4, mirrors)
+                self.len(1, set(mirrors))
+
+                stats = await core.callStorm('return($lib.cortex.storm.pool.stats())')
+                self.eq(4, sum(s['count'] for s in stats))
+
+                msgs = await core.stormlist('$lib.print($lib.cortex.storm.pool.stats())', opts={'mirror': False})
+                self.stormHasNoWarnErr(msgs)
+
+                visi = await core.auth.addUser('visi')
+                with self.raises(s_exc.AuthDeny):
+                    await core.callStorm('return($lib.cortex.storm.pool.stats())', opts={'user': visi.iden})
+
+                # mirrors without an AHA name are still routed separately
+                prox00._ahainfo = {}
+                prox01._ahainfo = {}
+
+                opts = {'timeout:sync': 1, 'timeout:connection': 1, 'weight:latency': 0.0}
+                core.stormpoolopts = opts
+                core.stormpoolrouter = s_stormpool.StormPoolRouter(opts)
+
+                with self.getStructuredAsyncLoggerStream('synapse') as stream:
+                    for i in range(4):
+                        self.eq(1, await core.count('inet:asn=0'))
+
+                mirrors = [m.get('mirror') for m in stream.jsonlines() if m.get('message', '').startswith('Offloading')]
+                self.len(4, mirrors)
+                self.len(2, set(mirrors))
+
+                stats = await core.getStormPoolStats()
+                self.eq([2, 2], [s['count'] for s in stats])
+                self.eq([True, True], [s['online'] for s in stats])
+
+                core.stormpool = None
+
+        async with self.getTestCore() as core:
+
+            msgs = await core.stormlist('cortex.storm.pool.set --weight-latency 2 --weight-nexslag 0.5 --pin aha://pool00...')
+            self.stormHasNoWarnErr(msgs)
+
+            url, opts = await core.getStormPool()
+            self.eq(opts, {
+                'timeout:sync': 2,
+                'timeout:connection': 2,
+                'weight:inflight': 1.0,
+                'weight:latency': 2.0,
+                'weight:nexslag': 0.5,
+                'pin': True,
+            })
+
+            msgs = await core.stormlist('cortex.storm.pool.get')
+            self.stormIsInPrint('Query Latency Weight: 2.0', msgs)
+            self.stormIsInPrint('Nexus Lag Weight: 0.5', msgs)
+            self.stormIsInPrint('Pin Queries By Hash: True', msgs)
+
+            with self.raises(s_exc.SchemaViolation):
+                await core.setStormPool('aha://pool00...', {'weight:inflight': -1})
+
+            await core.delStormPool()
+
     async def test_cortex_authgate(self):
         # TODO - Remove this in 3.0.0
         with self.getTestDir() as dirn:
@@ -5,6 +5,7 @@ import synapse.exc as s_exc
 import synapse.cryotank as s_cryotank
 
 import synapse.lib.const as s_const
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.slaboffs as s_slaboffs
 
 import synapse.tests.utils as s_t_utils
@@ -129,6 +130,95 @@ class CryoTest(s_t_utils.SynTest):
                 _, conf = cryo.names.get('conftest')
                 self.eq(conf, {'map_size': s_const.mebibyte * 64})
 
+    async def test_cryo_parallel(self):
+
+        with self.getTestDir() as dirn:
+
+            conf = {'indexes': {'name': [0], 'bar': [1, 'bar']}}
+
+            async with self.getTestCryoAndProxy(dirn=dirn) as (cryo, prox):
+
+                await prox.init('foo', conf=conf)
+                await prox.init('empty')
+
+                self.eq([], await prox.splits('empty', 4))
+                self.eq([], await alist(prox.packed('empty', 0)))
+
+                items = [(f'item{i % 10}', {'bar': i % 3}) for i in range(2500)]
+                self.eq(2500, await prox.puts('foo', items))
+
+                # splits cover all of the items for parallel consumers
+                splits = await prox.splits('foo', 3)
+                self.eq(splits, [(0, 834), (834, 833), (1667, 833)])
+
+                async def consume(offs, size):
+                    return [item async for item in prox.slice('foo', offs, size)]
+
+                parts = await asyncio.gather(*[consume(o, s) for (o, s) in splits])
+                self.eq(list(enumerate(items)), [(i, tuple(v)) for part in parts for (i, v) in part])
+
+                await prox.puts('empty', ('asdf', 'qwer'))
+                self.eq([(0, 1), (1, 1)], await prox.splits('empty', 4))
+
+                with self.raises(s_exc.BadArg):
+                    await prox.splits('foo', 0)
+
+                # packed rows are raw msgpack bytes
+                batches = await alist(prox.packed('foo', 10, size=2100, batch=1000))
+                self.eq([(10, 1000), (1010, 1000), (2010, 100)], [(b[0], b[1]) for b in batches])
+
+                unpk = s_msgpack.Unpk()
+                rows = [item for batch in batches for (_, item) in unpk.feed(batch[2])]
+                self.eq([tuple(r) for r in rows], items[10:2110])
+
+                self.len(1, await alist(prox.packed('foo', 2499)))
+
+                # secondary indexes
+                found = await alist(prox.search('foo', 'name', 'item3'))
+                self.len(250, found)
+                self.eq(3, found[0][0])
+                self.true(all(item[0] == 'item3' for (_, item) in found))
+
+                found = await alist(prox.search('foo', 'bar', 2, offs=1000, size=5))
+                self.eq([1001, 1004, 1007, 1010, 1013], [indx for (indx, _) in found])
+
+                self.eq([], await alist(prox.search('foo', 'name', 'newp')))
+
+                with self.raises(s_exc.NoSuchIndx):
+                    await alist(prox.search('foo', 'newp', 'item3'))
+
+                # items without the indexed value are not indexed
+                await prox.puts('foo', [('item3', None), {'newp': 'newp'}])
+                self.len(251, await alist(prox.search('foo', 'name', 'item3')))
+                self.len(833, await alist(prox.search('foo', 'bar', 2)))
+
+                info = [i for (n, i) in await prox.list() if n == 'foo'][0]
+                self.eq(info['indexes'], {'name': (0,), 'bar': (1, 'bar')})
+
+                # list values are found by tuples and culled items are removed from the indexes
+                await prox.init('tups', conf={'indexes': {'pair': [1]}})
+                await prox.puts('tups', [('a', (1, 2)), ('b', (3, 4)), ('c', (1, 2))])
+                self.eq([0, 2], [indx for (indx, _) in await alist(prox.search('tups', 'pair', (1, 2)))])
+
+                await prox.cull('tups', 1)
+                self.eq([(2, ('c', (1, 2)))], await alist(prox.search('tups', 'pair', (1, 2))))
+                self.eq([], await alist(prox.search('tups', 'pair', (3, 4))))
+
+                tank = cryo.tanks.get('tups')
+                self.eq([2], [indx for (indx, _) in await alist(tank.search('pair', [1, 2]))])
+                self.len(1, list(tank.slab.scanByFull(db=tank.indexes['pair'][1])))
+
+                with self.raises(s_exc.BadConfValu):
+                    await prox.init('bad', conf={'indexes': {'name': []}})
+
+            async with self.getTestCryo(dirn=dirn) as cryo:
+
+                async with cryo.getLocalProxy(share='cryotank/foo') as tank:
+                    self.eq([(0, 1251), (1251, 1251)], await tank.splits(2))
+                    self.len(251, await alist(tank.search('name', 'item3')))
+                    batches = await alist(tank.packed(0, size=3))
+                    self.eq((0, 3), batches[0][:2])
+
     async def test_cryo_perms(self):
 
         async with self.getTestCryo() as cryo:
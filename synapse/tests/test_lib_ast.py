@@ -8,6 +8,7 @@ import synapse.common as s_common
 import synapse.datamodel as s_datamodel
 
 import synapse.lib.ast as s_ast
+import synapse.lib.base as s_base
 import synapse.lib.json as s_json
 import synapse.lib.snap as s_snap
 
@@ -121,6 +122,10 @@ foo_stormpkg = {
     ],
 }
 
+async def iterPivoNoWindow(self, runt, genr, getndefs=None):
+    async for node, path in genr:
+        yield node, path, {}
+
 class AstTest(s_test.SynTest):
 
     async def test_mode_search(self):
@@ -988,6 +993,142 @@ class AstTest(s_test.SynTest):
             with self.raises(s_exc.NoSuchForm):
                 await core.nodes('inet:fqdn=vertex.link -(refs)> newp:*')
 
+    async def test_ast_pivot_window(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('''[
+                inet:dns:a=(vertex.link, 1.2.3.4)
+                inet:dns:a=(vertex.link, 5.6.7.8)
+                inet:dns:a=(woot.com, 1.2.3.4)
+                inet:dns:a=(woot.com, 9.9.9.9)
+                inet:dns:a=(newp.com, 8.8.8.8)
+            ]''')
+
+            await core.nodes('inet:ipv4=9.9.9.9 | delnode --force')
+
+            queries = (
+                'inet:fqdn -> inet:dns:a -> inet:ipv4',
+                'inet:fqdn -> inet:dns:a :ipv4 -> inet:ipv4',
+                'inet:fqdn -> inet:dns:a :ipv4 -> *',
+                'inet:dns:a -> *',
+                'inet:dns:a -+> *',
+                'inet:dns:a -> (inet:ipv4, inet:fqdn)',
+                'inet:dns:a :ipv4 -> (inet:ipv4, inet:fqdn)',
+            )
+
+            with mock.patch.object(s_ast, 'PIVOT_WINDOW_SIZE', 2):
+                for text in queries:
+                    msgs = await core.stormlist(text, opts={'links': True})
+                    nodes = [m[1] for m in msgs if m[0] == 'node']
+
+                    with mock.patch.object(s_ast.PivotOper, 'iterPivoWindows', iterPivoNoWindow):
+                        msgs = await core.stormlist(text, opts={'links': True})
+                        self.eq(nodes, [m[1] for m in msgs if m[0] == 'node'])
+
+            nodes = await core.nodes('inet:dns:a=(vertex.link, 1.2.3.4) -> *', opts={'links': True})
+            self.sorteq(['inet:fqdn', 'inet:ipv4'], [n.form.name for n in nodes])
+
+            # nodes resolved for a window may be deleted before the pivot reaches them
+            with mock.patch.object(s_ast, 'PIVOT_WINDOW_SIZE', 10):
+                q = 'inet:dns:a:ipv4=1.2.3.4 -> inet:ipv4 $lib.print(hit) | delnode --force'
+                msgs = await core.stormlist(q)
+                self.stormHasNoWarnErr(msgs)
+                self.len(1, [m for m in msgs if m[0] == 'print'])
+                self.len(0, await core.nodes('inet:ipv4=1.2.3.4'))
+
+                # nodes which are added after a window was resolved are found
+                q = 'inet:dns:a:fqdn=vertex.link :ipv4 -> inet:ipv4 { [ inet:ipv4=1.2.3.4 ] }'
+                count = len(await core.nodes(q))
+                await core.nodes('inet:ipv4=1.2.3.4 | delnode --force')
+
+                with mock.patch.object(s_ast.PivotOper, 'iterPivoWindows', iterPivoNoWindow):
+                    self.len(count, await core.nodes(q))
+
+            # a slow upstream with side effects is not windowed
+            q = 'for $i in $lib.range(2) { $lib.time.sleep(($i * 5)) [ inet:ipv4=$i ] } :asn -> inet:asn'
+            await core.nodes('for $i in $lib.range(4) { [ inet:ipv4=$i :asn=$i ] }')
+
+            async def first():
+                async for mesg in core.storm(q):
+                    if mesg[0] == 'node':
+                        return mesg[1]
+
+            self.eq(('inet:asn', 0), (await asyncio.wait_for(first(), timeout=4))[0])
+
+            # upstream side effects are not run ahead of the downstream operators
+            with mock.patch.object(s_ast, 'PIVOT_WINDOW_SIZE', 10):
+
+                q = 'inet:ipv4 +:asn $lib.print(up) :asn -> inet:asn $lib.print(down)'
+                msgs = await core.stormlist(q)
+                self.eq(['up', 'down'] * 4, [m[1]['mesg'] for m in msgs if m[0] == 'print'])
+
+                q = 'inet:ipv4 +:asn [ +#up ] :asn -> inet:asn [ +#down ]'
+                msgs = await core.stormlist(q, opts={'editformat': 'nodeedits'})
+                forms = [e[1] for m in msgs if m[0] == 'node:edits' for e in m[1]['edits']]
+                self.eq(['inet:ipv4', 'inet:asn'] * 4, [f for f in forms if f != 'syn:tag'])
+
+                q = 'inet:ipv4 +:asn | tee { [ +#tee ] } | :asn -> inet:asn [ +#tee ]'
+                msgs = await core.stormlist(q, opts={'editformat': 'nodeedits'})
+                forms = [e[1] for m in msgs if m[0] == 'node:edits' for e in m[1]['edits']]
+                self.eq(['inet:ipv4', 'inet:asn'] * 4, [f for f in forms if f != 'syn:tag'])
+
+                # a pivot preceded by lifts, filters and pivots is still windowed
+                with mock.patch.object(s_base, 'schedGenrChunks', wraps=s_base.schedGenrChunks) as chunks:
+                    self.len(4, await core.nodes('inet:ipv4 +:asn :asn -> inet:asn'))
+                    self.len(1, chunks.mock_calls)
+
+                    self.len(4, await core.nodes('inet:ipv4 +:asn $lib.print(up) :asn -> inet:asn'))
+                    self.len(4, await core.nodes('function f() { inet:ipv4 +:asn :asn -> inet:asn } yield $f()'))
+                    self.len(1, chunks.mock_calls)
+
+    async def test_ast_lift_plan(self):
+
+        async with self.getTestCore() as core:
+
+            await core.addTagProp('score', ('int', {}), {})
+
+            await core.nodes('for $i in $lib.range(20) { [ inet:ipv4=$i +#cno.mal:score=$i ] }')
+            await core.nodes('[ inet:ipv4=1 inet:ipv4=100 :asn=1234 ]')
+            await core.nodes('[ inet:ipv4=200 inet:ipv4=201 inet:ipv4=202 ]')
+
+            def getplan(msgs):
+                plans = [m[1]['mesg'] for m in msgs if m[0] == 'print' and m[1]['mesg'].startswith('Lift plan:')]
+                self.len(1, plans)
+                return plans[0]
+
+            opts = {'debug': True}
+
+            msgs = await core.stormlist('inet:ipv4 +#cno.mal +:asn=1234', opts=opts)
+            self.eq([1], [m[1][0][1] for m in msgs if m[0] == 'node'])
+            plan = getplan(msgs)
+            self.isin('Lift plan: inet:ipv4:asn=1234 (~2 rows)', plan)
+            self.isin('inet:ipv4 (24)', plan)
+            self.isin('inet:ipv4#cno.mal (20)', plan)
+
+            msgs = await core.stormlist('inet:ipv4 +:asn=1234 +#cno.mal', opts=opts)
+            self.eq([1], [m[1][0][1] for m in msgs if m[0] == 'node'])
+            self.isin('Lift plan: inet:ipv4:asn=1234 (~2 rows)', getplan(msgs))
+
+            msgs = await core.stormlist('inet:ipv4 +(#cno.mal and #cno.mal:score=3)', opts=opts)
+            self.eq([3], [m[1][0][1] for m in msgs if m[0] == 'node'])
+            self.isin('Lift plan: inet:ipv4#cno.mal:score=3 (~1 rows)', getplan(msgs))
+
+            msgs = await core.stormlist('inet:ipv4 +#cno.mal:score +:asn', opts=opts)
+            self.eq([1], [m[1][0][1] for m in msgs if m[0] == 'node'])
+            self.isin('Lift plan: inet:ipv4:asn (~2 rows)', getplan(msgs))
+
+            msgs = await core.stormlist('inet:ipv4 +#cno.mal:score>15', opts=opts)
+            self.eq([16, 17, 18, 19], [m[1][0][1] for m in msgs if m[0] == 'node'])
+            self.isin('Lift plan: inet:ipv4#cno.mal:score>15 (~20 rows)', getplan(msgs))
+
+            # no plan output without debug
+            msgs = await core.stormlist('inet:ipv4 +#cno.mal +:asn=1234')
+            self.len(0, [m for m in msgs if m[0] == 'print'])
+
+            self.len(0, await core.nodes('inet:ipv4 +#cno.mal +:newp=1234'))
+            self.len(0, await core.nodes('inet:ipv4 +#newp +:asn=1234'))
+
     async def test_ast_lift(self):
 
         async with self.getTestCore() as core:
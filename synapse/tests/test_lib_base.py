@@ -518,6 +518,41 @@ class BaseTest(s_t_utils.SynTest):
 
         await self.asyncraises(asyncio.CancelledError, task)
 
+    async def test_base_schedgenrchunks(self):
+
+        async def genr(count, sleep=0):
+            for i in range(count):
+                yield i
+                await asyncio.sleep(sleep)
+
+        async def badgenr():
+            yield 'foo'
+            await asyncio.sleep(0)
+            raise s_exc.SynErr(mesg='rando')
+
+        chunks = [c async for c in s_base.schedGenrChunks(genr(25), size=10, timeout=5)]
+        self.eq(chunks, [list(range(10)), list(range(10, 20)), list(range(20, 25))])
+
+        self.eq([], [c async for c in s_base.schedGenrChunks(genr(0))])
+
+        # partial chunks are yielded rather than waiting on a slow generator
+        chunks = [c async for c in s_base.schedGenrChunks(genr(3, sleep=0.1), size=10, timeout=0.01)]
+        self.eq(chunks, [[0], [1], [2]])
+
+        # results produced before an exception are yielded
+        chunks = []
+        with self.raises(s_exc.SynErr):
+            async for chunk in s_base.schedGenrChunks(badgenr(), size=10):
+                chunks.append(chunk)
+        self.eq(chunks, [['foo']])
+
+        # the scope of the calling task is available to the generator
+        async def scopegenr():
+            yield s_scope.get('hehe')
+
+        with s_scope.enter({'hehe': 'haha'}):
+            self.eq([['haha']], [c async for c in s_base.schedGenrChunks(scopegenr())])
+
     async def test_lib_base_scope(self):
 
         # Simple test with a single scope stack.
@@ -0,0 +1,40 @@
+import synapse.tests.utils as s_t_utils
+
+import synapse.lib.bloom as s_bloom
+
+class BloomTest(s_t_utils.SynTest):
+
+    def test_lib_bloom(self):
+
+        bloom = s_bloom.BloomFilter(1000)
+        self.notin(b'foo', bloom)
+        self.eq(0, bloom.count)
+
+        self.true(bloom.add(b'foo'))
+        self.false(bloom.add(b'foo'))
+        self.isin(b'foo', bloom)
+        self.eq(1, bloom.count)
+
+        for i in range(999):
+            bloom.add(str(i).encode())
+
+        # no false negatives
+        self.true(all(str(i).encode() in bloom for i in range(999)))
+
+        # false positives are near the error rate at capacity
+        fps = sum(1 for i in range(1000, 11000) if str(i).encode() in bloom)
+        self.lt(fps, 300)
+
+        self.false(bloom.isfull())
+        for i in range(1000, 2000):
+            bloom.add(str(i).encode())
+        self.true(bloom.isfull())
+
+        copy = bloom.copy()
+        self.isin(b'foo', copy)
+        self.eq(bloom.count, copy.count)
+
+        bloom.clear()
+        self.notin(b'foo', bloom)
+        self.eq(0, bloom.count)
+        self.isin(b'foo', copy)
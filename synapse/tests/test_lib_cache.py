@@ -127,6 +127,65 @@ class CacheTest(s_t_utils.SynTest):
         self.len(0, cache.fifo)
         self.len(0, cache.cache)
 
+    async def test_lib_cache_sized(self):
+
+        calls = []
+
+        async def callback(name):
+            calls.append(name)
+            if name == 'newp':
+                return s_common.novalu
+            return name.lower()
+
+        def sizefunc(key, valu):
+            return len(valu)
+
+        cache = s_cache.SizedCache(callback, sizefunc, 9)
+
+        self.eq('foo', await cache.aget('FOO'))
+        self.eq('foo', await cache.aget('FOO'))
+        self.eq('bar', await cache.aget('BAR'))
+        self.eq(['FOO', 'BAR'], calls)
+
+        self.len(2, cache)
+        self.eq(6, cache.size)
+
+        # FOO was used most recently so BAR is evicted
+        self.eq('foo', await cache.aget('FOO'))
+        self.eq('bazz', await cache.aget('BAZZ'))
+        self.len(2, cache)
+        self.eq(7, cache.size)
+        self.isin('FOO', cache.cache)
+        self.notin('BAR', cache.cache)
+
+        # values which are larger than the cache are not stored
+        self.eq('hehehahahaha', await cache.aget('HEHEHAHAHAHA'))
+        self.notin('HEHEHAHAHAHA', cache.cache)
+
+        self.eq(s_common.novalu, await cache.aget('newp'))
+        self.notin('newp', cache.cache)
+
+        self.eq('foo', cache.pop('FOO'))
+        self.none(cache.pop('FOO'))
+        self.eq(4, cache.size)
+
+        cache.put('BAZZ', 'bazzz')
+        self.len(1, cache)
+        self.eq(5, cache.size)
+
+        self.eq(cache.pack(), {
+            'size': 5,
+            'maxsize': 9,
+            'count': 1,
+            'hits': 2,
+            'misses': 5,
+            'evictions': 1,
+        })
+
+        cache.clear()
+        self.len(0, cache)
+        self.eq(0, cache.size)
+
     def test_regexize(self):
         restr = s_cache.regexizeTagGlob('foo*')
         self.eq(restr, r'foo([^.]+?)')
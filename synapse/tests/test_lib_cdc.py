@@ -0,0 +1,42 @@
+import os
+
+import synapse.lib.cdc as s_cdc
+
+import synapse.tests.utils as s_t_utils
+
+class CdcTest(s_t_utils.SynTest):
+
+    def test_lib_cdc_chunks(self):
+
+        self.eq((), tuple(s_cdc.chunks(b'')))
+        self.eq((b'asdf',), tuple(s_cdc.chunks(b'asdf')))
+
+        byts = os.urandom(4 * s_cdc.MAX_SIZE)
+
+        chunks = list(s_cdc.chunks(byts))
+        self.eq(byts, b''.join(chunks))
+        self.eq(chunks, list(s_cdc.chunks(byts)))
+
+        self.gt(len(chunks), 4)
+        for chnk in chunks[:-1]:
+            self.ge(len(chnk), s_cdc.MIN_SIZE)
+            self.le(len(chnk), s_cdc.MAX_SIZE)
+
+        # an insertion only changes the chunks around it
+        edit = byts[:s_cdc.MAX_SIZE] + b'hehe' + byts[s_cdc.MAX_SIZE:]
+        editchunks = list(s_cdc.chunks(edit))
+        self.eq(edit, b''.join(editchunks))
+
+        same = set(chunks)
+        self.le(len([c for c in editchunks if c not in same]), 2)
+
+        # runs of a byte which never form a window are split at MAX_SIZE
+        zero = [i for i in range(256) if not s_cdc.bitmap[i]][0]
+        byts = bytes([zero]) * (2 * s_cdc.MAX_SIZE + 10)
+        self.eq([s_cdc.MAX_SIZE, s_cdc.MAX_SIZE, 10], [len(c) for c in s_cdc.chunks(byts)])
+
+        # data with a skewed byte distribution uses the smaller windows
+        byts = b''.join(b'line %d of a log file\n' % (i,) for i in range(50000))
+        chunks = list(s_cdc.chunks(byts))
+        self.eq(byts, b''.join(chunks))
+        self.lt(max(len(c) for c in chunks), s_cdc.MAX_SIZE)
@@ -1318,6 +1318,11 @@ class CellTest(s_t_utils.SynTest):
                 self.nn(slab['readahead'])
                 self.nn(slab['lockmemory'])
                 self.nn(slab['recovering'])
+                self.nn(slab['xactbytes'])
+                self.eq(10000, slab['commitpolicy']['replay'])
+                self.isin('time', slab['commithist'])
+                self.isin('xactops', slab['commithist'])
+                self.isin('xactbytes', slab['commithist'])
 
     async def test_cell_system_info(self):
         with self.getTestDir() as dirn:
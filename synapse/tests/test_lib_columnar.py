@@ -0,0 +1,70 @@
+import synapse.exc as s_exc
+
+import synapse.lib.columnar as s_columnar
+
+import synapse.tests.utils as s_t_utils
+
+class ColumnarTest(s_t_utils.SynTest):
+
+    async def test_lib_columnar(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('for $i in $lib.range(1000) { [ test:str=$i :tick=($i % 2) :hehe=haha ] }')
+            await core.nodes('test:str=10 [ +#foo=2020 :bar=(test:str, 20) ]')
+            nodes = await core.nodes('test:str')
+
+            batch = s_columnar.ColumnBatch(('iden', 'valu', ':tick', 'hehe', '#foo', 'bar'))
+            for node in nodes:
+                batch.add(node)
+
+            self.eq(1000, batch.size)
+
+            mesg = batch.pack()
+            self.eq('batch', mesg[0])
+            self.eq(1000, mesg[1]['rows'])
+
+            widths = [col[1] for col in mesg[1]['cols']]
+            self.eq((2, 2, 1, 1, 1, 1), widths)
+
+            # dictionary encoded values are only stored once per batch
+            self.eq((0, 1), mesg[1]['cols'][2][0])
+            self.eq(['haha'], mesg[1]['cols'][3][0])
+
+            rows = list(s_columnar.iterRows([('cols', {'version': 1}), mesg]))
+            self.len(1000, rows)
+
+            for node, row in zip(nodes, rows):
+                self.eq(row, (node.iden(), node.ndef[1], node.get('tick'), 'haha', node.getTag('foo'), node.get('bar')))
+
+            batch.clear()
+            self.eq(0, batch.size)
+            self.eq(0, batch.pack()[1]['rows'])
+
+            # unhashable values are dictionary encoded by their msgpack bytes
+            await core.nodes('for $data in (({"foo": "bar"}), ({"foo": "baz"}), (1, 2)) { [ test:guid=* :data=$data ] }')
+            batch = s_columnar.ColumnBatch((':data',))
+            for node in await core.nodes('test:guid'):
+                batch.add(node)
+                batch.add(node)
+
+            mesg = batch.pack()
+            self.len(3, mesg[1]['cols'][0][0])
+            self.len(6, list(s_columnar.iterRows([mesg])))
+
+            with self.raises(s_exc.BadVersion):
+                list(s_columnar.iterRows([('cols', {'version': 99})]))
+
+            with self.raises(s_exc.BadDataValu):
+                s_columnar.unpackCols({'cols': [((), 3, b'')]})
+
+        self.eq(1, s_columnar.getIndxWidth(0x100))
+        self.eq(2, s_columnar.getIndxWidth(0x101))
+        self.eq(2, s_columnar.getIndxWidth(0x10000))
+        self.eq(4, s_columnar.getIndxWidth(0x10001))
+
+        with self.raises(s_exc.BadArg):
+            s_columnar.ColumnBatch(())
+
+        with self.raises(s_exc.BadArg):
+            s_columnar.ColumnBatch(('',))
@@ -47,3 +47,27 @@ class HashsetTest(s_t_utils.SynTest):
         hset = s_hashset.HashSet()
         hset.eatfd(fd)
         self.hashset_assertions(hset)
+
+    async def test_lib_hashset_aupdate(self):
+
+        hset = s_hashset.HashSet()
+        await hset.aupdate(asdf)
+        self.none(hset.pending)
+        await hset.wait()
+        self.hashset_assertions(hset)
+
+        byts = b'\x00' * s_hashset.THREAD_MIN_SIZE
+
+        hset = s_hashset.HashSet()
+        await hset.aupdate(byts)
+        self.nn(hset.pending)
+        await hset.aupdate(asdf)
+        await hset.aupdate(byts)
+        await hset.wait()
+        self.none(hset.pending)
+
+        valu = s_hashset.HashSet()
+        valu.update(byts + asdf + byts)
+
+        self.eq(hset.size, valu.size)
+        self.eq(hset.digests(), valu.digests())
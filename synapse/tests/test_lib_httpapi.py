@@ -1,9 +1,13 @@
 import ssl
 import http
+import asyncio
+import types
 
 import aiohttp
 import aiohttp.client_exceptions as a_exc
 
+import tornado.iostream as t_iostream
+
 import synapse.common as s_common
 import synapse.tools.service.backup as s_backup
 
@@ -12,6 +16,7 @@ import synapse.lib.coro as s_coro
 import synapse.lib.json as s_json
 import synapse.lib.link as s_link
 import synapse.lib.httpapi as s_httpapi
+import synapse.lib.msgpack as s_msgpack
 import synapse.lib.version as s_version
 
 import synapse.tests.utils as s_tests
@@ -1652,6 +1657,144 @@ class HttpApiTest(s_tests.SynTest):
                         self.eq(data.get('status'), 'err')
                         self.eq(data.get('code'), 'NotAuthenticated')
 
+    async def test_http_storm_stream(self):
+
+        async with self.getTestCore() as core:
+
+            root = await core.auth.getUserByName('root')
+            await root.setPasswd('secret')
+
+            host, port = await core.addHttpsPort(0, host='127.0.0.1')
+
+            await core.nodes('for $i in $lib.range(1000) { [ test:int=$i ] }')
+
+            async with self.getHttpSess(auth=('root', 'secret'), port=port) as sess:
+
+                url = f'https://localhost:{port}/api/v1/storm'
+
+                # jsonlines results are batched and compressed if the client accepts it
+                body = {'query': 'test:int', 'stream': 'jsonlines'}
+                async with sess.get(url, json=body) as resp:
+                    self.eq(resp.status, http.HTTPStatus.OK)
+                    self.eq('gzip', resp.headers.get('Content-Encoding'))
+                    self.eq('Accept-Encoding', resp.headers.get('Vary'))
+                    mesgs = [s_json.loads(line) for line in (await resp.read()).splitlines()]
+
+                self.eq('init', mesgs[0][0])
+                self.eq('fini', mesgs[-1][0])
+                self.len(1000, [m for m in mesgs if m[0] == 'node'])
+
+                headers = {'Accept-Encoding': 'identity'}
+                async with sess.get(url, json=body, headers=headers) as resp:
+                    self.eq(resp.status, http.HTTPStatus.OK)
+                    self.none(resp.headers.get('Content-Encoding'))
+                    chunks = [byts async for byts, _ in resp.content.iter_chunks() if byts]
+                    lines = b''.join(chunks).splitlines()
+
+                self.len(1002, lines)
+                self.lt(len(chunks), len(lines))
+
+                headers = {'Accept-Encoding': 'gzip;q=0, deflate'}
+                async with sess.get(url, json=body, headers=headers) as resp:
+                    self.eq(resp.status, http.HTTPStatus.OK)
+                    self.none(resp.headers.get('Content-Encoding'))
+                    self.len(1002, (await resp.read()).splitlines())
+
+                # msgpack results are batched the same way
+                body = {'query': 'test:int', 'stream': 'msgpack'}
+                async with sess.get(url, json=body) as resp:
+                    self.eq(resp.status, http.HTTPStatus.OK)
+                    self.eq('application/x-msgpack', resp.headers.get('Content-Type'))
+                    unpk = s_msgpack.Unpk()
+                    mesgs = [m for _, m in unpk.feed(await resp.read())]
+
+                self.eq('init', mesgs[0][0])
+                self.eq('fini', mesgs[-1][0])
+                self.len(1000, [m for m in mesgs if m[0] == 'node'])
+
+                async with sess.get(f'https://localhost:{port}/api/v1/storm/nodes', json=body) as resp:
+                    self.eq(resp.status, http.HTTPStatus.OK)
+                    unpk = s_msgpack.Unpk()
+                    podes = [p for _, p in unpk.feed(await resp.read())]
+
+                self.len(1000, podes)
+                self.eq(('test:int', 0), podes[0][0])
+
+                # buffered results are sent after the batch time
+                body = {'query': '$lib.print(hehe) $lib.time.sleep(10)', 'stream': 'jsonlines'}
+                async with sess.get(url, json=body) as resp:
+                    self.eq(resp.status, http.HTTPStatus.OK)
+                    self.eq('init', s_json.loads(await asyncio.wait_for(resp.content.readline(), timeout=5))[0])
+                    self.eq('print', s_json.loads(await asyncio.wait_for(resp.content.readline(), timeout=5))[0])
+
+                # errors before any results are still returned as a response
+                body = {'query': 'test:int', 'stream': 'jsonlines', 'opts': {'view': s_common.guid()}}
+                async with sess.get(url, json=body) as resp:
+                    self.eq(resp.status, http.HTTPStatus.NOT_FOUND)
+                    self.none(resp.headers.get('Content-Encoding'))
+                    self.eq('NoSuchView', (await resp.json()).get('code'))
+
+                # without a stream format each message is a separate chunk
+                body = {'query': 'test:int | limit 10'}
+                async with sess.get(url, json=body) as resp:
+                    self.eq(resp.status, http.HTTPStatus.OK)
+                    self.none(resp.headers.get('Content-Encoding'))
+                    mesgs = [s_json.loads(byts) async for byts, _ in resp.content.iter_chunks() if byts]
+
+                self.len(10, [m for m in mesgs if m[0] == 'node'])
+
+    async def test_http_storm_stream_flush(self):
+
+        class Handler:
+
+            def __init__(self):
+                self.request = types.SimpleNamespace(headers={})
+                self.futu = None
+
+            def add_header(self, name, valu):
+                pass
+
+            def write(self, byts):
+                pass
+
+            def flush(self):
+                self.futu = asyncio.get_running_loop().create_future()
+                self.futu.set_exception(t_iostream.StreamClosedError())
+                return self.futu
+
+        handler = Handler()
+        stream = s_httpapi.StormStream(handler, batch=True)
+
+        # a flush started by the batch timer must not leave an unretrieved error
+        with self.getAsyncLoggerStream('synapse.lib.httpapi', 'Error flushing Storm results') as logs:
+            await stream.write(b'hehe')
+            stream.timer.cancel()
+            stream._onBatchTime()
+            self.true(await logs.wait(timeout=5))
+
+        self.false(handler.futu._log_traceback)
+
+        # the next write raises the error so the handler stops streaming
+        with self.raises(t_iostream.StreamClosedError):
+            await stream.write(b'haha')
+
+    async def test_http_accepts_encoding(self):
+
+        self.true(s_httpapi.acceptsEncoding('gzip', 'gzip'))
+        self.true(s_httpapi.acceptsEncoding('deflate, GZIP;q=0.5', 'gzip'))
+        self.true(s_httpapi.acceptsEncoding('gzip ; q=1.0, identity; q=0', 'gzip'))
+        self.true(s_httpapi.acceptsEncoding('*', 'gzip'))
+        self.true(s_httpapi.acceptsEncoding('*;q=0, gzip', 'gzip'))
+
+        self.false(s_httpapi.acceptsEncoding('', 'gzip'))
+        self.false(s_httpapi.acceptsEncoding('identity', 'gzip'))
+        self.false(s_httpapi.acceptsEncoding('gzip;q=0', 'gzip'))
+        self.false(s_httpapi.acceptsEncoding('gzip;q=0.000, deflate', 'gzip'))
+        self.false(s_httpapi.acceptsEncoding('*, gzip;q=0', 'gzip'))
+        self.false(s_httpapi.acceptsEncoding('*;q=0', 'gzip'))
+        self.false(s_httpapi.acceptsEncoding('gzip;q=newp', 'gzip'))
+        self.false(s_httpapi.acceptsEncoding('xgzip', 'gzip'))
+
     async def test_tls_ciphers(self):
 
         async with self.getTestCore() as core:
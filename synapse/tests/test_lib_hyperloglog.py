@@ -0,0 +1,38 @@
+import synapse.tests.utils as s_t_utils
+
+import synapse.lib.hyperloglog as s_hyperloglog
+
+class HyperLogLogTest(s_t_utils.SynTest):
+
+    def test_lib_hyperloglog(self):
+
+        hll = s_hyperloglog.HyperLogLog()
+        self.eq(0, hll.count())
+        self.len(1024, hll.regs)
+
+        self.true(hll.add(b'foo'))
+        self.false(hll.add(b'foo'))
+        self.eq(1, hll.count())
+
+        for i in range(10000):
+            hll.add(str(i).encode())
+
+        count = hll.count()
+        self.true(9000 < count < 11000)
+
+        # resume from saved registers
+        regs = bytes(hll.regs)
+        self.eq(count, s_hyperloglog.HyperLogLog(regs=regs).count())
+
+        hll2 = s_hyperloglog.HyperLogLog()
+        for i in range(5000, 20000):
+            hll2.add(str(i).encode())
+
+        hll.merge(hll2)
+        self.true(18000 < hll.count() < 22000)
+
+        with self.raises(ValueError):
+            s_hyperloglog.HyperLogLog(regs=b'newp')
+
+        with self.raises(ValueError):
+            hll.merge(s_hyperloglog.HyperLogLog(precision=4))
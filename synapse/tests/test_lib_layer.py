@@ -1189,6 +1189,320 @@ class LayerTest(s_t_utils.SynTest):
             await alist(view01.eval('inet:ipv4=2.3.4.5 [ -(refs)> {inet:ipv4=5.6.7.8} ]'))
             self.none(await layr01.getNodeForm(buid1))
 
+    async def test_layer_getstornodesbatch(self):
+
+        async with self.getTestCore() as core:
+
+            layr = core.getLayer()
+
+            nodes = await core.nodes('[ inet:ipv4=1.2.3.4 :asn=10 ] [ inet:ipv4=5.6.7.8 +#foo ]')
+            buids = [n.buid for n in nodes]
+            buids.insert(1, s_common.buid(('inet:ipv4', 1)))
+
+            layr.buidcache.clear()
+
+            sodes = await layr.getStorNodesBatch(buids)
+            self.len(3, sodes)
+            self.eq(10, sodes[0]['props']['asn'][0])
+            self.eq({}, sodes[1])
+            self.eq((None, None), sodes[2]['tags']['foo'])
+            self.eq(sodes[2], await layr.getStorNode(buids[2]))
+
+            # returned sodes are shared and edits copy before modifying them
+            self.true(sodes[0] is (await layr.getStorNodesBatch(buids[:1]))[0])
+            self.true(sodes[0] is await layr.getStorNode(buids[0]))
+
+            await core.nodes('inet:ipv4=1.2.3.4 [ :asn=20 +#bar ]')
+            self.eq(10, sodes[0]['props']['asn'][0])
+            self.none(sodes[0]['tags'].get('bar'))
+
+            sode = await layr.getStorNode(buids[0])
+            self.false(sodes[0] is sode)
+            self.eq(20, sode['props']['asn'][0])
+            self.nn(sode['tags'].get('bar'))
+
+            self.eq([], await layr.getStorNodesBatch([]))
+
+    async def test_layer_sode_cow(self):
+
+        async with self.getTestCore() as core:
+
+            layr = core.getLayer()
+            await core.addTagProp('score', ('int', {}), {})
+
+            nodes = await core.nodes('[ test:str=foo :tick=2020 +#foo:score=10 ]')
+            buid = nodes[0].buid
+
+            lifted = [sode async for _, _, sode in layr.liftByProp('test:str', None)]
+            self.len(1, lifted)
+
+            # multiple edits within one commit window only copy once
+            await core.nodes('test:str=foo [ :tick=2021 +#foo:score=20 ]')
+            sode = await layr.getStorNode(buid)
+            await core.nodes('test:str=foo [ +#bar ]')
+            sode2 = layr._getStorNode(buid)
+
+            self.eq(10, lifted[0]['tagprops']['foo']['score'][0])
+            self.eq(20, sode['tagprops']['foo']['score'][0])
+            self.none(sode['tags'].get('bar'))
+            self.nn(sode2['tags'].get('bar'))
+
+            # a sode is only copied once until it is shared again
+            sode3 = layr._genStorNode(buid)
+            self.true(sode3 is layr._genStorNode(buid))
+            self.true(sode3 is await layr.getStorNode(buid))
+            self.false(sode3 is layr._genStorNode(buid))
+
+            # storage nodes read from the slab after eviction are shared
+            await layr._saveDirtySodes()
+            sode4 = layr._genStorNode(buid)
+            self.true(sode4 is layr._genStorNode(buid))
+            layr.buidcache.pop(buid)
+
+            sode5 = (await layr.getStorNodesBatch((buid,)))[0]
+            self.false(sode5 is layr._genStorNode(buid))
+
+            # storage nodes returned to storm are copies
+            opts = {'vars': {'iden': s_common.ehex(buid)}}
+            q = '$sode = $lib.layer.get().getStorNode($iden) $sode.props = $lib.null return($sode)'
+            self.none((await core.callStorm(q, opts=opts)).get('props'))
+            self.nn((await layr.getStorNode(buid)).get('props'))
+
+            copy = s_layer.copysode(sode3)
+            self.eq(copy, sode3)
+            self.false(copy['tagprops']['foo'] is sode3['tagprops']['foo'])
+
+    async def test_layer_sode_cow_batch(self):
+
+        async with self.getTestCore() as core:
+
+            layr = core.getLayer()
+
+            nodes = await core.nodes('[ test:str=foo ]')
+            buid = nodes[0].buid
+
+            reads = []
+            editTagSet = layr._editTagSet
+
+            async def readTagSet(buid, form, edit, sode, meta):
+                retn = await editTagSet(buid, form, edit, sode, meta)
+                reads.append(await layr.getStorNode(buid))
+                return retn
+
+            # readers during an edit batch do not see the later edits of the batch
+            layr.editors[s_layer.EDIT_TAG_SET] = readTagSet
+            await layr.saveNodeEdits([(buid, 'test:str', (
+                (s_layer.EDIT_TAG_SET, ('bar', (None, None), None), ()),
+                (s_layer.EDIT_TAG_SET, ('baz', (None, None), None), ()),
+                (s_layer.EDIT_PROP_SET, ('tick', 1577836800000, None, s_layer.STOR_TYPE_TIME), ()),
+            ))], {})
+
+            self.len(2, reads)
+            self.eq(('bar',), tuple(reads[0]['tags'].keys()))
+            self.eq(('bar', 'baz'), tuple(reads[1]['tags'].keys()))
+            self.none(reads[1]['props'].get('tick'))
+
+            sode = await layr.getStorNode(buid)
+            self.false(sode is reads[1])
+            self.eq(('bar', 'baz'), tuple(sode['tags'].keys()))
+            self.nn(sode['props'].get('tick'))
+
+            # the sode is owned by the layer again after the batch
+            self.true(layr._genStorNode(buid) is layr._genStorNode(buid))
+
+    async def test_layer_lift_parallel(self):
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('for $i in $lib.range(500) { [ inet:ipv4=$($i * 1000) :asn=$i ] }')
+            await core.nodes('inet:ipv4 +:asn<10 [ +#foo ]')
+
+            ropts = {'readonly': True, 'parallel': 4}
+
+            serial = await core.nodes('inet:ipv4')
+            self.len(500, serial)
+
+            with mock.patch.object(s_layer, 'PARALLEL_CHUNK_ROWS', 50):
+                nodes = await core.nodes('inet:ipv4', opts=ropts)
+                self.len(500, nodes)
+                self.sorteq([n.ndef for n in serial], [n.ndef for n in nodes])
+
+                # filters still apply and unsaved edits are visible
+                await core.nodes('[ inet:ipv4=1.2.3.4 :asn=1234 ]')
+                nodes = await core.nodes('inet:ipv4 +:asn>=498', opts=ropts)
+                self.sorteq([498, 499, 1234], [n.get('asn') for n in nodes])
+
+                nodes = await core.nodes('inet:ipv4 | +#foo', opts=ropts)
+                self.len(10, nodes)
+                self.nn(nodes[0].getTag('foo'))
+
+                # views with more than one layer use a serial lift
+                fork = await core.callStorm('return($lib.view.get().fork().iden)')
+                nodes = await core.nodes('inet:ipv4', opts={'view': fork, **ropts})
+                self.len(501, nodes)
+
+            self.len(0, await core.nodes('inet:fqdn', opts=ropts))
+
+            # a single index value
+            await core.nodes('[ test:int=10 ]')
+            nodes = await core.nodes('test:int', opts=ropts)
+            self.len(1, nodes)
+
+            layr = core.getLayer()
+            parts = layr._getIndxParts(layr.getPropAbrv('inet:ipv4', None), 4)
+            self.len(4, parts)
+            self.none(parts[-1][1])
+
+            with self.raises(s_exc.BadArg):
+                await core.nodes('inet:ipv4', opts={'parallel': 4})
+
+            with self.raises(s_exc.BadArg):
+                await core.nodes('inet:ipv4', opts={'readonly': True, 'parallel': 0})
+
+    async def test_layer_index_stats(self):
+
+        with self.getTestDir() as dirn:
+
+            async with self.getTestCore(dirn=dirn) as core:
+
+                layr = core.getLayer()
+                await core.addTagProp('score', ('int', {}), {})
+
+                q = 'for $i in $lib.range(300) { [ inet:ipv4=$i :asn=($i % 7) .seen=2020 +#cno.mal:score=$i ] }'
+                await core.nodes(q)
+                await core.nodes('[ inet:ipv4=1.2.3.4 inet:fqdn=vertex.link +#cno.mal ]')
+
+                stats = await layr.getIndexStats('inet:ipv4:asn')
+                self.eq(300, stats['count'])
+                self.eq(7, stats['distinct'])
+                self.eq([(i, i, 43) for i in range(6)] + [(6, 6, 42)], stats['histogram'])
+
+                stats = await layr.getIndexStats('inet:ipv4')
+                self.eq(301, stats['count'])
+                self.none(stats['distinct'])
+                self.eq((256, 257, 2), stats['histogram'][256])
+
+                self.eq(300, (await layr.getIndexStats('inet:ipv4.seen'))['count'])
+                self.eq(300, (await layr.getIndexStats('.seen'))['count'])
+                self.eq(301, (await layr.getIndexStats('inet:ipv4#cno.mal'))['count'])
+                self.eq(302, (await layr.getIndexStats('#cno.mal'))['count'])
+                self.eq(300, (await layr.getIndexStats('#cno.mal:score'))['count'])
+                self.eq(300, (await layr.getIndexStats('inet:ipv4#cno.mal:score'))['count'])
+                self.eq(0, (await layr.getIndexStats('inet:fqdn#cno.mal:score'))['count'])
+
+                self.eq(300, await layr.getPropCount('inet:ipv4', 'asn'))
+                self.eq(1, await layr.getPropCount('inet:ipv4', 'asn', maxsize=1))
+                self.eq(300, await layr.getPropCount('inet:ipv4', '.seen'))
+                self.eq(300, await layr.getUnivPropCount('.seen'))
+                self.eq(302, await layr.getTagCount('cno.mal'))
+                self.eq(1, await layr.getTagCount('cno.mal', formname='inet:fqdn'))
+                self.eq(300, await layr.getTagPropCount(None, 'cno.mal', 'score'))
+                self.eq(0, await layr.getTagCount('newp'))
+
+                # updates and deletes
+                await core.nodes('inet:ipv4:asn=6 [ :asn=7 ]')
+                stats = await layr.getIndexStats('inet:ipv4:asn')
+                self.eq(300, stats['count'])
+                self.eq((7, 7, 42), stats['histogram'][-1])
+
+                await core.nodes('inet:ipv4:asn=7 [ -:asn -#cno.mal ]')
+                stats = await layr.getIndexStats('inet:ipv4:asn')
+                self.eq(258, stats['count'])
+                self.eq(6, len(stats['histogram']))
+                self.eq(260, await layr.getTagCount('cno.mal'))
+                self.eq(258, await layr.getTagPropCount('inet:ipv4', 'cno.mal', 'score'))
+
+                await core.nodes('inet:ipv4=1.2.3.4 | delnode')
+                self.eq(300, (await layr.getIndexStats('inet:ipv4'))['count'])
+                self.eq(259, await layr.getTagCount('cno.mal'))
+
+                stats = await core.callStorm('return($lib.layer.get().getIndexStats(inet:ipv4:asn))')
+                self.eq(258, stats['count'])
+
+                # distinct value estimates are not reduced by deletes
+                self.eq(8, stats['distinct'])
+
+                # the catalog is rebuilt if it is missing
+                expect = {}
+                for name in ('inet:ipv4', 'inet:ipv4:asn', '.seen', '#cno.mal', 'inet:ipv4#cno.mal:score'):
+                    expect[name] = await layr.getIndexStats(name)
+
+                layr.meta.set('stats:version', 0)
+                layr.statcounts.set('#cno.mal', 1000)
+
+            # the catalog is built in the background without blocking startup
+            evnt = asyncio.Event()
+            initIndexStats = s_layer.Layer._initIndexStats
+
+            async def waitIndexStats(self):
+                await evnt.wait()
+                return await initIndexStats(self)
+
+            with self.getAsyncLoggerStream('synapse.lib.layer', 'Building index statistics') as stream:
+                with mock.patch.object(s_layer.Layer, '_initIndexStats', waitIndexStats):
+                    async with self.getTestCore(dirn=dirn) as core:
+
+                        layr = core.getLayer()
+                        self.false(layr.statsready)
+
+                        # the counts use index scans until the catalog is built
+                        self.eq(258, await layr.getPropCount('inet:ipv4', 'asn'))
+                        self.eq(259, await layr.getTagCount('cno.mal'))
+                        self.eq(1, await layr.getTagCount('cno.mal', formname='inet:fqdn'))
+                        self.eq(258, await layr.getTagPropCount(None, 'cno.mal', 'score'))
+                        self.eq(0, await layr.getTagPropCount(None, 'newp', 'score'))
+                        self.none((await layr.getIndexStats('inet:ipv4:asn'))['count'])
+
+                        # edits made while the catalog is built are counted once
+                        with mock.patch.object(s_layer, 'STATS_BUILD_CHUNK', 10):
+
+                            layr.buidcache.clear()
+
+                            evnt.set()
+                            self.true(await stream.wait(timeout=6))
+
+                            count = 0
+                            while not layr.statsready and count < 300:
+                                await core.nodes(f'inet:ipv4={count} [ +#hehe ]')
+                                count += 1
+
+                            await layr.statstask
+
+                        self.gt(count, 0)
+                        self.lt(count, 300)
+
+                        # the build does not load storage nodes into the buid cache
+                        buids = {s_common.buid(('inet:ipv4', i)) for i in range(count)}
+                        buids.add(s_common.buid(('syn:tag', 'hehe')))
+                        self.eq(set(), set(layr.buidcache.keys()) - buids)
+                        self.eq(count, await layr.getTagCount('hehe'))
+                        self.eq(count, await layr.getTagCount('hehe', formname='inet:ipv4'))
+
+                        await core.nodes('inet:ipv4#hehe [ -#hehe ]')
+                        self.eq(0, await layr.getTagCount('hehe'))
+
+                    layr = core.getLayer()
+                    for name, stats in expect.items():
+                        rebuilt = await layr.getIndexStats(name)
+                        self.eq(stats['count'], rebuilt['count'])
+                        self.eq(stats['histogram'], rebuilt['histogram'])
+                        expect[name] = rebuilt
+
+                    self.eq(6, expect['inet:ipv4:asn']['distinct'])
+
+            # the rebuilt catalog is persistent
+            async with self.getTestCore(dirn=dirn) as core:
+                layr = core.getLayer()
+                for name, stats in expect.items():
+                    self.eq(stats, await layr.getIndexStats(name))
+
+        async with self.getTestCoreAndProxy() as (core, prox):
+            layr = core.getLayer()
+            await core.nodes('[ inet:ipv4=1.2.3.4 :asn=10 ]')
+            async with core.getLocalProxy(f'*/layer/{layr.iden}') as lprox:
+                stats = await lprox.getIndexStats('inet:ipv4:asn')
+                self.eq(1, stats['count'])
+
     async def test_layer(self):
 
         async with self.getTestCore() as core:
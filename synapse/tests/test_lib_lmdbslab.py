@@ -108,6 +108,9 @@ class LmdbSlabTest(s_t_utils.SynTest):
                 self.eq([b'hoho'], list(slab.scanKeysByPref(b'h', db=dupsdb)))
                 self.eq([], list(slab.scanKeysByPref(b'z', db=dupsdb)))
 
+                self.eq(((b'aaaa', None), (b'hoho', b'haha')), slab.getmulti((b'aaaa', b'hoho'), db=testdb))
+                self.eq([], slab.getmulti((), db=testdb))
+
     async def test_lmdbslab_base(self):
 
         with self.getTestDir() as dirn0, self.getTestDir(startdir=dirn0) as dirn:
@@ -1464,6 +1467,141 @@ class LmdbSlabTest(s_t_utils.SynTest):
                 self.len(2, commitstats)
                 self.eq(2, commitstats[-1][1])
 
+                commithist = stats['commithist']
+                self.eq(2, commithist['xactops']['count'])
+                self.eq(2, commithist['xactops']['max'])
+                self.eq(((0, 1), (2, 1)), commithist['xactops']['buckets'])
+                self.eq(12, commithist['xactbytes']['total'])
+                self.eq(2, commithist['time']['count'])
+
+                self.eq(stats['commitpolicy'], {
+                    'period': None,
+                    'bytes': None,
+                    'replay': 10000,
+                    'replay:base': 10000,
+                    'replay:grow': None,
+                })
+
+    async def test_lmdbslab_commit_policy(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+
+            # commit only on explicit sync
+            async with await s_lmdbslab.Slab.anit(path, commit_period=0) as slab:
+
+                foo = slab.initdb('foo')
+                slab.forcecommit()
+
+                slab.put(b'\x00\x01', b'hehe', db=foo)
+                await s_lmdbslab.Slab.syncLoopOnce()
+                self.true(slab.dirty)
+                self.eq(1, len(slab.xactops))
+                self.eq(6, slab.xactbytes)
+
+                await slab.sync()
+                self.false(slab.dirty)
+                self.eq(0, slab.xactbytes)
+
+                # the replay log limit still forces a commit
+                slab.max_xactops_len = 2
+                slab.put(b'\x00\x02', b'haha', db=foo)
+                await s_lmdbslab.Slab.syncLoopOnce()
+                self.true(slab.dirty)
+
+                slab.put(b'\x00\x03', b'hoho', db=foo)
+                self.true(s_lmdbslab.Slab.syncevnt.is_set())
+                await s_lmdbslab.Slab.syncLoopOnce()
+                self.false(slab.dirty)
+
+            # commit after a number of bytes
+            async with await s_lmdbslab.Slab.anit(path, commit_period=0, commit_bytes=100) as slab:
+
+                foo = slab.initdb('foo')
+                slab.forcecommit()
+
+                s_lmdbslab.Slab.syncevnt.clear()
+                slab._putmulti([(b'\x00\x04', b'x' * 40)], db=foo)
+                self.false(s_lmdbslab.Slab.syncevnt.is_set())
+                await s_lmdbslab.Slab.syncLoopOnce()
+                self.true(slab.dirty)
+
+                slab._putmulti([(b'\x00\x05', b'x' * 60)], db=foo)
+                self.true(s_lmdbslab.Slab.syncevnt.is_set())
+                await s_lmdbslab.Slab.syncLoopOnce()
+                self.false(slab.dirty)
+
+                self.eq(104, slab.getCommitHist()['xactbytes']['max'])
+
+            # commit after a period of time
+            async with await s_lmdbslab.Slab.anit(path, commit_period=0.05) as slab:
+
+                self.eq(0.05, s_lmdbslab.Slab._getSyncTimeout())
+
+                foo = slab.initdb('foo')
+                slab.forcecommit()
+
+                slab.put(b'\x00\x06', b'hehe', db=foo)
+                await s_lmdbslab.Slab.syncLoopOnce()
+                self.true(slab.dirty)
+
+                await asyncio.sleep(0.05)
+                await s_lmdbslab.Slab.syncLoopOnce()
+                self.false(slab.dirty)
+
+                self.eq(b'hehe', slab.get(b'\x00\x06', db=foo))
+
+            # policy options may be set in the slab opts file
+            s_common.yamlmod({'commit_period': 0, 'commit_bytes': 1000}, s_common.switchext(path, ext='.opts.yaml'))
+            async with await s_lmdbslab.Slab.anit(path) as slab:
+                policy = slab.getCommitPolicy()
+                self.eq(0, policy['period'])
+                self.eq(1000, policy['bytes'])
+
+                stats = [s for s in await s_lmdbslab.Slab.getSlabStats() if s['path'] == path][0]
+                self.eq(policy, stats['commitpolicy'])
+                self.nn(stats['commithist'])
+
+    async def test_lmdbslab_replay_grow(self):
+
+        with self.getTestDir() as dirn:
+
+            path = os.path.join(dirn, 'test.lmdb')
+
+            async with await s_lmdbslab.Slab.anit(path, commit_period=0, max_replay_log=10, max_replay_grow=40) as slab:
+
+                foo = slab.initdb('foo')
+                slab.forcecommit()
+
+                async def fill():
+                    for i in range(slab.max_xactops_len):
+                        slab.put(s_common.int64en(i), b'haha', db=foo)
+                    await s_lmdbslab.Slab.syncLoopOnce()
+                    self.false(slab.dirty)
+
+                # sustained writes grow the replay log up to the limit
+                await fill()
+                self.eq(20, slab.max_xactops_len)
+
+                await fill()
+                self.eq(40, slab.max_xactops_len)
+
+                await fill()
+                self.eq(40, slab.max_xactops_len)
+
+                self.eq((10, 20, 40), [c[1] for c in slab.commitstats][-3:])
+
+                # small commits shrink it back down to the base
+                for size in (20, 10, 10):
+                    slab.put(b'\x00', b'hehe', db=foo)
+                    await slab.sync()
+                    self.eq(size, slab.max_xactops_len)
+
+            # the limit may not be smaller than the base replay log size
+            async with await s_lmdbslab.Slab.anit(path, max_replay_log=10, max_replay_grow=5) as slab:
+                self.eq(10, slab.getCommitPolicy()['replay:grow'])
+
     async def test_lmdbslab_iter_and_delete(self):
         with self.getTestDir() as dirn:
             path = os.path.join(dirn, 'test.lmdb')
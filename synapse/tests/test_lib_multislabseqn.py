@@ -1,6 +1,9 @@
+import os
 import shutil
 import asyncio
 
+from unittest import mock
+
 import synapse.exc as s_exc
 import synapse.common as s_common
 
@@ -519,3 +522,142 @@ class MultiSlabSeqn(s_t_utils.SynTest):
                 # create a hole in the index
                 await msqn.add('foo6', indx=6)
                 self.eq((6, 'foo6'), await msqn.last())
+
+    async def test_multislabseqn_compress(self):
+
+        with self.getTestDir() as dirn:
+
+            s_multislabseqn.COMPRESS_BLOCK_SIZE, oldsize = 100, s_multislabseqn.COMPRESS_BLOCK_SIZE
+            self.addCleanup(setattr, s_multislabseqn, 'COMPRESS_BLOCK_SIZE', oldsize)
+
+            async with await s_multislabseqn.MultiSlabSeqn.anit(dirn) as msqn:
+
+                for i in range(20):
+                    await msqn.add(f'foo{i}' * 10)
+
+                await msqn.add('foo22', indx=22)
+
+                self.eq(23, await msqn.rotate())
+
+                await msqn.add('foo23')
+
+                # iterate so the rotated slab is the cache slab
+                self.len(22, await alist(msqn.iter(0)))
+                self.nn(msqn._cacheslab)
+
+                self.eq(1, await msqn.compressSegments())
+                self.eq(0, await msqn.compressSegments())
+                self.none(msqn._cacheslab)
+
+                self.eq([], s_common.listdir(dirn, glob='*.lmdb.*'))
+
+                retn = await alist(msqn.iter(0))
+                self.len(22, retn)
+                self.eq((0, 'foo0' * 10), retn[0])
+                self.eq([(22, 'foo22'), (23, 'foo23')], retn[-2:])
+
+                retn = await alist(msqn.iter(7))
+                self.eq((7, 'foo7' * 10), retn[0])
+                self.len(15, retn)
+
+                self.eq('foo13' * 10, await msqn.get(13))
+                self.none(await msqn.get(21))
+                self.eq('foo22', await msqn.get(22))
+
+                async with msqn._getSeqn(0) as seqn:
+                    self.isinstance(seqn, s_multislabseqn.BlockSeqn)
+                    self.gt(len(list(seqn.slab.scanByFull(db=seqn.db))), 1)
+                    self.eq(21, seqn.size)
+                    self.eq(23, seqn.index())
+                    self.eq((0, 'foo0' * 10), seqn.first())
+
+                # re-adding an existing item is allowed but new items are not
+                self.eq(3, await msqn.add('foo3' * 10, indx=3))
+                with self.raises(s_exc.BadIndxValu):
+                    await msqn.add('newp', indx=3)
+                with self.raises(s_exc.BadIndxValu):
+                    await msqn.add('newp', indx=21)
+
+                await msqn.rotate()
+                self.eq((23, 'foo23'), await msqn.last())
+
+            # the last item may be in a compressed segment after a restart
+            async with await s_multislabseqn.MultiSlabSeqn.anit(dirn, opts={'compress': True}) as msqn:
+
+                self.eq(24, msqn.index())
+                self.eq((23, 'foo23'), await msqn.last())
+
+                await msqn.compressSegments()
+                self.len(3, msqn._ranges)
+                async with msqn._getSeqn(1) as seqn:
+                    self.isinstance(seqn, s_multislabseqn.BlockSeqn)
+
+                self.len(22, await alist(msqn.iter(0)))
+
+                self.true(await msqn.cull(22))
+                self.eq([(23, 'foo23')], await alist(msqn.iter(0)))
+                self.len(2, msqn._ranges)
+
+                await msqn.add('foo24')
+                self.eq(25, await msqn.rotate())
+                await msqn.compressSegments()
+                async with msqn._getSeqn(0) as seqn:
+                    self.isinstance(seqn, s_multislabseqn.BlockSeqn)
+                self.eq([(23, 'foo23'), (24, 'foo24')], await alist(msqn.iter(0)))
+
+            # recover from interrupted compressions
+            fn = s_multislabseqn.MultiSlabSeqn.slabFilename(dirn, 23)
+            shutil.copytree(fn, fn + '.comp')
+            os.rename(fn, fn + '.orig')
+
+            async with await s_multislabseqn.MultiSlabSeqn.anit(dirn) as msqn:
+                self.eq([(23, 'foo23'), (24, 'foo24')], await alist(msqn.iter(0)))
+
+            self.eq([], s_common.listdir(dirn, glob='*.lmdb.*'))
+
+            shutil.copytree(fn, fn + '.orig')
+
+            async with await s_multislabseqn.MultiSlabSeqn.anit(dirn) as msqn:
+                self.eq([(23, 'foo23'), (24, 'foo24')], await alist(msqn.iter(0)))
+
+            self.eq([], s_common.listdir(dirn, glob='*.lmdb.*'))
+
+    async def test_multislabseqn_compress_cull(self):
+
+        with self.getTestDir() as dirn:
+
+            async with await s_multislabseqn.MultiSlabSeqn.anit(dirn) as msqn:
+
+                for i in range(10):
+                    await msqn.add(f'foo{i}')
+
+                self.eq(10, await msqn.rotate())
+                await msqn.add('foo10')
+
+                opened = asyncio.Event()
+                release = asyncio.Event()
+                makeSlab = msqn._makeSlab
+
+                async def slowMakeSlab(startidx):
+                    retn = await makeSlab(startidx)
+                    opened.set()
+                    await release.wait()
+                    return retn
+
+                # culling waits for a compression which holds the segment open
+                with mock.patch.object(msqn, '_makeSlab', slowMakeSlab):
+
+                    comptask = msqn.schedCoro(msqn.compressSegments())
+                    await asyncio.wait_for(opened.wait(), timeout=5)
+
+                    culltask = msqn.schedCoro(msqn.cull(9))
+                    await asyncio.sleep(0.01)
+                    self.false(culltask.done())
+
+                    release.set()
+                    self.eq(1, await asyncio.wait_for(comptask, timeout=5))
+                    self.true(await asyncio.wait_for(culltask, timeout=5))
+
+                self.eq([(10, 'foo10')], await alist(msqn.iter(0)))
+                self.len(1, msqn._ranges)
+                self.eq([], s_common.listdir(dirn, glob='*.lmdb.*'))
@@ -108,6 +108,9 @@ class NexusTest(s_t_utils.SynTest):
                         await nexus2.doathingauto3(eventdict)
                     self.eq(cm.exception.get('mesg'), 'Test error')
 
+                    # the last entry is replayed when the last applied entry is unknown
+                    nexsroot.nexshot.delete('nexs:applied')
+
                     with self.getLoggerStream('synapse.lib.nexus') as stream:
                         await nexsroot.recover()
 
@@ -127,6 +130,99 @@ class NexusTest(s_t_utils.SynTest):
                     self.eq(offs, nexsindx)
                     self.eq(item[1], 'thing:doathing')
 
+    async def test_nexus_group(self):
+
+        with self.getTestDir() as dirn:
+
+            conf = {'nexslog:en': True, 'nexslog:group:size': 8}
+            async with await SampleNexus.anit(conf=conf, dirn=dirn) as nexus:
+
+                nexsroot = nexus.nexsroot
+
+                strt = await nexsroot.index()
+
+                sizes = []
+                origadds = nexsroot.nexslog.addsWithPackRetn
+                async def addsWithPackRetn(items):
+                    sizes.append(len(items))
+                    return await origadds(items)
+
+                async def listen():
+                    items = []
+                    async for item in nexus.getNexusChanges(strt, wait=True):
+                        items.append(item)
+                        if len(items) == 20:
+                            return items
+
+                task = nexus.schedCoro(listen())
+                await asyncio.sleep(0)
+
+                eventdicts = [{'specialpush': 0} for i in range(20)]
+                with mock.patch.object(nexsroot.nexslog, 'addsWithPackRetn', addsWithPackRetn):
+                    coros = [nexus.doathingauto(eventdict, i) for (i, eventdict) in enumerate(eventdicts)]
+                    coros.insert(10, nexus.doathingauto3({'specialpush': 0}))
+                    retn = await asyncio.gather(*coros, return_exceptions=True)
+
+                # each waiter gets its own result and errors are not shared across a group
+                self.isinstance(retn.pop(10), s_exc.SynErr)
+                self.eq(list(range(20)), retn)
+                self.true(all(e.get('autohappened') == nexus.iden for e in eventdicts))
+
+                self.eq(21, sum(sizes))
+                self.eq(8, max(sizes))
+                self.lt(len(sizes), 21)
+
+                self.eq(strt + 21, await nexsroot.index())
+
+                # events are logged and fanned out to listeners in the order they were issued
+                items = await asyncio.wait_for(task, timeout=12)
+                self.eq(list(range(strt, strt + 20)), [offs for (offs, item) in items])
+                self.eq(list(range(10)), [item[2][1] for (offs, item) in items[:10]])
+                self.eq('auto3', items[10][1][1])
+
+                self.none(await nexsroot.eat(nexus.iden, 'auto2', ({'specialpush': 0}, 'nowait'), {}, None, wait=False))
+                self.eq('foo', await nexus.doathingauto({'specialpush': 0}, 'foo'))
+
+                self.eq(strt + 23, await nexsroot.index())
+                self.none(nexsroot.grouptask)
+
+                with self.raises(s_exc.NoSuchName):
+                    await nexsroot.eat(nexus.iden, 'newp', (), {}, None)
+
+                # recover only replays the events after the last applied event
+                self.eq(strt + 22, nexsroot.nexshot.get('nexs:applied'))
+
+                applied = []
+                async def _apply(indx, mesg):
+                    applied.append(indx)
+
+                with mock.patch.object(nexsroot, '_apply', _apply):
+                    await nexsroot.recover()
+                    self.eq([], applied)
+
+                    nexsroot.nexshot.set('nexs:applied', strt + 15)
+                    await nexsroot.recover()
+                    self.eq(list(range(strt + 16, strt + 23)), applied)
+
+                    # the last event is replayed if the last applied event is unknown
+                    applied.clear()
+                    nexsroot.nexshot.delete('nexs:applied')
+                    await nexsroot.recover()
+                    self.eq([strt + 22], applied)
+
+                    nexsroot.nexshot.set('nexs:applied', strt + 15)
+
+            # the events after the last applied event are replayed at startup and the
+            # last applied event is also recorded without group commits
+            conf = {'nexslog:en': True}
+            async with await SampleNexus.anit(conf=conf, dirn=dirn) as nexus:
+
+                nexsroot = nexus.nexsroot
+                self.eq(strt + 22, nexsroot.nexshot.get('nexs:applied'))
+
+                self.eq('foo', await nexus.doathingauto({'specialpush': 0}, 'foo'))
+                self.eq(strt + 23, nexsroot.nexshot.get('nexs:applied'))
+
     async def test_nexus_fini(self):
 
         conf = {'nexslog:en': True}
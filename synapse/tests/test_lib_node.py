@@ -605,3 +605,49 @@ class NodeTest(s_t_utils.SynTest):
             self.len(1, nodes)
             self.len(1, nodes[0].tags)
             self.isin('ping', nodes[0].tags)
+
+    async def test_node_bylayer_lazy(self):
+
+        async with self.getTestCore() as core:
+
+            await core.addTagProp('score', ('int', {}), {})
+
+            base = core.getLayer().iden
+            fork = await core.callStorm('return($lib.view.get().fork().iden)')
+            forklayr = core.getView(fork).layers[0].iden
+
+            await core.nodes('[ test:str=foo :tick=2020 +#foo:score=10 ]')
+            await core.nodes('test:str=foo [ :hehe=haha +#bar +#foo:score=20 ]', opts={'view': fork})
+
+            nodes = await core.nodes('test:str=foo', opts={'view': fork})
+            self.len(1, nodes)
+
+            node = nodes[0]
+            self.false(hasattr(node, '__dict__'))
+
+            # bylayer is constructed on first access
+            self.nn(node.sodes)
+            self.none(node._bylayer)
+
+            self.eq(node.bylayer, {
+                'ndef': base,
+                'props': {'.created': base, 'tick': base, 'hehe': forklayr},
+                'tags': {'foo': base, 'bar': forklayr},
+                'tagprops': {'foo': {'score': forklayr}},
+            })
+            self.none(node.sodes)
+
+            self.eq(node.getByLayer(), node.bylayer)
+            self.eq(await core.callStorm('test:str=foo return($node.getByLayer())', opts={'view': fork}), node.bylayer)
+
+            # edits update a node which has not constructed bylayer yet
+            nodes = await core.nodes('test:str=foo [ :tick=2021 ]', opts={'view': fork})
+            self.eq(forklayr, nodes[0].bylayer['props']['tick'])
+
+            nodes = await core.nodes('[ test:str=bar ]')
+            self.eq(base, nodes[0].bylayer['ndef'])
+            self.eq(base, nodes[0].bylayer['props']['.created'])
+
+            # runt nodes have no bylayer
+            nodes = await core.nodes('syn:form=test:str')
+            self.none(nodes[0].bylayer)
@@ -1,9 +1,12 @@
 import gc
 import random
 import asyncio
+import weakref
 import contextlib
 import collections
 
+from unittest import mock
+
 import synapse.exc as s_exc
 import synapse.common as s_common
 
@@ -67,10 +70,12 @@ class SnapTest(s_t_utils.SynTest):
         async with self.getTestCore() as core:
             async with await core.snap() as snap:
                 nodebuid = None
+                noderef = None
                 snap.buidcache = collections.deque(maxlen=10)
 
                 async def doit():
                     nonlocal nodebuid
+                    nonlocal noderef
                     # Reduce the buid cache so we don't have to make 100K nodes
 
                     node0 = await snap.addNode('test:int', 0)
@@ -90,7 +95,7 @@ class SnapTest(s_t_utils.SynTest):
 
                     self.eq(nodes[0].buid, node0.buid)
                     self.eq(id(nodes[0]), id(node0))
-                    node._test = True
+                    noderef = weakref.ref(node)
 
                 await doit()  # run in separate function so that objects are gc'd
 
@@ -104,7 +109,7 @@ class SnapTest(s_t_utils.SynTest):
                 # Ensure that the node is not the same object as we encountered earlier.
                 # We cannot check via id() since it is possible for a pyobject to be
                 # allocated at the same location as the old object.
-                self.false(hasattr(node, '_test'))
+                self.none(noderef())
 
     async def test_addNodes(self):
         async with self.getTestCore() as core:
@@ -286,6 +291,43 @@ class SnapTest(s_t_utils.SynTest):
             async with await view1.snap(user=root) as snap:
                 await snap.applyNodeEdit((nodes[0].buid, 'inet:ipv4', edits))
 
+    async def test_snap_getnodesbybuids(self):
+        async with self._getTestCoreMultiLayer() as (view0, view1):
+
+            await alist(view0.eval('[ inet:ipv4=1.2.3.4 :asn=42 ]'))
+            await alist(view1.eval('[ inet:ipv4=1.2.3.4 +#foo ] [ inet:ipv4=5.6.7.8 ]'))
+
+            buids = [s_common.buid(('inet:ipv4', 0x01020304)), s_common.buid(('inet:ipv4', 0x05060708)),
+                     s_common.buid(('inet:ipv4', 0x01010101))]
+
+            root = view0.core.auth.rootuser
+            async with await view1.snap(user=root) as snap:
+                nodes = await snap.getNodesByBuids(buids)
+                self.len(3, nodes)
+                self.eq(42, nodes[0].get('asn'))
+                self.nn(nodes[0].getTag('foo'))
+                self.eq(('inet:ipv4', 0x05060708), nodes[1].ndef)
+                self.none(nodes[2])
+
+                # live nodes are returned as-is
+                self.true(nodes[0] is (await snap.getNodesByBuids(buids[:1]))[0])
+
+            sodes = await view0.core._getStorNodesBatch(buids, view1.layers)
+            self.len(3, sodes)
+            self.eq(42, sodes[0][1]['props']['asn'][0])
+            self.nn(sodes[0][0]['tags']['foo'])
+            self.eq({}, sodes[1][1])
+            self.eq([{}, {}], sodes[2])
+
+            # lifts which span more than one sode batch
+            with mock.patch('synapse.cortex.SODE_BATCH_SIZE', 2):
+                await alist(view0.eval('[ inet:ipv4=1.1.1.1 inet:ipv4=2.2.2.2 inet:ipv4=3.3.3.3 ]'))
+                await alist(view1.eval('inet:ipv4=2.2.2.2 [ :asn=99 ]'))
+                nodes = await alist(view1.eval('inet:ipv4'))
+                self.len(5, nodes)
+                self.eq(1, len([n for n in nodes if n.get('asn') == 99]))
+                self.len(1, await alist(view1.eval('inet:ipv4:asn=42')))
+
     async def test_cortex_lift_layers_bad_filter(self):
         '''
         Test a two layer cortex where a lift operation gives the wrong result
@@ -407,6 +449,177 @@ class SnapTest(s_t_utils.SynTest):
                 self.ne(id(original_node0), id(new_node0))
                 self.notin('foo.bar.baz', new_node0.tags)
 
+    async def test_snap_nodecache(self):
+
+        import synapse.lib.snap as s_snap
+
+        async with self.getTestCore() as core:
+
+            await core.nodes('[ test:str=foo test:str=bar test:str=baz ]')
+
+            layr = (await core.addLayer()).get('iden')
+            view = (await core.addView({'layers': (layr, core.getLayer().iden)})).get('iden')
+            await core.callStorm('$lib.layer.get($iden).set(readonly, $lib.true)', opts={'vars': {'iden': layr}})
+
+            opts = {'view': view}
+
+            info = await core.getNodeCacheInfo()
+            self.eq(0, info['count'])
+
+            nodes = await core.nodes('test:str', opts=opts)
+            self.len(3, nodes)
+
+            info = await core.getNodeCacheInfo()
+            self.eq(3, info['count'])
+            self.eq(0, info['hits'])
+            self.gt(info['size'], 0)
+
+            # lifts populate the cache and buid lookups are served from it
+            idens = ' '.join(node.iden() for node in nodes)
+            nodes = await core.nodes(f'iden {idens}', opts=opts)
+            self.len(3, nodes)
+
+            info = await core.getNodeCacheInfo()
+            self.eq(3, info['count'])
+            self.eq(3, info['hits'])
+
+            # snaps of writable views do not use the shared cache
+            self.len(3, await core.nodes(f'iden {idens}'))
+            self.eq(3, (await core.getNodeCacheInfo())['hits'])
+
+            # edits in an underlying layer invalidate the cached node
+            await core.nodes('test:str=foo [ :tick=2020 +#hehe ]')
+            self.eq(2, (await core.getNodeCacheInfo())['count'])
+
+            nodes = await core.nodes('test:str=foo', opts=opts)
+            self.len(1, nodes)
+            self.nn(nodes[0].get('tick'))
+            self.nn(nodes[0].getTag('hehe'))
+
+            # nodes constructed from the cache do not share dicts with it
+            await core.nodes('test:str=bar $node.data.set(secret, hehe)')
+            bar = (await core.nodes('test:str=bar', opts=opts))[0].iden()
+
+            hits = (await core.getNodeCacheInfo())['hits']
+            nodes = await core.nodes(f'iden {bar} | $node.data.load(secret)', opts=opts)
+            self.eq({'secret': 'hehe'}, nodes[0].nodedata)
+
+            nodes = await core.nodes(f'iden {bar}', opts=opts)
+            self.eq(hits + 2, (await core.getNodeCacheInfo())['hits'])
+            self.len(1, nodes)
+            self.eq({}, nodes[0].nodedata)
+            self.none(nodes[0].get('hehe'))
+
+            async with await core.getView(view).snap(user=core.auth.rootuser) as snap:
+                node = await snap.getNodeByNdef(('test:str', 'bar'))
+                node.nodedata['secret'] = 'newp'
+                node.props['hehe'] = 'newp'
+                node.tags['newp'] = (None, None)
+
+            nodes = await core.nodes(f'iden {bar}', opts=opts)
+            self.len(1, nodes)
+            self.eq({}, nodes[0].nodedata)
+            self.none(nodes[0].get('hehe'))
+            self.none(nodes[0].getTag('newp'))
+
+            async with core.getLocalProxy() as proxy:
+                info = await proxy.getNodeCacheInfo()
+                self.eq(3, info['count'])
+
+                cellinfo = await proxy.getCellInfo()
+                self.eq(info['maxsize'], cellinfo['cortex']['nodecache']['maxsize'])
+
+            # layer deletion clears the cache
+            await core.delView(view)
+            await core.delLayer(layr)
+            self.eq(0, (await core.getNodeCacheInfo())['count'])
+
+        cache = s_snap.NodeCache(2048)
+        pode = (('test:str', 'foo'), {'props': {}, 'tags': {}, 'tagprops': {}})
+
+        cache.put(b'\x00', ('a',), pode, {})
+        cache.put(b'\x01', ('a',), pode, {})
+        self.len(2, cache)
+        self.eq(2048, cache.size)
+
+        self.nn(cache.get(b'\x00', ('a',)))
+        self.none(cache.get(b'\x00', ('b',)))
+        self.eq(1, cache.hits)
+        self.eq(1, cache.misses)
+
+        # least recently used entries are evicted first
+        cache.put(b'\x02', ('a',), pode, {})
+        self.len(2, cache)
+        self.eq(1, cache.evictions)
+        self.none(cache.get(b'\x01', ('a',)))
+        self.nn(cache.get(b'\x00', ('a',)))
+
+        editgen = cache.editgen
+        cache.pop(b'\x00')
+        self.len(1, cache)
+        self.eq(1024, cache.size)
+        self.gt(cache.editgen, editgen)
+
+        # invalidations only prevent storing the buids which were edited
+        self.false(cache.put(b'\x00', ('a',), pode, {}, editgen=editgen))
+        self.true(cache.put(b'\x01', ('a',), pode, {}, editgen=editgen))
+        self.true(cache.put(b'\x00', ('a',), pode, {}, editgen=cache.editgen))
+
+        # readers older than the invalidation history are rejected
+        cache = s_snap.NodeCache(4096, pophist=2)
+        editgen = cache.editgen
+        cache.pop(b'\x00')
+        self.true(cache.put(b'\x01', ('a',), pode, {}, editgen=editgen))
+        cache.pop(b'\x02')
+        cache.pop(b'\x03')
+        self.len(2, cache.popped)
+        self.false(cache.put(b'\x01', ('a',), pode, {}, editgen=editgen))
+        self.true(cache.put(b'\x01', ('a',), pode, {}, editgen=cache.editgen))
+
+        cache.clear()
+        self.len(0, cache.popped)
+        self.false(cache.put(b'\x01', ('a',), pode, {}, editgen=editgen))
+
+        # nodes larger than the cache are not stored
+        cache = s_snap.NodeCache(100)
+        cache.put(b'\x00', ('a',), pode, {})
+        self.len(0, cache)
+
+        # the size of entries includes the storage nodes they were joined from
+        cache = s_snap.NodeCache(4096)
+        sodes = [
+            ('a', {'form': 'test:str', 'props': {'hehe': ('haha', 1)}, 'tags': {'foo': (None, None)}}),
+            ('b', {}),
+        ]
+        self.true(cache.put(b'\x00', ('a', 'b'), pode, sodes))
+        self.eq(1024 + 512 * 2 + 256 * 2 + 4, cache.size)
+
+        cache.pop(b'\x00')
+        self.eq(0, cache.size)
+
+    async def test_snap_keepalive(self):
+
+        import synapse.lib.snap as s_snap
+
+        conf = {'snap:cache:size': 4096}
+        async with self.getTestCore(conf=conf) as core:
+
+            await core.nodes('[ test:str=foo test:str=bar test:str=baz test:str=faz test:str=zip test:str=zap ]')
+
+            async with await core.snap() as snap:
+                nodes = await alist(snap.nodesByProp('test:str'))
+                self.len(6, nodes)
+                size = s_snap.getNodeSize(nodes[0])
+                self.len(4096 // size, snap.buidcache)
+                self.le(snap.buidcache.size, 4096)
+
+                # the most recently used node is always kept alive
+                keepalive = s_snap.NodeKeepAlive(0)
+                keepalive.append(nodes[0])
+                keepalive.append(nodes[1])
+                self.len(1, keepalive)
+                self.eq(nodes[1], keepalive.nodes[0][0])
+
     async def test_cortex_lift_layers_bad_filter_tagprop(self):
         '''
         Test a two layer cortex where a lift operation gives the wrong result, with tagprops
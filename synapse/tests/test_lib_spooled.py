@@ -1,4 +1,7 @@
 import os
+import asyncio
+
+import synapse.common as s_common
 
 import synapse.tests.utils as s_test
 
@@ -130,3 +133,127 @@ class SpooledTest(s_test.SynTest):
         async with await s_spooled.Dict.anit(size=1000) as sd1:
             await runtest(sd1)
             self.false(sd1.fallback)
+
+    async def test_spooled_set_fallback(self):
+
+        buids = [s_common.buid(('test:int', i)) for i in range(100)]
+
+        async with await s_spooled.Set.anit(size=10) as sset:
+
+            for buid in buids:
+                await sset.add(buid)
+                await sset.add(s_common.ehex(buid))
+
+            self.true(sset.fallback)
+            self.len(200, sset)
+
+            # buids are stored raw in their own db
+            self.nn(sset.slab.get(buids[0], db=sset.buiddb))
+            self.none(sset.slab.get(buids[0], db=sset.itemdb))
+
+            self.true(buids[99] in sset)
+            self.true(sset.has(s_common.ehex(buids[99])))
+            self.false(s_common.buid() in sset)
+            self.false(sset.has('newp'))
+
+            await sset.add(buids[0])
+            self.len(200, sset)
+
+            # items which have not been flushed to the slab yet
+            newp = s_common.buid()
+            await sset.add(newp)
+            self.isin((newp, sset.buiddb), sset.pending)
+            self.true(newp in sset)
+            self.len(201, sset)
+
+            sset.discard(newp)
+            self.false(newp in sset)
+            self.len(200, sset)
+
+            sset.discard(buids[0])
+            sset.discard(buids[0])
+            self.false(buids[0] in sset)
+            self.len(199, sset)
+
+            items = [item async for item in sset]
+            self.len(199, items)
+            self.eq(set(items), set(buids[1:]) | set(s_common.ehex(b) for b in buids))
+            self.len(0, sset.pending)
+
+            newset = await sset.copy()
+            self.len(199, newset)
+            self.true(buids[1] in newset)
+            self.true(s_common.ehex(buids[1]) in newset)
+            self.false(buids[0] in newset)
+            await newset.fini()
+
+            # the bloom filter is rebuilt once it is full
+            sset.bloom = s_spooled.s_bloom.BloomFilter(200)
+            for lkey, db in sset._iterLkeys():
+                sset.bloom.add(lkey)
+
+            for i in range(100):
+                await sset.add(i)
+
+            self.eq(800, sset.bloom.capacity)
+            self.len(299, sset)
+            self.true(all(i in sset for i in range(100)))
+            self.true(all(buid in sset for buid in buids[1:]))
+
+            # membership checks are correct while the bloom filter is rebuilt
+            await sset._flush()
+            sset.bloom = s_spooled.s_bloom.BloomFilter(250)
+            for lkey, db in sset._iterLkeys():
+                sset.bloom.add(lkey)
+
+            task = sset.schedCoro(sset.add(100))
+            await asyncio.sleep(0)
+
+            checks = 0
+            while not task.done():
+                self.true(all(buid in sset for buid in buids[1:]))
+                await sset.add(buids[1])
+                if sset.rebloom is not None:
+                    await sset.add(101)
+                checks += 1
+                await asyncio.sleep(0)
+
+            await task
+
+            self.gt(checks, 0)
+            self.eq(1000, sset.bloom.capacity)
+            self.len(301, sset)
+            self.true(101 in sset)
+            self.len(301, [item async for item in sset])
+
+    async def test_spooled_dict_fallback(self):
+
+        buids = [s_common.buid(('test:int', i)) for i in range(100)]
+
+        async with await s_spooled.Dict.anit(size=10) as sdict:
+
+            for i, buid in enumerate(buids):
+                await sdict.set(buid, i)
+
+            self.true(sdict.fallback)
+            self.len(100, sdict)
+
+            self.eq(10, sdict.get(buids[10]))
+            self.none(sdict.get(s_common.buid()))
+            self.false(sdict.has(s_common.buid()))
+            self.eq('newp', sdict.pop(s_common.buid(), 'newp'))
+
+            await sdict.set(buids[10], 'hehe')
+            self.len(100, sdict)
+            self.eq('hehe', sdict.get(buids[10]))
+
+            await sdict.set('haha', 'hoho')
+            self.len(101, sdict)
+
+            self.eq(set(sdict.keys()), set(buids) | {'haha'})
+            self.eq(dict(sdict.items())['haha'], 'hoho')
+            self.eq(dict(sdict.items())[buids[10]], 'hehe')
+
+            self.eq(20, sdict.pop(buids[20]))
+            self.false(sdict.has(buids[20]))
+            self.len(100, sdict)
@@ -0,0 +1,126 @@
+from unittest import mock
+
+import synapse.exc as s_exc
+
+import synapse.lib.stormpool as s_stormpool
+
+import synapse.tests.utils as s_t_utils
+
+class StormPoolTest(s_t_utils.SynTest):
+
+    def test_lib_stormpool_router(self):
+
+        router = s_stormpool.StormPoolRouter({'weight:latency': 0.0})
+        names = ('mirror00', 'mirror01', 'mirror02')
+
+        # with equal load the least recently used mirror is first
+        order = []
+        for _ in range(6):
+            name = router.order(names)[0]
+            with router.track(name):
+                order.append(name)
+
+        self.eq(order, ['mirror00', 'mirror01', 'mirror02', 'mirror00', 'mirror01', 'mirror02'])
+
+        with router.track('mirror00'):
+            with router.track('mirror01'):
+                self.eq('mirror02', router.order(names)[0])
+                self.eq(1, router.getStats('mirror00').inflight)
+
+        self.eq(0, router.getStats('mirror00').inflight)
+
+        router = s_stormpool.StormPoolRouter({})
+
+        router.getStats('mirror00').latency = 10.0
+        router.getStats('mirror01').latency = 0.5
+        router.getStats('mirror02').latency = 0.1
+        router.setNexsLag('mirror02', 200)
+
+        self.eq(['mirror01', 'mirror02', 'mirror00'], router.order(names))
+
+        with router.track('mirror01'):
+            with router.track('mirror01'):
+                self.eq(['mirror02', 'mirror01', 'mirror00'], router.order(names))
+
+        router.setNexsLag('mirror02', -10)
+        self.eq(0, router.getStats('mirror02').nexslag)
+
+        router = s_stormpool.StormPoolRouter({'weight:latency': 0.0, 'weight:nexslag': 0.0})
+        router.getStats('mirror00').latency = 10.0
+        router.setNexsLag('mirror00', 5000)
+        router.getStats('mirror01').lastused = 1.0
+        router.getStats('mirror02').lastused = 2.0
+        self.eq(['mirror00', 'mirror01', 'mirror02'], router.order(names))
+
+        # pinned queries are consistently routed by hash
+        router = s_stormpool.StormPoolRouter({'pin': True})
+
+        first = router.order(names, text='inet:fqdn')
+        with router.track(first[0]):
+            self.eq(first, router.order(names, text='inet:fqdn'))
+
+        # removing another mirror does not change the pinned mirror
+        self.eq(first[0], router.order([n for n in names if n != first[-1]], text='inet:fqdn')[0])
+
+        pinned = set(router.order(names, text=f'inet:ipv4={i}')[0] for i in range(30))
+        self.eq(pinned, set(names))
+
+    def test_lib_stormpool_stats(self):
+
+        router = s_stormpool.StormPoolRouter({})
+
+        with router.track('mirror00'):
+            pass
+
+        with self.raises(s_exc.TimeOut):
+            with router.track('mirror00'):
+                raise s_exc.TimeOut()
+
+        stats = router.getStats('mirror00')
+        self.eq(2, stats.count)
+        self.eq(1, stats.errors)
+        self.nn(stats.latency)
+
+        stats.latency = None
+        stats.addLatency(1.0)
+        self.eq(1.0, stats.latency)
+        stats.addLatency(2.0)
+        self.eq(1.2, stats.latency)
+
+        # streaming queries record the time to their first result
+        ticks = iter((10.0, 10.5, 30.0))
+        with mock.patch.object(s_stormpool.time, 'monotonic', lambda: next(ticks)):
+            with router.track('mirror02') as query:
+                query.onResult()
+                query.onResult()
+
+        self.eq(0.5, router.getStats('mirror02').latency)
+
+        ticks = iter((10.0, 13.0))
+        with mock.patch.object(s_stormpool.time, 'monotonic', lambda: next(ticks)):
+            with router.track('mirror02') as query:
+                pass
+
+        self.eq(1.0, router.getStats('mirror02').latency)
+
+        router.setNexsLag('mirror01', 3)
+
+        self.eq(router.pack(), (
+            {'name': 'mirror00', 'count': 2, 'errors': 1, 'inflight': 0, 'latency': 1200, 'nexslag': 0},
+            {'name': 'mirror01', 'count': 0, 'errors': 0, 'inflight': 0, 'latency': None, 'nexslag': 3},
+            {'name': 'mirror02', 'count': 2, 'errors': 0, 'inflight': 0, 'latency': 1000, 'nexslag': 0},
+        ))
+
+    def test_lib_stormpool_mirror_name(self):
+
+        class Proxy:
+            def __init__(self, ahainfo):
+                self._ahainfo = ahainfo
+
+        self.eq('00.mirror', s_stormpool.getMirrorName(Proxy({'name': '00.mirror'})))
+
+        # mirrors without a name are tracked separately
+        prox00 = Proxy({})
+        prox01 = Proxy({})
+        self.eq(s_stormpool.getMirrorName(prox00), s_stormpool.getMirrorName(prox00))
+        self.ne(s_stormpool.getMirrorName(prox00), s_stormpool.getMirrorName(prox01))
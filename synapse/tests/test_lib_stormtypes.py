@@ -22,6 +22,8 @@ import synapse.lib.time as s_time
 import synapse.lib.storm as s_storm
 import synapse.lib.hashset as s_hashset
 import synapse.lib.httpapi as s_httpapi
+import synapse.lib.msgpack as s_msgpack
+import synapse.lib.columnar as s_columnar
 import synapse.lib.modelrev as s_modelrev
 import synapse.lib.stormtypes as s_stormtypes
 
@@ -7467,6 +7469,17 @@ words\tword\twrd'''
             with self.raises(s_exc.BadArg):
                 await core.callStorm('return( $lib.export.toaxon(${.created}, (bad, opts,)) )')
 
+            size, sha256 = await core.callStorm('return( $lib.export.colstoaxon(${inet:dns:a}, (valu, ":fqdn")) )')
+            byts = b''.join([b async for b in core.axon.get(s_common.uhex(sha256))])
+            mesgs = [m[1] for m in s_msgpack.Unpk().feed(byts)]
+            self.eq([(('vertex.link', 0x01020304), 'vertex.link')], list(s_columnar.iterRows(mesgs)))
+
+            with self.raises(s_exc.BadArg):
+                await core.callStorm('return( $lib.export.colstoaxon(${.created}, valu) )')
+
+            with self.raises(s_exc.BadArg):
+                await core.callStorm('return( $lib.export.colstoaxon(${.created}, (valu,), (bad, opts,)) )')
+
     async def test_storm_nodes_edges(self):
 
         async with self.getTestCore() as core:
@@ -18,7 +18,9 @@ import synapse.telepath as s_telepath
 import synapse.lib.cell as s_cell
 import synapse.lib.coro as s_coro
 import synapse.lib.link as s_link
+import synapse.lib.queue as s_queue
 import synapse.lib.const as s_const
+import synapse.lib.scope as s_scope
 import synapse.lib.share as s_share
 import synapse.lib.certdir as s_certdir
 import synapse.lib.version as s_version
@@ -119,6 +121,14 @@ class Foo:
         await asyncio.sleep(5)
         return 42
 
+    async def manygenr(self, x):
+        for i in range(x):
+            yield i
+
+    def syncmanygenr(self, x):
+        for i in range(x):
+            yield i
+
     async def corogenr(self, x):
         for i in range(x):
             yield i
@@ -127,6 +137,29 @@ class Foo:
             except asyncio.CancelledError:
                 return
 
+    async def loopgenr(self, x):
+        for i in range(x):
+            yield i
+            await asyncio.sleep(0)
+
+    async def linkgenr(self):
+        yield 0
+        yield 1
+        # items sent directly to the link follow the items yielded before them
+        await s_scope.get('link').tx(('t2:yield', {'retn': (True, 2)}))
+        yield 3
+
+    async def idlegenr(self, x):
+        for i in range(x):
+            yield i
+        await asyncio.sleep(60)
+
+    async def windgenr(self, x):
+        async with await s_queue.Window.anit() as wind:
+            await wind.puts(range(x))
+            async for item in wind:
+                yield item
+
     def boom(self):
         return Boom()
 
@@ -642,6 +675,105 @@ class TeleTest(s_t_utils.SynTest):
 
                 self.eq(retn, [0, 1, 2])
 
+    async def test_telepath_batchyield(self):
+
+        foo = Foo()
+
+        mesgs = []
+        rx = s_link.Link.rx
+
+        async def rxwrap(self):
+            mesg = await rx(self)
+            if mesg is not None:
+                mesgs.append(mesg[0])
+            return mesg
+
+        async with self.getTestDmon() as dmon:
+
+            dmon.share('foo', foo)
+
+            with mock.patch.object(s_link.Link, 'rx', rxwrap):
+
+                async with await s_telepath.openurl('tcp://127.0.0.1/foo', port=dmon.addr[1]) as prox:
+
+                    # the feature is not advertised so each item is sent separately
+                    self.false(prox._hasTeleFeat('batchyield'))
+                    self.eq(list(range(10)), [x async for x in prox.manygenr(10)])
+                    self.notin('t2:yields', mesgs)
+                    self.eq(10, mesgs.count('t2:yield') - 1)
+
+                    prox._features['batchyield'] = 1
+
+                    with mock.patch.object(s_daemon, 'BATCH_SIZE', 100):
+
+                        mesgs.clear()
+                        self.eq(list(range(1000)), [x async for x in prox.manygenr(1000)])
+                        self.notin('t2:yield', mesgs[:-1])
+                        self.le(mesgs.count('t2:yields'), 11)
+                        self.eq(mesgs[-1], 't2:yield')
+
+                        self.eq(list(range(1000)), [x async for x in await prox.syncmanygenr(1000)])
+
+                        # yielding to the loop does not send a partial batch
+                        mesgs.clear()
+                        self.eq(list(range(1000)), [x async for x in prox.loopgenr(1000)])
+                        self.le(mesgs.count('t2:yields'), 11)
+
+                        # a batch is also sent once it reaches the byte limit
+                        with mock.patch.object(s_daemon, 'BATCH_BYTES', 100):
+                            mesgs.clear()
+                            self.eq(list(range(1000)), [x async for x in prox.manygenr(1000)])
+                            self.ge(mesgs.count('t2:yields'), 20)
+                        self.eq([], [x async for x in prox.manygenr(0)])
+
+                        self.eq([0, 1, 2], [x async for x in prox.corogenr(3)])
+                        self.eq([0, 1, 2, 3], [x async for x in prox.linkgenr()])
+
+                        retn = []
+                        with self.raises(s_exc.SynErr):
+                            async for item in prox.agenrboom():
+                                retn.append(item)
+                        self.eq(retn, [10, 20])
+
+                        retn = []
+                        with self.raises(s_exc.SynErr):
+                            async for item in await prox.genrboom():
+                                retn.append(item)
+                        self.eq(retn, [10, 20])
+
+                        # the link is dropped if the caller bails early
+                        async for item in prox.manygenr(1000):
+                            if item == 150:
+                                break
+
+                        self.eq(1000, len([x async for x in prox.manygenr(1000)]))
+
+                    async def consume(genr, size):
+                        retn = []
+                        async for item in genr:
+                            retn.append(item)
+                            if len(retn) == size:
+                                return retn
+
+                    # pending items are sent once they have waited for the batch time
+                    retn = await asyncio.wait_for(consume(prox.idlegenr(3), 3), timeout=5)
+                    self.eq(retn, [0, 1, 2])
+
+                    # pending items are sent when a generator waits for realtime data
+                    with mock.patch.object(s_daemon, 'BATCH_TIME', 60):
+                        retn = await asyncio.wait_for(consume(prox.windgenr(3), 3), timeout=5)
+                        self.eq(retn, [0, 1, 2])
+
+            async with self.getTestCore() as core:
+
+                async with core.getLocalProxy() as prox:
+                    self.true(prox._hasTeleFeat('batchyield'))
+
+                    await core.nodes('for $i in $lib.range(2000) { [ test:int=$i ] }')
+                    msgs = await prox.storm('test:int').list()
+                    self.len(2000, [m for m in msgs if m[0] == 'node'])
+                    self.eq(msgs[-1][0], 'fini')
+
     async def test_telepath_blocking(self):
         ''' Make sure that async methods on the same proxy don't block each other '''
 
@@ -1,5 +1,7 @@
 import os
 
+import unittest.mock as mock
+
 import synapse.common as s_common
 
 import synapse.lib.msgpack as s_msgpack
@@ -9,6 +11,7 @@ import synapse.tests.utils as s_test
 
 import synapse.tools.cortex.layer.dump as s_t_dump
 import synapse.tools.cortex.layer.load as s_t_load
+import synapse.tools.cortex.layer.build as s_t_build
 
 class LayerTest(s_test.SynTest):
 
@@ -417,3 +420,158 @@ class LayerTest(s_test.SynTest):
                 outp = self.getTestOutp()
                 self.eq(1, await s_t_load.main(argv, outp=outp))
                 outp.expect(f'Incomplete/corrupt export: {filename}. Expected offset {eoffs}, got {soffs}.')
+
+    async def test_tools_layer_build(self):
+
+        edits = (
+            'for $i in $lib.range(300) { [ inet:ipv4=$i :asn=($i % 7) :loc=us.va +#foo.bar=(2020, 2021) ] }',
+            '[ inet:fqdn=vertex.link inet:fqdn=woot.com +#baz ]',
+            '[ test:arrayprop=* :ints=(1, 2, 3) :strs=(foo, bar) ]',
+            '[ test:str=ndefs :bar=(inet:fqdn, woot.com) :ndefs=((inet:fqdn, vertex.link),) ]',
+            '[ ps:contact=* :name=visi :email=visi@vertex.link +#foo:score=10 ]',
+            'inet:ipv4=5 [ <(refs)+ { inet:fqdn=vertex.link } -#foo.bar ]',
+            'inet:ipv4=6 [ -:loc +#foo.bar=(2019, 2020) ] $node.data.set(hehe, haha)',
+            'inet:ipv4=7 | delnode',
+            'inet:fqdn=woot.com [ -#baz ]',
+        )
+
+        async with self.getTestCore() as core:
+
+            await core.addTagProp('score', ('int', {}), {})
+
+            url = core.getLocalUrl()
+
+            layr00 = await core.addLayer()
+            layr00iden = layr00.get('iden')
+            view00 = (await core.addView({'layers': [layr00iden]})).get('iden')
+
+            for text in edits:
+                await core.nodes(text, opts={'view': view00})
+
+            podes = [pode async for pode in core.exportStorm('.created', opts={'view': view00})]
+            self.true(all(pode[1]['props'].get('.created') for pode in podes))
+
+            with self.getTestDir() as dirn:
+
+                argv = ('--url', url, layr00iden, dirn)
+                self.eq(0, await s_t_dump.main(argv, outp=self.getTestOutp()))
+
+                files = [os.path.join(dirn, k) for k in os.listdir(dirn) if k.endswith('.nodeedits')]
+
+                nodesfile = s_common.genpath(dirn, 'podes.nodes')
+                with open(nodesfile, 'wb') as fd:
+                    for pode in podes:
+                        fd.write(s_msgpack.en(pode))
+
+                queries = (
+                    'inet:ipv4',
+                    'inet:ipv4:asn=3',
+                    'inet:ipv4:loc=us.va',
+                    '#foo.bar',
+                    '#foo',
+                    'inet:ipv4#foo.bar@=2019',
+                    '#foo:score=10',
+                    'test:arrayprop:ints*[=2]',
+                    'test:arrayprop:strs*[=bar]',
+                    'test:str:ndefs*[=(inet:fqdn, vertex.link)]',
+                    'inet:fqdn=vertex.link -> test:str',
+                    'inet:fqdn=woot.com -> test:str:bar',
+                    'ps:contact:email=visi@vertex.link',
+                    'inet:asn',
+                    '#baz',
+                    '.created',
+                )
+                counts = [(text, await core.count(text, opts={'view': view00})) for text in queries]
+                self.eq(299, counts[0][1])
+
+                sodecount = core.getLayer(layr00iden).getStorNodeCount()
+                editindx = await core.getLayer(layr00iden).getEditIndx()
+
+                expect = {tuple(pode[0]): pode for pode in podes}
+
+                with self.getTestDir() as coredirn:
+
+                    async with self.getTestCore(dirn=coredirn) as core01:
+                        await core01.addTagProp('score', ('int', {}), {})
+                        layr01iden = (await core01.addLayer()).get('iden')
+                        layr02iden = (await core01.addLayer()).get('iden')
+                        layr03iden = (await core01.addLayer()).get('iden')
+                        view01 = (await core01.addView({'layers': [layr01iden]})).get('iden')
+                        view02 = (await core01.addView({'layers': [layr02iden]})).get('iden')
+
+                    # the build tool opens the cortex using the cell.yaml config
+                    conf = {'modules': [('synapse.tests.utils.TestModule', {'key': 'valu'})]}
+                    s_common.yamlsave(conf, coredirn, 'cell.yaml')
+
+                    with (mock.patch.object(s_t_build, 'RUN_SIZE', 50),
+                          mock.patch.object(s_t_build, 'PUT_CHUNK', 30),
+                          mock.patch.object(s_t_build, 'LOG_CHUNK', 40)):
+
+                        outp = self.getTestOutp()
+                        self.eq(0, await s_t_build.main((coredirn, layr01iden, *files), outp=outp))
+                        outp.expect(f'Successfully built layer {layr01iden} with {sodecount} storage nodes.')
+
+                        argv = ('--format', 'nodes', coredirn, layr02iden, nodesfile)
+                        outp = self.getTestOutp()
+                        self.eq(0, await s_t_build.main(argv, outp=outp), msg=str(outp))
+                        outp.expect(f'Successfully built layer {layr02iden} with {len(podes)} storage nodes.')
+
+                    # a layer which has already been built may not be built again
+                    outp = self.getTestOutp()
+                    self.eq(1, await s_t_build.main((coredirn, layr01iden, *files), outp=outp))
+                    outp.expect(f'ERROR: Layer {layr01iden} is not empty.')
+
+                    outp = self.getTestOutp()
+                    self.eq(1, await s_t_build.main((coredirn, s_common.guid(), *files), outp=outp))
+                    outp.expect('ERROR: No layer with iden')
+
+                    outp = self.getTestOutp()
+                    self.eq(1, await s_t_build.main((coredirn, layr03iden, 'newp.nodeedits'), outp=outp))
+                    outp.expect('ERROR: Invalid input file specified: newp.nodeedits.')
+
+                    async with self.getTestCore(dirn=coredirn) as core01:
+
+                        for layriden in (layr01iden, layr02iden):
+                            layr = core01.getLayer(layriden)
+                            self.eq([], [e async for e in layr.verify()])
+                            self.nn(layr.meta.get('build'))
+                            self.eq(299, (await layr.getFormCounts()).get('inet:ipv4'))
+
+                        opts = {'view': view01}
+                        async for pode in core01.exportStorm('.created', opts=opts):
+                            self.eq(expect.pop(tuple(pode[0])), pode)
+                        self.len(0, expect)
+
+                        self.eq('haha', await core01.callStorm('inet:ipv4=6 return($node.data.get(hehe))', opts=opts))
+
+                        for view in (view01, view02):
+                            opts = {'view': view}
+                            for text, count in counts:
+                                self.eq(count, await core01.count(text, opts=opts), msg=text)
+
+                        self.eq(1, await core01.count('inet:fqdn=vertex.link -(refs)> *', opts={'view': view01}))
+                        self.eq(1, await core01.count('inet:ipv4=5 <(refs)- *', opts={'view': view01}))
+
+                        # the nodeedit log of the built layer ends at the input offset
+                        layr01 = core01.getLayer(layr01iden)
+                        self.eq(editindx, await layr01.getEditIndx())
+                        self.ge(await core01.getNexsIndx(), editindx)
+
+                        offs = []
+                        buids = set()
+                        async for offi, nodeedits in layr01.syncNodeEdits(0, wait=False):
+                            offs.append(offi)
+                            buids.update(nodeedit[0] for nodeedit in nodeedits)
+
+                        self.eq(editindx - 1, offs[-1])
+                        self.eq(offs, list(range(offs[0], editindx)))
+                        self.len(sodecount, buids)
+
+                        # live edits are logged after the built edits
+                        await core01.nodes('[ inet:ipv4=1.2.3.4 ]', opts={'view': view01})
+                        self.gt(await layr01.getEditIndx(), editindx)
+                        self.len(len(offs), [x async for x in layr01.syncNodeEdits(0, wait=False) if x[0] < editindx])
+
+                        layr02 = core01.getLayer(layr02iden)
+                        nodeedits = [ne async for _, nes in layr02.syncNodeEdits(0, wait=False) for ne in nes]
+                        self.len(len(podes), nodeedits)
@@ -0,0 +1,649 @@
+import os
+import heapq
+import asyncio
+import itertools
+import collections
+
+import synapse.exc as s_exc
+import synapse.common as s_common
+import synapse.cortex as s_cortex
+
+import synapse.lib.cmd as s_cmd
+import synapse.lib.layer as s_layer
+import synapse.lib.output as s_output
+import synapse.lib.msgpack as s_msgpack
+import synapse.lib.processpool as s_processpool
+
+descr = '''
+Build an empty Synapse layer offline from exported node edits or packed nodes.
+
+The Cortex must not be running. Edits are folded into storage nodes and index
+rows which are sorted externally and written to the layer in key order.
+'''
+
+# the number of rows which are sorted in memory before spilling a run to disk
+RUN_SIZE = 500_000
+
+# the number of rows per putmulti() call
+PUT_CHUNK = 10_000
+
+# the minimum number of node edits per nodeedit log entry
+LOG_CHUNK = 1000
+
+# layer dbs which are built from sorted runs ( all of which are dupsort )
+INDEX_DBS = (
+    ('layrslab', 'byform'),
+    ('layrslab', 'byprop'),
+    ('layrslab', 'byarray'),
+    ('layrslab', 'byndef'),
+    ('layrslab', 'bytag'),
+    ('layrslab', 'bytagprop'),
+    ('layrslab', 'byverb'),
+    ('layrslab', 'edgesn1'),
+    ('layrslab', 'edgesn2'),
+    ('layrslab', 'edgesn1n2'),
+    ('dataslab', 'dataname'),
+)
+
+def mergeValu(stortype, oldv, valu):
+    '''
+    Merge a new property value with an existing one the same way the layer does.
+    '''
+    if stortype == s_layer.STOR_TYPE_IVAL:
+        return (min(*oldv, *valu), max(*oldv, *valu))
+
+    if stortype == s_layer.STOR_TYPE_MINTIME:
+        return min(valu, oldv)
+
+    if stortype == s_layer.STOR_TYPE_MAXTIME:
+        return max(valu, oldv)
+
+    return valu
+
+def _getOffs(path):
+    for mesg in s_msgpack.iterfile(path):
+        return mesg[1].get('offset')
+
+def _writeRun(path, rows):
+    with open(path, 'wb') as fd:
+        for row in rows:
+            fd.write(s_msgpack.en(row))
+
+def _mergeRuns(paths, outpath):
+    '''
+    Merge sorted run files into a single sorted run file without duplicate rows.
+
+    NOTE: This is executed in a forked process.
+    '''
+    last = None
+    count = 0
+
+    with open(outpath, 'wb') as fd:
+
+        for row in heapq.merge(*[s_msgpack.iterfile(path) for path in paths]):
+
+            if row == last:
+                continue
+
+            fd.write(s_msgpack.en(row))
+
+            last = row
+            count += 1
+
+    for path in paths:
+        os.unlink(path)
+
+    return count
+
+class RunSpool:
+    '''
+    Accumulate rows and spill them to sorted run files on disk.
+    '''
+    def __init__(self, dirn, name):
+        self.dirn = dirn
+        self.name = name
+        self.rows = []
+        self.paths = []
+
+    def add(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= RUN_SIZE:
+            self.spill()
+
+    def spill(self):
+
+        if not self.rows:
+            return
+
+        self.rows.sort()
+
+        path = s_common.genpath(self.dirn, f'{self.name}.{len(self.paths)}.run')
+        _writeRun(path, self.rows)
+
+        self.paths.append(path)
+        self.rows.clear()
+
+    def iterRows(self):
+        self.spill()
+        return heapq.merge(*[s_msgpack.iterfile(path) for path in self.paths])
+
+class LayerBuilder:
+    '''
+    Build the storage nodes and indexes of an empty layer from node edits.
+
+    Edits are spooled by buid and applied in order to build the final storage
+    node for each buid, so deletes and value merges are supported and only
+    index rows for the final values are written.
+    '''
+    def __init__(self, layr, dirn, workers=1):
+
+        self.layr = layr
+        self.dirn = dirn
+        self.workers = workers
+
+        self.seqn = 0
+        self.edits = RunSpool(dirn, 'edits')
+        self.indxs = {name: RunSpool(dirn, name) for (_, name) in INDEX_DBS}
+
+        self.formcounts = collections.Counter()
+        self.stats = s_layer.IndexStatsDelta()
+
+    def addNodeEdits(self, nodeedits):
+
+        todo = collections.deque(nodeedits)
+        while todo:
+
+            buid, form, edits = todo.popleft()
+
+            for edit in edits:
+
+                self.edits.add((buid + s_common.int64en(self.seqn), form, edit[0], edit[1]))
+                self.seqn += 1
+
+                if edit[2]:
+                    todo.extend(edit[2])
+
+    def addPackedNode(self, pode):
+
+        model = self.layr.core.model
+
+        (formname, valu), info = pode
+
+        form = model.form(formname)
+        if form is None:
+            raise s_exc.NoSuchForm.init(formname)
+
+        buid = s_common.buid((formname, valu))
+        edits = [(s_layer.EDIT_NODE_ADD, (valu, form.type.stortype), ())]
+
+        for name, pval in info.get('props', {}).items():
+            prop = form.props.get(name)
+            if prop is None:
+                raise s_exc.NoSuchProp.init(f'{formname}:{name}')
+            edits.append((s_layer.EDIT_PROP_SET, (name, pval, None, prop.type.stortype), ()))
+
+        for tag, tval in info.get('tags', {}).items():
+            edits.append((s_layer.EDIT_TAG_SET, (tag, tuple(tval), None), ()))
+
+        for tag, props in info.get('tagprops', {}).items():
+            for name, pval in props.items():
+                prop = model.getTagProp(name)
+                if prop is None:
+                    raise s_exc.NoSuchTagProp(mesg=f'No tag property named {name}.', name=name)
+                edits.append((s_layer.EDIT_TAGPROP_SET, (tag, name, pval, None, prop.type.stortype), ()))
+
+        for name, dval in info.get('nodedata', {}).items():
+            edits.append((s_layer.EDIT_NODEDATA_SET, (name, dval, None), ()))
+
+        for verb, n2 in info.get('edges', ()):
+            if not isinstance(n2, str):
+                n2 = s_common.ehex(s_common.buid(n2))
+            edits.append((s_layer.EDIT_EDGE_ADD, (verb, n2), ()))
+
+        self.addNodeEdits([(buid, formname, edits)])
+
+    def _foldEdits(self, rows):
+
+        sode = collections.defaultdict(dict)
+        data = {}
+        edges = set()
+
+        form = None
+        for _, form, etyp, args in rows:
+
+            if etyp == s_layer.EDIT_NODE_ADD:
+                sode['valu'] = tuple(args)
+
+            elif etyp == s_layer.EDIT_NODE_DEL:
+                sode.pop('valu', None)
+                data.clear()
+                edges.clear()
+
+            elif etyp == s_layer.EDIT_PROP_SET:
+                prop, valu, _, stortype = args
+                oldv = sode['props'].get(prop)
+                if oldv is not None:
+                    valu = mergeValu(stortype, oldv[0], valu)
+                sode['props'][prop] = (valu, stortype)
+
+            elif etyp == s_layer.EDIT_PROP_DEL:
+                sode['props'].pop(args[0], None)
+
+            elif etyp == s_layer.EDIT_TAG_SET:
+                tag, valu, _ = args
+                oldv = sode['tags'].get(tag)
+                if oldv is not None and oldv != (None, None) and valu != (None, None):
+                    valu = (min(oldv[0], valu[0]), max(oldv[1], valu[1]))
+                sode['tags'][tag] = tuple(valu)
+
+            elif etyp == s_layer.EDIT_TAG_DEL:
+                sode['tags'].pop(args[0], None)
+
+            elif etyp == s_layer.EDIT_TAGPROP_SET:
+                tag, prop, valu, _, stortype = args
+                props = sode['tagprops'].get(tag)
+                if props is None:
+                    props = sode['tagprops'][tag] = {}
+                oldv = props.get(prop)
+                if oldv is not None:
+                    valu = mergeValu(stortype, oldv[0], valu)
+                props[prop] = (valu, stortype)
+
+            elif etyp == s_layer.EDIT_TAGPROP_DEL:
+                tag, prop = args[:2]
+                props = sode['tagprops'].get(tag)
+                if props is not None:
+                    props.pop(prop, None)
+                    if not props:
+                        sode['tagprops'].pop(tag, None)
+
+            elif etyp == s_layer.EDIT_NODEDATA_SET:
+                data[args[0]] = args[1]
+
+            elif etyp == s_layer.EDIT_NODEDATA_DEL:
+                data.pop(args[0], None)
+
+            elif etyp == s_layer.EDIT_EDGE_ADD:
+                edges.add(tuple(args))
+
+            elif etyp == s_layer.EDIT_EDGE_DEL:
+                edges.discard(tuple(args))
+
+            else:
+                mesg = f'Unsupported node edit type: {etyp}.'
+                raise s_exc.BadArg(mesg=mesg, etyp=etyp)
+
+        for name in ('props', 'tags', 'tagprops'):
+            if name in sode and not sode[name]:
+                sode.pop(name)
+
+        if not (sode or data or edges):
+            return None
+
+        sode['form'] = form
+
+        # the layer adds .created when a node is added
+        if sode.get('valu') is not None and '.created' not in sode.get('props', {}):
+            sode['props']['.created'] = (s_common.now(), s_layer.STOR_TYPE_MINTIME)
+
+        return sode, data, edges
+
+    def _addIndxRows(self, buid, sode, data, edges):
+
+        layr = self.layr
+        form = sode['form']
+
+        indx = self.indxs
+        changes = []
+
+        formabrv = layr.setPropAbrv(form, None)
+        indx['byform'].add((formabrv, buid))
+
+        valt = sode.get('valu')
+        if valt is not None:
+
+            valu, stortype = valt
+
+            self.formcounts[form] += 1
+            changes.append((s_layer.EDIT_NODE_ADD, valt, ()))
+
+            if stortype & s_layer.STOR_FLAG_ARRAY:
+                for byts in layr.getStorIndx(stortype, valu):
+                    indx['byarray'].add((formabrv + byts, buid))
+                for byts in layr.getStorIndx(s_layer.STOR_TYPE_MSGP, valu):
+                    indx['byprop'].add((formabrv + byts, buid))
+            else:
+                for byts in layr.getStorIndx(stortype, valu):
+                    indx['byprop'].add((formabrv + byts, buid))
+
+        for prop, (valu, stortype) in sode.get('props', {}).items():
+
+            changes.append((s_layer.EDIT_PROP_SET, (prop, valu, None, stortype), ()))
+
+            abrvs = [layr.setPropAbrv(form, prop)]
+            if prop[0] == '.':
+                abrvs.append(layr.setPropAbrv(None, prop))
+
+            if stortype & s_layer.STOR_FLAG_ARRAY:
+
+                realtype = stortype & 0x7fff
+
+                for byts in layr.getStorIndx(stortype, valu):
+                    for abrv in abrvs:
+                        indx['byarray'].add((abrv + byts, buid))
+
+                    if realtype == s_layer.STOR_TYPE_NDEF:
+                        indx['byndef'].add((byts, buid + abrvs[0]))
+
+                for byts in layr.getStorIndx(s_layer.STOR_TYPE_MSGP, valu):
+                    for abrv in abrvs:
+                        indx['byprop'].add((abrv + byts, buid))
+
+            else:
+
+                for byts in layr.getStorIndx(stortype, valu):
+                    for abrv in abrvs:
+                        indx['byprop'].add((abrv + byts, buid))
+
+                    if stortype == s_layer.STOR_TYPE_NDEF:
+                        indx['byndef'].add((byts, buid + abrvs[0]))
+
+        for tag, valu in sode.get('tags', {}).items():
+            changes.append((s_layer.EDIT_TAG_SET, (tag, valu, None), ()))
+            tagabrv = layr.tagabrv.setBytsToAbrv(tag.encode())
+            indx['bytag'].add((tagabrv + formabrv, buid))
+
+        for tag, props in sode.get('tagprops', {}).items():
+            for prop, (valu, stortype) in props.items():
+
+                changes.append((s_layer.EDIT_TAGPROP_SET, (tag, prop, valu, None, stortype), ()))
+
+                tp_abrv = layr.setTagPropAbrv(None, tag, prop)
+                ftp_abrv = layr.setTagPropAbrv(form, tag, prop)
+
+                for byts in layr.getStorIndx(stortype, valu):
+                    indx['bytagprop'].add((tp_abrv + byts, buid))
+                    indx['bytagprop'].add((ftp_abrv + byts, buid))
+
+        datarows = []
+        for name, valu in data.items():
+            abrv = layr.setPropAbrv(name, None)
+            indx['dataname'].add((abrv, buid))
+            datarows.append((buid + abrv, s_msgpack.en(valu)))
+
+        for verb, n2iden in edges:
+
+            venc = verb.encode()
+            n2buid = s_common.uhex(n2iden)
+
+            indx['byverb'].add((venc, buid + n2buid))
+            indx['edgesn1'].add((buid + venc, n2buid))
+            indx['edgesn2'].add((n2buid + venc, buid))
+            indx['edgesn1n2'].add((buid + n2buid, venc))
+
+        layr._updIndexStats(self.stats, form, changes)
+
+        datarows.sort()
+        return datarows, changes
+
+    async def _putRows(self, slab, rows, db, append=False):
+
+        count = 0
+        for chunk in s_common.chunks(rows, PUT_CHUNK):
+            slab._putmulti(list(chunk), dupdata=not append, append=append, db=db)
+            slab.forcecommit()
+            count += len(chunk)
+            await asyncio.sleep(0)
+
+        return count
+
+    async def _saveEditLog(self, path, size, offs):
+        '''
+        Write the folded node edits to the layer nodeedit log ending at offs.
+
+        Returns:
+            int: The next nodeedit log / nexus index.
+        '''
+        layr = self.layr
+        core = layr.core
+
+        if offs is None:
+            chunksize = LOG_CHUNK
+            indx = await core.getNexsIndx()
+        else:
+            # never use more log entries than there are offsets available
+            chunksize = max(LOG_CHUNK, -(-size // (offs + 1)))
+            indx = offs + 1 - (-(-size // chunksize))
+
+        meta = {'time': s_common.now(), 'user': core.auth.rootuser.iden}
+
+        for chunk in s_common.chunks(s_msgpack.iterfile(path), chunksize):
+            layr.nodeeditlog.add((list(chunk), meta), indx=indx)
+            indx += 1
+            await asyncio.sleep(0)
+
+        if offs is not None:
+            indx = offs + 1
+
+        await layr.nodeeditslab.sync()
+
+        return indx
+
+    async def build(self, outp, offs=None):
+        '''
+        Write the storage nodes, indexes and nodeedit log to the layer.
+
+        Args:
+            outp (s_output.OutPut): The output to print progress to.
+            offs (int): The nodeedit log offset of the last input edit.
+
+        Returns:
+            int: The number of storage nodes written.
+        '''
+        layr = self.layr
+
+        outp.printf('Building storage nodes.')
+
+        logsize = 0
+        logpath = s_common.genpath(self.dirn, 'nodeedits.log')
+
+        def genr(logfd):
+            nonlocal logsize
+
+            for buid, rows in itertools.groupby(self.edits.iterRows(), key=lambda row: row[0][:32]):
+
+                retn = self._foldEdits(rows)
+                if retn is None:
+                    continue
+
+                sode, data, edges = retn
+
+                datarows, changes = self._addIndxRows(buid, sode, data, edges)
+                if datarows:
+                    yield 'data', datarows
+
+                for name, valu in data.items():
+                    changes.append((s_layer.EDIT_NODEDATA_SET, (name, valu, None), ()))
+
+                for verb, n2iden in sorted(edges):
+                    changes.append((s_layer.EDIT_EDGE_ADD, (verb, n2iden), ()))
+
+                if changes and layr.logedits:
+                    logfd.write(s_msgpack.en((buid, sode['form'], changes)))
+                    logsize += 1
+
+                yield 'sode', (buid, s_msgpack.en(sode))
+
+        count = 0
+        sodes = []
+        datas = []
+
+        async def flush():
+            # buids are in sorted order so both dbs may be appended to
+            await self._putRows(layr.layrslab, sodes, layr.bybuidv3, append=True)
+            await self._putRows(layr.dataslab, datas, layr.nodedata, append=True)
+            sodes.clear()
+            datas.clear()
+
+            layr._saveIndexStats(self.stats)
+            self.stats = s_layer.IndexStatsDelta()
+
+        with open(logpath, 'wb') as logfd:
+
+            for name, item in genr(logfd):
+
+                if name == 'data':
+                    datas.extend(item)
+                    continue
+
+                sodes.append(item)
+                count += 1
+
+                if len(sodes) >= PUT_CHUNK:
+                    await flush()
+
+            await flush()
+
+        # merge the sorted runs for each index db in parallel processes
+        sema = asyncio.Semaphore(self.workers)
+
+        async def merge(paths, outpath):
+            async with sema:
+                return await s_processpool.forked(_mergeRuns, paths, outpath)
+
+        todo = []
+        for slabname, name in INDEX_DBS:
+
+            spool = self.indxs[name]
+            spool.spill()
+
+            if not spool.paths:
+                continue
+
+            outpath = s_common.genpath(self.dirn, f'{name}.merged')
+            todo.append((slabname, name, outpath, merge(spool.paths, outpath)))
+
+        sizes = await asyncio.gather(*[item[3] for item in todo])
+
+        for (slabname, name, outpath, _), size in zip(todo, sizes):
+
+            outp.printf(f'Writing {size} rows to {name}.')
+
+            slab = getattr(layr, slabname)
+
+            # dupsort dbs can not be appended to with multiple values per key
+            await self._putRows(slab, s_msgpack.iterfile(outpath), name)
+            os.unlink(outpath)
+
+        for form, valu in self.formcounts.items():
+            layr.formcounts.inc(form, valu=valu)
+
+        await layr.layrslab.sync()
+        await layr.dataslab.sync()
+
+        outp.printf(f'Writing {logsize} node edits to the nodeedit log.')
+
+        nexsindx = await self._saveEditLog(logpath, logsize, offs)
+        os.unlink(logpath)
+
+        # live edits are logged at the nexus index so it must follow the built edits
+        if nexsindx > await layr.core.getNexsIndx():
+            await layr.core.nexsroot.setindex(nexsindx)
+
+        return count
+
+async def buildLayer(infiles, opts, outp):
+
+    async with await s_cortex.Cortex.anit(opts.dirn) as core:
+
+        layr = core.getLayer(opts.iden)
+        if layr is None:
+            mesg = f'No layer with iden {opts.iden}.'
+            raise s_exc.NoSuchLayer(mesg=mesg, iden=opts.iden)
+
+        if layr.getStorNodeCount() or layr.meta.get('build') is not None:
+            mesg = f'Layer {opts.iden} is not empty.'
+            raise s_exc.BadArg(mesg=mesg, iden=opts.iden)
+
+        with s_common.getTempDir(dirn=opts.tmpdir) as dirn:
+
+            builder = LayerBuilder(layr, dirn, workers=opts.workers)
+
+            offs = None
+
+            for filename in infiles:
+
+                outp.printf(f'Reading {filename}.')
+
+                genr = s_msgpack.iterfile(filename)
+
+                if opts.format == 'nodes':
+                    for pode in genr:
+                        builder.addPackedNode(pode)
+                    continue
+
+                fini = None
+                for item in genr:
+                    match item:
+                        case ('init', _):
+                            continue
+
+                        case ('edit', (offs, edits, _)):
+                            builder.addNodeEdits(edits)
+
+                        case ('fini', info):
+                            fini = info
+                            break
+
+                        case _:
+                            mesg = f'Unexpected message type: {item[0]}.'
+                            raise s_exc.BadMesgFormat(mesg=mesg)
+
+                if fini is None or fini.get('offset') != offs:
+                    mesg = f'Incomplete/corrupt export: {filename}.'
+                    raise s_exc.BadDataValu(mesg=mesg)
+
+            count = await builder.build(outp, offs=offs)
+
+            # record the build last so a partial build is never considered complete
+            layr.meta.set('build', {'offset': offs, 'nodes': count, 'time': s_common.now()})
+            await layr.layrslab.sync()
+
+            outp.printf(f'Successfully built layer {opts.iden} with {count} storage nodes.')
+
+async def main(argv, outp=s_output.stdout):
+
+    pars = s_cmd.Parser(prog='layer.build', outp=outp, description=descr)
+    pars.add_argument('--format', default='nodeedits', choices=('nodeedits', 'nodes'),
+                      help='The format of the input files.')
+    pars.add_argument('--tmpdir', default=None, help='The directory used to sort rows.')
+    pars.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                      help='The number of processes used to merge sorted index rows.')
+
+    pars.add_argument('dirn', help='The directory of the Cortex.')
+    pars.add_argument('iden', help='The iden of the empty layer to build.')
+    pars.add_argument('files', nargs='+', help='The .nodeedits or .nodes files to build from.')
+
+    opts = pars.parse_args(argv)
+
+    try:
+
+        for filename in opts.files:
+            if not os.path.isfile(filename):
+                mesg = f'Invalid input file specified: {filename}.'
+                raise s_exc.NoSuchFile(mesg=mesg)
+
+        infiles = opts.files
+        if opts.format == 'nodeedits':
+            infiles = sorted(infiles, key=_getOffs)
+
+        await buildLayer(infiles, opts, outp)
+        return 0
+
+    except s_exc.SynErr as exc:
+        mesg = exc.get('mesg')
+        outp.printf(f'ERROR: {mesg}')
+        return 1
+
+if __name__ == '__main__':  # pragma: no cover
+    s_cmd.exitmain(main)